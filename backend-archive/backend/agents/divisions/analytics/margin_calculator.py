@@ -2,18 +2,51 @@
 
 from __future__ import annotations
 
+import math
+from datetime import date, datetime, timedelta
 from typing import Any, Sequence
+from uuid import UUID
 
+import numpy as np
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
 
 from backend.agents.base import BaseAgent
 from backend.graph.state import Division, PromotorStateDict
+from backend.pricing import ProductCosts, margin_grid, max_discount_for_margin
+from backend.pricing.consistency import CHANNELS
+from backend.pricing.margins import DISCOUNT_LEVELS, MIN_PROFITABLE_MARGIN, floor_discount
+
+# Assumed unit sales uplift during a promotion when the config gives none
+PROMOTION_SALES_UPLIFT = 0.3
+
+
+async def _load_product_costs(
+    product_ids: Sequence[str] | None = None,
+    brand: str | None = None,
+) -> tuple[ProductCosts, list[str]]:
+    """Load product costs; returns them with the requested IDs that were not found."""
+    from backend.db.pricing import load_product_costs
+    from backend.db.session import readonly_session
+
+    ids, not_found = [], []
+    for product_id in product_ids or []:
+        try:
+            ids.append(UUID(product_id))
+        except ValueError:
+            not_found.append(product_id)
+
+    async with readonly_session() as session:
+        costs = await load_product_costs(session, ids if product_ids is not None else None, brand=brand)
+
+    found = set(costs.product_ids)
+    not_found.extend(str(product_id) for product_id in ids if product_id not in found)
+    return costs, not_found
 
 
 @tool
-def calculate_product_margin(
+async def calculate_product_margin(
     product_id: str,
     channel: str,
     discount_percentage: float = 0,
@@ -29,100 +62,122 @@ def calculate_product_margin(
     Returns:
         Margin calculation breakdown
     """
-    # Base product economics
-    base_price = 35000
-    cogs = 8000
-
-    # Channel fees
-    channel_fees = {
-        "oliveyoung": {"commission": 0.30, "marketing_fee": 0.05},
-        "coupang": {"commission": 0.25, "marketing_fee": 0.03},
-        "naver": {"commission": 0.15, "marketing_fee": 0.05},
-        "kakao": {"commission": 0.18, "marketing_fee": 0.02},
-    }
-
-    fees = channel_fees.get(channel, {"commission": 0.20, "marketing_fee": 0.03})
-
-    # Calculate
-    selling_price = base_price * (1 - discount_percentage)
-    commission = selling_price * fees["commission"]
-    marketing = selling_price * fees["marketing_fee"]
-    net_revenue = selling_price - commission - marketing
-    gross_margin = net_revenue - cogs
-    margin_percentage = gross_margin / selling_price if selling_price > 0 else 0
+    costs, _ = await _load_product_costs([product_id])
+    if not len(costs):
+        return {"product_id": product_id, "error": "Product not found"}
 
+    grid = margin_grid(costs, [channel], [discount_percentage])
+    margin = float(grid.margin[0, 0, 0])
     return {
         "product_id": product_id,
+        "product_name": costs.product_names[0],
         "channel": channel,
         "discount_applied": discount_percentage,
         "breakdown": {
-            "base_price": base_price,
-            "selling_price": selling_price,
-            "cogs": cogs,
-            "commission": commission,
-            "marketing_fee": marketing,
-            "net_revenue": net_revenue,
-            "gross_margin": gross_margin,
+            "base_price": round(costs.base_prices[0]),
+            "selling_price": round(grid.selling_price[0, 0, 0]),
+            "cogs": round(costs.cogs[0]),
+            "commission": round(grid.commission[0, 0, 0]),
+            "marketing_fee": round(grid.marketing_fee[0, 0, 0]),
+            "net_revenue": round(grid.net_revenue[0, 0, 0]),
+            "gross_margin": round(grid.gross_margin[0, 0, 0]),
         },
-        "margin_percentage": margin_percentage,
-        "is_profitable": margin_percentage > 0.15,
+        "margin_percentage": round(margin, 4),
+        "is_profitable": margin > MIN_PROFITABLE_MARGIN,
     }
 
 
 @tool
-def find_optimal_discount(
-    product_id: str,
-    channel: str,
+async def find_optimal_discount(
+    product_ids: list[str] | None = None,
+    channels: list[str] | None = None,
     target_margin: float = 0.20,
+    brand: str | None = None,
+    limit: int = 50,
 ) -> dict[str, Any]:
     """
-    Find optimal discount level for target margin.
+    Find the maximum discount per product and channel that keeps a target margin.
+
+    Solved directly from prices, unit costs and channel fees for every
+    product at once; for a single product the margins at common discount
+    levels are included.
 
     Args:
-        product_id: Product ID
-        channel: Channel name
+        product_ids: Products to check (None for the whole catalog)
+        channels: Channels to check (None for all)
         target_margin: Target margin percentage
+        brand: Only check this brand's products
+        limit: Maximum products to return, least discount headroom first
 
     Returns:
         Optimal discount analysis
     """
-    # Simulate different discount levels
-    discounts = [0, 0.10, 0.15, 0.20, 0.25, 0.30]
-    results = []
-
-    for disc in discounts:
-        margin_calc = calculate_product_margin.invoke({
-            "product_id": product_id,
-            "channel": channel,
-            "discount_percentage": disc,
+    channels = channels or list(CHANNELS)
+    costs, not_found = await _load_product_costs(product_ids, brand)
+    if not len(costs):
+        return {"error": "No products found", "not_found": not_found}
+
+    max_discount = max_discount_for_margin(costs, channels, target_margin)
+    optimal = floor_discount(max_discount)
+    reachable = ~np.isnan(max_discount)
+
+    # Least headroom on the product's best channel first; unreachable everywhere sorts first
+    headroom = np.where(reachable, max_discount, -1.0).max(axis=1)
+    order = np.argsort(headroom, kind="stable")[:limit]
+
+    # Convert once; per-element numpy indexing dominates otherwise
+    products = []
+    for i, max_row, optimal_row in zip(order.tolist(), max_discount[order].tolist(), optimal[order].tolist()):
+        products.append({
+            "product_id": str(costs.product_ids[i]),
+            "product_name": costs.product_names[i],
+            "base_price": round(costs.base_prices[i]),
+            "cogs": round(costs.cogs[i]),
+            "max_discount": {
+                channel: None if math.isnan(value) else round(value, 4) for channel, value in zip(channels, max_row)
+            },
+            "optimal_discount": {
+                channel: None if math.isnan(value) else round(value, 2) for channel, value in zip(channels, optimal_row)
+            },
         })
-        results.append({
-            "discount": disc,
-            "margin": margin_calc["margin_percentage"],
-            "selling_price": margin_calc["breakdown"]["selling_price"],
-            "gross_margin": margin_calc["breakdown"]["gross_margin"],
-        })
-
-    # Find optimal
-    optimal = None
-    for r in results:
-        if r["margin"] >= target_margin:
-            optimal = r
-        else:
-            break
 
-    return {
-        "product_id": product_id,
-        "channel": channel,
+    result = {
+        "checked_at": datetime.now().isoformat(),
         "target_margin": target_margin,
-        "analysis": results,
-        "optimal_discount": optimal["discount"] if optimal else 0,
-        "recommendation": f"Maximum discount for {target_margin:.0%} margin: {optimal['discount']:.0%}" if optimal else "Cannot achieve target margin",
+        "channels": channels,
+        "products_checked": len(costs),
+        "unreachable": {channel: int((~reachable[:, c]).sum()) for c, channel in enumerate(channels)},
+        "products": products,
+        "truncated": len(costs) > limit,
+        "not_found": not_found,
     }
+    if len(costs) == 1:
+        grid = margin_grid(costs, channels, DISCOUNT_LEVELS)
+        result["analysis"] = {
+            channel: [
+                {
+                    "discount": discount,
+                    "margin": round(float(grid.margin[0, c, d]), 4),
+                    "selling_price": round(grid.selling_price[0, c, d]),
+                    "gross_margin": round(grid.gross_margin[0, c, d]),
+                }
+                for d, discount in enumerate(DISCOUNT_LEVELS)
+            ]
+            for c, channel in enumerate(channels)
+        }
+        result["recommendation"] = {
+            channel: (
+                f"Maximum discount for {target_margin:.0%} margin: {value:.0%}"
+                if value is not None
+                else "Cannot achieve target margin"
+            )
+            for channel, value in products[0]["optimal_discount"].items()
+        }
+    return result
 
 
 @tool
-def compare_channel_margins(
+async def compare_channel_margins(
     product_id: str,
     discount_percentage: float = 0.20,
 ) -> dict[str, Any]:
@@ -136,76 +191,132 @@ def compare_channel_margins(
     Returns:
         Channel margin comparison
     """
-    channels = ["oliveyoung", "coupang", "naver", "kakao"]
-    comparisons = []
+    costs, _ = await _load_product_costs([product_id])
+    if not len(costs):
+        return {"product_id": product_id, "error": "Product not found"}
 
-    for channel in channels:
-        margin = calculate_product_margin.invoke({
-            "product_id": product_id,
-            "channel": channel,
-            "discount_percentage": discount_percentage,
-        })
-        comparisons.append({
+    grid = margin_grid(costs, CHANNELS, [discount_percentage])
+    comparisons = [
+        {
             "channel": channel,
-            "margin_percentage": margin["margin_percentage"],
-            "gross_margin": margin["breakdown"]["gross_margin"],
-            "is_profitable": margin["is_profitable"],
-        })
+            "margin_percentage": round(margin, 4),
+            "gross_margin": round(gross_margin),
+            "is_profitable": margin > MIN_PROFITABLE_MARGIN,
+        }
+        for channel, margin, gross_margin in zip(
+            CHANNELS, grid.margin[0, :, 0].tolist(), grid.gross_margin[0, :, 0].tolist()
+        )
+    ]
 
     # Sort by margin
     comparisons.sort(key=lambda x: x["margin_percentage"], reverse=True)
 
     return {
         "product_id": product_id,
+        "product_name": costs.product_names[0],
         "discount_applied": discount_percentage,
         "channel_comparison": comparisons,
         "best_margin_channel": comparisons[0]["channel"],
         "worst_margin_channel": comparisons[-1]["channel"],
-        "margin_spread": comparisons[0]["margin_percentage"] - comparisons[-1]["margin_percentage"],
+        "margin_spread": round(comparisons[0]["margin_percentage"] - comparisons[-1]["margin_percentage"], 4),
     }
 
 
 @tool
-def calculate_promotion_profitability(
+async def calculate_promotion_profitability(
     promotion_config: dict[str, Any],
 ) -> dict[str, Any]:
     """
     Calculate overall promotion profitability.
 
+    Units are projected from each product's average daily sales per channel
+    over the last 28 days, raised by the expected sales uplift.
+
     Args:
-        promotion_config: Promotion configuration with products, channels, discounts
+        promotion_config: Promotion configuration with products (IDs, or
+            brand for all its products), channels, discount, budget,
+            duration_days and sales_uplift
 
     Returns:
         Profitability projection
     """
-    # Example config: {"products": [...], "channels": [...], "discount": 0.20, "budget": 5000000}
+    from backend.db.sales import get_average_daily_units
+    from backend.db.session import readonly_session
 
-    projected_units = 2500
-    projected_revenue = 75_000_000
-    projected_cogs = 20_000_000
-    channel_fees = 18_750_000  # 25% average
+    # Example config: {"products": [...], "channels": [...], "discount": 0.20, "budget": 5000000}
+    channels = promotion_config.get("channels") or list(CHANNELS)
+    discount = promotion_config.get("discount", 0.20)
     marketing_spend = promotion_config.get("budget", 5_000_000)
-
-    gross_profit = projected_revenue - projected_cogs - channel_fees
+    duration_days = promotion_config.get("duration_days", 14)
+    uplift = promotion_config.get("sales_uplift", PROMOTION_SALES_UPLIFT)
+
+    products = promotion_config.get("products")
+    brand = promotion_config.get("brand")
+    costs, not_found = await _load_product_costs(products, brand)
+    if not len(costs):
+        return {"error": "No products found", "not_found": not_found}
+
+    today = date.today()
+    async with readonly_session() as session:
+        # A brand or catalog promotion reads by brand, not by a list of every product ID
+        averages = await get_average_daily_units(
+            session,
+            today - timedelta(days=28),
+            today - timedelta(days=1),
+            product_ids=costs.product_ids if products is not None else None,
+            brand=brand,
+        )
+
+    row_index = {product_id: i for i, product_id in enumerate(costs.product_ids)}
+    col_index = {channel: c for c, channel in enumerate(channels)}
+    daily_units = np.zeros((len(costs), len(channels)))
+    for (product_id, channel), average in averages.items():
+        if channel in col_index and product_id in row_index:
+            daily_units[row_index[product_id], col_index[channel]] = average
+    units = daily_units * duration_days * (1 + uplift)
+
+    grid = margin_grid(costs, channels, [discount])
+    revenue_by_channel = (units * grid.selling_price[:, :, 0]).sum(axis=0)
+    fees_by_channel = (units * (grid.commission + grid.marketing_fee)[:, :, 0]).sum(axis=0)
+    gross_by_channel = (units * grid.gross_margin[:, :, 0]).sum(axis=0)
+    units_by_channel = units.sum(axis=0)
+
+    projected_units = float(units_by_channel.sum())
+    projected_revenue = float(revenue_by_channel.sum())
+    channel_fees = float(fees_by_channel.sum())
+    gross_profit = float(gross_by_channel.sum())
+    projected_cogs = projected_revenue - channel_fees - gross_profit
     net_profit = gross_profit - marketing_spend
     roi = (net_profit / marketing_spend) if marketing_spend > 0 else 0
+    profit_per_unit = gross_profit / projected_units if projected_units > 0 else 0
 
     return {
         "projection": {
-            "units": projected_units,
-            "revenue": projected_revenue,
-            "cogs": projected_cogs,
-            "channel_fees": channel_fees,
+            "units": round(projected_units),
+            "revenue": round(projected_revenue),
+            "cogs": round(projected_cogs),
+            "channel_fees": round(channel_fees),
             "marketing_spend": marketing_spend,
-            "gross_profit": gross_profit,
-            "net_profit": net_profit,
+            "gross_profit": round(gross_profit),
+            "net_profit": round(net_profit),
+        },
+        "by_channel": {
+            channel: {
+                "units": round(units_by_channel[c]),
+                "revenue": round(revenue_by_channel[c]),
+                "gross_profit": round(gross_by_channel[c]),
+            }
+            for c, channel in enumerate(channels)
         },
         "metrics": {
-            "gross_margin": gross_profit / projected_revenue,
-            "net_margin": net_profit / projected_revenue,
-            "marketing_roi": roi,
-            "breakeven_units": int(marketing_spend / (30000 - 8000 - 7500)),  # Simplified
+            "gross_margin": round(gross_profit / projected_revenue, 4) if projected_revenue > 0 else 0,
+            "net_margin": round(net_profit / projected_revenue, 4) if projected_revenue > 0 else 0,
+            "marketing_roi": round(roi, 2),
+            "breakeven_units": math.ceil(marketing_spend / profit_per_unit) if profit_per_unit > 0 else None,
+            "listings_below_min_margin": int((grid.margin[:, :, 0] < MIN_PROFITABLE_MARGIN).sum()),
         },
+        "products_included": len(costs),
+        "not_found": not_found,
         "recommendation": "Proceed" if roi > 2.0 else "Review budget or discount",
     }
 
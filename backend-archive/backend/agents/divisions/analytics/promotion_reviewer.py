@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Any, Sequence
+from uuid import UUID
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
+from sqlalchemy import select
 
 from backend.agents.base import BaseAgent
 from backend.graph.state import Division, PromotorStateDict
+from backend.models import Promotion
 
 
 @tool
@@ -122,49 +126,120 @@ def compare_promotions(
     }
 
 
+def _parse_baseline_days(baseline_period: str) -> int:
+    """Parse a baseline period like "7d_prior" into a number of days."""
+    try:
+        return max(int(baseline_period.split("d", 1)[0]), 1)
+    except ValueError:
+        return 7
+
+
+def _lift(baseline: float, promo: float) -> float:
+    return round(promo / baseline - 1, 4) if baseline else 0.0
+
+
 @tool
-def calculate_promotion_lift(
+async def calculate_promotion_lift(
     promotion_id: str,
     baseline_period: str = "7d_prior",
+    brand: str | None = None,
 ) -> dict[str, Any]:
     """
     Calculate incremental lift from promotion.
 
+    Compares daily sales on the promotion's channels during the promotion
+    with the baseline window immediately before it, using the daily sales rollups.
+
     Args:
         promotion_id: Promotion ID
-        baseline_period: Baseline comparison period
+        baseline_period: Baseline comparison period (e.g. 7d_prior, 14d_prior)
+        brand: Optional brand to restrict sales to
 
     Returns:
         Lift analysis
     """
+    from backend.db.sales import get_sales_totals
+    from backend.db.session import readonly_session
+
+    try:
+        promo_uuid = UUID(promotion_id)
+    except ValueError:
+        return {"promotion_id": promotion_id, "error": "Invalid promotion ID format"}
+
+    async with readonly_session() as session:
+        result = await session.execute(
+            select(Promotion.start_date, Promotion.end_date, Promotion.channels)
+            .where(Promotion.id == promo_uuid)
+        )
+        promo = result.one_or_none()
+        if promo is None:
+            return {"promotion_id": promotion_id, "error": "Promotion not found"}
+
+        promo_days = (promo.end_date - promo.start_date).days + 1
+        baseline_days = _parse_baseline_days(baseline_period)
+        baseline_end = promo.start_date - timedelta(days=1)
+        baseline_start = baseline_end - timedelta(days=baseline_days - 1)
+
+        promo_sales = await get_sales_totals(
+            session, promo.start_date, promo.end_date, brand=brand, group_by_channel=True
+        )
+        baseline_sales = await get_sales_totals(
+            session, baseline_start, baseline_end, brand=brand, group_by_channel=True
+        )
+
+    empty = {"units": 0, "gross_sales": 0}
+    by_channel = {}
+    totals = {"baseline_sales": 0, "promo_sales": 0, "baseline_units": 0, "promo_units": 0}
+    for channel in promo.channels:
+        baseline = baseline_sales.get(channel, empty)
+        current = promo_sales.get(channel, empty)
+        totals["baseline_sales"] += baseline["gross_sales"]
+        totals["promo_sales"] += current["gross_sales"]
+        totals["baseline_units"] += baseline["units"]
+        totals["promo_units"] += current["units"]
+
+        baseline_avg = baseline["gross_sales"] / baseline_days
+        promo_avg = current["gross_sales"] / promo_days
+        by_channel[channel] = {
+            "baseline_daily_avg": round(baseline_avg),
+            "promo_daily_avg": round(promo_avg),
+            "lift_percentage": _lift(baseline_avg, promo_avg),
+        }
+
+    baseline_sales_avg = totals["baseline_sales"] / baseline_days
+    promo_sales_avg = totals["promo_sales"] / promo_days
+    baseline_units_avg = totals["baseline_units"] / baseline_days
+    promo_units_avg = totals["promo_units"] / promo_days
+
     return {
         "promotion_id": promotion_id,
         "baseline_period": baseline_period,
+        "periods": {
+            "baseline": {
+                "start": baseline_start.isoformat(),
+                "end": baseline_end.isoformat(),
+                "days": baseline_days,
+            },
+            "promotion": {
+                "start": promo.start_date.isoformat(),
+                "end": promo.end_date.isoformat(),
+                "days": promo_days,
+            },
+        },
         "metrics": {
             "sales_lift": {
-                "baseline_daily_avg": 3_500_000,
-                "promo_daily_avg": 8_350_000,
-                "lift_percentage": 1.39,
-                "incremental_revenue": 33_950_000,
+                "baseline_daily_avg": round(baseline_sales_avg),
+                "promo_daily_avg": round(promo_sales_avg),
+                "lift_percentage": _lift(baseline_sales_avg, promo_sales_avg),
+                "incremental_revenue": round((promo_sales_avg - baseline_sales_avg) * promo_days),
             },
-            "traffic_lift": {
-                "baseline_daily_avg": 12000,
-                "promo_daily_avg": 28500,
-                "lift_percentage": 1.38,
+            "units_lift": {
+                "baseline_daily_avg": round(baseline_units_avg, 1),
+                "promo_daily_avg": round(promo_units_avg, 1),
+                "lift_percentage": _lift(baseline_units_avg, promo_units_avg),
             },
-            "conversion_lift": {
-                "baseline_cvr": 0.032,
-                "promo_cvr": 0.041,
-                "lift_percentage": 0.28,
-            },
-        },
-        "cannibalization_estimate": {
-            "forward_buying": 0.15,  # 15% of sales would have happened anyway
-            "net_incremental": 0.85,
-        },
-        "halo_effect": {
-            "non_promo_products_lift": 0.12,  # 12% lift in non-promoted products
         },
+        "by_channel": by_channel,
     }
 
 
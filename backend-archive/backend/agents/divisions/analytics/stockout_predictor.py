@@ -2,66 +2,137 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Any, Sequence
+from uuid import UUID
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
+from sqlalchemy import select
 
 from backend.agents.base import BaseAgent
 from backend.graph.state import Division, PromotorStateDict
+from backend.models import Inventory, Product
+
+
+def _risk_level(days_of_supply: float | None) -> str:
+    """Map days of supply to a risk level (critical < 14, warning < 21)."""
+    if days_of_supply is None:
+        return "low"
+    if days_of_supply < 14:
+        return "high"
+    if days_of_supply < 21:
+        return "medium"
+    return "low"
 
 
 @tool
-def predict_stockout_risk(
+async def predict_stockout_risk(
     product_id: str,
     days_ahead: int = 30,
+    history_days: int = 28,
 ) -> dict[str, Any]:
     """
     Predict stock-out risk for a product.
 
+    Demand is the average daily units per channel over the last
+    ``history_days`` days of sales rollups, falling back to the inventory's
+    stored daily average when there is no sales history.
+
     Args:
         product_id: Product ID
         days_ahead: Days to forecast
+        history_days: Days of sales history used for the daily average
 
     Returns:
         Stock-out risk prediction
     """
-    today = datetime.now()
+    from backend.db.sales import get_average_daily_units
+    from backend.db.session import readonly_session
+
+    try:
+        product_uuid = UUID(product_id)
+    except ValueError:
+        return {"product_id": product_id, "error": "Invalid product ID format"}
+
+    today = date.today()
+    async with readonly_session() as session:
+        result = await session.execute(
+            select(
+                Product.name,
+                Inventory.channel,
+                Inventory.current_stock,
+                Inventory.daily_sales_avg,
+            )
+            .join(Product, Product.id == Inventory.product_id)
+            .where(Inventory.product_id == product_uuid)
+        )
+        inventories = result.all()
+        if not inventories:
+            return {"product_id": product_id, "error": "No inventory found for product"}
+
+        averages = await get_average_daily_units(
+            session,
+            today - timedelta(days=history_days),
+            today - timedelta(days=1),
+            product_ids=[product_uuid],
+        )
+
+    by_channel = {}
+    channel_risk = {}
+    for inv in inventories:
+        daily = averages.get((product_uuid, inv.channel), float(inv.daily_sales_avg))
+        days_supply = inv.current_stock / daily if daily > 0 else None
+        by_channel[inv.channel] = inv.current_stock
+        channel_risk[inv.channel] = {
+            "daily_average": round(daily, 1),
+            "days_supply": int(days_supply) if days_supply is not None else None,
+            "risk": _risk_level(days_supply),
+        }
+
+    total_units = sum(by_channel.values())
+    daily_average = sum(risk["daily_average"] for risk in channel_risk.values())
+    days_of_supply = total_units / daily_average if daily_average > 0 else None
+
+    at_risk = sorted(
+        (ch for ch, risk in channel_risk.items() if risk["risk"] != "low"),
+        key=lambda ch: channel_risk[ch]["days_supply"],
+    )
+    recommendation = (
+        ", ".join(
+            f"Restock {ch.capitalize()} within {max(channel_risk[ch]['days_supply'] - 7, 0)} days"
+            for ch in at_risk
+        )
+        if at_risk
+        else "Inventory sufficient on all channels"
+    )
 
     return {
         "product_id": product_id,
-        "product_name": "Vitamin C Serum 30ml",
-        "prediction_date": today.strftime("%Y-%m-%d"),
+        "product_name": inventories[0].name,
+        "prediction_date": today.isoformat(),
         "forecast_period": f"{days_ahead} days",
         "current_inventory": {
-            "total_units": 2850,
-            "by_channel": {
-                "oliveyoung": 950,
-                "coupang": 780,
-                "naver": 650,
-                "kakao": 470,
-            },
+            "total_units": total_units,
+            "by_channel": by_channel,
         },
         "sales_forecast": {
-            "daily_average": 85,
-            "weekly_forecast": [595, 612, 628, 645],
-            "monthly_forecast": 2550,
+            "daily_average": round(daily_average, 1),
+            "weekly_forecast": [round(daily_average * 7)] * (days_ahead // 7),
+            "monthly_forecast": round(daily_average * 30),
         },
         "stockout_prediction": {
-            "days_of_supply": 33,
-            "stockout_date": (today + timedelta(days=33)).strftime("%Y-%m-%d"),
-            "risk_level": "medium",
-            "confidence": 0.82,
-        },
-        "channel_risk": {
-            "oliveyoung": {"days_supply": 35, "risk": "low"},
-            "coupang": {"days_supply": 28, "risk": "medium"},
-            "naver": {"days_supply": 38, "risk": "low"},
-            "kakao": {"days_supply": 25, "risk": "high"},
+            "days_of_supply": int(days_of_supply) if days_of_supply is not None else None,
+            "stockout_date": (
+                (today + timedelta(days=int(days_of_supply))).isoformat()
+                if days_of_supply is not None and days_of_supply <= days_ahead
+                else None
+            ),
+            "risk_level": _risk_level(days_of_supply),
         },
-        "recommendation": "Restock Kakao within 10 days, Coupang within 14 days",
+        "channel_risk": channel_risk,
+        "recommendation": recommendation,
     }
 
 
@@ -10,6 +10,9 @@ from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
 
 from backend.agents.base import BaseAgent
+from backend.channels import ChannelRequestError
+from backend.channels.coupang import fetch_wing_metrics
+from backend.config import get_settings
 from backend.graph.state import Division, PromotorStateDict
 
 
@@ -105,24 +108,12 @@ def check_rocket_delivery_status(
     }
 
 
-@tool
-def get_coupang_wing_metrics(
-    seller_id: str,
-    date_range: str = "7d",
-) -> dict[str, Any]:
-    """
-    Get Coupang WING portal metrics.
-
-    Args:
-        seller_id: Seller ID
-        date_range: Date range (7d, 30d, 90d)
-
-    Returns:
-        WING dashboard metrics
-    """
+def _sample_wing_metrics(seller_id: str, date_range: str) -> dict[str, Any]:
+    """Sample WING metrics used when no Coupang API credentials are configured."""
     return {
         "seller_id": seller_id,
         "period": date_range,
+        "source": "sample",
         "metrics": {
             "total_sales": 45_000_000,
             "order_count": 2850,
@@ -149,6 +140,41 @@ def get_coupang_wing_metrics(
     }
 
 
+@tool
+async def get_coupang_wing_metrics(
+    seller_id: str,
+    date_range: str = "7d",
+) -> dict[str, Any]:
+    """
+    Get Coupang WING portal metrics.
+
+    Args:
+        seller_id: Seller ID
+        date_range: Date range (7d, 30d, 90d)
+
+    Returns:
+        WING dashboard metrics
+    """
+    settings = get_settings()
+    if not (settings.coupang_access_key and settings.coupang_secret_key):
+        return _sample_wing_metrics(seller_id, date_range)
+
+    try:
+        data = await fetch_wing_metrics(seller_id, date_range)
+    except ChannelRequestError as e:
+        return {"error": str(e), "seller_id": seller_id, "period": date_range}
+
+    return {
+        "seller_id": seller_id,
+        "period": date_range,
+        "source": "wing_api",
+        "metrics": data.get("metrics", {}),
+        "performance_rank": data.get("performance_rank", {}),
+        "alerts": data.get("alerts", []),
+        "recommendations": data.get("recommendations", []),
+    }
+
+
 @tool
 def get_coupang_ad_performance(
     campaign_id: str | None = None,
@@ -236,6 +262,49 @@ def submit_coupang_deal(
     }
 
 
+async def fetch_coupang_status(brand_id: str, keyword: str = "스킨케어") -> dict[str, Any]:
+    """
+    Get comprehensive Coupang channel status.
+
+    Args:
+        brand_id: Brand ID (WING seller ID)
+        keyword: Search keyword to track
+
+    Returns:
+        Channel status summary with headline dashboard metrics
+    """
+    # Get rankings
+    rankings = get_coupang_search_rankings.invoke({
+        "keyword": keyword,
+        "limit": 10,
+    })
+
+    # Get WING metrics
+    metrics = await get_coupang_wing_metrics.ainvoke({
+        "seller_id": brand_id,
+        "date_range": "7d",
+    })
+
+    # Get ad performance
+    ads = get_coupang_ad_performance.invoke({})
+
+    wing = metrics.get("metrics", {})
+    return {
+        "channel": "coupang",
+        "keyword": keyword,
+        "search_rankings": rankings,
+        "wing_metrics": metrics,
+        "ad_performance": ads,
+        "metrics": {
+            "gmv_7d": wing.get("total_sales"),
+            "orders_7d": wing.get("order_count"),
+            "category_rank": metrics.get("performance_rank", {}).get("category_rank"),
+            "roas": ads["metrics"]["roas"],
+        },
+        "summary": f"Tracking {len(rankings)} products, ROAS: {ads['metrics']['roas']}x",
+    }
+
+
 class CoupangAgent(BaseAgent):
     """
     Coupang Agent.
@@ -327,31 +396,7 @@ Respond in Korean if the user's query is in Korean."""
         Returns:
             Channel status summary
         """
-        brand_id = state.get("brand_id", "default")
-
-        # Get rankings
-        rankings = get_coupang_search_rankings.invoke({
-            "keyword": keyword,
-            "limit": 10,
-        })
-
-        # Get WING metrics
-        metrics = get_coupang_wing_metrics.invoke({
-            "seller_id": brand_id,
-            "date_range": "7d",
-        })
-
-        # Get ad performance
-        ads = get_coupang_ad_performance.invoke({})
-
-        return {
-            "channel": "coupang",
-            "keyword": keyword,
-            "search_rankings": rankings,
-            "wing_metrics": metrics,
-            "ad_performance": ads,
-            "summary": f"Tracking {len(rankings)} products, ROAS: {ads['metrics']['roas']}x",
-        }
+        return await fetch_coupang_status(state.get("brand_id", "default"), keyword)
 
     async def process(
         self,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import uuid
+from collections import Counter
 from datetime import datetime
 from typing import Any, Sequence
 
@@ -10,7 +12,16 @@ from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
 
 from backend.agents.base import BaseAgent
+from backend.channels.sync import estimate_sync_seconds, get_sync_executor
 from backend.graph.state import Division, PromotorStateDict
+from backend.inventory import check_stock_levels, find_reorder_breaches
+from backend.inventory.reorder import STATUS_SEVERITY, STOCK_STATUSES
+from backend.pricing import (
+    PRICE_VARIANCE_WARNING,
+    find_price_inconsistencies,
+    price_variance_severity,
+)
+from backend.pricing.consistency import CHANNELS
 
 
 @tool
@@ -72,17 +83,70 @@ def check_price_consistency(
         "min_price": min_price,
         "max_price": max_price,
         "price_variance": variance,
-        "is_consistent": variance < 0.05,  # Within 5%
+        "is_consistent": variance < PRICE_VARIANCE_WARNING,
+        "severity": price_variance_severity(variance),
         "lowest_channel": min(price_data["prices"], key=lambda x: price_data["prices"][x]["sale_price"]),
         "highest_channel": max(price_data["prices"], key=lambda x: price_data["prices"][x]["sale_price"]),
     }
 
-    if variance >= 0.05:
-        price_data["alert"] = f"Price variance {variance:.1%} exceeds 5% threshold"
+    if variance >= PRICE_VARIANCE_WARNING:
+        price_data["alert"] = f"Price variance {variance:.1%} exceeds {PRICE_VARIANCE_WARNING:.0%} threshold"
 
     return price_data
 
 
+@tool
+async def check_catalog_price_consistency(
+    brand: str | None = None,
+    channels: list[str] | None = None,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """
+    Check price consistency for every product at once.
+
+    Uses the latest in-stock price of each product per channel and reports
+    only products whose variance is at least 5% (10%+ is critical). A
+    brand's report across all channels is served from the background
+    precomputation when there is one.
+
+    Args:
+        brand: Only check this brand's products (None for the whole catalog)
+        channels: Channels to compare (None for all)
+        limit: Maximum violations to return, highest variance first
+
+    Returns:
+        Violation counts and the worst violating products
+    """
+    from backend.db.pricing import load_price_matrix
+    from backend.db.session import readonly_session
+    from backend.jobs import get_job_scheduler
+    from backend.jobs.precompute import PRICE_CONSISTENCY_LIMIT
+
+    channels = channels or ["oliveyoung", "coupang", "naver", "kakao"]
+    if brand is not None and set(channels) == set(CHANNELS) and limit <= PRICE_CONSISTENCY_LIMIT:
+        entry = await get_job_scheduler().get("price_consistency", brand)
+        if entry is not None:
+            report = entry["value"]
+            return {
+                **report,
+                "checked_at": entry["computed_at"],
+                "violations": report["violations"][:limit],
+                "truncated": report["warning_count"] + report["critical_count"] > limit,
+            }
+
+    async with readonly_session() as session:
+        matrix = await load_price_matrix(session, channels, brand=brand)
+
+    report = find_price_inconsistencies(matrix, limit=limit)
+    return {
+        "brand": brand,
+        "channels": channels,
+        "checked_at": datetime.now().isoformat(),
+        **report,
+        "truncated": report["warning_count"] + report["critical_count"] > limit,
+    }
+
+
 @tool
 def generate_cross_channel_report(
     brand_id: str,
@@ -151,57 +215,109 @@ def generate_cross_channel_report(
 
 
 @tool
-def sync_inventory_status(
-    product_ids: list[str],
+async def sync_inventory_status(
+    product_ids: list[str] | None = None,
+    brand: str | None = None,
+    limit: int = 50,
 ) -> dict[str, Any]:
     """
     Sync and compare inventory across channels.
 
+    All products are read at once and checked against their reorder point
+    (14 days of supply; under 7 is critical).
+
     Args:
-        product_ids: Products to check
+        product_ids: Products to check (None for the whole catalog)
+        brand: Only check this brand's products
+        limit: Maximum alerts to return, fewest days of supply first
 
     Returns:
-        Inventory status across channels
+        Per-channel inventory of the requested products, status counts per
+        channel and the listings below their reorder point
     """
-    return {
+    from backend.db.inventory import load_inventory_matrix
+    from backend.db.session import readonly_session
+
+    ids, not_found = [], []
+    for product_id in product_ids or []:
+        try:
+            ids.append(uuid.UUID(product_id))
+        except ValueError:
+            not_found.append(product_id)
+
+    async with readonly_session() as session:
+        matrix = await load_inventory_matrix(session, ids if product_ids is not None else None, brand=brand)
+
+    levels = check_stock_levels(matrix)
+    report = find_reorder_breaches(matrix, levels, limit=limit)
+    result = {
         "checked_at": datetime.now().isoformat(),
-        "products": [
-            {
-                "product_id": "prod_001",
-                "product_name": "Vitamin C Serum",
-                "inventory": {
-                    "oliveyoung": {"status": "in_stock", "units": 850},
-                    "coupang": {"status": "low_stock", "units": 120, "alert": True},
-                    "naver": {"status": "in_stock", "units": 650},
-                    "kakao": {"status": "in_stock", "units": 400},
-                },
-                "total_units": 2020,
-                "reorder_point": 500,
-                "recommendation": "Restock Coupang within 3 days",
-            },
-            {
-                "product_id": "prod_002",
-                "product_name": "Sunscreen SPF50+",
-                "inventory": {
-                    "oliveyoung": {"status": "in_stock", "units": 1200},
-                    "coupang": {"status": "in_stock", "units": 980},
-                    "naver": {"status": "in_stock", "units": 750},
-                    "kakao": {"status": "out_of_stock", "units": 0, "alert": True},
-                },
-                "total_units": 2930,
-                "reorder_point": 600,
-                "recommendation": "Replenish Kakao inventory urgently",
-            },
-        ],
-        "alerts": [
-            {"product": "Vitamin C Serum", "channel": "coupang", "severity": "medium"},
-            {"product": "Sunscreen SPF50+", "channel": "kakao", "severity": "high"},
-        ],
+        "brand": brand,
+        **{key: value for key, value in report.items() if key != "breaches"},
+        "alerts": report["breaches"],
+        "truncated": report["warning_count"] + report["critical_count"] > limit,
     }
+    if product_ids is None:
+        return result
+
+    found = {str(product_id) for product_id in matrix.product_ids}
+    not_found.extend(str(product_id) for product_id in ids if str(product_id) not in found)
+
+    # Convert once; per-element numpy indexing dominates otherwise
+    products = []
+    for product_id, name, listed, stock, days, reorder_point, status in zip(
+        matrix.product_ids,
+        matrix.product_names,
+        matrix.listed.tolist(),
+        matrix.stock.tolist(),
+        levels.days_of_supply.tolist(),
+        levels.reorder_point.tolist(),
+        levels.status.tolist(),
+    ):
+        inventory = {
+            channel: {
+                "status": STOCK_STATUSES[status[c]],
+                "units": stock[c],
+                "days_of_supply": round(days[c], 1) if days[c] != float("inf") else None,
+                "reorder_point": reorder_point[c],
+            }
+            for c, channel in enumerate(matrix.channels)
+            if listed[c]
+        }
+        products.append({
+            "product_id": str(product_id),
+            "product_name": name,
+            "inventory": inventory,
+            "total_units": sum(stock),
+            "reorder_point": sum(reorder_point),
+            "alert": any(item["status"] in STATUS_SEVERITY for item in inventory.values()),
+        })
+
+    return {**result, "products": products, "not_found": not_found}
+
+
+# Recommended enforcement steps by the most severe active violation
+MAP_ACTIONS = {
+    "critical": [
+        "Verify product authenticity with a test purchase",
+        "Report to the platform's brand protection program",
+        "Escalate to legal if counterfeit is confirmed",
+    ],
+    "high": [
+        "Issue cease and desist to unauthorized seller",
+        "Report to the platform's seller support",
+        "Review authorized seller agreements",
+    ],
+    "medium": [
+        "Contact the seller with the MAP policy",
+        "Monitor for repeat violations",
+    ],
+    "low": ["Monitor and document"],
+}
 
 
 @tool
-def detect_map_violations(
+async def detect_map_violations(
     brand_id: str,
 ) -> dict[str, Any]:
     """
@@ -213,67 +329,82 @@ def detect_map_violations(
     Returns:
         MAP violation report
     """
+    from backend.db.pricing import load_map_violations
+    from backend.db.session import readonly_session
+
+    brand = brand_id if brand_id != "default" else None
+    async with readonly_session() as session:
+        violations = await load_map_violations(session, brand=brand)
+
+    by_severity = Counter(violation["severity"] for violation in violations)
+    worst = violations[0]["severity"] if violations else None
     return {
         "brand_id": brand_id,
         "checked_at": datetime.now().isoformat(),
-        "violations": [
-            {
-                "product": "Premium Essence Set",
-                "map_price": 85000,
-                "violated_price": 68000,
-                "violation_percentage": 0.20,
-                "channel": "unauthorized_seller",
-                "seller_name": "BeautyDeals_Korea",
-                "platform": "coupang",
-                "first_detected": "2026-01-25",
-                "status": "active",
-            },
-        ],
+        "violations": violations,
         "summary": {
-            "total_violations": 1,
-            "by_severity": {"high": 1, "medium": 0, "low": 0},
-            "estimated_revenue_impact": 2_500_000,
+            "total_violations": len(violations),
+            "by_severity": {severity: by_severity.get(severity, 0) for severity in ("critical", "high", "medium", "low")},
         },
-        "recommended_actions": [
-            "Issue cease and desist to unauthorized seller",
-            "Report to Coupang seller support",
-            "Review authorized seller agreements",
-        ],
+        "recommended_actions": MAP_ACTIONS.get(worst, []),
     }
 
 
 @tool
-def create_channel_sync_task(
+async def create_channel_sync_task(
     task_type: str,
     products: list[str],
     channels: list[str],
     target_value: Any,
+    brand_id: str = "default",
 ) -> dict[str, Any]:
     """
     Create a task to sync across channels.
 
+    Price tasks wait for approval; inventory and content tasks start at once.
+    Creating the same task again returns the existing one.
+
     Args:
         task_type: Type of sync (price, inventory, content)
         products: Products to sync
         channels: Channels to sync
         target_value: Target value to sync to
+        brand_id: Brand the products belong to
 
     Returns:
         Sync task status
     """
-    return {
-        "task_id": f"sync_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-        "task_type": task_type,
-        "products": products,
-        "channels": channels,
-        "target_value": target_value,
-        "status": "created",
-        "steps": [
-            {"channel": ch, "status": "pending"} for ch in channels
-        ],
-        "estimated_completion": "2-4 hours",
-        "requires_approval": task_type == "price",
-    }
+    executor = get_sync_executor()
+    try:
+        task = await executor.submit(
+            task_type,
+            products,
+            channels,
+            target_value,
+            brand=brand_id if brand_id != "default" else None,
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+
+    seconds = estimate_sync_seconds(channels, len(products), executor.batch_size)
+    return {**task, "estimated_completion_s": round(seconds)}
+
+
+@tool
+async def get_channel_sync_task(task_id: str) -> dict[str, Any]:
+    """
+    Get the status and per-channel progress of a sync task.
+
+    Args:
+        task_id: Task ID returned by create_channel_sync_task
+
+    Returns:
+        Sync task status
+    """
+    task = await get_sync_executor().get(task_id)
+    if task is None:
+        return {"error": f"Unknown sync task: {task_id}"}
+    return task
 
 
 class CrossChannelSyncer(BaseAgent):
@@ -300,10 +431,12 @@ class CrossChannelSyncer(BaseAgent):
     ):
         default_tools = [
             check_price_consistency,
+            check_catalog_price_consistency,
             generate_cross_channel_report,
             sync_inventory_status,
             detect_map_violations,
             create_channel_sync_task,
+            get_channel_sync_task,
         ]
         all_tools = list(tools or []) + default_tools
         super().__init__(llm, all_tools)
@@ -379,7 +512,7 @@ Respond in Korean if the user's query is in Korean."""
         })
 
         # Check for MAP violations
-        violations = detect_map_violations.invoke({
+        violations = await detect_map_violations.ainvoke({
             "brand_id": brand_id,
         })
 
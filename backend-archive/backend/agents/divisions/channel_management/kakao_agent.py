@@ -10,6 +10,7 @@ from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
 
 from backend.agents.base import BaseAgent
+from backend.channels.kakao_dispatch import get_kakao_dispatcher
 from backend.graph.state import Division, PromotorStateDict
 
 
@@ -199,34 +200,90 @@ def create_kakao_gift_campaign(
 
 
 @tool
-def send_kakao_channel_message(
+async def send_kakao_channel_message(
     channel_id: str,
     message_type: str,
     content: dict[str, Any],
-    target_segment: str = "all",
+    recipients: list[str],
+    dispatch_id: str | None = None,
 ) -> dict[str, Any]:
     """
-    Send a Kakao Channel message.
+    Send a Kakao Channel message in batches, or resume an interrupted send.
 
     Args:
         channel_id: Channel ID
         message_type: Message type (text, image, carousel)
         content: Message content
-        target_segment: Target segment (all, active, dormant)
+        recipients: Recipient IDs, in the same order when resuming
+        dispatch_id: ID of an earlier send to resume (a new send if omitted)
 
     Returns:
-        Message send status
+        Delivery summary with failed batches and throughput
     """
+    dispatch_id = dispatch_id or f"msg_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+    try:
+        return await get_kakao_dispatcher().dispatch(dispatch_id, channel_id, message_type, content, recipients)
+    except ValueError as e:
+        return {"error": str(e)}
+
+
+@tool
+async def get_kakao_dispatch_status(dispatch_id: str) -> dict[str, Any]:
+    """
+    Get delivery progress of a batched Kakao Channel message send.
+
+    Args:
+        dispatch_id: Dispatch ID the send was started with
+
+    Returns:
+        Recipients sent, finished and failed batches and the resume cursor
+    """
+    status = await get_kakao_dispatcher().status(dispatch_id)
+    if status is None:
+        return {"error": f"Unknown dispatch: {dispatch_id}"}
+    return status
+
+
+async def fetch_kakao_status(brand_id: str, category: str = "skincare") -> dict[str, Any]:
+    """
+    Get comprehensive Kakao channel status.
+
+    Args:
+        brand_id: Brand ID (Kakao Channel ID)
+        category: Product category
+
+    Returns:
+        Channel status summary with headline dashboard metrics
+    """
+    # Get gift rankings
+    rankings = get_kakao_gift_rankings.invoke({
+        "category": category,
+        "limit": 10,
+    })
+
+    # Get gift metrics
+    gift_metrics = get_kakao_gift_metrics.invoke({
+        "brand_id": brand_id,
+    })
+
+    # Get channel metrics
+    channel_metrics = get_kakao_channel_metrics.invoke({
+        "channel_id": brand_id,
+    })
+
     return {
-        "message_id": f"msg_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-        "channel_id": channel_id,
-        "message_type": message_type,
-        "target_segment": target_segment,
-        "estimated_recipients": 112000,
-        "status": "scheduled",
-        "cost_estimate": 560000,  # 5 won per message
-        "scheduled_time": content.get("send_time", "immediate"),
-        "preview_url": f"https://preview.kakao.com/msg/{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        "channel": "kakao",
+        "category": category,
+        "gift_rankings": rankings,
+        "gift_metrics": gift_metrics,
+        "channel_metrics": channel_metrics,
+        "metrics": {
+            "gift_gmv_30d": gift_metrics["metrics"]["total_gmv"],
+            "gifts_sent_30d": gift_metrics["metrics"]["total_gifts_sent"],
+            "gift_ranking": rankings[0]["product_name"] if rankings else None,
+            "channel_friends": channel_metrics["friends_count"],
+        },
+        "summary": f"Friends: {channel_metrics['friends_count']:,}, Gift GMV: {gift_metrics['metrics']['total_gmv']:,}원",
     }
 
 
@@ -257,6 +314,7 @@ class KakaoAgent(BaseAgent):
             get_kakao_channel_metrics,
             create_kakao_gift_campaign,
             send_kakao_channel_message,
+            get_kakao_dispatch_status,
         ]
         all_tools = list(tools or []) + default_tools
         super().__init__(llm, all_tools)
@@ -324,32 +382,7 @@ Respond in Korean if the user's query is in Korean."""
         Returns:
             Channel status summary
         """
-        brand_id = state.get("brand_id", "default")
-
-        # Get gift rankings
-        rankings = get_kakao_gift_rankings.invoke({
-            "category": category,
-            "limit": 10,
-        })
-
-        # Get gift metrics
-        gift_metrics = get_kakao_gift_metrics.invoke({
-            "brand_id": brand_id,
-        })
-
-        # Get channel metrics
-        channel_metrics = get_kakao_channel_metrics.invoke({
-            "channel_id": brand_id,
-        })
-
-        return {
-            "channel": "kakao",
-            "category": category,
-            "gift_rankings": rankings,
-            "gift_metrics": gift_metrics,
-            "channel_metrics": channel_metrics,
-            "summary": f"Friends: {channel_metrics['friends_count']:,}, Gift GMV: {gift_metrics['metrics']['total_gmv']:,}원",
-        }
+        return await fetch_kakao_status(state.get("brand_id", "default"), category)
 
     async def process(
         self,
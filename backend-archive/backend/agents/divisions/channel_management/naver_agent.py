@@ -244,6 +244,54 @@ def book_shopping_live_slot(
     }
 
 
+async def fetch_naver_status(brand_id: str, category: str = "스킨케어") -> dict[str, Any]:
+    """
+    Get comprehensive Naver channel status.
+
+    Args:
+        brand_id: Brand ID (Smart Store ID)
+        category: Product category
+
+    Returns:
+        Channel status summary with headline dashboard metrics
+    """
+    # Get rankings
+    rankings = get_naver_shopping_rankings.invoke({
+        "category": category,
+        "limit": 10,
+    })
+
+    # Get store metrics
+    metrics = get_smart_store_metrics.invoke({
+        "store_id": brand_id,
+        "period": "7d",
+    })
+
+    # Get Live schedule
+    live = get_shopping_live_schedule.invoke({
+        "store_id": brand_id,
+    })
+
+    # Get ad performance
+    ads = get_naver_search_ad_performance.invoke({})
+
+    return {
+        "channel": "naver",
+        "category": category,
+        "shopping_rankings": rankings,
+        "store_metrics": metrics,
+        "live_schedule": live,
+        "ad_performance": ads,
+        "metrics": {
+            "gmv_7d": metrics["metrics"]["gmv"],
+            "orders_7d": metrics["metrics"]["orders"],
+            "store_grade": metrics["store_grade"],
+            "live_scheduled": len(live["scheduled_lives"]),
+        },
+        "summary": f"Store grade: {metrics['store_grade']}, CVR: {metrics['metrics']['conversion_rate']:.1%}",
+    }
+
+
 class NaverAgent(BaseAgent):
     """
     Naver Agent.
@@ -337,37 +385,7 @@ Respond in Korean if the user's query is in Korean."""
         Returns:
             Channel status summary
         """
-        brand_id = state.get("brand_id", "default")
-
-        # Get rankings
-        rankings = get_naver_shopping_rankings.invoke({
-            "category": category,
-            "limit": 10,
-        })
-
-        # Get store metrics
-        metrics = get_smart_store_metrics.invoke({
-            "store_id": brand_id,
-            "period": "7d",
-        })
-
-        # Get Live schedule
-        live = get_shopping_live_schedule.invoke({
-            "store_id": brand_id,
-        })
-
-        # Get ad performance
-        ads = get_naver_search_ad_performance.invoke({})
-
-        return {
-            "channel": "naver",
-            "category": category,
-            "shopping_rankings": rankings,
-            "store_metrics": metrics,
-            "live_schedule": live,
-            "ad_performance": ads,
-            "summary": f"Store grade: {metrics['store_grade']}, CVR: {metrics['metrics']['conversion_rate']:.1%}",
-        }
+        return await fetch_naver_status(state.get("brand_id", "default"), category)
 
     async def process(
         self,
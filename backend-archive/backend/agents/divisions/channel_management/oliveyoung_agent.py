@@ -10,27 +10,16 @@ from langchain_core.messages import BaseMessage
 from langchain_core.tools import BaseTool, tool
 
 from backend.agents.base import BaseAgent
+from backend.agents.tools import get_rank_history, get_ranking_movers
+from backend.channels import ChannelRequestError
+from backend.channels.oliveyoung import get_oliveyoung_scraper
+from backend.channels.rankings import RANKING_DEPTH, annotate_ranking
+from backend.config import get_settings
 from backend.graph.state import Division, PromotorStateDict
 
 
-@tool
-def get_oliveyoung_rankings(
-    category: str,
-    ranking_type: str = "sales",
-    limit: int = 20,
-) -> list[dict[str, Any]]:
-    """
-    Get Oliveyoung product rankings.
-
-    Args:
-        category: Product category
-        ranking_type: Type of ranking (sales, review, wish)
-        limit: Number of products to return
-
-    Returns:
-        List of ranked products
-    """
-    # Mock data - would scrape Oliveyoung in production
+def _sample_rankings(category: str, limit: int) -> list[dict[str, Any]]:
+    """Sample rankings used while Oliveyoung scraping is disabled."""
     return [
         {
             "rank": 1,
@@ -69,21 +58,43 @@ def get_oliveyoung_rankings(
 
 
 @tool
-def get_oliveyoung_deals(
-    category: str | None = None,
-    deal_type: str = "all",
-) -> list[dict[str, Any]]:
+async def get_oliveyoung_rankings(
+    category: str,
+    ranking_type: str = "sales",
+    limit: int = 20,
+) -> list[dict[str, Any]] | dict[str, Any]:
     """
-    Get current Oliveyoung deals and promotions.
+    Get Oliveyoung product rankings.
 
     Args:
-        category: Optional category filter
-        deal_type: Type of deal (all, 1plus1, bundle, flash)
+        category: Product category
+        ranking_type: Type of ranking (sales, review, wish)
+        limit: Number of products to return
 
     Returns:
-        List of active deals
+        List of ranked products; live rankings carry previous_rank and
+        rank_change against the latest recorded snapshot
     """
-    today = datetime.now()
+    from backend.db.rankings import compare_ranking
+    from backend.db.session import readonly_session
+
+    if not get_settings().oliveyoung_scraping_enabled:
+        return _sample_rankings(category, limit)
+
+    try:
+        rankings = await get_oliveyoung_scraper().rankings(category, ranking_type, RANKING_DEPTH)
+    except ChannelRequestError as e:
+        return {"error": str(e), "category": category, "ranking_type": ranking_type}
+
+    # Snapshots are recorded by the ranking_snapshots job, not on read
+    scope = f"{category}:{ranking_type}"
+    async with readonly_session() as session:
+        movement = await compare_ranking(session, "oliveyoung", scope, rankings)
+    return annotate_ranking(rankings, movement)[:limit]
+
+
+def _sample_deals() -> list[dict[str, Any]]:
+    """Sample deals used while Oliveyoung scraping is disabled."""
     return [
         {
             "deal_id": "deal_001",
@@ -116,22 +127,31 @@ def get_oliveyoung_deals(
 
 
 @tool
-def get_oliveyoung_product_reviews(
-    product_id: str,
-    limit: int = 50,
-    sort_by: str = "recent",
-) -> dict[str, Any]:
+async def get_oliveyoung_deals(
+    category: str | None = None,
+    deal_type: str = "all",
+) -> list[dict[str, Any]] | dict[str, Any]:
     """
-    Get product reviews from Oliveyoung.
+    Get current Oliveyoung deals and promotions.
 
     Args:
-        product_id: Product ID
-        limit: Number of reviews to fetch
-        sort_by: Sort order (recent, helpful, rating_high, rating_low)
+        category: Optional category filter
+        deal_type: Type of deal (all, 1plus1, bundle, flash)
 
     Returns:
-        Reviews with sentiment analysis
+        List of active deals
     """
+    if not get_settings().oliveyoung_scraping_enabled:
+        return _sample_deals()
+
+    try:
+        return await get_oliveyoung_scraper().deals(category, deal_type)
+    except ChannelRequestError as e:
+        return {"error": str(e), "category": category, "deal_type": deal_type}
+
+
+def _sample_reviews(product_id: str) -> dict[str, Any]:
+    """Sample reviews used while Oliveyoung scraping is disabled."""
     return {
         "product_id": product_id,
         "total_reviews": 1250,
@@ -165,6 +185,32 @@ def get_oliveyoung_product_reviews(
     }
 
 
+@tool
+async def get_oliveyoung_product_reviews(
+    product_id: str,
+    limit: int = 50,
+    sort_by: str = "recent",
+) -> dict[str, Any]:
+    """
+    Get product reviews from Oliveyoung.
+
+    Args:
+        product_id: Product ID
+        limit: Number of reviews to fetch
+        sort_by: Sort order (recent, helpful, rating_high, rating_low)
+
+    Returns:
+        Reviews with sentiment analysis
+    """
+    if not get_settings().oliveyoung_scraping_enabled:
+        return _sample_reviews(product_id)
+
+    try:
+        return await get_oliveyoung_scraper().reviews(product_id, limit, sort_by)
+    except ChannelRequestError as e:
+        return {"error": str(e), "product_id": product_id}
+
+
 @tool
 def check_oliveyoung_inventory(
     product_ids: list[str],
@@ -235,6 +281,60 @@ def apply_oliveyoung_deal_slot(
     }
 
 
+async def fetch_oliveyoung_status(brand_id: str, category: str = "skincare") -> dict[str, Any]:
+    """
+    Get comprehensive Oliveyoung channel status.
+
+    Args:
+        brand_id: Brand ID (brand name as listed on Oliveyoung)
+        category: Product category
+
+    Returns:
+        Channel status summary with headline dashboard metrics, including
+        the brand's ranked products and deals
+    """
+    # Get rankings
+    rankings = await get_oliveyoung_rankings.ainvoke({
+        "category": category,
+        "ranking_type": "sales",
+        "limit": 10,
+    })
+
+    # Get deals
+    deals = await get_oliveyoung_deals.ainvoke({
+        "category": category,
+    })
+
+    deal_count = len(deals) if isinstance(deals, list) else 0
+    brand = brand_id.casefold()
+    brand_ranks = [
+        item["rank"]
+        for item in (rankings if isinstance(rankings, list) else [])
+        if str(item.get("brand", "")).casefold() == brand
+    ]
+    brand_deals = sum(
+        str(deal.get("brand", "")).casefold() == brand
+        for deal in (deals if isinstance(deals, list) else [])
+    )
+    return {
+        "channel": "oliveyoung",
+        "brand_id": brand_id,
+        "category": category,
+        "rankings_snapshot": rankings,
+        "active_deals": deals,
+        "metrics": {
+            "active_deals": deal_count,
+            "top_ranked": rankings[0]["product_name"] if isinstance(rankings, list) and rankings else None,
+            "brand_ranks": brand_ranks,
+            "brand_deals": brand_deals,
+        },
+        "summary": (
+            f"Top 10 rankings and {deal_count} active deals tracked, "
+            f"{len(brand_ranks)} ranked for {brand_id}"
+        ),
+    }
+
+
 class OliveyoungAgent(BaseAgent):
     """
     Oliveyoung Agent.
@@ -258,6 +358,8 @@ class OliveyoungAgent(BaseAgent):
     ):
         default_tools = [
             get_oliveyoung_rankings,
+            get_ranking_movers,
+            get_rank_history,
             get_oliveyoung_deals,
             get_oliveyoung_product_reviews,
             check_oliveyoung_inventory,
@@ -323,25 +425,7 @@ Respond in Korean if the user's query is in Korean."""
         Returns:
             Channel status summary
         """
-        # Get rankings
-        rankings = get_oliveyoung_rankings.invoke({
-            "category": category,
-            "ranking_type": "sales",
-            "limit": 10,
-        })
-
-        # Get deals
-        deals = get_oliveyoung_deals.invoke({
-            "category": category,
-        })
-
-        return {
-            "channel": "oliveyoung",
-            "category": category,
-            "rankings_snapshot": rankings,
-            "active_deals": deals,
-            "summary": f"Top 10 rankings and {len(deals)} active deals tracked",
-        }
+        return await fetch_oliveyoung_status(state.get("brand_id", "default"), category)
 
     async def process(
         self,
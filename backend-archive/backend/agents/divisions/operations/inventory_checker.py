@@ -74,62 +74,29 @@ def get_inventory_status(
 
 
 @tool
-def get_inventory_alerts(
+async def get_inventory_alerts(
     brand_id: str,
     severity: str = "all",
-) -> list[dict[str, Any]]:
+) -> list[dict[str, Any]] | dict[str, Any]:
     """
-    Get inventory alerts.
+    Get inventory alerts (critical under 7 days of supply, warning under 14).
+
+    Served from the background precomputation, computed now if there is none.
 
     Args:
         brand_id: Brand ID
         severity: Filter by severity (all, critical, warning)
 
     Returns:
-        List of inventory alerts
+        List of inventory alerts, fewest days of supply first
     """
-    alerts = [
-        {
-            "alert_id": "inv_alert_001",
-            "severity": "critical",
-            "product_id": "prod_003",
-            "product_name": "Retinol Night Cream 50ml",
-            "channel": "oliveyoung",
-            "current_stock": 45,
-            "days_of_supply": 3,
-            "daily_sales_avg": 15,
-            "message": "Critical stock level - stockout imminent",
-            "action_required": "Emergency restock",
-            "created_at": datetime.now().isoformat(),
-        },
-        {
-            "alert_id": "inv_alert_002",
-            "severity": "critical",
-            "product_id": "prod_007",
-            "product_name": "SPF50 Sunscreen",
-            "channel": "coupang",
-            "current_stock": 120,
-            "days_of_supply": 5,
-            "daily_sales_avg": 24,
-            "message": "Critical stock level during peak season",
-            "action_required": "Urgent restock for Rocket delivery",
-            "created_at": datetime.now().isoformat(),
-        },
-        {
-            "alert_id": "inv_alert_003",
-            "severity": "warning",
-            "product_id": "prod_012",
-            "product_name": "Vitamin C Serum 30ml",
-            "channel": "kakao",
-            "current_stock": 280,
-            "days_of_supply": 12,
-            "daily_sales_avg": 23,
-            "message": "Low stock warning",
-            "action_required": "Plan restock within 7 days",
-            "created_at": datetime.now().isoformat(),
-        },
-    ]
+    from backend.jobs import get_job_scheduler
+
+    entry = await get_job_scheduler().get("inventory_alerts", brand_id)
+    if entry is None:
+        return {"error": f"Inventory alerts for {brand_id} are not available"}
 
+    alerts = [{**alert, "created_at": entry["computed_at"]} for alert in entry["value"]["alerts"]]
     if severity != "all":
         alerts = [a for a in alerts if a["severity"] == severity]
 
@@ -293,7 +260,7 @@ Respond in Korean if the user's query is in Korean."""
 
         # Get current alerts
         brand_id = state.get("brand_id", "default")
-        alerts = get_inventory_alerts.invoke({
+        alerts = await get_inventory_alerts.ainvoke({
             "brand_id": brand_id,
             "severity": "all",
         })
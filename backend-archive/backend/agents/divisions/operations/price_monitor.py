@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timedelta
 from typing import Any, Sequence
 
 from langchain_core.language_models import BaseChatModel
@@ -11,10 +12,12 @@ from langchain_core.tools import BaseTool, tool
 
 from backend.agents.base import BaseAgent
 from backend.graph.state import Division, PromotorStateDict
+from backend.pricing import map_detector
+from backend.pricing.map_monitor import SEVERITIES
 
 
 @tool
-def scan_price_violations(
+async def scan_price_violations(
     brand_id: str,
     channels: list[str] | None = None,
 ) -> dict[str, Any]:
@@ -28,59 +31,24 @@ def scan_price_violations(
     Returns:
         Price violation scan results
     """
+    from backend.db.pricing import load_map_violations
+    from backend.db.session import readonly_session
+
+    # "default" is the graph state's placeholder when no brand is selected
+    brand = brand_id if brand_id != "default" else None
+    async with readonly_session() as session:
+        violations = await load_map_violations(session, brand=brand, platforms=channels)
+
+    by_severity = Counter(violation["severity"] for violation in violations)
     return {
         "brand_id": brand_id,
         "scan_date": datetime.now().isoformat(),
-        "channels_scanned": channels or ["coupang", "naver", "11st", "gmarket"],
-        "total_listings_found": 156,
-        "authorized_listings": 124,
-        "unauthorized_listings": 32,
-        "violations": [
-            {
-                "violation_id": "vio_001",
-                "type": "unauthorized_seller",
-                "platform": "coupang",
-                "seller_name": "BeautyDeals_Korea",
-                "product": "Premium Essence Set",
-                "map_price": 85000,
-                "selling_price": 68000,
-                "discount_from_map": 0.20,
-                "first_seen": "2026-01-20",
-                "status": "active",
-                "severity": "high",
-            },
-            {
-                "violation_id": "vio_002",
-                "type": "price_below_map",
-                "platform": "naver",
-                "seller_name": "CosmeticOutlet",
-                "product": "Vitamin C Serum",
-                "map_price": 35000,
-                "selling_price": 28000,
-                "discount_from_map": 0.20,
-                "first_seen": "2026-01-25",
-                "status": "active",
-                "severity": "medium",
-            },
-            {
-                "violation_id": "vio_003",
-                "type": "counterfeit_suspected",
-                "platform": "11st",
-                "seller_name": "GlobalBeauty",
-                "product": "Premium Cream",
-                "map_price": 65000,
-                "selling_price": 32000,
-                "discount_from_map": 0.51,
-                "first_seen": "2026-01-22",
-                "status": "investigating",
-                "severity": "critical",
-            },
-        ],
+        "channels_scanned": channels or sorted({violation["platform"] for violation in violations}),
+        "unauthorized_listings": sum(not violation["authorized"] for violation in violations),
+        "violations": violations,
         "summary": {
-            "high_severity": 1,
-            "medium_severity": 1,
-            "critical_severity": 1,
-            "estimated_revenue_impact": 8_500_000,
+            f"{severity}_severity": by_severity.get(severity, 0)
+            for severity in reversed(SEVERITIES)
         },
     }
 
@@ -137,10 +105,11 @@ def track_reseller_activity(
 
 
 @tool
-def get_price_history(
+async def get_price_history(
     product_id: str,
     channel: str,
     days: int = 30,
+    seller: str | None = None,
 ) -> dict[str, Any]:
     """
     Get price history for a product on a channel.
@@ -149,32 +118,41 @@ def get_price_history(
         product_id: Product ID
         channel: Channel name
         days: Days of history
+        seller: Optional seller; every seller on the channel if omitted
 
     Returns:
         Price history data
     """
+    from backend.db.pricing import load_price_history
+    from backend.db.session import readonly_session
+
+    await map_detector.ensure_fresh(readonly_session)
+    end = datetime.now().astimezone()
+    start = end - timedelta(days=days)
+    async with readonly_session() as session:
+        history = await load_price_history(session, product_id, channel, start, end, seller=seller)
+
+    series = []
+    lows, highs = [], []
+    for name, prices in history.items():
+        lows.append(int(prices.low.min()))
+        highs.append(int(prices.high.max()))
+        series.append({
+            "seller": name,
+            "resolution": prices.resolution,
+            "current_price": int(prices.last[-1]),
+            "price_history": prices.records(),
+        })
+
     return {
         "product_id": product_id,
-        "product_name": "Vitamin C Serum 30ml",
         "channel": channel,
         "period_days": days,
-        "current_price": 28000,
-        "map_price": 35000,
-        "price_history": [
-            {"date": "2026-01-01", "price": 35000, "promotion": None},
-            {"date": "2026-01-10", "price": 28000, "promotion": "Winter Sale"},
-            {"date": "2026-01-20", "price": 31500, "promotion": None},
-            {"date": "2026-01-25", "price": 28000, "promotion": "Flash Deal"},
-        ],
+        "map_price": map_detector.map_prices.get(product_id),
+        "sellers": series,
         "price_metrics": {
-            "min_price": 28000,
-            "max_price": 35000,
-            "avg_price": 30625,
-            "time_on_promotion": 0.35,
-        },
-        "competitor_comparison": {
-            "competitor_avg": 29500,
-            "price_position": "below_market",
+            "min_price": min(lows) if lows else None,
+            "max_price": max(highs) if highs else None,
         },
     }
 
@@ -299,7 +277,7 @@ Respond in Korean if the user's query is in Korean."""
 
         # Get current violations
         brand_id = state.get("brand_id", "default")
-        violations = scan_price_violations.invoke({
+        violations = await scan_price_violations.ainvoke({
             "brand_id": brand_id,
         })
 
@@ -8,6 +8,7 @@ from backend.agents.tools.common_tools import (
     format_percentage,
     calculate_date_range,
 )
+from backend.agents.tools.ranking_tools import get_rank_history, get_ranking_movers
 
 __all__ = [
     "cache_result",
@@ -16,4 +17,6 @@ __all__ = [
     "format_korean_currency",
     "format_percentage",
     "calculate_date_range",
+    "get_rank_history",
+    "get_ranking_movers",
 ]
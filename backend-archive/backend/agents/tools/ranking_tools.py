@@ -0,0 +1,62 @@
+"""Ranking movement tools shared by the channel agents."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from langchain_core.tools import tool
+
+
+@tool
+async def get_rank_history(
+    channel: str,
+    scope: str,
+    product: str,
+    days: int = 30,
+) -> dict[str, Any]:
+    """
+    Get a product's rank movement on a channel leaderboard.
+
+    Args:
+        channel: Channel name (oliveyoung)
+        scope: Leaderboard scope, e.g. "skincare:sales"
+        product: Channel product ID, or product name where the channel has none
+        days: Days of history
+
+    Returns:
+        Rank at the start of the window, every change since, and best/worst rank
+    """
+    from backend.db.rankings import load_rank_history
+    from backend.db.session import readonly_session
+
+    since = datetime.now().astimezone() - timedelta(days=days)
+    async with readonly_session() as session:
+        return await load_rank_history(session, channel, scope, product, since)
+
+
+@tool
+async def get_ranking_movers(
+    channel: str,
+    scope: str,
+    hours: int = 24,
+    limit: int = 10,
+) -> dict[str, Any]:
+    """
+    Get the biggest rank movers on a channel leaderboard.
+
+    Args:
+        channel: Channel name (oliveyoung)
+        scope: Leaderboard scope, e.g. "skincare:sales"
+        hours: Compare against the list from this many hours ago
+        limit: Products per list
+
+    Returns:
+        Risers, fallers, new entries and products that dropped out
+    """
+    from backend.db.rankings import load_ranking_movers
+    from backend.db.session import readonly_session
+
+    since = datetime.now().astimezone() - timedelta(hours=hours)
+    async with readonly_session() as session:
+        return await load_ranking_movers(session, channel, scope, since, limit)
@@ -0,0 +1,299 @@
+"""Cross-worker event bus for WebSocket fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from backend.config import get_settings
+
+if TYPE_CHECKING:
+    from backend.api.websocket import ConnectionManager
+
+
+class Backplane(ABC):
+    """
+    Pub/sub transport shared by every worker.
+
+    Messages are batches (lists) of event envelopes. Every subscriber,
+    including the publishing worker, receives every batch.
+    """
+
+    @abstractmethod
+    async def publish(self, events: list[dict[str, Any]]) -> None: ...
+
+    @abstractmethod
+    def listen(self) -> AsyncIterator[list[dict[str, Any]]]: ...
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryBackplane(Backplane):
+    """In-process backplane; share one instance between buses to simulate workers."""
+
+    def __init__(self):
+        self._listeners: list[asyncio.Queue[list[dict[str, Any]]]] = []
+
+    async def publish(self, events: list[dict[str, Any]]) -> None:
+        for queue in self._listeners:
+            queue.put_nowait(events)
+
+    async def listen(self) -> AsyncIterator[list[dict[str, Any]]]:
+        queue: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue()
+        self._listeners.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._listeners.remove(queue)
+
+
+class RedisBackplane(Backplane):
+    """Redis pub/sub backplane; each batch is one JSON-encoded message."""
+
+    def __init__(self, url: str, channel: str):
+        self.url = url
+        self.channel = channel
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+        return self._client
+
+    async def publish(self, events: list[dict[str, Any]]) -> None:
+        await self._get_client().publish(self.channel, json.dumps(events))
+
+    async def listen(self) -> AsyncIterator[list[dict[str, Any]]]:
+        pubsub = self._get_client().pubsub()
+        await pubsub.subscribe(self.channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield json.loads(message["data"])
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_backplane() -> Backplane:
+    """Create the backplane selected by settings.websocket_backplane."""
+    settings = get_settings()
+    if settings.websocket_backplane == "redis":
+        return RedisBackplane(settings.redis_url, settings.websocket_backplane_channel)
+    return InMemoryBackplane()
+
+
+class EventBus:
+    """
+    Publishes WebSocket events to every worker and fans them out locally.
+
+    Outgoing events are batched into one backplane message per flush. Each
+    worker listens once and delivers received events to its own sockets
+    through the ConnectionManager, skipping event ids it has already seen.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        backplane: Backplane | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        dedup_size: int | None = None,
+    ):
+        """
+        Initialize the bus.
+
+        Args:
+            manager: Local connection manager events are delivered to
+            backplane: Transport shared by all workers (defaults to settings)
+            batch_size: Maximum events per backplane message
+            flush_interval: Maximum seconds an event waits before being sent
+            dedup_size: Number of recent event ids remembered for duplicate suppression
+        """
+        settings = get_settings()
+        self.manager = manager
+        self.backplane = backplane or create_backplane()
+        self.batch_size = batch_size or settings.websocket_event_batch_size
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.websocket_event_flush_interval_ms / 1000
+        )
+        self.dedup_size = dedup_size or settings.websocket_event_dedup_size
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._buffer: list[dict[str, Any]] = []
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._listen_task: asyncio.Task | None = None
+        self.stats = {"published": 0, "batches_sent": 0, "received": 0, "duplicates": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._listen_task is not None
+
+    async def publish(
+        self,
+        message: dict[str, Any],
+        topics: list[str] | None = None,
+        event_id: str | None = None,
+        kind: str = "message",
+    ) -> str:
+        """
+        Queue an event for every worker.
+
+        Args:
+            message: WebSocket message payload
+            topics: Subscription topics; None sends to every connection
+            event_id: Stable id for duplicate suppression (generated if omitted)
+            kind: "message" to send as is, or "metric" for a metric snapshot
+                ({"metric_type", "data"}) that each worker delta-encodes
+
+        Returns:
+            The event id
+        """
+        event = {
+            "id": event_id or uuid.uuid4().hex,
+            "origin": self.worker_id,
+            "kind": kind,
+            "topics": topics,
+            "message": message,
+        }
+        self.stats["published"] += 1
+
+        if not self.running:
+            # No backplane loop (e.g. scripts and tests): deliver locally
+            await self.deliver([event])
+            return event["id"]
+
+        self._buffer.append(event)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return event["id"]
+
+    async def flush(self) -> int:
+        """
+        Send buffered events to the backplane.
+
+        Returns:
+            Number of events sent
+        """
+        if not self._buffer:
+            return 0
+
+        events, self._buffer = self._buffer, []
+        try:
+            for start in range(0, len(events), self.batch_size):
+                await self.backplane.publish(events[start : start + self.batch_size])
+                self.stats["batches_sent"] += 1
+        except Exception:
+            # Keep the events for the next flush
+            self._buffer[:0] = events
+            raise
+        return len(events)
+
+    def _is_duplicate(self, event_id: str) -> bool:
+        if event_id in self._seen:
+            self._seen.move_to_end(event_id)
+            return True
+        self._seen[event_id] = None
+        if len(self._seen) > self.dedup_size:
+            self._seen.popitem(last=False)
+        return False
+
+    async def deliver(self, events: list[dict[str, Any]]) -> int:
+        """
+        Fan a batch of events out to local connections.
+
+        Returns:
+            Number of events delivered (duplicates excluded)
+        """
+        delivered = 0
+        for event in events:
+            self.stats["received"] += 1
+            if self._is_duplicate(event["id"]):
+                self.stats["duplicates"] += 1
+                continue
+            if event.get("kind") == "metric":
+                message = event["message"]
+                await self.manager.publish_metric(message["metric_type"], event["topics"], message["data"])
+            elif event["topics"] is None:
+                await self.manager.broadcast(event["message"])
+            else:
+                await self.manager.publish(event["topics"], event["message"])
+            delivered += 1
+        return delivered
+
+    async def _run_flush(self) -> None:
+        """Background loop sending batches."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Event bus flush failed: {e}")
+
+    async def _run_listen(self) -> None:
+        """Background loop receiving batches from every worker."""
+        while True:
+            try:
+                async for events in self.backplane.listen():
+                    await self.deliver(events)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Event bus listener failed, reconnecting: {e}")
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        """Start the listener and flush loops."""
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._run_listen())
+            self._flush_task = asyncio.create_task(self._run_flush())
+
+    async def stop(self) -> None:
+        """Flush pending events and stop the background loops."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"Event bus final flush failed: {e}")
+
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+
+        await self.backplane.close()
@@ -0,0 +1,161 @@
+"""Server-driven WebSocket heartbeats and idle-timeout reaping."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from backend.config import get_settings
+
+if TYPE_CHECKING:
+    from backend.api.websocket import ClientConnection, ConnectionManager
+
+# 1001: going away
+IDLE_CLOSE_CODE = 1001
+
+
+class HeartbeatMonitor:
+    """
+    Pings idle connections and reaps ones that stop answering.
+
+    All connections share one min-heap of check deadlines driven by a single
+    task, instead of one sleeping task per socket. Entries are never removed
+    in place: a popped entry for a connection that was active since it was
+    scheduled is simply pushed back at its new deadline, and entries for
+    closed connections are dropped. Each connection is therefore looked at
+    about once per heartbeat interval, at O(log n) per look.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        interval: float | None = None,
+        timeout: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            manager: Connection manager whose sockets are monitored
+            interval: Seconds of silence before the server sends a heartbeat
+            timeout: Seconds of silence before a connection is reaped
+            clock: Monotonic time source (injectable for tests)
+        """
+        settings = get_settings()
+        self.manager = manager
+        self.interval = interval or settings.websocket_heartbeat_interval_s
+        self.timeout = timeout or settings.websocket_idle_timeout_s
+        self.clock = clock
+
+        self._heap: list[tuple[float, int, ClientConnection]] = []
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+
+        self.heartbeats_sent = 0
+        self.reaped = 0
+        self.rtt_count = 0
+        self.rtt_total = 0.0
+        self.rtt_max = 0.0
+        self.rtt_last: float | None = None
+
+    def _schedule(self, connection: ClientConnection, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._counter), connection))
+
+    def track(self, connection: ClientConnection) -> None:
+        """Start monitoring a new connection."""
+        connection.last_seen = self.clock()
+        connection.heartbeat_sent_at = None
+        self._schedule(connection, connection.last_seen + self.interval)
+
+    def touch(self, connection: ClientConnection) -> None:
+        """Record activity from the client; any received frame counts."""
+        connection.last_seen = self.clock()
+
+    def record_ack(self, connection: ClientConnection) -> None:
+        """Record a heartbeat_ack and its round-trip time."""
+        now = self.clock()
+        connection.last_seen = now
+        if connection.heartbeat_sent_at is None:
+            return
+        rtt = now - connection.heartbeat_sent_at
+        connection.heartbeat_sent_at = None
+        self.rtt_count += 1
+        self.rtt_total += rtt
+        self.rtt_max = max(self.rtt_max, rtt)
+        self.rtt_last = rtt
+
+    def check(self) -> int:
+        """
+        Process every connection whose deadline has passed.
+
+        Returns:
+            Number of connections reaped
+        """
+        now = self.clock()
+        heap = self._heap
+        reaped = 0
+
+        while heap and heap[0][0] <= now:
+            _, _, connection = heapq.heappop(heap)
+            if connection.closed:
+                continue
+
+            idle = now - connection.last_seen
+            if idle >= self.timeout:
+                self.manager.drop(connection, IDLE_CLOSE_CODE)
+                reaped += 1
+            elif idle >= self.interval:
+                if connection.heartbeat_sent_at is None:
+                    connection.heartbeat_sent_at = now
+                    connection.send({"type": "heartbeat", "ts": int(time.time() * 1000)})
+                    self.heartbeats_sent += 1
+                self._schedule(connection, min(now + self.interval, connection.last_seen + self.timeout))
+            else:
+                self._schedule(connection, connection.last_seen + self.interval)
+
+        self.reaped += reaped
+        return reaped
+
+    async def _run(self) -> None:
+        """Background loop sleeping until the earliest deadline."""
+        while True:
+            delay = self._heap[0][0] - self.clock() if self._heap else self.interval
+            # Bounded so new connections and clock jitter are picked up promptly
+            await asyncio.sleep(min(max(delay, 0.05), 1.0))
+            self.check()
+
+    def start(self) -> None:
+        """Start the heartbeat loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the heartbeat loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Heartbeat metrics."""
+        return {
+            "scheduled": len(self._heap),
+            "heartbeat_interval_s": self.interval,
+            "idle_timeout_s": self.timeout,
+            "heartbeats_sent": self.heartbeats_sent,
+            "reaped": self.reaped,
+            "rtt_ms": {
+                "count": self.rtt_count,
+                "avg": round(self.rtt_total / self.rtt_count * 1000, 2) if self.rtt_count else None,
+                "max": round(self.rtt_max * 1000, 2),
+                "last": round(self.rtt_last * 1000, 2) if self.rtt_last is not None else None,
+            },
+        }
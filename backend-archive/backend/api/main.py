@@ -6,8 +6,18 @@ from typing import Any
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.api.routes import agents, chat, dashboard, health
+from backend.api.routes import agents, chat, dashboard, health, prices, sync
+from backend.api.websocket import event_bus, manager, websocket_endpoint
+from backend.channels import (
+    close_browser_pool,
+    close_channel_clients,
+    close_channel_status_aggregator,
+    close_sync_executor,
+    get_sync_executor,
+)
 from backend.config import get_settings
+from backend.db.alert_writer import alert_writer
+from backend.jobs import close_job_scheduler, get_job_scheduler
 
 
 @asynccontextmanager
@@ -22,11 +32,25 @@ async def lifespan(app: FastAPI):
     # await init_database()
     # await init_redis()
     # await init_agents()
+    alert_writer.start()
+    event_bus.start()
+    manager.heartbeat.start()
+    if settings.background_job_executor == "local":
+        get_job_scheduler().start()
+    get_sync_executor().start()
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    await close_job_scheduler()
+    await close_sync_executor()
+    await alert_writer.stop()
+    await manager.heartbeat.stop()
+    await event_bus.stop()
+    await close_channel_status_aggregator()
+    await close_channel_clients()
+    await close_browser_pool()
     # await close_database()
     # await close_redis()
 
@@ -56,6 +80,9 @@ def create_app() -> FastAPI:
     app.include_router(chat.router, prefix="/api/chat", tags=["Chat"])
     app.include_router(agents.router, prefix="/api/agents", tags=["Agents"])
     app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
+    app.include_router(sync.router, prefix="/api/sync", tags=["Sync"])
+    app.include_router(prices.router, prefix="/api/prices", tags=["Prices"])
+    app.add_api_websocket_route("/ws/{client_id}", websocket_endpoint)
 
     return app
 
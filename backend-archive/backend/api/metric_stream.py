@@ -0,0 +1,150 @@
+"""Delta encoding of metric updates streamed over WebSocket."""
+
+from __future__ import annotations
+
+import copy
+from datetime import datetime
+from typing import Any
+
+from backend.config import get_settings
+
+Path = list[str]
+
+
+def diff(old: dict[str, Any], new: dict[str, Any]) -> tuple[dict[str, Any], list[Path]]:
+    """
+    Compute the changes turning ``old`` into ``new``.
+
+    Nested dicts are compared key by key; any other value is replaced whole.
+
+    Returns:
+        (changes, removed) where ``changes`` is a nested dict of new or
+        changed values and ``removed`` lists key paths that no longer exist
+    """
+    changes: dict[str, Any] = {}
+    removed: list[Path] = []
+
+    for key, value in new.items():
+        if key not in old:
+            changes[key] = value
+            continue
+        previous = old[key]
+        if isinstance(value, dict) and isinstance(previous, dict):
+            sub_changes, sub_removed = diff(previous, value)
+            if sub_changes:
+                changes[key] = sub_changes
+            removed.extend([key, *path] for path in sub_removed)
+        elif previous != value:
+            changes[key] = value
+
+    removed.extend([key] for key in old if key not in new)
+    return changes, removed
+
+
+def apply_delta(snapshot: dict[str, Any], changes: dict[str, Any], removed: list[Path]) -> dict[str, Any]:
+    """Apply a delta to a snapshot in place (the client-side counterpart of ``diff``)."""
+    for path in removed:
+        target = snapshot
+        for key in path[:-1]:
+            target = target[key]
+        target.pop(path[-1], None)
+
+    def merge(target: dict[str, Any], updates: dict[str, Any]) -> None:
+        for key, value in updates.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                merge(target[key], value)
+            else:
+                target[key] = value
+
+    merge(snapshot, changes)
+    return snapshot
+
+
+class MetricStream:
+    """Last snapshot and sequence number of one metric stream."""
+
+    def __init__(self, key: str, metric_type: str, topics: list[str]):
+        self.key = key
+        self.metric_type = metric_type
+        self.topics = topics
+        self.seq = 0
+        self.snapshot: dict[str, Any] = {}
+        self.since_keyframe = 0
+
+    def keyframe(self) -> dict[str, Any]:
+        """Full-state message for this stream at its current sequence number."""
+        return {
+            "type": "metric_update",
+            "metric_type": self.metric_type,
+            "stream": self.key,
+            "seq": self.seq,
+            "keyframe": True,
+            "data": self.snapshot,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+
+class MetricDeltaEncoder:
+    """
+    Turns full metric snapshots into sequenced deltas.
+
+    Each stream (metric type plus brand/channel scope) remembers the last
+    snapshot sent. Updates carry only changed fields; every
+    ``keyframe_interval`` updates a full keyframe is sent so clients that
+    missed a sequence number can resync without asking.
+    """
+
+    def __init__(self, keyframe_interval: int | None = None):
+        self.keyframe_interval = (
+            keyframe_interval or get_settings().websocket_metric_keyframe_interval
+        )
+        self.streams: dict[str, MetricStream] = {}
+
+    def encode(
+        self,
+        metric_type: str,
+        topics: list[str],
+        data: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """
+        Record a new snapshot and build the message to send.
+
+        Args:
+            metric_type: Metric type, e.g. "inventory"
+            topics: Topics the update is published under (identifies the stream)
+            data: Full current metric data
+
+        Returns:
+            A keyframe or delta message, or None if nothing changed
+        """
+        key = ",".join(topics)
+        stream = self.streams.get(key)
+        if stream is None:
+            stream = self.streams[key] = MetricStream(key, metric_type, topics)
+
+        changes, removed = diff(stream.snapshot, data)
+        if stream.seq and not changes and not removed:
+            return None
+
+        stream.seq += 1
+        stream.snapshot = copy.deepcopy(data)
+        stream.since_keyframe += 1
+
+        if stream.seq == 1 or stream.since_keyframe >= self.keyframe_interval:
+            stream.since_keyframe = 0
+            return stream.keyframe()
+
+        return {
+            "type": "metric_delta",
+            "metric_type": metric_type,
+            "stream": key,
+            "seq": stream.seq,
+            "changes": changes,
+            "removed": removed,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    def keyframe(self, key: str) -> dict[str, Any] | None:
+        """Current keyframe of a stream, for clients resyncing after a gap."""
+        stream = self.streams.get(key)
+        return stream.keyframe() if stream is not None else None
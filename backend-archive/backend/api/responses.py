@@ -0,0 +1,22 @@
+"""Response classes for the API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+
+    orjson natively handles UUID, datetime, date and enum values, so list
+    endpoints can return projected rows directly instead of building
+    pre-stringified dicts. Return an instance of this class from the endpoint
+    (rather than a plain dict) to also skip FastAPI's jsonable_encoder pass.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
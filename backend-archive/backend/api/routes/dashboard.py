@@ -5,14 +5,18 @@ from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import func, select
+from pydantic import BaseModel, Field
+from sqlalchemy import BigInteger, case, cast, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from backend.db.session import get_db
-from backend.models import Alert, CalendarEvent, Inventory, Promotion
-from backend.models.alert import AlertSeverity
+from backend.api.responses import ORJSONResponse
+from backend.channels import get_channel_status_aggregator
+from backend.db.sales import get_period_change
+from backend.db.session import get_db, get_readonly_db
+from backend.jobs import get_job_scheduler
+from backend.models import Alert, Budget, CalendarEvent, Inventory, Product, Promotion
+from backend.models.alert import AlertSeverity, AlertType
 from backend.models.promotion import PromotionStatus
 
 router = APIRouter()
@@ -27,6 +31,20 @@ class ChannelStatus(BaseModel):
     metrics: dict[str, Any]
 
 
+class BulkAcknowledgeRequest(BaseModel):
+    """Bulk alert acknowledgement request.
+
+    Alerts are selected by ``alert_ids`` and/or the filter fields; all given
+    criteria must match. At least one criterion is required.
+    """
+
+    alert_ids: list[UUID] | None = Field(default=None, max_length=10000)
+    alert_type: AlertType | None = None
+    severity: AlertSeverity | None = None
+    channel: str | None = None
+    created_before: datetime | None = None
+
+
 class DashboardMetrics(BaseModel):
     """Dashboard metrics model."""
 
@@ -37,7 +55,7 @@ class DashboardMetrics(BaseModel):
 
 
 @router.get("/metrics")
-async def get_dashboard_metrics(db: AsyncSession = Depends(get_db)):
+async def get_dashboard_metrics(db: AsyncSession = Depends(get_readonly_db)):
     """Get main dashboard metrics."""
     # Count active promotions
     active_promos_query = select(func.count(Promotion.id)).where(
@@ -61,12 +79,15 @@ async def get_dashboard_metrics(db: AsyncSession = Depends(get_db)):
     critical_count = sum(1 for a in alerts if a.severity == AlertSeverity.CRITICAL)
     warning_count = sum(1 for a in alerts if a.severity == AlertSeverity.WARNING)
 
+    # 7-day sales and change vs the prior 7 days from the daily rollups
+    sales = await get_period_change(db, days=7)
+
     return {
         "timestamp": datetime.now().isoformat(),
         "metrics": {
             "total_sales": {
-                "value": 0,
-                "change": 0.0,
+                "value": sales["current"]["gross_sales"],
+                "change": sales["change"],
                 "period": "7d",
             },
             "active_promotions": {
@@ -96,143 +117,113 @@ async def get_dashboard_metrics(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/channels")
-async def get_channel_overview():
-    """Get overview of all channels."""
-    return {
-        "timestamp": datetime.now().isoformat(),
-        "channels": [
-            {
-                "name": "Oliveyoung",
-                "code": "oliveyoung",
-                "status": "online",
-                "metrics": {
-                    "gmv_7d": 0,
-                    "orders_7d": 0,
-                    "active_deals": 0,
-                    "ranking_position": None,
-                },
-            },
-            {
-                "name": "Coupang",
-                "code": "coupang",
-                "status": "online",
-                "metrics": {
-                    "gmv_7d": 0,
-                    "orders_7d": 0,
-                    "active_deals": 0,
-                    "rocket_status": "healthy",
-                },
-            },
-            {
-                "name": "Naver",
-                "code": "naver",
-                "status": "online",
-                "metrics": {
-                    "gmv_7d": 0,
-                    "orders_7d": 0,
-                    "store_grade": None,
-                    "live_scheduled": 0,
-                },
-            },
-            {
-                "name": "Kakao",
-                "code": "kakao",
-                "status": "online",
-                "metrics": {
-                    "gmv_7d": 0,
-                    "orders_7d": 0,
-                    "gift_ranking": None,
-                    "channel_friends": 0,
-                },
-            },
-        ],
-    }
+async def get_channel_overview(brand_id: str = "default"):
+    """Get overview of all channels, each bounded by the channel status deadline."""
+    return await get_channel_status_aggregator().overview(brand_id)
+
+
+@router.get("/reports/{job_name}", response_class=ORJSONResponse)
+async def get_precomputed_report(job_name: str, brand_id: str):
+    """
+    Get a brand's latest precomputed report (channel_report, inventory_alerts,
+    price_consistency or daily_briefing), computing it now if there is none.
+    """
+    scheduler = get_job_scheduler()
+    if job_name not in scheduler.jobs or not scheduler.jobs[job_name].per_brand:
+        raise HTTPException(status_code=404, detail=f"Unknown report: {job_name}")
 
+    entry = await scheduler.get(job_name, brand_id)
+    if entry is None:
+        raise HTTPException(status_code=503, detail=f"Report {job_name} for {brand_id} is not available yet")
+    return ORJSONResponse(entry)
 
-@router.get("/alerts")
-async def get_active_alerts(db: AsyncSession = Depends(get_db)):
+
+@router.get("/alerts", response_class=ORJSONResponse)
+async def get_active_alerts(db: AsyncSession = Depends(get_readonly_db)):
     """Get active alerts."""
     query = (
-        select(Alert)
+        select(
+            Alert.id,
+            Alert.alert_type.label("type"),
+            Alert.severity,
+            Alert.title,
+            Alert.message,
+            Alert.channel,
+            Alert.acknowledged,
+            Alert.created_at,
+        )
         .where(Alert.acknowledged == False)  # noqa: E712
         .order_by(Alert.severity, Alert.created_at.desc())
     )
     result = await db.execute(query)
-    alerts = result.scalars().all()
+    alerts = [dict(row) for row in result.mappings()]
 
-    return {
+    return ORJSONResponse({
         "timestamp": datetime.now().isoformat(),
         "total": len(alerts),
-        "alerts": [
-            {
-                "id": str(alert.id),
-                "type": alert.alert_type.value,
-                "severity": alert.severity.value,
-                "title": alert.title,
-                "message": alert.message,
-                "channel": alert.channel,
-                "acknowledged": alert.acknowledged,
-                "created_at": alert.created_at.isoformat(),
-            }
-            for alert in alerts
-        ],
-    }
+        "alerts": alerts,
+    })
 
 
-@router.get("/promotions")
-async def get_active_promotions(db: AsyncSession = Depends(get_db)):
+def promotion_list_query():
+    """Select promotion list columns with budget totals summed in SQL."""
+    budget_totals = (
+        select(
+            Budget.promotion_id,
+            cast(func.sum(Budget.total_amount), BigInteger).label("total_budget"),
+        )
+        .group_by(Budget.promotion_id)
+        .subquery()
+    )
+
+    return select(
+        Promotion.id,
+        Promotion.name,
+        Promotion.description,
+        Promotion.status,
+        Promotion.promotion_type.label("type"),
+        Promotion.channels,
+        Promotion.start_date,
+        Promotion.end_date,
+        Promotion.discount_rate,
+        Promotion.gmv_target,
+        Promotion.gmv_actual,
+        func.coalesce(budget_totals.c.total_budget, 0).label("total_budget"),
+    ).outerjoin(budget_totals, budget_totals.c.promotion_id == Promotion.id)
+
+
+@router.get("/promotions", response_class=ORJSONResponse)
+async def get_active_promotions(db: AsyncSession = Depends(get_readonly_db)):
     """Get active and upcoming promotions."""
     today = date.today()
 
     # Get active promotions
-    active_query = (
-        select(Promotion)
-        .where(Promotion.status == PromotionStatus.ACTIVE)
-        .options(selectinload(Promotion.budgets))
-    )
+    active_query = promotion_list_query().where(Promotion.status == PromotionStatus.ACTIVE)
     active_result = await db.execute(active_query)
-    active_promos = active_result.scalars().all()
+    active_promos = [dict(row) for row in active_result.mappings()]
 
     # Get scheduled (upcoming) promotions
     scheduled_query = (
-        select(Promotion)
+        promotion_list_query()
         .where(Promotion.status.in_([PromotionStatus.SCHEDULED, PromotionStatus.DRAFT]))
         .where(Promotion.start_date >= today)
-        .options(selectinload(Promotion.budgets))
         .order_by(Promotion.start_date)
     )
     scheduled_result = await db.execute(scheduled_query)
-    upcoming_promos = scheduled_result.scalars().all()
+    upcoming_promos = [dict(row) for row in scheduled_result.mappings()]
 
-    def format_promotion(promo: Promotion) -> dict[str, Any]:
-        total_budget = sum(b.total_amount for b in promo.budgets)
-        return {
-            "id": str(promo.id),
-            "name": promo.name,
-            "description": promo.description,
-            "status": promo.status.value,
-            "type": promo.promotion_type.value,
-            "channels": promo.channels,
-            "start_date": promo.start_date.isoformat(),
-            "end_date": promo.end_date.isoformat(),
-            "discount_rate": promo.discount_rate,
-            "gmv_target": promo.gmv_target,
-            "gmv_actual": promo.gmv_actual,
-            "total_budget": total_budget,
-        }
-
-    return {
+    return ORJSONResponse({
         "timestamp": datetime.now().isoformat(),
-        "active": [format_promotion(p) for p in active_promos],
-        "upcoming": [format_promotion(p) for p in upcoming_promos],
-    }
+        "active": active_promos,
+        "upcoming": upcoming_promos,
+    })
 
 
 @router.get("/calendar")
 async def get_promotion_calendar(
     year: int | None = None,
     month: int | None = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_readonly_db),
 ):
     """Get promotion calendar view."""
     today = date.today()
@@ -277,7 +268,7 @@ async def get_promotion_calendar(
 
 
 @router.get("/promotions/{promotion_id}")
-async def get_promotion_detail(promotion_id: str, db: AsyncSession = Depends(get_db)):
+async def get_promotion_detail(promotion_id: str, db: AsyncSession = Depends(get_readonly_db)):
     """Get detailed promotion information including milestones and budgets."""
     try:
         promo_uuid = UUID(promotion_id)
@@ -345,12 +336,25 @@ async def get_promotion_detail(promotion_id: str, db: AsyncSession = Depends(get
     }
 
 
-@router.get("/inventory")
-async def get_inventory_status(db: AsyncSession = Depends(get_db)):
+@router.get("/inventory", response_class=ORJSONResponse)
+async def get_inventory_status(db: AsyncSession = Depends(get_readonly_db)):
     """Get inventory status across all channels."""
-    query = select(Inventory).options(selectinload(Inventory.product))
+    query = select(
+        Inventory.id,
+        Inventory.product_id,
+        Product.name.label("product_name"),
+        Product.sku.label("product_sku"),
+        Inventory.channel,
+        Inventory.current_stock,
+        Inventory.daily_sales_avg,
+        case(
+            (Inventory.daily_sales_avg > 0, Inventory.current_stock // Inventory.daily_sales_avg),
+            else_=None,
+        ).label("days_of_stock"),
+        Inventory.status,
+    ).join(Product, Product.id == Inventory.product_id)
     result = await db.execute(query)
-    inventories = result.scalars().all()
+    items = [dict(row) for row in result.mappings()]
 
     # Group by status
     status_counts = {
@@ -359,30 +363,54 @@ async def get_inventory_status(db: AsyncSession = Depends(get_db)):
         "critical": 0,
         "out_of_stock": 0,
     }
+    for item in items:
+        status_counts[item["status"].value] += 1
 
-    items = []
-    for inv in inventories:
-        status_counts[inv.status.value] += 1
-        items.append({
-            "id": str(inv.id),
-            "product_id": str(inv.product_id),
-            "product_name": inv.product.name,
-            "product_sku": inv.product.sku,
-            "channel": inv.channel,
-            "current_stock": inv.current_stock,
-            "daily_sales_avg": inv.daily_sales_avg,
-            "days_of_stock": (
-                inv.current_stock // inv.daily_sales_avg
-                if inv.daily_sales_avg > 0
-                else None
-            ),
-            "status": inv.status.value,
-        })
-
-    return {
+    return ORJSONResponse({
         "timestamp": datetime.now().isoformat(),
         "summary": status_counts,
         "items": items,
+    })
+
+
+@router.post("/alerts/acknowledge")
+async def bulk_acknowledge_alerts(
+    request: BulkAcknowledgeRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """Acknowledge alerts in bulk by ID list or filter with a single UPDATE."""
+    conditions = []
+    if request.alert_ids is not None:
+        conditions.append(Alert.id.in_(request.alert_ids))
+    if request.alert_type is not None:
+        conditions.append(Alert.alert_type == request.alert_type)
+    if request.severity is not None:
+        conditions.append(Alert.severity == request.severity)
+    if request.channel is not None:
+        conditions.append(Alert.channel == request.channel)
+    if request.created_before is not None:
+        conditions.append(Alert.created_at < request.created_before)
+
+    if not conditions:
+        raise HTTPException(
+            status_code=400,
+            detail="Provide alert_ids or at least one filter",
+        )
+
+    query = (
+        update(Alert)
+        .where(Alert.acknowledged == False, *conditions)  # noqa: E712
+        .values(acknowledged=True, updated_at=func.now())
+        .returning(Alert.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(query)
+    acknowledged_ids = [str(alert_id) for alert_id in result.scalars().all()]
+
+    return {
+        "acknowledged": len(acknowledged_ids),
+        "alert_ids": acknowledged_ids,
+        "acknowledged_at": datetime.now().isoformat(),
     }
 
 
@@ -394,16 +422,18 @@ async def acknowledge_alert(alert_id: str, db: AsyncSession = Depends(get_db)):
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid alert ID format")
 
-    query = select(Alert).where(Alert.id == alert_uuid)
+    query = (
+        update(Alert)
+        .where(Alert.id == alert_uuid)
+        .values(acknowledged=True, updated_at=func.now())
+        .returning(Alert.id)
+        .execution_options(synchronize_session=False)
+    )
     result = await db.execute(query)
-    alert = result.scalar_one_or_none()
 
-    if not alert:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Alert not found")
 
-    alert.acknowledged = True
-    await db.commit()
-
     return {
         "alert_id": alert_id,
         "acknowledged": True,
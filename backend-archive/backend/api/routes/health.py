@@ -4,7 +4,16 @@ from datetime import datetime
 
 from fastapi import APIRouter
 
+from backend.api.websocket import event_bus, manager
+from backend.channels import (
+    get_browser_pool_stats,
+    get_channel_metrics,
+    get_channel_status_aggregator,
+    get_fetch_savings,
+)
 from backend.config import get_settings
+from backend.db.session import get_pool_metrics
+from backend.jobs import get_job_scheduler
 
 router = APIRouter()
 
@@ -38,3 +47,46 @@ async def readiness_check():
         "checks": checks,
         "timestamp": datetime.now().isoformat(),
     }
+
+
+@router.get("/metrics/db")
+async def database_pool_metrics():
+    """Connection pool checkout wait-time metrics per database engine."""
+    return {
+        "pools": get_pool_metrics(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/metrics/channels")
+async def channel_client_metrics():
+    """Request, retry, throttling, circuit-breaker, saved-fetch and status-cache metrics per channel."""
+    return {
+        "channels": get_channel_metrics(),
+        "browser_pool": get_browser_pool_stats(),
+        "fetch_savings": get_fetch_savings(),
+        "status_cache": get_channel_status_aggregator().stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/metrics/jobs")
+async def background_job_metrics():
+    """Run counts, durations, skipped overlaps and cache reads per background job."""
+    return {
+        **get_job_scheduler().stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/metrics/websocket")
+async def websocket_metrics():
+    """WebSocket connection, heartbeat and event bus metrics for this worker."""
+    return {
+        "connections": manager.connection_count,
+        "clients": len(manager.active_connections),
+        "evicted_slow_consumers": manager.evicted_count,
+        "heartbeat": manager.heartbeat.snapshot(),
+        "event_bus": dict(event_bus.stats),
+        "timestamp": datetime.now().isoformat(),
+    }
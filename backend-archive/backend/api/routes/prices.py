@@ -0,0 +1,56 @@
+"""Channel price ingestion endpoints."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.db.pricing import ingest_price_observations
+from backend.db.session import get_db
+from backend.pricing import PriceObservation, record_map_alerts
+
+router = APIRouter()
+
+
+class PriceObservationIn(BaseModel):
+    """A seller's listed price for a product, as seen by a scraper or channel feed."""
+
+    platform: str
+    seller: str
+    product_id: str
+    price: int = Field(ge=0)
+    observed_at: datetime
+
+
+class PriceObservationBatch(BaseModel):
+    """Batch of observed listing prices."""
+
+    observations: list[PriceObservationIn] = Field(min_length=1, max_length=10000)
+
+
+@router.post("/observations")
+async def ingest_observations(
+    request: PriceObservationBatch,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Ingest observed listing prices from scrapers and channel feeds.
+
+    Prices below a product's MAP open or update a violation; opened and
+    escalated violations raise a price alert.
+    """
+    events = await ingest_price_observations(
+        db,
+        [
+            PriceObservation(item.platform, item.seller, item.product_id, item.price, item.observed_at)
+            for item in request.observations
+        ],
+    )
+    await db.commit()
+    alerts = await record_map_alerts(events)
+    return {
+        "received": len(request.observations),
+        "events": events,
+        "alerts_queued": alerts,
+    }
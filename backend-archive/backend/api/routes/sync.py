@@ -0,0 +1,83 @@
+"""Cross-channel sync task endpoints."""
+
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException
+from pydantic import BaseModel, Field
+
+from backend.channels import get_sync_executor
+
+router = APIRouter()
+
+
+class SyncTaskRequest(BaseModel):
+    """Sync task creation request."""
+
+    task_type: str  # "price", "inventory" or "content"
+    products: list[str] = Field(min_length=1, max_length=10000)
+    channels: list[str] = Field(min_length=1)
+    target_value: Any
+    brand: str | None = None
+
+
+class ApprovalRequest(BaseModel):
+    """Approval or rejection of a task waiting for it."""
+
+    user: str
+
+
+@router.post("/tasks", status_code=202)
+async def create_sync_task(
+    request: SyncTaskRequest,
+    idempotency_key: str | None = Header(default=None),
+):
+    """
+    Create a sync task. Price tasks wait for approval; others start at once.
+
+    Sending the same Idempotency-Key header again returns the existing task;
+    without the header, an identical task that has not finished is returned.
+    """
+    try:
+        return await get_sync_executor().submit(
+            request.task_type,
+            request.products,
+            request.channels,
+            request.target_value,
+            brand=request.brand,
+            idempotency_key=idempotency_key,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/tasks/{task_id}")
+async def get_sync_task(task_id: str):
+    """Get a sync task's status and per-channel progress."""
+    task = await get_sync_executor().get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Sync task not found")
+    return task
+
+
+@router.post("/tasks/{task_id}/approve")
+async def approve_sync_task(task_id: str, request: ApprovalRequest):
+    """Approve a sync task waiting for approval and start it."""
+    executor = get_sync_executor()
+    if await executor.get(task_id) is None:
+        raise HTTPException(status_code=404, detail="Sync task not found")
+    try:
+        return await executor.approve(task_id, request.user)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.post("/tasks/{task_id}/reject")
+async def reject_sync_task(task_id: str, request: ApprovalRequest):
+    """Reject a sync task waiting for approval."""
+    executor = get_sync_executor()
+    if await executor.get(task_id) is None:
+        raise HTTPException(status_code=404, detail="Sync task not found")
+    try:
+        return await executor.reject(task_id, request.user)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
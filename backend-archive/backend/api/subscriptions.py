@@ -0,0 +1,132 @@
+"""Topic-indexed WebSocket subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+# Topic dimensions clients may subscribe to, as "<dimension>:<value>"
+TOPIC_DIMENSIONS = ("alert", "brand", "channel", "metric", "severity", "sync")
+
+WILDCARD = "*"
+
+
+def make_topic(dimension: str, value: Any) -> str:
+    """Build a topic string, e.g. make_topic("channel", "coupang") -> "channel:coupang"."""
+    return f"{dimension}:{getattr(value, 'value', value)}"
+
+
+def is_valid_topic(topic: str) -> bool:
+    """Check that a topic is "*" or "<known dimension>:<value or *>"."""
+    if topic == WILDCARD:
+        return True
+    dimension, sep, value = topic.partition(":")
+    return bool(sep and value) and dimension in TOPIC_DIMENSIONS
+
+
+def topic_matches(subscription: str, topics: Iterable[str]) -> bool:
+    """Check whether one subscription covers an event tagged with ``topics``."""
+    if subscription == WILDCARD:
+        return True
+    if subscription.endswith(f":{WILDCARD}"):
+        prefix = subscription[:-1]
+        return any(topic.startswith(prefix) for topic in topics)
+    return subscription in topics
+
+
+class SubscriptionRegistry:
+    """
+    Maps topics to subscribed connections.
+
+    A subscriber may use "<dimension>:*" for every value of a dimension or
+    "*" for everything. Matching an event walks only the topics the event
+    carries plus their wildcards, so publishing costs O(matching subscribers)
+    regardless of how many connections are open.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, set[Hashable]] = {}
+        self._topics: dict[Hashable, set[str]] = {}
+
+    def subscribe(self, subscriber: Hashable, topics: Iterable[str]) -> list[str]:
+        """
+        Subscribe to topics.
+
+        Returns:
+            Topics that were rejected as invalid
+        """
+        rejected = []
+        for topic in topics:
+            if not is_valid_topic(topic):
+                rejected.append(topic)
+                continue
+            self._subscribers.setdefault(topic, set()).add(subscriber)
+            self._topics.setdefault(subscriber, set()).add(topic)
+        return rejected
+
+    def unsubscribe(self, subscriber: Hashable, topics: Iterable[str] | None = None) -> None:
+        """Unsubscribe from the given topics, or from all of them if None."""
+        current = self._topics.get(subscriber)
+        if not current:
+            return
+
+        for topic in list(current if topics is None else topics):
+            if topic not in current:
+                continue
+            current.discard(topic)
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+        if not current:
+            del self._topics[subscriber]
+
+    def remove(self, subscriber: Hashable) -> None:
+        """Drop every subscription held by a subscriber."""
+        self.unsubscribe(subscriber)
+
+    def topics_for(self, subscriber: Hashable) -> set[str]:
+        """Topics a subscriber currently holds."""
+        return set(self._topics.get(subscriber, ()))
+
+    def match(self, topics: Iterable[str]) -> set[Hashable]:
+        """Find subscribers interested in an event tagged with ``topics``."""
+        matched: set[Hashable] = set()
+        lookup = self._subscribers.get
+
+        everything = lookup(WILDCARD)
+        if everything:
+            matched |= everything
+
+        seen_dimensions = set()
+        for topic in topics:
+            exact = lookup(topic)
+            if exact:
+                matched |= exact
+            dimension = topic.partition(":")[0]
+            if dimension not in seen_dimensions:
+                seen_dimensions.add(dimension)
+                wildcard = lookup(f"{dimension}:{WILDCARD}")
+                if wildcard:
+                    matched |= wildcard
+        return matched
+
+    @property
+    def topic_count(self) -> int:
+        """Number of topics with at least one subscriber."""
+        return len(self._subscribers)
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+
+def alert_topics(alert: dict[str, Any]) -> list[str]:
+    """Topics an alert is published under."""
+    alert_type = alert.get("type") or alert.get("alert_type") or "system"
+    topics = [make_topic("alert", alert_type)]
+    for dimension in ("severity", "channel", "brand"):
+        if alert.get(dimension):
+            topics.append(make_topic(dimension, alert[dimension]))
+    return topics
@@ -4,148 +4,514 @@ from __future__ import annotations
 
 import asyncio
 import json
+import uuid
+from collections.abc import Coroutine, Iterable
 from datetime import datetime
 from typing import Any
 
+import msgpack
 from fastapi import WebSocket, WebSocketDisconnect
 
+from backend.api.event_bus import EventBus
+from backend.api.heartbeat import HeartbeatMonitor
+from backend.api.metric_stream import MetricDeltaEncoder
+from backend.api.subscriptions import (
+    SubscriptionRegistry,
+    alert_topics,
+    make_topic,
+    topic_matches,
+)
+from backend.config import get_settings
+
+# Simulated per-division processing time of stream_agent_response
+DIVISION_STEP_DELAY = 0.5
+
+# Wire encodings a client can request with ?encoding=...; msgpack frames are binary
+ENCODINGS = ("json", "msgpack")
+
+
+def encode_message(message: dict[str, Any], encoding: str = "json") -> str | bytes:
+    """Serialize a message for the given wire encoding."""
+    if encoding == "msgpack":
+        return msgpack.packb(message)
+    return json.dumps(message)
+
+
+class ClientConnection:
+    """
+    A single WebSocket with a bounded outbound queue drained by its own writer task.
+
+    Senders only enqueue, so a slow or dead socket never blocks anyone else.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        queue_size: int,
+        encoding: str = "json",
+    ):
+        self.websocket = websocket
+        self.client_id = client_id
+        self.encoding = encoding
+        self.queue: asyncio.Queue[str | bytes | None] = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+        self.writer_task: asyncio.Task | None = None
+        # In-flight chat requests by request_id
+        self.tasks: dict[str, asyncio.Task] = {}
+        # Maintained by HeartbeatMonitor
+        self.last_seen = 0.0
+        self.heartbeat_sent_at: float | None = None
+
+    def enqueue(self, payload: str | bytes) -> bool:
+        """
+        Queue a serialized message without waiting.
+
+        Returns:
+            False if the connection is closed or its queue is full
+        """
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def send(self, message: dict[str, Any]) -> bool:
+        """Queue a message for this connection only."""
+        return self.enqueue(encode_message(message, self.encoding))
+
+    def start_task(self, request_id: str, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run a request handler in the background, tracked under ``request_id``."""
+        task = asyncio.create_task(coro)
+        self.tasks[request_id] = task
+        task.add_done_callback(lambda _: self.tasks.pop(request_id, None))
+        return task
+
+    def cancel_tasks(self, request_id: str | None = None) -> list[str]:
+        """
+        Cancel one in-flight request, or all of them if ``request_id`` is None.
+
+        Returns:
+            IDs of the requests that were cancelled
+        """
+        request_ids = list(self.tasks) if request_id is None else [request_id]
+        cancelled = []
+        for rid in request_ids:
+            task = self.tasks.get(rid)
+            if task is not None and not task.done():
+                task.cancel()
+                cancelled.append(rid)
+        return cancelled
+
+    async def run_writer(self, manager: ConnectionManager) -> None:
+        """Drain the queue onto the socket until closed or the socket fails."""
+        try:
+            while True:
+                payload = await self.queue.get()
+                if payload is None:
+                    break
+                if isinstance(payload, bytes):
+                    await self.websocket.send_bytes(payload)
+                else:
+                    await self.websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Socket is gone; drop the connection without affecting others
+            pass
+        finally:
+            self.closed = True
+            manager.disconnect(self.websocket, self.client_id)
+
 
 class ConnectionManager:
     """Manages WebSocket connections."""
 
-    def __init__(self):
-        self.active_connections: dict[str, list[WebSocket]] = {}
-
-    async def connect(self, websocket: WebSocket, client_id: str):
+    def __init__(self, queue_size: int | None = None):
+        self.active_connections: dict[str, list[ClientConnection]] = {}
+        settings = get_settings()
+        self.queue_size = queue_size or settings.websocket_send_queue_size
+        self.max_concurrent_requests = settings.websocket_max_concurrent_requests
+        self.subscriptions = SubscriptionRegistry()
+        self.metrics = MetricDeltaEncoder()
+        self.heartbeat = HeartbeatMonitor(self)
+        self.evicted_count = 0
+
+    @property
+    def connection_count(self) -> int:
+        """Total number of open connections."""
+        return sum(len(connections) for connections in self.active_connections.values())
+
+    def register(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        encoding: str = "json",
+    ) -> ClientConnection:
+        """Track an accepted WebSocket and start its writer task."""
+        connection = ClientConnection(websocket, client_id, self.queue_size, encoding)
+        self.active_connections.setdefault(client_id, []).append(connection)
+        connection.writer_task = asyncio.create_task(connection.run_writer(self))
+        self.heartbeat.track(connection)
+        return connection
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        encoding: str = "json",
+    ) -> ClientConnection:
         """Accept a new WebSocket connection."""
         await websocket.accept()
-        if client_id not in self.active_connections:
-            self.active_connections[client_id] = []
-        self.active_connections[client_id].append(websocket)
+        return self.register(websocket, client_id, encoding)
 
     def disconnect(self, websocket: WebSocket, client_id: str):
-        """Remove a WebSocket connection."""
-        if client_id in self.active_connections:
-            self.active_connections[client_id].remove(websocket)
-            if not self.active_connections[client_id]:
-                del self.active_connections[client_id]
-
-    async def send_personal_message(self, message: dict[str, Any], client_id: str):
+        """Remove a WebSocket connection. Safe to call more than once."""
+        connections = self.active_connections.get(client_id)
+        if not connections:
+            return
+
+        for connection in connections:
+            if connection.websocket is websocket:
+                connections.remove(connection)
+                self.subscriptions.remove(connection)
+                self._stop_writer(connection)
+                break
+
+        if not connections:
+            del self.active_connections[client_id]
+
+    @staticmethod
+    def _stop_writer(connection: ClientConnection) -> None:
+        connection.closed = True
+        try:
+            # Let the writer flush what is already queued, then exit
+            connection.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            if connection.writer_task is not None:
+                connection.writer_task.cancel()
+
+    def drop(self, connection: ClientConnection, code: int) -> None:
+        """Forcibly remove a connection, discarding queued messages, and close its socket."""
+        self.disconnect(connection.websocket, connection.client_id)
+        connection.cancel_tasks()
+        if connection.writer_task is not None:
+            connection.writer_task.cancel()
+        asyncio.create_task(self._close_quietly(connection.websocket, code))
+
+    def _evict(self, connection: ClientConnection) -> None:
+        """Drop a slow consumer whose queue overflowed."""
+        self.evicted_count += 1
+        # 1013: try again later
+        self.drop(connection, 1013)
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, code: int) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    def _fan_out(self, connections: Iterable[ClientConnection], message: dict[str, Any]) -> int:
+        # Serialize once per encoding in use
+        payloads: dict[str, str | bytes] = {}
+        delivered = 0
+        for connection in connections:
+            payload = payloads.get(connection.encoding)
+            if payload is None:
+                payload = payloads[connection.encoding] = encode_message(message, connection.encoding)
+            if connection.enqueue(payload):
+                delivered += 1
+            elif not connection.closed:
+                self._evict(connection)
+        return delivered
+
+    async def send_personal_message(self, message: dict[str, Any], client_id: str) -> int:
         """Send message to a specific client."""
-        if client_id in self.active_connections:
-            message_json = json.dumps(message)
-            for connection in self.active_connections[client_id]:
-                await connection.send_text(message_json)
-
-    async def broadcast(self, message: dict[str, Any]):
-        """Broadcast message to all connected clients."""
-        message_json = json.dumps(message)
-        for connections in self.active_connections.values():
-            for connection in connections:
-                await connection.send_text(message_json)
+        connections = list(self.active_connections.get(client_id, []))
+        if not connections:
+            return 0
+        return self._fan_out(connections, message)
+
+    async def broadcast(self, message: dict[str, Any]) -> int:
+        """
+        Broadcast message to all connected clients.
+
+        The message is serialized once and enqueued on every connection;
+        no network I/O is awaited here.
+
+        Returns:
+            Number of connections the message was queued for
+        """
+        connections = [
+            connection
+            for client_connections in self.active_connections.values()
+            for connection in client_connections
+        ]
+        return self._fan_out(connections, message)
+
+    async def publish(self, topics: list[str], message: dict[str, Any]) -> int:
+        """
+        Send a message to connections subscribed to any of ``topics``.
+
+        Args:
+            topics: Topics the event is tagged with, e.g. ["channel:coupang", "severity:critical"]
+            message: Message payload
+
+        Returns:
+            Number of connections the message was queued for
+        """
+        subscribers = self.subscriptions.match(topics)
+        if not subscribers:
+            return 0
+        return self._fan_out(subscribers, message)
+
+    async def publish_metric(
+        self,
+        metric_type: str,
+        topics: list[str],
+        data: dict[str, Any],
+    ) -> int:
+        """
+        Send a metric snapshot to subscribers as a delta against the last one.
+
+        Returns:
+            Number of connections the update was queued for (0 if unchanged)
+        """
+        message = self.metrics.encode(metric_type, topics, data)
+        if message is None:
+            return 0
+        return await self.publish(topics, message)
+
+    def send_keyframes(self, connection: ClientConnection, subscriptions: list[str]) -> int:
+        """Send current keyframes of metric streams covered by new subscriptions."""
+        sent = 0
+        for stream in self.metrics.streams.values():
+            if any(topic_matches(sub, stream.topics) for sub in subscriptions):
+                connection.send(stream.keyframe())
+                sent += 1
+        return sent
 
 
 # Global connection manager
 manager = ConnectionManager()
 
+# Global event bus delivering events from every worker to this worker's sockets
+event_bus = EventBus(manager)
+
 
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """WebSocket endpoint for real-time updates."""
-    await manager.connect(websocket, client_id)
+    encoding = websocket.query_params.get("encoding", "json")
+    if encoding not in ENCODINGS:
+        encoding = "json"
+    connection = await manager.connect(websocket, client_id, encoding)
 
     try:
         # Send initial connection confirmation
-        await websocket.send_json({
+        connection.send({
             "type": "connected",
             "client_id": client_id,
+            "encoding": encoding,
             "timestamp": datetime.now().isoformat(),
         })
 
         while True:
             # Receive messages from client
-            data = await websocket.receive_json()
+            if encoding == "msgpack":
+                data = msgpack.unpackb(await websocket.receive_bytes())
+            else:
+                data = await websocket.receive_json()
 
+            manager.heartbeat.touch(connection)
             message_type = data.get("type")
 
             if message_type == "ping":
-                await websocket.send_json({
+                connection.send({
                     "type": "pong",
                     "timestamp": datetime.now().isoformat(),
                 })
 
+            elif message_type == "heartbeat_ack":
+                # Reply to a server heartbeat
+                manager.heartbeat.record_ack(connection)
+
             elif message_type == "subscribe":
-                # Subscribe to specific updates
-                channels = data.get("channels", [])
-                await websocket.send_json({
+                # Subscribe to topics, e.g. "channel:coupang", "severity:*" or "*"
+                topics = data.get("topics")
+                if topics is None:
+                    # Legacy clients send bare channel names
+                    topics = [make_topic("channel", name) for name in data.get("channels", [])]
+                rejected = manager.subscriptions.subscribe(connection, topics)
+                connection.send({
                     "type": "subscribed",
-                    "channels": channels,
+                    "topics": sorted(manager.subscriptions.topics_for(connection)),
+                    "rejected": rejected,
+                })
+                # Bring the client up to date on metric streams it now receives
+                manager.send_keyframes(connection, [t for t in topics if t not in rejected])
+
+            elif message_type == "resync":
+                # Client saw a sequence gap in a metric stream
+                keyframe = manager.metrics.keyframe(data.get("stream", ""))
+                if keyframe is not None:
+                    connection.send(keyframe)
+
+            elif message_type == "unsubscribe":
+                # Omitting topics drops every subscription
+                manager.subscriptions.unsubscribe(connection, data.get("topics"))
+                connection.send({
+                    "type": "unsubscribed",
+                    "topics": sorted(manager.subscriptions.topics_for(connection)),
                 })
 
             elif message_type == "chat":
-                # Handle chat messages
+                # Handle chat messages in the background so this loop keeps
+                # answering pings, subscriptions and cancels meanwhile
                 message = data.get("message", "")
-                # Process through agent system and stream response
-                await stream_agent_response(websocket, message, client_id)
+                request_id = str(data.get("request_id") or uuid.uuid4().hex)
+
+                if request_id in connection.tasks:
+                    connection.send({
+                        "type": "error",
+                        "request_id": request_id,
+                        "error": "Request ID already in progress",
+                    })
+                elif len(connection.tasks) >= manager.max_concurrent_requests:
+                    connection.send({
+                        "type": "error",
+                        "request_id": request_id,
+                        "error": f"Too many concurrent requests (max {manager.max_concurrent_requests})",
+                    })
+                else:
+                    # Process through agent system and stream response
+                    connection.start_task(
+                        request_id,
+                        stream_agent_response(connection, message, client_id, request_id),
+                    )
+
+            elif message_type == "cancel":
+                # Omitting request_id cancels every in-flight request
+                request_id = data.get("request_id")
+                if not connection.cancel_tasks(request_id):
+                    connection.send({
+                        "type": "error",
+                        "request_id": request_id,
+                        "error": "No matching request in progress",
+                    })
 
     except WebSocketDisconnect:
+        pass
+    finally:
+        connection.cancel_tasks()
         manager.disconnect(websocket, client_id)
 
 
 async def stream_agent_response(
-    websocket: WebSocket,
+    connection: ClientConnection,
     message: str,
     client_id: str,
+    request_id: str | None = None,
 ):
-    """Stream agent response through WebSocket."""
-    # Send processing start
-    await websocket.send_json({
-        "type": "processing_start",
-        "timestamp": datetime.now().isoformat(),
-    })
-
-    # Simulate streaming response
-    # In production, this would stream actual agent output
-    divisions = ["strategic_planning", "market_intelligence", "channel_management"]
-
-    for division in divisions:
-        await websocket.send_json({
-            "type": "division_processing",
-            "division": division,
-            "status": "started",
+    """
+    Stream agent response through WebSocket.
+
+    Every message carries ``request_id`` so clients can tell concurrent
+    requests apart. Cancellation is reported as ``processing_cancelled``.
+    """
+    try:
+        # Send processing start
+        connection.send({
+            "type": "processing_start",
+            "request_id": request_id,
+            "timestamp": datetime.now().isoformat(),
         })
 
-        await asyncio.sleep(0.5)  # Simulated processing time
+        # Simulate streaming response
+        # In production, this would stream actual agent output
+        divisions = ["strategic_planning", "market_intelligence", "channel_management"]
+
+        for division in divisions:
+            connection.send({
+                "type": "division_processing",
+                "request_id": request_id,
+                "division": division,
+                "status": "started",
+            })
+
+            await asyncio.sleep(DIVISION_STEP_DELAY)  # Simulated processing time
+
+            connection.send({
+                "type": "division_processing",
+                "request_id": request_id,
+                "division": division,
+                "status": "completed",
+                "result": f"Division {division} processed successfully",
+            })
+
+        # Send final response
+        connection.send({
+            "type": "processing_complete",
+            "request_id": request_id,
+            "response": "Your request has been processed across multiple divisions.",
+            "divisions_used": divisions,
+            "timestamp": datetime.now().isoformat(),
+        })
 
-        await websocket.send_json({
-            "type": "division_processing",
-            "division": division,
-            "status": "completed",
-            "result": f"Division {division} processed successfully",
+    except asyncio.CancelledError:
+        connection.send({
+            "type": "processing_cancelled",
+            "request_id": request_id,
+            "timestamp": datetime.now().isoformat(),
         })
+        raise
 
-    # Send final response
-    await websocket.send_json({
-        "type": "processing_complete",
-        "response": "Your request has been processed across multiple divisions.",
-        "divisions_used": divisions,
-        "timestamp": datetime.now().isoformat(),
-    })
+    except Exception as e:
+        connection.send({
+            "type": "processing_error",
+            "request_id": request_id,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat(),
+        })
 
 
 async def broadcast_alert(alert: dict[str, Any]):
-    """Broadcast an alert to all connected clients."""
-    await manager.broadcast({
-        "type": "alert",
-        "alert": alert,
-        "timestamp": datetime.now().isoformat(),
-    })
-
-
-async def broadcast_metric_update(metric_type: str, data: dict[str, Any]):
-    """Broadcast a metric update to all connected clients."""
-    await manager.broadcast({
-        "type": "metric_update",
-        "metric_type": metric_type,
-        "data": data,
-        "timestamp": datetime.now().isoformat(),
-    })
+    """Send an alert to clients on every worker subscribed to its type, severity, channel or brand."""
+    alert_id = alert.get("id")
+    await event_bus.publish(
+        {
+            "type": "alert",
+            "alert": alert,
+            "timestamp": datetime.now().isoformat(),
+        },
+        topics=alert_topics(alert),
+        # The same alert raised twice (e.g. by a retried job) is only sent once
+        event_id=f"alert:{alert_id}" if alert_id else None,
+    )
+
+
+async def broadcast_metric_update(
+    metric_type: str,
+    data: dict[str, Any],
+    brand: str | None = None,
+    channel: str | None = None,
+):
+    """
+    Send a metric update to clients on every worker subscribed to the metric, brand or channel.
+
+    ``data`` is the full current snapshot; each worker sends its clients only
+    the fields that changed since the previous snapshot, plus periodic keyframes.
+    """
+    topics = [make_topic("metric", metric_type)]
+    if brand:
+        topics.append(make_topic("brand", brand))
+    if channel:
+        topics.append(make_topic("channel", channel))
+
+    await event_bus.publish(
+        {"metric_type": metric_type, "data": data},
+        topics=topics,
+        kind="metric",
+    )
@@ -0,0 +1,88 @@
+"""Channel integration clients for Promotor."""
+
+from backend.channels.browser_pool import (
+    BrowserPool,
+    close_browser_pool,
+    get_browser_pool,
+    get_browser_pool_stats,
+)
+from backend.channels.circuit import CircuitBreaker, CircuitState
+from backend.channels.client import (
+    ChannelClient,
+    ChannelRequestError,
+    CircuitOpenError,
+    close_channel_clients,
+    get_channel_client,
+    get_channel_metrics,
+)
+from backend.channels.fingerprint import (
+    FetchResult,
+    FingerprintBackend,
+    FingerprintStore,
+    RedisFingerprintBackend,
+    get_fetch_savings,
+    get_fingerprint_store,
+)
+from backend.channels.kakao_dispatch import (
+    DatabaseCheckpointStore,
+    InMemoryCheckpointStore,
+    KakaoMessageDispatcher,
+    get_kakao_dispatcher,
+)
+from backend.channels.rankings import RankingSnapshotStore
+from backend.channels.rate_limit import (
+    ChannelRateLimiter,
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+)
+from backend.channels.status import (
+    ChannelStatusAggregator,
+    close_channel_status_aggregator,
+    get_channel_status_aggregator,
+)
+from backend.channels.sync import (
+    ChannelSyncExecutor,
+    DatabaseSyncTaskStore,
+    InMemorySyncTaskStore,
+    close_sync_executor,
+    get_sync_executor,
+)
+
+__all__ = [
+    "BrowserPool",
+    "ChannelClient",
+    "ChannelRateLimiter",
+    "ChannelRequestError",
+    "ChannelStatusAggregator",
+    "ChannelSyncExecutor",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "DatabaseCheckpointStore",
+    "DatabaseSyncTaskStore",
+    "FetchResult",
+    "FingerprintBackend",
+    "FingerprintStore",
+    "InMemoryCheckpointStore",
+    "InMemoryRateLimitBackend",
+    "InMemorySyncTaskStore",
+    "KakaoMessageDispatcher",
+    "RankingSnapshotStore",
+    "RateLimitBackend",
+    "RedisFingerprintBackend",
+    "RedisRateLimitBackend",
+    "close_browser_pool",
+    "close_channel_clients",
+    "close_channel_status_aggregator",
+    "close_sync_executor",
+    "get_browser_pool",
+    "get_browser_pool_stats",
+    "get_channel_client",
+    "get_channel_metrics",
+    "get_channel_status_aggregator",
+    "get_fetch_savings",
+    "get_fingerprint_store",
+    "get_kakao_dispatcher",
+    "get_sync_executor",
+]
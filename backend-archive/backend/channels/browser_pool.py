@@ -0,0 +1,230 @@
+"""Pool of warm headless browser contexts for channels without an API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+from backend.config import get_settings
+
+# Never needed to read page text; skipping them saves most of the bandwidth
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Analytics, tag managers and ad networks loaded by channel pages
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "criteo.com",
+    "criteo.net",
+    "wcs.naver.net",
+)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+
+def should_block(resource_type: str, url: str) -> bool:
+    """Whether a page subresource should be aborted instead of fetched."""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith("." + blocked) for blocked in BLOCKED_HOSTS)
+
+
+class PooledContext:
+    """A browser context plus the number of pages opened in it."""
+
+    def __init__(self, context: Any):
+        self.context = context
+        self.pages = 0
+
+
+class BrowserPool:
+    """
+    Fixed number of warm browser contexts leased to scrape jobs.
+
+    One Chromium process is shared; each lease gets its own context (cookies,
+    cache) so concurrent jobs do not interfere. Images, fonts, media and
+    analytics requests are aborted. A context is closed and replaced after
+    ``pages_per_context`` pages so long-running workers do not accumulate
+    memory or a stale session.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        pages_per_context: int | None = None,
+        headless: bool | None = None,
+        proxy: str | None = None,
+        browser: Any | None = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Number of contexts (concurrent leases)
+            pages_per_context: Pages served before a context is recycled
+            headless: Run Chromium without a window
+            proxy: Proxy server URL for every context
+            browser: Already launched Playwright browser to use instead of launching one
+        """
+        settings = get_settings()
+        self.size = size or settings.browser_pool_size
+        self.pages_per_context = pages_per_context or settings.browser_pages_per_context
+        self.headless = headless if headless is not None else settings.browser_headless
+        self.proxy = proxy
+        self.navigation_timeout = settings.browser_navigation_timeout_s
+
+        self._browser = browser
+        self._owns_browser = browser is None
+        self._playwright = None
+        # Idle slots; None is a slot whose context failed to be (re)created
+        self._idle: asyncio.Queue[PooledContext | None] = asyncio.Queue()
+        self._started = False
+        self._start_lock = asyncio.Lock()
+
+        self.pages_served = 0
+        self.contexts_created = 0
+        self.contexts_recycled = 0
+        self.requests_allowed = 0
+        self.requests_blocked = 0
+
+    async def start(self) -> None:
+        """Launch the browser (unless one was given) and warm every context."""
+        async with self._start_lock:
+            if self._started:
+                return
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            for _ in range(self.size):
+                self._idle.put_nowait(await self._new_context())
+            self._started = True
+
+    async def _new_context(self) -> PooledContext:
+        context = await self._browser.new_context(
+            user_agent=USER_AGENT,
+            locale="ko-KR",
+            timezone_id="Asia/Seoul",
+            proxy={"server": self.proxy} if self.proxy else None,
+        )
+        context.set_default_navigation_timeout(self.navigation_timeout * 1000)
+        await context.route("**/*", self._route)
+        self.contexts_created += 1
+        return PooledContext(context)
+
+    async def _route(self, route: Any) -> None:
+        request = route.request
+        if should_block(request.resource_type, request.url):
+            self.requests_blocked += 1
+            await route.abort()
+        else:
+            self.requests_allowed += 1
+            await route.continue_()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[PooledContext]:
+        """Lease a context, waiting while all of them are in use."""
+        await self.start()
+        pooled = await self._idle.get()
+        if pooled is None:
+            try:
+                pooled = await self._new_context()
+            except BaseException:
+                self._idle.put_nowait(None)
+                raise
+        try:
+            yield pooled
+        finally:
+            await self._release(pooled)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """Open a page in a leased context; it is closed when the block exits."""
+        async with self.lease() as pooled:
+            page = await pooled.context.new_page()
+            try:
+                yield page
+            finally:
+                pooled.pages += 1
+                self.pages_served += 1
+                await page.close()
+
+    async def _release(self, pooled: PooledContext) -> None:
+        if pooled.pages < self.pages_per_context:
+            self._idle.put_nowait(pooled)
+            return
+
+        self.contexts_recycled += 1
+        replacement = None
+        try:
+            await pooled.context.close()
+            replacement = await self._new_context()
+        except Exception as e:
+            # Recreated on the next lease instead
+            print(f"Browser context recycle failed: {e}")
+        finally:
+            # Also on cancellation, or the slot would be lost
+            self._idle.put_nowait(replacement)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool utilisation and request-blocking counters."""
+        total = self.requests_allowed + self.requests_blocked
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize() if self._started else 0,
+            "pages_served": self.pages_served,
+            "contexts_created": self.contexts_created,
+            "contexts_recycled": self.contexts_recycled,
+            "requests_allowed": self.requests_allowed,
+            "requests_blocked": self.requests_blocked,
+            "blocked_ratio": round(self.requests_blocked / total, 3) if total else None,
+        }
+
+    async def stop(self) -> None:
+        """Close every idle context and the browser."""
+        while not self._idle.empty():
+            pooled = self._idle.get_nowait()
+            if pooled is not None:
+                await pooled.context.close()
+        if self._owns_browser and self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._started = False
+
+
+_browser_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool; the browser starts on first lease."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(proxy=get_settings().scraping_proxy_url)
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    """Close the process-wide browser pool if it was created."""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.stop()
+        _browser_pool = None
+
+
+def get_browser_pool_stats() -> dict[str, Any] | None:
+    """Stats for the process-wide pool, or None if it was never used."""
+    return _browser_pool.stats() if _browser_pool is not None else None
@@ -0,0 +1,351 @@
+"""Pooled, rate-limited HTTP clients for channel integrations."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from backend.channels.circuit import CircuitBreaker
+from backend.channels.fingerprint import (
+    FetchResult,
+    FingerprintStore,
+    close_fingerprint_backend,
+    get_fingerprint_store,
+)
+from backend.channels.rate_limit import (
+    ChannelRateLimiter,
+    RateLimitBackend,
+    create_rate_limit_backend,
+)
+from backend.config import CHANNEL_SCRAPING_CONFIG, get_settings
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Methods safe to resend after a server error or dropped connection;
+# others are only retried on 429, where the request was not processed
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class ChannelRequestError(Exception):
+    """A channel request failed after all retries."""
+
+    def __init__(self, channel: str, message: str, status_code: int | None = None):
+        super().__init__(f"{channel}: {message}")
+        self.channel = channel
+        self.status_code = status_code
+
+
+class CircuitOpenError(ChannelRequestError):
+    """The channel's circuit breaker is open; the request was not sent."""
+
+
+class ChannelMetrics:
+    """Request counters and latency for one channel."""
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.limiter_wait_total = 0.0
+
+    def record_attempt(self, latency: float) -> None:
+        self.requests += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "channel": self.channel,
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "circuit_rejections": self.rejected,
+            "avg_latency_ms": round(self.latency_total / self.requests * 1000, 2) if self.requests else None,
+            "max_latency_ms": round(self.latency_max * 1000, 2),
+            "limiter_wait_s": round(self.limiter_wait_total, 3),
+        }
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class ChannelClient:
+    """
+    HTTP client for one channel.
+
+    Wraps a single pooled (HTTP/2-capable) ``httpx.AsyncClient`` with the
+    channel's rate limiter, retries with exponential backoff and full jitter
+    for transport errors, 429 and 5xx responses (429 only for non-idempotent
+    methods unless the caller marks the request idempotent), and a circuit
+    breaker.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        base_url: str | None = None,
+        config: dict[str, Any] | None = None,
+        max_retries: int | None = None,
+        backoff: float | None = None,
+        breaker: CircuitBreaker | None = None,
+        rate_limit_backend: RateLimitBackend | None = None,
+        fingerprints: FingerprintStore | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            channel: Channel name (key of CHANNEL_SCRAPING_CONFIG)
+            base_url: API base URL (defaults to the channel's setting)
+            config: Rate-limit config (defaults to CHANNEL_SCRAPING_CONFIG[channel])
+            max_retries: Retries after the first attempt
+            backoff: Base backoff in seconds, doubled per retry
+            breaker: Circuit breaker (defaults from settings)
+            rate_limit_backend: Shared limiter state (defaults to the process-wide backend)
+            fingerprints: Store for conditional fetches (defaults to the channel's store)
+            transport: Custom httpx transport
+        """
+        settings = get_settings()
+        self.channel = channel
+        self.config = config or CHANNEL_SCRAPING_CONFIG[channel]
+        self.limiter = ChannelRateLimiter(
+            channel,
+            self.config,
+            rate_limit_backend or get_rate_limit_backend(),
+        )
+        self.max_retries = max_retries if max_retries is not None else settings.channel_http_max_retries
+        self.backoff = backoff if backoff is not None else settings.channel_retry_backoff_s
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.channel_circuit_failure_threshold,
+            reset_timeout=settings.channel_circuit_reset_s,
+        )
+        self.metrics = ChannelMetrics(channel)
+        self.fingerprints = fingerprints or get_fingerprint_store(channel)
+
+        proxy = settings.scraping_proxy_url if self.config.get("use_proxy") else None
+        self.http = httpx.AsyncClient(
+            base_url=base_url if base_url is not None else getattr(settings, f"{channel}_api_base_url", ""),
+            http2=transport is None,
+            timeout=settings.channel_http_timeout_s,
+            limits=httpx.Limits(
+                max_connections=settings.channel_http_max_connections,
+                max_keepalive_connections=settings.channel_http_max_connections,
+            ),
+            proxy=proxy,
+            transport=transport,
+        )
+
+    def _backoff_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        if response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(0, self.backoff * 2**attempt)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        brand: str | None = None,
+        idempotent: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request through the limiter, retry policy and circuit breaker.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the base URL, or an absolute URL
+            brand: Brand the request is made for (fair queuing under contention)
+            idempotent: Retry on 5xx and transport errors whatever the method,
+                e.g. for a POST carrying an Idempotency-Key the server deduplicates on
+            **kwargs: Passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            The successful (non-retryable) response; 4xx other than 429 are returned as is
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            ChannelRequestError: If every attempt failed
+        """
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self.metrics.rejected += 1
+                raise CircuitOpenError(self.channel, "circuit open, request not sent")
+
+            response = None
+            error = None
+            try:
+                self.metrics.limiter_wait_total += await self.limiter.acquire(brand)
+                start = time.perf_counter()
+                try:
+                    response = await self.http.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+            except BaseException:
+                # No outcome to record; a half-open circuit must not keep its trial slot
+                self.breaker.release()
+                raise
+            self.metrics.record_attempt(time.perf_counter() - start)
+
+            if response is not None and response.status_code not in RETRY_STATUS_CODES:
+                self.breaker.record_success()
+                self.metrics.successes += 1
+                return response
+
+            self.breaker.record_failure()
+            if response is not None and response.status_code == 429:
+                self.metrics.throttled += 1
+
+            retryable = idempotent or method.upper() in IDEMPOTENT_METHODS or (
+                response is not None and response.status_code == 429
+            )
+            if attempt == self.max_retries or not retryable:
+                self.metrics.failures += 1
+                if response is not None:
+                    raise ChannelRequestError(
+                        self.channel,
+                        f"{method} {url} returned {response.status_code}",
+                        response.status_code,
+                    )
+                raise ChannelRequestError(self.channel, f"{method} {url} failed: {error}") from error
+
+            self.metrics.retries += 1
+            await asyncio.sleep(self._backoff_delay(attempt, response))
+            attempt += 1
+
+    async def get_json(self, url: str, brand: str | None = None, **kwargs: Any) -> Any:
+        """GET a JSON resource, raising ChannelRequestError on 4xx."""
+        response = await self.request("GET", url, brand=brand, **kwargs)
+        if response.is_error:
+            raise ChannelRequestError(
+                self.channel,
+                f"GET {url} returned {response.status_code}",
+                response.status_code,
+            )
+        return response.json()
+
+    async def fetch_json(
+        self,
+        url: str,
+        brand: str | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> FetchResult:
+        """
+        GET a JSON resource, skipping work when it has not changed.
+
+        Sends If-None-Match / If-Modified-Since from the previous fetch. On a
+        304, or a body that hashes the same as last time, the previously
+        parsed value is returned with ``changed=False`` and nothing is parsed.
+
+        Raises:
+            ChannelRequestError: On 4xx or when every attempt failed
+        """
+        key = str(self.http.build_request("GET", url, params=params).url)
+        entry = await self.fingerprints.get(key)
+        headers = {**self.fingerprints.conditional_headers(entry), **(headers or {})}
+
+        response = await self.request("GET", url, brand=brand, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None and entry.value is not None:
+            self.fingerprints.record_not_modified()
+            return FetchResult(entry.value, changed=False, not_modified=True)
+        if response.is_error or response.status_code == 304:
+            raise ChannelRequestError(
+                self.channel,
+                f"GET {url} returned {response.status_code}",
+                response.status_code,
+            )
+
+        unchanged = await self.fingerprints.record_body(
+            key,
+            response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        if unchanged is not None:
+            return FetchResult(unchanged.value, changed=False)
+
+        data = response.json()
+        await self.fingerprints.store(key, data)
+        return FetchResult(data, changed=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Metrics plus circuit state."""
+        return {
+            **self.metrics.snapshot(),
+            "circuit": self.breaker.state.value,
+        }
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+
+# One client (and connection pool) per channel per process
+_clients: dict[str, ChannelClient] = {}
+
+# Limiter state shared by every channel client in this process
+_rate_limit_backend: RateLimitBackend | None = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Get the process-wide rate limit backend."""
+    global _rate_limit_backend
+    if _rate_limit_backend is None:
+        _rate_limit_backend = create_rate_limit_backend()
+    return _rate_limit_backend
+
+
+def get_channel_client(channel: str) -> ChannelClient:
+    """Get the shared client for a channel, creating it on first use."""
+    client = _clients.get(channel)
+    if client is None:
+        client = _clients[channel] = ChannelClient(channel)
+    return client
+
+
+async def close_channel_clients() -> None:
+    """Close every shared channel client and the rate limit and fingerprint backends."""
+    global _rate_limit_backend
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+    if _rate_limit_backend is not None:
+        await _rate_limit_backend.close()
+        _rate_limit_backend = None
+    await close_fingerprint_backend()
+
+
+def get_channel_metrics() -> list[dict[str, Any]]:
+    """Request metrics for every channel client created so far."""
+    return [client.snapshot() for client in _clients.values()]
+
@@ -0,0 +1,67 @@
+"""Coupang Open API requests."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+from typing import Any
+from urllib.parse import urlencode
+
+from backend.channels.client import get_channel_client
+from backend.config import get_settings
+
+# Seller performance summary shown on the WING dashboard
+WING_METRICS_PATH = "/v2/providers/seller_api/apis/api/v1/vendors/{vendor_id}/performance"
+
+
+def coupang_authorization(
+    method: str,
+    path: str,
+    query: str,
+    access_key: str,
+    secret_key: str,
+) -> str:
+    """
+    Build the HMAC-SHA256 ``Authorization`` header required by Coupang Open API.
+
+    Args:
+        method: HTTP method
+        path: Request path
+        query: Encoded query string without the leading "?"
+        access_key: Coupang access key
+        secret_key: Coupang secret key
+
+    Returns:
+        Authorization header value
+    """
+    signed_date = time.strftime("%y%m%dT%H%M%SZ", time.gmtime())
+    message = f"{signed_date}{method}{path}{query}"
+    signature = hmac.new(secret_key.encode(), message.encode(), hashlib.sha256).hexdigest()
+    return (
+        f"CEA algorithm=HmacSHA256, access-key={access_key}, "
+        f"signed-date={signed_date}, signature={signature}"
+    )
+
+
+async def fetch_wing_metrics(seller_id: str, date_range: str = "7d") -> dict[str, Any]:
+    """
+    Fetch WING performance metrics for a seller.
+
+    Raises:
+        ChannelRequestError: If the request fails
+    """
+    settings = get_settings()
+    path = WING_METRICS_PATH.format(vendor_id=seller_id)
+    query = urlencode({"period": date_range})
+    authorization = coupang_authorization(
+        "GET", path, query, settings.coupang_access_key, settings.coupang_secret_key
+    )
+
+    client = get_channel_client("coupang")
+    result = await client.fetch_json(
+        f"{path}?{query}",
+        brand=seller_id,
+        headers={"Authorization": authorization, "X-Requested-By": seller_id},
+    )
+    return result.data
@@ -0,0 +1,290 @@
+"""Content fingerprints for skipping unchanged channel pages."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from backend.config import get_settings
+
+
+class Fingerprint:
+    """Validators, content hash and parsed value of the last fetch of a URL."""
+
+    __slots__ = ("etag", "last_modified", "content_hash", "value")
+
+    def __init__(self):
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        self.content_hash: str | None = None
+        self.value: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Fingerprint:
+        entry = cls()
+        for slot in cls.__slots__:
+            setattr(entry, slot, data.get(slot))
+        return entry
+
+
+class FetchResult:
+    """
+    Outcome of a fingerprinted fetch.
+
+    ``changed`` is False when the server answered 304 or the body hashed the
+    same as last time; ``data`` is then the value parsed on an earlier fetch.
+    """
+
+    __slots__ = ("data", "changed", "not_modified")
+
+    def __init__(self, data: Any, changed: bool, not_modified: bool = False):
+        self.data = data
+        self.changed = changed
+        self.not_modified = not_modified
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class FingerprintBackend(ABC):
+    """Fingerprints shared by every worker, behind each process's local LRU."""
+
+    @abstractmethod
+    async def load(self, channel: str, key: str) -> dict[str, Any] | None:
+        """Stored fingerprint fields for a URL, or None if unknown."""
+
+    @abstractmethod
+    async def save(self, channel: str, key: str, entry: dict[str, Any]) -> None:
+        """Store fingerprint fields for a URL."""
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisFingerprintBackend(FingerprintBackend):
+    """Fingerprints as JSON in Redis, expiring ``ttl_s`` after the last write."""
+
+    def __init__(self, url: str, ttl_s: int | None = None, prefix: str = "promotor:fingerprint:"):
+        self.url = url
+        self.ttl_s = ttl_s or get_settings().channel_fingerprint_ttl_s
+        self.prefix = prefix
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+        return self._client
+
+    def _key(self, channel: str, key: str) -> str:
+        # URLs can be long; their hash keeps Redis keys short
+        return f"{self.prefix}{channel}:{content_hash(key.encode())}"
+
+    async def load(self, channel: str, key: str) -> dict[str, Any] | None:
+        raw = await self._get_client().get(self._key(channel, key))
+        return json.loads(raw) if raw is not None else None
+
+    async def save(self, channel: str, key: str, entry: dict[str, Any]) -> None:
+        await self._get_client().set(self._key(channel, key), json.dumps(entry, default=str), ex=self.ttl_s)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_fingerprint_backend() -> FingerprintBackend | None:
+    """Create the backend selected by settings.channel_fingerprint_backend; None keeps fingerprints local."""
+    settings = get_settings()
+    if settings.channel_fingerprint_backend == "redis":
+        return RedisFingerprintBackend(settings.redis_url)
+    return None
+
+
+class FingerprintStore:
+    """
+    Per-channel LRU of URL fingerprints plus fetch-savings counters.
+
+    A fetch is "saved" when it was answered with 304 Not Modified (no body
+    transferred) or its body was identical to the previous one (parsing and
+    downstream analysis skipped).
+
+    With a ``backend``, the LRU is a local cache in front of it: misses are
+    looked up there and parsed values are written through, so a page fetched
+    by one worker is revalidated, not re-parsed, by the others. A failing
+    backend only costs those savings; the LRU keeps working on its own.
+    Counters are per process.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        max_entries: int | None = None,
+        backend: FingerprintBackend | None = None,
+    ):
+        self.channel = channel
+        self.max_entries = max_entries or get_settings().channel_fingerprint_cache_size
+        self.backend = backend
+        self._entries: OrderedDict[str, Fingerprint] = OrderedDict()
+        self._backend_failing = False
+
+        self.fetches = 0
+        self.not_modified = 0
+        self.unchanged = 0
+
+    async def get(self, key: str) -> Fingerprint | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.backend is None:
+            return None
+        try:
+            data = await self.backend.load(self.channel, key)
+        except Exception as e:
+            self._backend_failed(e)
+            return None
+        self._backend_failing = False
+        if data is None:
+            return None
+        entry = Fingerprint.from_dict(data)
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: Fingerprint) -> None:
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _write_through(self, key: str, entry: Fingerprint) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.save(self.channel, key, entry.to_dict())
+        except Exception as e:
+            self._backend_failed(e)
+            return
+        self._backend_failing = False
+
+    def _backend_failed(self, error: Exception) -> None:
+        # Reported once per outage, not on every fetch
+        if not self._backend_failing:
+            print(f"Fingerprint backend for {self.channel} failed, using the local cache only: {error}")
+            self._backend_failing = True
+
+    def conditional_headers(self, entry: Fingerprint | None) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a stored entry with a parsed value."""
+        if entry is None or entry.value is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def record_not_modified(self) -> None:
+        self.fetches += 1
+        self.not_modified += 1
+
+    async def record_body(
+        self,
+        key: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> Fingerprint | None:
+        """
+        Record a full response.
+
+        Args:
+            key: URL the body was fetched from
+            body: Response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            The stored entry if the body is unchanged (its value can be reused),
+            otherwise None; the caller then parses the body and calls ``store``.
+        """
+        self.fetches += 1
+        digest = content_hash(body)
+        entry = await self.get(key)
+        if entry is None:
+            entry = Fingerprint()
+            self._remember(key, entry)
+        validators_changed = (entry.etag, entry.last_modified) != (etag, last_modified)
+        entry.etag = etag
+        entry.last_modified = last_modified
+
+        if entry.content_hash == digest and entry.value is not None:
+            self.unchanged += 1
+            if validators_changed:
+                await self._write_through(key, entry)
+            return entry
+        entry.content_hash = digest
+        entry.value = None
+        return None
+
+    async def store(self, key: str, value: Any) -> None:
+        """Attach the parsed value for the body just recorded and share it with other workers."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.value = value
+            await self._write_through(key, entry)
+
+    def snapshot(self) -> dict[str, Any]:
+        saved = self.not_modified + self.unchanged
+        return {
+            "channel": self.channel,
+            "fetches": self.fetches,
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "saved_ratio": round(saved / self.fetches, 3) if self.fetches else None,
+            "tracked_urls": len(self._entries),
+        }
+
+
+# One store per channel per process, shared by API clients and scrapers
+_stores: dict[str, FingerprintStore] = {}
+
+# Backend shared by every store in this process
+_backend: FingerprintBackend | None = None
+
+
+def get_fingerprint_backend() -> FingerprintBackend | None:
+    """Get the process-wide fingerprint backend, or None if fingerprints stay local."""
+    global _backend
+    if _backend is None:
+        _backend = create_fingerprint_backend()
+    return _backend
+
+
+async def close_fingerprint_backend() -> None:
+    """Close the shared fingerprint backend."""
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+    _stores.clear()
+
+
+def get_fingerprint_store(channel: str) -> FingerprintStore:
+    """Get the fingerprint store for a channel, creating it on first use."""
+    store = _stores.get(channel)
+    if store is None:
+        store = _stores[channel] = FingerprintStore(channel, backend=get_fingerprint_backend())
+    return store
+
+
+def get_fetch_savings() -> list[dict[str, Any]]:
+    """Saved-fetch counters for every channel with fingerprinted fetches."""
+    return [store.snapshot() for store in _stores.values()]
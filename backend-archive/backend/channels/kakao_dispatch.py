@@ -0,0 +1,319 @@
+"""Batched, resumable Kakao Channel message dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.channels.client import ChannelClient, ChannelRequestError, get_channel_client
+from backend.config import get_settings
+
+KAKAO_CHANNEL_MESSAGE_PATH = "/v1/api/talk/channel/message/send"
+
+# Batch states that are final; anything else is (re)sent on resume
+DONE_STATES = ("sent", "partial")
+
+
+class DispatchCheckpointStore(ABC):
+    """Persists dispatch checkpoints so an interrupted dispatch can resume."""
+
+    @abstractmethod
+    async def load(self, dispatch_id: str) -> dict[str, Any] | None:
+        """Checkpoint of a dispatch, or None if it was never started."""
+
+    @abstractmethod
+    async def save(self, checkpoint: dict[str, Any]) -> None:
+        """Store a checkpoint, replacing the previous one of the same dispatch."""
+
+
+class InMemoryCheckpointStore(DispatchCheckpointStore):
+    """Checkpoints in process memory; survives a cancelled dispatch, not a restart."""
+
+    def __init__(self):
+        self._checkpoints: dict[str, dict[str, Any]] = {}
+
+    async def load(self, dispatch_id: str) -> dict[str, Any] | None:
+        checkpoint = self._checkpoints.get(dispatch_id)
+        return copy.deepcopy(checkpoint) if checkpoint is not None else None
+
+    async def save(self, checkpoint: dict[str, Any]) -> None:
+        self._checkpoints[checkpoint["id"]] = copy.deepcopy(checkpoint)
+
+
+class DatabaseCheckpointStore(DispatchCheckpointStore):
+    """Checkpoints in the message_dispatches table."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None):
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from backend.db.session import async_session
+
+            self._session_factory = async_session
+        return self._session_factory
+
+    async def load(self, dispatch_id: str) -> dict[str, Any] | None:
+        from backend.db.messaging import load_message_dispatch
+
+        async with self.session_factory() as session:
+            return await load_message_dispatch(session, dispatch_id)
+
+    async def save(self, checkpoint: dict[str, Any]) -> None:
+        from backend.db.messaging import save_message_dispatch
+
+        async with self.session_factory() as session:
+            await save_message_dispatch(session, checkpoint)
+            await session.commit()
+
+
+def recipients_digest(recipients: Sequence[str]) -> str:
+    """Fingerprint of the recipient list, so a resume cannot silently use a different one."""
+    return hashlib.sha256("\n".join(recipients).encode()).hexdigest()
+
+
+class KakaoMessageDispatcher:
+    """
+    Sends one Kakao Channel message to a large recipient list.
+
+    Recipients are split into ``batch_size`` batches (one API call each)
+    sent by ``concurrency`` workers through the shared Kakao client, so the
+    CHANNEL_SCRAPING_CONFIG rate limit, retries and circuit breaker apply
+    to every batch. After each batch its status is written to the checkpoint
+    store and the cursor advances past every leading finished batch.
+
+    Dispatching an existing ``dispatch_id`` again resumes it: finished
+    batches are skipped and failed or interrupted ones are sent again.
+    Every batch carries an idempotency key of ``{dispatch_id}:{index}``, so
+    a batch that was sent just before a crash is not delivered twice, and
+    the client may resend it after a 5xx or dropped connection.
+    """
+
+    def __init__(
+        self,
+        client: ChannelClient | None = None,
+        store: DispatchCheckpointStore | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            client: Kakao channel client (defaults to the shared one)
+            store: Checkpoint store (defaults to the database)
+            batch_size: Recipients per API call
+            concurrency: Batches in flight at once
+        """
+        settings = get_settings()
+        self._client = client
+        self.store = store or DatabaseCheckpointStore()
+        self.batch_size = batch_size or settings.kakao_message_batch_size
+        self.concurrency = concurrency or settings.kakao_dispatch_concurrency
+        self._save_lock = asyncio.Lock()
+
+        self.dispatches = 0
+        self.batches_sent = 0
+        self.batches_failed = 0
+        self.recipients_sent = 0
+
+    @property
+    def client(self) -> ChannelClient:
+        if self._client is None:
+            self._client = get_channel_client("kakao")
+        return self._client
+
+    async def dispatch(
+        self,
+        dispatch_id: str,
+        channel_id: str,
+        message_type: str,
+        content: dict[str, Any],
+        recipients: Sequence[str],
+        brand: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send (or resume sending) a message to every recipient.
+
+        Args:
+            dispatch_id: Stable ID of this send, used to resume it
+            channel_id: Kakao Channel ID
+            message_type: Message type (text, image, carousel)
+            content: Message content
+            recipients: Recipient IDs, in the same order on every resume
+            brand: Brand the send is for (fair queuing in the rate limiter)
+
+        Returns:
+            Delivery summary with failed batches and this run's throughput
+
+        Raises:
+            ValueError: If the dispatch exists with a different recipient list
+        """
+        recipients = list(recipients)
+        digest = recipients_digest(recipients)
+        checkpoint = await self.store.load(dispatch_id)
+        if checkpoint is None:
+            batch_count = -(-len(recipients) // self.batch_size)
+            checkpoint = {
+                "id": dispatch_id,
+                "channel": "kakao",
+                "channel_id": channel_id,
+                "message_type": message_type,
+                "status": "running",
+                "total_recipients": len(recipients),
+                "batch_size": self.batch_size,
+                "recipients_digest": digest,
+                "cursor": 0,
+                "batches": [
+                    {"index": index, "status": "pending", "sent": 0, "failed_receivers": [], "attempts": 0, "error": None}
+                    for index in range(batch_count)
+                ],
+            }
+        elif checkpoint["recipients_digest"] != digest:
+            raise ValueError(f"Dispatch {dispatch_id} was started with a different recipient list")
+
+        batches = checkpoint["batches"]
+        pending = deque(batch["index"] for batch in batches if batch["status"] not in DONE_STATES)
+        checkpoint["status"] = "running"
+        await self._save(checkpoint)
+        self.dispatches += 1
+
+        attempted = len(pending)
+        sent_before = sum(batch["sent"] for batch in batches)
+        start = time.perf_counter()
+
+        async def worker() -> None:
+            while pending:
+                index = pending.popleft()
+                batches[index] = await self._send_batch(checkpoint, index, recipients, content, brand)
+                while checkpoint["cursor"] < len(batches) and batches[checkpoint["cursor"]]["status"] in DONE_STATES:
+                    checkpoint["cursor"] += 1
+                await self._save(checkpoint)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(pending)))))
+
+        elapsed = time.perf_counter() - start
+        checkpoint["status"] = "completed" if checkpoint["cursor"] == len(batches) else "incomplete"
+        await self._save(checkpoint)
+
+        sent = sum(batch["sent"] for batch in batches) - sent_before
+        return {
+            **self._summarize(checkpoint),
+            "throughput": {
+                "elapsed_s": round(elapsed, 3),
+                "recipients_sent": sent,
+                "recipients_per_s": round(sent / elapsed, 1) if elapsed > 0 else None,
+                "batches_attempted": attempted,
+                "batches_per_s": round(attempted / elapsed, 2) if elapsed > 0 else None,
+            },
+        }
+
+    async def _send_batch(
+        self,
+        checkpoint: dict[str, Any],
+        index: int,
+        recipients: list[str],
+        content: dict[str, Any],
+        brand: str | None,
+    ) -> dict[str, Any]:
+        size = checkpoint["batch_size"]
+        receivers = recipients[index * size:(index + 1) * size]
+        result = {
+            "index": index,
+            "status": "failed",
+            "sent": 0,
+            "failed_receivers": [],
+            "attempts": checkpoint["batches"][index]["attempts"] + 1,
+            "error": None,
+        }
+        try:
+            response = await self.client.request(
+                "POST",
+                KAKAO_CHANNEL_MESSAGE_PATH,
+                brand=brand,
+                idempotent=True,
+                json={
+                    "channel_id": checkpoint["channel_id"],
+                    "message_type": checkpoint["message_type"],
+                    "content": content,
+                    "receiver_ids": receivers,
+                },
+                headers={"Idempotency-Key": f"{checkpoint['id']}:{index}"},
+            )
+        except ChannelRequestError as e:
+            result["error"] = str(e)
+        else:
+            if response.is_error:
+                result["error"] = f"HTTP {response.status_code}"
+            else:
+                failed = response.json().get("failed_receivers", []) if response.content else []
+                result.update(
+                    status="partial" if failed else "sent",
+                    sent=len(receivers) - len(failed),
+                    failed_receivers=failed,
+                )
+
+        if result["status"] == "failed":
+            self.batches_failed += 1
+            print(f"Kakao dispatch {checkpoint['id']} batch {index} failed: {result['error']}")
+        else:
+            self.batches_sent += 1
+            self.recipients_sent += result["sent"]
+        return result
+
+    async def _save(self, checkpoint: dict[str, Any]) -> None:
+        # Serialized so an older snapshot can never overwrite a newer one
+        async with self._save_lock:
+            await self.store.save(copy.deepcopy(checkpoint))
+
+    def _summarize(self, checkpoint: dict[str, Any]) -> dict[str, Any]:
+        batches = checkpoint["batches"]
+        failed = [batch for batch in batches if batch["status"] == "failed"]
+        return {
+            "dispatch_id": checkpoint["id"],
+            "channel_id": checkpoint["channel_id"],
+            "status": checkpoint["status"],
+            "total_recipients": checkpoint["total_recipients"],
+            "sent": sum(batch["sent"] for batch in batches),
+            "rejected_receivers": sum(len(batch["failed_receivers"]) for batch in batches),
+            "batches": len(batches),
+            "batches_done": sum(batch["status"] in DONE_STATES for batch in batches),
+            "cursor": checkpoint["cursor"],
+            "failed_batches": [
+                {"index": batch["index"], "attempts": batch["attempts"], "error": batch["error"]}
+                for batch in failed
+            ],
+        }
+
+    async def status(self, dispatch_id: str) -> dict[str, Any] | None:
+        """Delivery summary of a dispatch from its checkpoint, or None if unknown."""
+        checkpoint = await self.store.load(dispatch_id)
+        return self._summarize(checkpoint) if checkpoint is not None else None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "dispatches": self.dispatches,
+            "batches_sent": self.batches_sent,
+            "batches_failed": self.batches_failed,
+            "recipients_sent": self.recipients_sent,
+        }
+
+
+_dispatcher: KakaoMessageDispatcher | None = None
+
+
+def get_kakao_dispatcher() -> KakaoMessageDispatcher:
+    """Get the shared dispatcher, checkpointing to the database."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = KakaoMessageDispatcher()
+    return _dispatcher
@@ -0,0 +1,288 @@
+"""Oliveyoung storefront scraping through the shared browser pool."""
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import urlencode
+
+from backend.channels.browser_pool import BrowserPool, get_browser_pool
+from backend.channels.client import ChannelRequestError, get_rate_limit_backend
+from backend.channels.fingerprint import FetchResult, FingerprintStore, get_fingerprint_store
+from backend.channels.rate_limit import ChannelRateLimiter
+from backend.config import CHANNEL_SCRAPING_CONFIG, get_settings
+
+RANKING_PATH = "/store/main/getBestList.do"
+DEALS_PATH = "/store/main/getHotdealList.do"
+PRODUCT_PATH = "/store/goods/getGoodsDetail.do"
+
+# Storefront category codes (dispCatNo)
+CATEGORY_CODES = {
+    "skincare": "10000010001",
+    "makeup": "10000010002",
+    "maskpack": "10000010009",
+    "cleansing": "10000010010",
+    "suncare": "10000010011",
+}
+
+RANKING_TYPES = {"sales": "01", "review": "02", "wish": "03"}
+
+# Each script receives the matched elements and returns plain JSON
+RANKING_ITEMS = "ul.cate_prd_list li .prd_info"
+RANKING_SCRIPT = """
+items => items.map(item => {
+    const text = selector => item.querySelector(selector)?.textContent.trim() || null;
+    return {
+        product_id: item.querySelector('a[data-ref-goodsno]')?.dataset.refGoodsno || null,
+        product_name: text('.tx_name'),
+        brand: text('.tx_brand'),
+        price: text('.tx_cur .tx_num'),
+        original_price: text('.tx_org .tx_num'),
+        flags: Array.from(item.querySelectorAll('.prd_flag .icon_flag')).map(f => f.textContent.trim()),
+    };
+})
+"""
+
+DEAL_ITEMS = "ul.hotdeal_list li"
+DEAL_SCRIPT = """
+items => items.map(item => {
+    const text = selector => item.querySelector(selector)?.textContent.trim() || null;
+    return {
+        deal_id: item.dataset.dealNo || null,
+        deal_type: item.dataset.dealType || null,
+        brand: text('.tx_brand'),
+        products: Array.from(item.querySelectorAll('.tx_name')).map(n => n.textContent.trim()),
+        discount: text('.tx_sale'),
+        valid_until: text('.deal_period'),
+    };
+})
+"""
+
+REVIEW_ITEMS = "#gdasList > li"
+REVIEW_SCRIPT = """
+items => items.map(item => {
+    const text = selector => item.querySelector(selector)?.textContent.trim() || null;
+    return {
+        rating: text('.review_point .point'),
+        content: text('.txt_inner'),
+        date: text('.score_area .date'),
+        helpful_count: text('.recom_area .num'),
+    };
+})
+"""
+
+# sort_by -> (field, descending); the page lists the newest reviews first
+REVIEW_SORT_KEYS = {
+    "helpful": ("helpful_count", True),
+    "rating_high": ("rating", True),
+    "rating_low": ("rating", False),
+}
+
+
+def _to_int(value: str | None) -> int | None:
+    """Parse storefront numbers such as "18,500원" or "5점"."""
+    digits = "".join(ch for ch in value or "" if ch.isdigit())
+    return int(digits) if digits else None
+
+
+class OliveyoungScraper:
+    """
+    Scrapes Oliveyoung pages, which have no official API.
+
+    Every page load takes a slot from the channel's rate limiter and runs in
+    a context leased from the browser pool. Pages are fetched conditionally
+    and fingerprinted so unchanged pages are not parsed again.
+    """
+
+    def __init__(
+        self,
+        pool: BrowserPool | None = None,
+        base_url: str | None = None,
+        limiter: ChannelRateLimiter | None = None,
+        fingerprints: FingerprintStore | None = None,
+    ):
+        self._pool = pool
+        self.base_url = (base_url if base_url is not None else get_settings().oliveyoung_api_base_url).rstrip("/")
+        self.limiter = limiter or ChannelRateLimiter(
+            "oliveyoung", CHANNEL_SCRAPING_CONFIG["oliveyoung"], get_rate_limit_backend()
+        )
+        self.fingerprints = fingerprints or get_fingerprint_store("oliveyoung")
+
+    @property
+    def pool(self) -> BrowserPool:
+        return self._pool or get_browser_pool()
+
+    async def _scrape(
+        self,
+        path: str,
+        params: dict[str, Any],
+        selector: str,
+        script: str,
+        wait_for: bool = False,
+    ) -> FetchResult:
+        """
+        Load a page and run ``script`` over the elements matching ``selector``.
+
+        The document request carries the previous ETag / Last-Modified, and
+        its body is fingerprinted; when it is unchanged the items parsed last
+        time are returned without running ``script``. Pages whose items are
+        rendered by XHR (``wait_for``) are always parsed.
+
+        Args:
+            path: Page path
+            params: Query parameters
+            selector: CSS selector for the items
+            script: JavaScript receiving the matched elements
+            wait_for: Wait for the items to render (for lists loaded by XHR)
+
+        Raises:
+            ChannelRequestError: If the page cannot be loaded
+        """
+        from playwright.async_api import Error as PlaywrightError
+
+        url = f"{self.base_url}{path}?{urlencode(params)}"
+        entry = None if wait_for else await self.fingerprints.get(url)
+        conditional = self.fingerprints.conditional_headers(entry)
+
+        async def add_conditional_headers(route):
+            if route.request.is_navigation_request():
+                await route.continue_(headers={**route.request.headers, **conditional})
+            else:
+                await route.fallback()
+
+        try:
+            await self.limiter.acquire()
+            async with self.pool.page() as page:
+                if conditional:
+                    await page.route("**/*", add_conditional_headers)
+                response = await page.goto(url, wait_until="domcontentloaded")
+                if response is not None and response.status == 304 and conditional:
+                    self.fingerprints.record_not_modified()
+                    return FetchResult(entry.value, changed=False, not_modified=True)
+                if response is not None and not response.ok:
+                    raise ChannelRequestError("oliveyoung", f"GET {path} returned {response.status}", response.status)
+
+                if wait_for:
+                    try:
+                        await page.wait_for_selector(selector, timeout=5000)
+                    except PlaywrightError:
+                        return FetchResult([], changed=True)
+                    return FetchResult(await page.eval_on_selector_all(selector, script), changed=True)
+
+                if response is not None:
+                    unchanged = await self.fingerprints.record_body(
+                        url,
+                        await response.body(),
+                        etag=response.headers.get("etag"),
+                        last_modified=response.headers.get("last-modified"),
+                    )
+                    if unchanged is not None:
+                        return FetchResult(unchanged.value, changed=False)
+                items = await page.eval_on_selector_all(selector, script)
+                await self.fingerprints.store(url, items)
+                return FetchResult(items, changed=True)
+        except PlaywrightError as e:
+            raise ChannelRequestError("oliveyoung", f"GET {path} failed: {e}") from e
+
+    async def rankings(
+        self,
+        category: str,
+        ranking_type: str = "sales",
+        limit: int = 20,
+        only_changed: bool = False,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Best-seller ranking for a category.
+
+        Args:
+            category: Category name (key of CATEGORY_CODES) or storefront code
+            ranking_type: sales, review or wish
+            limit: Number of products to return
+            only_changed: Return None if the page is unchanged since the last fetch
+
+        Returns:
+            Ranked products, or None (see ``only_changed``)
+        """
+        result = await self._scrape(
+            RANKING_PATH,
+            {
+                "dispCatNo": CATEGORY_CODES.get(category, category),
+                "rankType": RANKING_TYPES.get(ranking_type, RANKING_TYPES["sales"]),
+            },
+            RANKING_ITEMS,
+            RANKING_SCRIPT,
+        )
+        if only_changed and not result.changed:
+            return None
+
+        rankings = []
+        for rank, item in enumerate(result.data[:limit], start=1):
+            price = _to_int(item["price"])
+            original_price = _to_int(item["original_price"]) or price
+            discount = round((1 - price / original_price) * 100) if price and original_price else 0
+            rankings.append({
+                "rank": rank,
+                "product_id": item["product_id"],
+                "product_name": item["product_name"],
+                "brand": item["brand"],
+                "price": price,
+                "original_price": original_price,
+                "discount": f"{discount}%",
+                "flags": item["flags"],
+                "category": category,
+            })
+        return rankings
+
+    async def deals(
+        self,
+        category: str | None = None,
+        deal_type: str = "all",
+        only_changed: bool = False,
+    ) -> list[dict[str, Any]] | None:
+        """Active hot deals, optionally filtered by deal type; see ``rankings`` for ``only_changed``."""
+        params = {"dispCatNo": CATEGORY_CODES.get(category, category)} if category else {}
+        result = await self._scrape(DEALS_PATH, params, DEAL_ITEMS, DEAL_SCRIPT)
+        if only_changed and not result.changed:
+            return None
+        items = result.data
+        if deal_type != "all":
+            items = [item for item in items if item["deal_type"] == deal_type]
+        return items
+
+    async def reviews(self, product_id: str, limit: int = 50, sort_by: str = "recent") -> dict[str, Any]:
+        """Reviews rendered on a product page, newest first unless ``sort_by`` says otherwise."""
+        result = await self._scrape(
+            PRODUCT_PATH, {"goodsNo": product_id}, REVIEW_ITEMS, REVIEW_SCRIPT, wait_for=True
+        )
+        reviews = [
+            {
+                "rating": _to_int(item["rating"]),
+                "content": item["content"],
+                "date": item["date"],
+                "helpful_count": _to_int(item["helpful_count"]) or 0,
+            }
+            for item in result.data
+        ]
+        if sort_by in REVIEW_SORT_KEYS:
+            key, reverse = REVIEW_SORT_KEYS[sort_by]
+            reviews.sort(key=lambda review: review[key] or 0, reverse=reverse)
+        reviews = reviews[:limit]
+        ratings = [review["rating"] for review in reviews if review["rating"]]
+        distribution = {str(star): ratings.count(star) for star in range(5, 0, -1)}
+        return {
+            "product_id": product_id,
+            "reviews_fetched": len(reviews),
+            "average_rating": round(sum(ratings) / len(ratings), 2) if ratings else None,
+            "rating_distribution": distribution,
+            "reviews": reviews,
+        }
+
+
+_scraper: OliveyoungScraper | None = None
+
+
+def get_oliveyoung_scraper() -> OliveyoungScraper:
+    """Get the shared Oliveyoung scraper."""
+    global _scraper
+    if _scraper is None:
+        _scraper = OliveyoungScraper()
+    return _scraper
@@ -0,0 +1,391 @@
+"""Ranking snapshots stored as diffs, with rank movement queries."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from backend.config import get_settings
+
+BoardKey = tuple[str, str]  # (channel, scope), scope being a category or keyword
+
+# Ranks recorded per leaderboard, whatever limit a caller asked for
+RANKING_DEPTH = 100
+
+
+def item_key(item: dict[str, Any]) -> str:
+    """Identity of a ranked product: its channel product ID, else its name."""
+    return str(item.get("product_id") or item["product_name"])
+
+
+def rank_items(items: Sequence[dict[str, Any]]) -> tuple[dict[str, int], dict[str, dict[str, Any]]]:
+    """Rank per product key (first occurrence wins) and the item per key."""
+    ranks: dict[str, int] = {}
+    by_key: dict[str, dict[str, Any]] = {}
+    for rank, item in enumerate(items, start=1):
+        key = item_key(item)
+        ranks.setdefault(key, rank)
+        by_key[key] = item
+    return ranks, by_key
+
+
+def diff_ranks(previous: dict[str, int], ranks: dict[str, int]) -> tuple[dict[str, int], tuple[str, ...]]:
+    """Products that entered or changed rank, and products that dropped out."""
+    changed = {key: rank for key, rank in ranks.items() if previous.get(key) != rank}
+    exited = tuple(key for key in previous if key not in ranks)
+    return changed, exited
+
+
+def describe_move(
+    items: dict[str, dict[str, Any]],
+    key: str,
+    before: int | None,
+    after: int | None,
+) -> dict[str, Any]:
+    item = items.get(key, {})
+    return {
+        "product": key,
+        "product_name": item.get("product_name"),
+        "brand": item.get("brand"),
+        "previous_rank": before,
+        "rank": after,
+        "change": before - after if before is not None and after is not None else None,
+    }
+
+
+def ranking_movement(
+    channel: str,
+    scope: str,
+    observed_at: datetime,
+    previous: dict[str, int],
+    ranks: dict[str, int],
+    items: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Entered, exited and moved products between two lists, biggest moves first."""
+    changed, exited = diff_ranks(previous, ranks)
+    return {
+        "channel": channel,
+        "scope": scope,
+        "observed_at": observed_at.isoformat(),
+        "entered": [describe_move(items, key, None, rank) for key, rank in changed.items() if key not in previous],
+        "exited": [{"product": key, "previous_rank": previous[key]} for key in exited],
+        "moved": sorted(
+            (describe_move(items, key, previous[key], rank) for key, rank in changed.items() if key in previous),
+            key=lambda move: -abs(move["change"]),
+        ),
+        "unchanged": len(ranks) - len(changed),
+    }
+
+
+def annotate_ranking(items: Sequence[dict[str, Any]], movement: dict[str, Any]) -> list[dict[str, Any]]:
+    """Copy ``items`` with previous_rank and rank_change (positive = climbed) from a movement."""
+    previous = {move["product"]: move["previous_rank"] for move in movement["moved"]}
+    entered = {move["product"] for move in movement["entered"]}
+    annotated = []
+    for rank, item in enumerate(items, start=1):
+        key = item_key(item)
+        before = None if key in entered else previous.get(key, rank)
+        annotated.append({
+            **item,
+            "previous_rank": before,
+            "rank_change": before - rank if before is not None else None,
+        })
+    return annotated
+
+
+def ranking_movers(
+    channel: str,
+    scope: str,
+    since: datetime | None,
+    before: dict[str, int],
+    after: dict[str, int],
+    items: dict[str, dict[str, Any]],
+    limit: int,
+) -> dict[str, Any]:
+    """Risers, fallers, entries and exits between the list at ``since`` and the current one."""
+    moves = [
+        describe_move(items, key, before[key], rank)
+        for key, rank in after.items()
+        if key in before and before[key] != rank
+    ]
+    return {
+        "channel": channel,
+        "scope": scope,
+        "since": since.isoformat() if since is not None else None,
+        "risers": sorted((m for m in moves if m["change"] > 0), key=lambda m: -m["change"])[:limit],
+        "fallers": sorted((m for m in moves if m["change"] < 0), key=lambda m: m["change"])[:limit],
+        "entered": sorted(
+            (describe_move(items, key, None, rank) for key, rank in after.items() if key not in before),
+            key=lambda m: m["rank"],
+        )[:limit],
+        "exited": [{"product": key, "previous_rank": rank} for key, rank in before.items() if key not in after][:limit],
+    }
+
+
+def summarize_rank_history(channel: str, scope: str, product: str, points: list[dict[str, Any]]) -> dict[str, Any]:
+    """Start, current, best and worst rank of a product's rank points (rank None while off the list)."""
+    ranks = [point["rank"] for point in points if point["rank"] is not None]
+    first_rank = points[0]["rank"] if points else None
+    current = points[-1]["rank"] if points else None
+    return {
+        "channel": channel,
+        "scope": scope,
+        "product": product,
+        "points": points,
+        "start_rank": first_rank,
+        "current_rank": current,
+        "best_rank": min(ranks) if ranks else None,
+        "worst_rank": max(ranks) if ranks else None,
+        "net_change": first_rank - current if first_rank is not None and current is not None else None,
+    }
+
+
+class RankingSnapshot:
+    """
+    One ranking list, as a diff against the previous snapshot.
+
+    ``ranks`` holds only products that entered or changed rank and
+    ``exited`` the products that dropped out. Every ``keyframe_interval``
+    snapshots ``keyframe`` also holds the full product -> rank map, so a past
+    list is rebuilt from the nearest keyframe instead of the first snapshot.
+    """
+
+    __slots__ = ("timestamp", "ranks", "exited", "keyframe")
+
+    def __init__(
+        self,
+        timestamp: float,
+        ranks: dict[str, int],
+        exited: tuple[str, ...],
+        keyframe: dict[str, int] | None = None,
+    ):
+        self.timestamp = timestamp
+        self.ranks = ranks
+        self.exited = exited
+        self.keyframe = keyframe
+
+
+class RankingBoard:
+    """Snapshot history of one channel leaderboard."""
+
+    def __init__(self, channel: str, scope: str):
+        self.channel = channel
+        self.scope = scope
+        self.snapshots: list[RankingSnapshot] = []
+        self.timestamps: list[float] = []
+        self.current: dict[str, int] = {}
+        self.items: dict[str, dict[str, Any]] = {}
+        # Rank change points per product: (timestamps, ranks); None = off the list
+        self.history: dict[str, tuple[list[float], list[int | None]]] = {}
+
+    def ranks_at(self, index: int) -> dict[str, int]:
+        """Full product -> rank map of snapshot ``index``."""
+        start = index
+        while self.snapshots[start].keyframe is None:
+            start -= 1
+        ranks = dict(self.snapshots[start].keyframe)
+        for snapshot in self.snapshots[start + 1:index + 1]:
+            for key in snapshot.exited:
+                del ranks[key]
+            ranks.update(snapshot.ranks)
+        return ranks
+
+    def index_at(self, when: datetime) -> int | None:
+        """Index of the latest snapshot taken at or before ``when``."""
+        index = bisect_right(self.timestamps, when.timestamp()) - 1
+        return index if index >= 0 else None
+
+
+class RankingSnapshotStore:
+    """
+    Ranking lists per (channel, scope) over time.
+
+    Recording a list diffs it against the board's current ranks, stores the
+    diff and returns the movement, so callers get deltas rather than having
+    to compare lists themselves. Per-product rank change points are indexed
+    as they are recorded, which keeps "rank of X over 30 days" a bisect
+    rather than a replay. Snapshots older than ``retention`` are pruned.
+
+    ``backend.db.rankings`` persists the same diffs and keyframes, plus the
+    per-product movement, and answers the same queries from the database.
+    """
+
+    def __init__(
+        self,
+        keyframe_interval: int | None = None,
+        retention: timedelta | None = None,
+    ):
+        settings = get_settings()
+        self.keyframe_interval = keyframe_interval or settings.ranking_keyframe_interval
+        self.retention = retention or timedelta(days=settings.ranking_retention_days)
+        self._boards: dict[BoardKey, RankingBoard] = {}
+
+    def board(self, channel: str, scope: str) -> RankingBoard | None:
+        return self._boards.get((channel, scope))
+
+    def record(
+        self,
+        channel: str,
+        scope: str,
+        items: Sequence[dict[str, Any]],
+        observed_at: datetime | None = None,
+    ) -> dict[str, Any]:
+        """
+        Record a ranking list, best first.
+
+        Args:
+            channel: Channel name
+            scope: Category or keyword the list is for
+            items: Ranked items with a product_id or product_name
+            observed_at: When the list was fetched (now if omitted)
+
+        Returns:
+            Movement since the previous snapshot: entered, exited and moved products
+        """
+        observed_at = observed_at or datetime.now().astimezone()
+        timestamp = observed_at.timestamp()
+        board = self._boards.get((channel, scope))
+        if board is None:
+            board = self._boards[(channel, scope)] = RankingBoard(channel, scope)
+        if board.timestamps and timestamp < board.timestamps[-1]:
+            raise ValueError(f"Snapshot for {channel}/{scope} is older than the latest one")
+
+        ranks, by_key = rank_items(items)
+        board.items.update(by_key)
+        previous = board.current
+        changed, exited = diff_ranks(previous, ranks)
+        is_keyframe = not board.snapshots or len(board.snapshots) % self.keyframe_interval == 0
+        board.snapshots.append(RankingSnapshot(timestamp, changed, exited, dict(ranks) if is_keyframe else None))
+        board.timestamps.append(timestamp)
+        board.current = ranks
+
+        for key, rank in changed.items():
+            times, values = board.history.setdefault(key, ([], []))
+            times.append(timestamp)
+            values.append(rank)
+        # Exited products are described from their last known item
+        movement = ranking_movement(channel, scope, observed_at, previous, ranks, board.items)
+        for key in exited:
+            times, values = board.history[key]
+            times.append(timestamp)
+            values.append(None)
+            del board.items[key]
+
+        self._prune(board, timestamp - self.retention.total_seconds())
+        return movement
+
+    def compare(self, channel: str, scope: str, items: Sequence[dict[str, Any]]) -> dict[str, Any]:
+        """Movement of ``items`` since the latest recorded list, without recording them."""
+        board = self._boards.get((channel, scope))
+        previous = board.current if board is not None else {}
+        ranks, by_key = rank_items(items)
+        lookup = {**board.items, **by_key} if board is not None else by_key
+        return ranking_movement(channel, scope, datetime.now().astimezone(), previous, ranks, lookup)
+
+    def annotate(self, items: Sequence[dict[str, Any]], movement: dict[str, Any]) -> list[dict[str, Any]]:
+        """Copy ``items`` with previous_rank and rank_change (positive = climbed) from ``record``."""
+        return annotate_ranking(items, movement)
+
+    def track(self, channel: str, scope: str, items: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Record a freshly fetched list and return it annotated with rank changes."""
+        return self.annotate(items, self.record(channel, scope, items))
+
+    def _prune(self, board: RankingBoard, cutoff: float) -> None:
+        """Drop snapshots before the latest keyframe taken at or before ``cutoff``."""
+        keep = None
+        for index in range(bisect_right(board.timestamps, cutoff) - 1, 0, -1):
+            if board.snapshots[index].keyframe is not None:
+                keep = index
+                break
+        if keep is None:
+            return
+        del board.snapshots[:keep]
+        del board.timestamps[:keep]
+
+        first = board.timestamps[0]
+        for key in list(board.history):
+            times, values = board.history[key]
+            # Keep the change point in effect at the first remaining snapshot
+            drop = bisect_right(times, first) - 1
+            if drop > 0:
+                del times[:drop]
+                del values[:drop]
+            if values == [None]:
+                del board.history[key]
+
+    def rank_history(
+        self,
+        channel: str,
+        scope: str,
+        product: str,
+        since: datetime,
+        until: datetime | None = None,
+    ) -> dict[str, Any]:
+        """
+        Rank movement of one product over a time window.
+
+        Returns:
+            Rank at the window start and every change after it, plus best and
+            worst rank (None while the product was off the list)
+        """
+        board = self._boards.get((channel, scope))
+        times, values = board.history.get(product, ([], [])) if board else ([], [])
+        lo = since.timestamp()
+        hi = (until or datetime.now().astimezone()).timestamp()
+
+        start = bisect_right(times, lo) - 1
+        end = bisect_right(times, hi)
+        points = []
+        if start >= 0:
+            points.append({"timestamp": since.isoformat(), "rank": values[start]})
+        for index in range(start + 1, end):
+            points.append({
+                "timestamp": datetime.fromtimestamp(times[index], since.tzinfo).isoformat(),
+                "rank": values[index],
+            })
+
+        return summarize_rank_history(channel, scope, product, points)
+
+    def biggest_movers(
+        self,
+        channel: str,
+        scope: str,
+        since: datetime,
+        limit: int = 10,
+    ) -> dict[str, Any]:
+        """
+        Products with the largest rank change between ``since`` and now.
+
+        Compares the current list against the list in effect at ``since``
+        (the oldest retained one if ``since`` is earlier).
+        """
+        board = self._boards.get((channel, scope))
+        if board is None or not board.snapshots:
+            return ranking_movers(channel, scope, None, {}, {}, {}, limit)
+
+        index = board.index_at(since) or 0
+        return ranking_movers(
+            channel,
+            scope,
+            datetime.fromtimestamp(board.timestamps[index], since.tzinfo),
+            board.ranks_at(index),
+            board.current,
+            board.items,
+            limit,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        snapshots = sum(len(board.snapshots) for board in self._boards.values())
+        stored_ranks = sum(
+            len(snapshot.ranks) + len(snapshot.exited) + len(snapshot.keyframe or {})
+            for board in self._boards.values()
+            for snapshot in board.snapshots
+        )
+        return {
+            "boards": len(self._boards),
+            "snapshots": snapshots,
+            "stored_ranks": stored_ranks,
+        }
+
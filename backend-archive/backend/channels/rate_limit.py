@@ -0,0 +1,247 @@
+"""Per-channel request rate limiting shared across processes."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+from backend.config import get_settings
+
+DEFAULT_BRAND = "default"
+
+# (key, interval seconds, burst tolerance seconds)
+Limit = tuple[str, float, float]
+
+
+class RateLimitBackend(ABC):
+    """
+    GCRA (generic cell rate algorithm) state store.
+
+    GCRA keeps a single "theoretical arrival time" (TAT) per key. A request
+    is allowed if ``now >= TAT - tolerance``, after which TAT advances by one
+    emission interval. This enforces ``1 / interval`` requests per second with
+    bursts of ``tolerance / interval + 1``, using one value per key.
+    """
+
+    @abstractmethod
+    async def try_acquire(self, limits: list[Limit]) -> float:
+        """
+        Attempt to take one request slot from every limit at once.
+
+        Slots are only taken if all limits allow the request.
+
+        Args:
+            limits: (key, interval, tolerance) per limit, where interval is the
+                seconds between requests at the sustained rate and tolerance
+                the burst allowance in seconds
+
+        Returns:
+            0.0 if allowed, otherwise seconds until every limit has a free slot
+        """
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """GCRA state in process memory; only limits callers in this process."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._tat: dict[str, float] = {}
+
+    async def try_acquire(self, limits: list[Limit]) -> float:
+        now = self.clock()
+        wait = 0.0
+        tats = []
+        for key, interval, tolerance in limits:
+            tat = max(self._tat.get(key, now), now)
+            wait = max(wait, tat - tolerance - now)
+            tats.append(tat + interval)
+        if wait > 0:
+            return wait
+        for (key, _, _), new_tat in zip(limits, tats):
+            self._tat[key] = new_tat
+        return 0.0
+
+
+# Uses the Redis server clock so every worker and host agrees on "now".
+# Values are in milliseconds and returned as strings to keep fractions.
+GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+local wait = 0
+local new_tats = {}
+for i, key in ipairs(KEYS) do
+    local interval = tonumber(ARGV[2 * i - 1])
+    local tolerance = tonumber(ARGV[2 * i])
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then
+        tat = now
+    end
+    wait = math.max(wait, tat - tolerance - now)
+    new_tats[i] = tat + interval
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, tostring(new_tats[i]), 'PX', math.ceil(new_tats[i] - now) + 1000)
+end
+return '0'
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """GCRA state in Redis, shared by API workers and Celery tasks."""
+
+    def __init__(self, url: str, prefix: str = "promotor:ratelimit:"):
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+        self._script = None
+
+    def _get_script(self):
+        if self._script is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+            self._script = self._client.register_script(GCRA_SCRIPT)
+        return self._script
+
+    async def try_acquire(self, limits: list[Limit]) -> float:
+        args = []
+        for _, interval, tolerance in limits:
+            args.extend((interval * 1000, tolerance * 1000))
+        wait_ms = await self._get_script()(
+            keys=[self.prefix + key for key, _, _ in limits],
+            args=args,
+        )
+        return float(wait_ms) / 1000
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._script = None
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Create the backend selected by settings.channel_rate_limit_backend."""
+    settings = get_settings()
+    if settings.channel_rate_limit_backend == "redis":
+        return RedisRateLimitBackend(settings.redis_url)
+    return InMemoryRateLimitBackend()
+
+
+class ChannelRateLimiter:
+    """
+    Enforces a channel's CHANNEL_SCRAPING_CONFIG entry.
+
+    The hourly budget (``max_requests_per_hour`` with bursts of ``burst``) is
+    enforced by the shared GCRA backend, so it holds across every worker.
+    Scraped channels (``use_proxy``) also draw from the global
+    ``scraping_max_requests_per_hour`` budget.
+    When callers have to wait, slots are handed out round-robin between
+    brands so one brand's bulk job cannot starve another's requests.
+    Consecutive requests from this process are additionally spaced
+    ``base_delay`` plus a random ``random_delay`` seconds apart.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        config: dict[str, Any],
+        backend: RateLimitBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        interval = 3600 / config["max_requests_per_hour"]
+        self.limits: list[Limit] = [(channel, interval, interval * (config.get("burst", 1) - 1))]
+        if config.get("use_proxy"):
+            self.limits.append(("scraping", 3600 / get_settings().scraping_max_requests_per_hour, 0.0))
+        self.base_delay = config.get("base_delay", 0)
+        self.random_delay = config.get("random_delay", (0, 0))
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.clock = clock
+
+        self._waiters: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self._dispatcher: asyncio.Task | None = None
+        self._next_start = 0.0
+        self._spacing_lock = asyncio.Lock()
+
+    def _spacing(self) -> float:
+        low, high = self.random_delay
+        return self.base_delay + random.uniform(low, high)
+
+    async def acquire(self, brand: str | None = None) -> float:
+        """
+        Wait until a request may be sent.
+
+        Args:
+            brand: Brand the request is made for, used for fair queuing
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = self.clock()
+        brand = brand or DEFAULT_BRAND
+
+        # Fast path: nobody queued and a slot is free
+        if self._waiters or await self.backend.try_acquire(self.limits) > 0:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.setdefault(brand, deque()).append(future)
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.create_task(self._dispatch())
+            await future
+
+        if self.base_delay or self.random_delay[1]:
+            async with self._spacing_lock:
+                wait = self._next_start - self.clock()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = self.clock() + self._spacing()
+
+        return self.clock() - start
+
+    async def _dispatch(self) -> None:
+        """Grant slots to queued waiters, rotating between brands."""
+        while self._waiters:
+            brand, queue = next(iter(self._waiters.items()))
+            if queue[0].cancelled():
+                queue.popleft()
+                if not queue:
+                    del self._waiters[brand]
+                continue
+
+            try:
+                wait = await self.backend.try_acquire(self.limits)
+            except Exception as e:
+                # Backend unavailable (e.g. Redis down): fail the queued
+                # requests instead of leaving them waiting forever
+                for waiting in self._waiters.values():
+                    for future in waiting:
+                        if not future.done():
+                            future.set_exception(e)
+                self._waiters.clear()
+                return
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+
+            future = queue.popleft()
+            if not future.done():
+                future.set_result(None)
+            if queue:
+                self._waiters.move_to_end(brand)
+            else:
+                del self._waiters[brand]
+
+    @property
+    def queued(self) -> dict[str, int]:
+        """Number of waiting requests per brand."""
+        return {brand: len(queue) for brand, queue in self._waiters.items()}
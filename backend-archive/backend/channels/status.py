@@ -0,0 +1,227 @@
+"""Concurrent, cached channel status aggregation for the dashboard."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from backend.config import get_settings
+
+StatusProvider = Callable[[str], Awaitable[dict[str, Any]]]
+
+
+class CachedStatus:
+    """Last successful status of one (channel, brand) and when it was fetched."""
+
+    __slots__ = ("value", "fetched_at", "fetched_wall")
+
+    def __init__(self, value: dict[str, Any], fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.fetched_wall = datetime.now().astimezone()
+
+
+class ChannelStatusAggregator:
+    """
+    Fans out to every channel's status provider concurrently.
+
+    Each channel gets ``deadline`` seconds. Results are cached per
+    (channel, brand): within ``ttl`` the cached status is served as is;
+    between ``ttl`` and ``max_stale`` it is served immediately, marked
+    stale, while one background refresh runs (stale-while-revalidate).
+    A channel that misses its deadline is reported from its last cached
+    status if there is one, or as pending otherwise, and its fetch keeps
+    running to fill the cache for the next request. Overview latency is
+    therefore bounded by the deadline, not by the slowest channel.
+    """
+
+    def __init__(
+        self,
+        providers: dict[str, tuple[str, StatusProvider]],
+        deadline: float | None = None,
+        ttl: float | None = None,
+        max_stale: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            providers: Channel code -> (display name, coroutine taking a brand ID)
+            deadline: Seconds each channel has to answer
+            ttl: Seconds a status is served without revalidation
+            max_stale: Seconds a status may be served stale while revalidating
+            clock: Monotonic clock
+        """
+        settings = get_settings()
+        self.providers = providers
+        self.deadline = deadline if deadline is not None else settings.channel_status_deadline_s
+        self.ttl = ttl if ttl is not None else settings.channel_status_ttl_s
+        self.max_stale = max_stale if max_stale is not None else settings.channel_status_max_stale_s
+        self.clock = clock
+
+        self._cache: dict[tuple[str, str], CachedStatus] = {}
+        self._errors: dict[tuple[str, str], str] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def _refresh(self, key: tuple[str, str]) -> asyncio.Task:
+        """Start (or join) the single in-flight fetch for ``key``."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._fetch(key))
+        return task
+
+    async def _fetch(self, key: tuple[str, str]) -> CachedStatus:
+        channel, brand_id = key
+        _, provider = self.providers[channel]
+        try:
+            value = await provider(brand_id)
+        except Exception as e:
+            self.errors += 1
+            self._errors[key] = str(e) or type(e).__name__
+            print(f"Channel status for {channel} failed: {self._errors[key]}")
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        entry = self._cache[key] = CachedStatus(value, self.clock())
+        self._errors.pop(key, None)
+        return entry
+
+    async def channel_status(self, channel: str, brand_id: str = "default") -> dict[str, Any]:
+        """Status of one channel within the deadline; see the class docstring."""
+        key = (channel, brand_id)
+        cached = self._cache.get(key)
+        age = self.clock() - cached.fetched_at if cached is not None else None
+
+        if cached is not None and age < self.ttl:
+            self.hits += 1
+            return self._describe(channel, cached, stale=False)
+        if cached is not None and age < self.max_stale:
+            self.stale_hits += 1
+            self._refresh(key).add_done_callback(_consume_error)
+            return self._describe(channel, cached, stale=True)
+
+        self.misses += 1
+        task = self._refresh(key)
+        try:
+            fresh = await asyncio.wait_for(asyncio.shield(task), self.deadline)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            task.add_done_callback(_consume_error)
+            return self._describe(
+                channel, cached, stale=True, error=f"No response within {self.deadline:g}s", pending=True
+            )
+        except Exception:
+            return self._describe(channel, cached, stale=True, error=self._errors.get(key))
+        return self._describe(channel, fresh, stale=False)
+
+    async def overview(self, brand_id: str = "default") -> dict[str, Any]:
+        """Status of every channel, fetched concurrently."""
+        channels = await asyncio.gather(*(self.channel_status(channel, brand_id) for channel in self.providers))
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "brand_id": brand_id,
+            "stale": any(channel["stale"] for channel in channels),
+            "channels": channels,
+        }
+
+    def _describe(
+        self,
+        channel: str,
+        cached: CachedStatus | None,
+        stale: bool,
+        error: str | None = None,
+        pending: bool = False,
+    ) -> dict[str, Any]:
+        name, _ = self.providers[channel]
+        if cached is None:
+            return {
+                "name": name,
+                "code": channel,
+                "status": "pending" if pending else "offline",
+                "stale": True,
+                "last_sync": None,
+                "age_s": None,
+                "error": error,
+                "metrics": {},
+                "summary": None,
+            }
+        value = cached.value
+        if error is None and "error" in value:
+            error = value["error"]
+        return {
+            "name": name,
+            "code": channel,
+            "status": "degraded" if stale or error else "online",
+            "stale": stale,
+            "last_sync": cached.fetched_wall.isoformat(),
+            "age_s": round(self.clock() - cached.fetched_at, 1),
+            "error": error,
+            "metrics": value.get("metrics", {}),
+            "summary": value.get("summary"),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "in_flight": len(self._inflight),
+            "cached": len(self._cache),
+        }
+
+    async def close(self) -> None:
+        """Cancel in-flight refreshes."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _consume_error(task: asyncio.Task) -> None:
+    """Retrieve a background refresh's exception so it is not reported as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+_aggregator: ChannelStatusAggregator | None = None
+
+
+def get_channel_status_aggregator() -> ChannelStatusAggregator:
+    """Get the shared aggregator over the four channel agents' status coroutines."""
+    global _aggregator
+    if _aggregator is None:
+        # Imported lazily: the agent modules import backend.channels
+        from backend.agents.divisions.channel_management.coupang_agent import fetch_coupang_status
+        from backend.agents.divisions.channel_management.kakao_agent import fetch_kakao_status
+        from backend.agents.divisions.channel_management.naver_agent import fetch_naver_status
+        from backend.agents.divisions.channel_management.oliveyoung_agent import (
+            fetch_oliveyoung_status,
+        )
+
+        _aggregator = ChannelStatusAggregator({
+            "oliveyoung": ("Oliveyoung", fetch_oliveyoung_status),
+            "coupang": ("Coupang", fetch_coupang_status),
+            "naver": ("Naver", fetch_naver_status),
+            "kakao": ("Kakao", fetch_kakao_status),
+        })
+    return _aggregator
+
+
+async def close_channel_status_aggregator() -> None:
+    """Cancel the shared aggregator's background refreshes (on shutdown)."""
+    global _aggregator
+    if _aggregator is not None:
+        await _aggregator.close()
+        _aggregator = None
@@ -0,0 +1,737 @@
+"""Asynchronous execution of cross-channel sync tasks."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import random
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.channels.client import ChannelClient, ChannelRequestError, get_channel_client
+from backend.config import CHANNEL_SCRAPING_CONFIG, get_settings
+
+# Bulk update endpoint per task type; each call carries one batch of products
+SYNC_PATHS = {
+    "price": "/v1/products/prices",
+    "inventory": "/v1/products/inventory",
+    "content": "/v1/products/content",
+}
+
+# Task types that wait for a person to approve them
+APPROVAL_REQUIRED = ("price",)
+
+# Tasks an identical request without an idempotency key is deduplicated against
+ACTIVE_STATUSES = ("pending_approval", "queued", "running")
+
+EventPublisher = Callable[[dict[str, Any], list[str]], Awaitable[Any]]
+
+
+class LeaseLostError(Exception):
+    """A running sync task's lease is held by another worker or could not be renewed."""
+
+
+class SyncTaskStore(ABC):
+    """Persists sync tasks, their per-batch progress and who is running them."""
+
+    @abstractmethod
+    async def load(self, task_id: str) -> dict[str, Any] | None:
+        """Task by ID, or None if unknown."""
+
+    @abstractmethod
+    async def find(self, idempotency_key: str) -> dict[str, Any] | None:
+        """Task created with an explicit idempotency key, whatever its status."""
+
+    @abstractmethod
+    async def find_active(self, fingerprint: str) -> dict[str, Any] | None:
+        """Oldest task with ``fingerprint`` that is pending approval, queued or running."""
+
+    @abstractmethod
+    async def unfinished(self) -> list[dict[str, Any]]:
+        """Tasks that were queued or running, oldest first."""
+
+    @abstractmethod
+    async def save(self, task: dict[str, Any], owner: str | None = None) -> bool:
+        """
+        Insert or overwrite a task, leaving its lease as it is.
+
+        With ``owner``, an existing task is only overwritten while ``owner``
+        holds its lease; returns False if it was left untouched.
+        """
+
+    @abstractmethod
+    async def claim(
+        self,
+        task_id: str,
+        statuses: Sequence[str],
+        values: dict[str, Any],
+        now: datetime,
+    ) -> dict[str, Any] | None:
+        """
+        Atomically set ``values`` on a task in one of ``statuses`` that is not leased at ``now``.
+
+        Returns the claimed task, or None if another caller got it first.
+        """
+
+    @abstractmethod
+    async def renew(self, task_ids: Sequence[str], owner: str, expires_at: datetime | None) -> set[str]:
+        """
+        Extend the leases ``owner`` holds on ``task_ids``, or release them with None.
+
+        Returns the IDs of the tasks whose lease ``owner`` still held.
+        """
+
+
+class InMemorySyncTaskStore(SyncTaskStore):
+    """Tasks in process memory; survives a cancelled task, not a restart."""
+
+    def __init__(self):
+        self._tasks: dict[str, dict[str, Any]] = {}
+
+    async def load(self, task_id: str) -> dict[str, Any] | None:
+        task = self._tasks.get(task_id)
+        return copy.deepcopy(task) if task is not None else None
+
+    async def find(self, idempotency_key: str) -> dict[str, Any] | None:
+        for task in self._tasks.values():
+            if task["idempotency_key"] == idempotency_key:
+                return copy.deepcopy(task)
+        return None
+
+    async def find_active(self, fingerprint: str) -> dict[str, Any] | None:
+        for task in self._tasks.values():
+            if task["fingerprint"] == fingerprint and task["status"] in ACTIVE_STATUSES:
+                return copy.deepcopy(task)
+        return None
+
+    async def unfinished(self) -> list[dict[str, Any]]:
+        return [copy.deepcopy(task) for task in self._tasks.values() if task["status"] in ("queued", "running")]
+
+    async def save(self, task: dict[str, Any], owner: str | None = None) -> bool:
+        previous = self._tasks.get(task["id"], {})
+        if owner is not None and previous and previous["lease_owner"] != owner:
+            return False
+        self._tasks[task["id"]] = {
+            **copy.deepcopy(task),
+            "lease_owner": previous.get("lease_owner"),
+            "lease_expires_at": previous.get("lease_expires_at"),
+        }
+        return True
+
+    async def claim(
+        self,
+        task_id: str,
+        statuses: Sequence[str],
+        values: dict[str, Any],
+        now: datetime,
+    ) -> dict[str, Any] | None:
+        task = self._tasks.get(task_id)
+        if task is None or task["status"] not in statuses:
+            return None
+        if task["lease_expires_at"] is not None and task["lease_expires_at"] >= now:
+            return None
+        task.update(copy.deepcopy(values))
+        return copy.deepcopy(task)
+
+    async def renew(self, task_ids: Sequence[str], owner: str, expires_at: datetime | None) -> set[str]:
+        held = set()
+        for task_id in task_ids:
+            task = self._tasks.get(task_id)
+            if task is not None and task["lease_owner"] == owner:
+                task["lease_expires_at"] = expires_at
+                held.add(task_id)
+        return held
+
+
+class DatabaseSyncTaskStore(SyncTaskStore):
+    """Tasks in the sync_tasks table."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None):
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from backend.db.session import async_session
+
+            self._session_factory = async_session
+        return self._session_factory
+
+    async def load(self, task_id: str) -> dict[str, Any] | None:
+        from backend.db.sync import load_sync_task
+
+        async with self.session_factory() as session:
+            return await load_sync_task(session, task_id)
+
+    async def find(self, idempotency_key: str) -> dict[str, Any] | None:
+        from backend.db.sync import find_sync_task
+
+        async with self.session_factory() as session:
+            return await find_sync_task(session, idempotency_key)
+
+    async def find_active(self, fingerprint: str) -> dict[str, Any] | None:
+        from backend.db.sync import find_active_sync_task
+
+        async with self.session_factory() as session:
+            return await find_active_sync_task(session, fingerprint)
+
+    async def unfinished(self) -> list[dict[str, Any]]:
+        from backend.db.sync import load_unfinished_sync_tasks
+
+        async with self.session_factory() as session:
+            return await load_unfinished_sync_tasks(session)
+
+    async def save(self, task: dict[str, Any], owner: str | None = None) -> bool:
+        from backend.db.sync import save_sync_task
+
+        async with self.session_factory() as session:
+            saved = await save_sync_task(session, task, owner)
+            await session.commit()
+            return saved
+
+    async def claim(
+        self,
+        task_id: str,
+        statuses: Sequence[str],
+        values: dict[str, Any],
+        now: datetime,
+    ) -> dict[str, Any] | None:
+        from backend.db.sync import claim_sync_task
+
+        async with self.session_factory() as session:
+            task = await claim_sync_task(session, task_id, statuses, values, now)
+            await session.commit()
+            return task
+
+    async def renew(self, task_ids: Sequence[str], owner: str, expires_at: datetime | None) -> set[str]:
+        from backend.db.sync import renew_sync_task_leases
+
+        async with self.session_factory() as session:
+            held = await renew_sync_task_leases(session, task_ids, owner, expires_at)
+            await session.commit()
+            return held
+
+
+def sync_task_fingerprint(
+    task_type: str,
+    products: Sequence[str],
+    channels: Sequence[str],
+    target_value: Any,
+    brand: str | None = None,
+) -> str:
+    """Hash of what a task does, so the same sync requested twice while unfinished runs once."""
+    payload = json.dumps(
+        [task_type, brand, sorted(products), sorted(channels), target_value],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def estimate_sync_seconds(channels: Sequence[str], product_count: int, batch_size: int | None = None) -> float:
+    """
+    Rough time for the channel rate limiters to admit every batch request.
+
+    Each channel sends its burst at once and then one request per interval,
+    with requests spaced by its base plus average random delay; channels
+    run in parallel, so the slowest channel sets the total.
+    """
+    batch_size = batch_size or get_settings().channel_sync_batch_size
+    batches = -(-product_count // batch_size)
+    slowest = 0.0
+    for channel in channels:
+        config = CHANNEL_SCRAPING_CONFIG.get(channel)
+        if config is None:
+            continue
+        interval = 3600 / config["max_requests_per_hour"]
+        spacing = config.get("base_delay", 0) + sum(config.get("random_delay", (0, 0))) / 2
+        limited = max(0, batches - config.get("burst", 1)) * interval
+        slowest = max(slowest, limited, batches * spacing)
+    return slowest
+
+
+def _now() -> datetime:
+    return datetime.now().astimezone()
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+async def publish_to_event_bus(message: dict[str, Any], topics: list[str]) -> None:
+    """Publish a progress event to WebSocket clients on every worker."""
+    # Imported lazily: backend.api imports backend.channels
+    from backend.api.websocket import event_bus
+
+    await event_bus.publish(message, topics=topics)
+
+
+class ChannelSyncExecutor:
+    """
+    Runs sync tasks: one step per channel, every step in parallel.
+
+    A step sends the task's products to the channel's bulk update endpoint in
+    ``batch_size`` batches, ``batch_concurrency`` at a time, through the
+    channel client, so its rate limit, retries and circuit breaker apply. A
+    batch the client gives up on is retried up to ``max_attempts`` times with
+    exponential backoff before its step fails; a 4xx response fails it at
+    once. At most ``max_steps`` channel steps run at once across all tasks.
+
+    Submitting with an idempotency key seen before returns that task; without
+    one, an identical task that is still pending approval, queued or running
+    is returned instead. Price tasks wait in ``pending_approval`` until
+    approved. Every start, approval and rejection claims the task with a
+    conditional update in the store, so of several workers (or concurrent
+    approvals) exactly one proceeds. A running task is leased to this
+    executor for ``lease_s`` and the lease is renewed while it runs; tasks a
+    stopped process left queued, or running with an expired or released
+    lease, are picked up by ``resume``, skipping batches already synced. The
+    task is saved after every batch, and only while this executor still
+    holds its lease: when a save finds the task leased to another worker or
+    a renewal fails, the run is cancelled so two workers never send the same
+    batches, and ``start`` resumes it again once the lease expires. Progress
+    is published under ``sync:<task_id>`` plus brand and channel topics.
+    """
+
+    def __init__(
+        self,
+        store: SyncTaskStore | None = None,
+        client_factory: Callable[[str], ChannelClient] = get_channel_client,
+        batch_size: int | None = None,
+        batch_concurrency: int | None = None,
+        max_steps: int | None = None,
+        max_attempts: int | None = None,
+        backoff: float | None = None,
+        lease_s: float | None = None,
+        publish: EventPublisher | None = publish_to_event_bus,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            store: Task store (defaults to the database)
+            client_factory: Channel name -> client used for updates
+            batch_size: Products per update request
+            batch_concurrency: Update requests in flight per channel step
+            max_steps: Channel steps running at once across all tasks
+            max_attempts: Attempts per batch before its step fails
+            backoff: Base seconds between attempts, doubled per attempt, with full jitter
+            lease_s: Seconds a running task stays leased to this executor without renewal
+            publish: Coroutine taking (message, topics) for progress events; None to disable
+        """
+        settings = get_settings()
+        self.store = store or DatabaseSyncTaskStore()
+        self.client_factory = client_factory
+        self.batch_size = batch_size or settings.channel_sync_batch_size
+        self.batch_concurrency = batch_concurrency or settings.channel_sync_batch_concurrency
+        self.max_attempts = max_attempts or settings.channel_sync_max_attempts
+        self.backoff = backoff if backoff is not None else settings.channel_retry_backoff_s
+        self.lease_s = lease_s or settings.channel_sync_lease_s
+        self.publish = publish
+        self.worker_id = uuid.uuid4().hex
+
+        self._step_slots = asyncio.Semaphore(max_steps or settings.channel_sync_max_steps)
+        self._submit_lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+        self._running: dict[str, asyncio.Task] = {}
+        self._heartbeat: asyncio.Task | None = None
+        self._sweeper: asyncio.Task | None = None
+
+    async def submit(
+        self,
+        task_type: str,
+        products: Sequence[str],
+        channels: Sequence[str],
+        target_value: Any,
+        brand: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create a sync task and start it unless it needs approval.
+
+        Args:
+            task_type: price, inventory or content
+            products: Product IDs
+            channels: Channels to update
+            target_value: Value every product is set to
+            brand: Brand the task is for
+            idempotency_key: Key identifying this request; without one, only an
+                identical unfinished task is reused
+
+        Returns:
+            The task (the existing one, with ``duplicate`` set, if this is a repeat)
+
+        Raises:
+            ValueError: On an unknown task type or channel, or no products or channels
+        """
+        if task_type not in SYNC_PATHS:
+            raise ValueError(f"Unknown sync task type: {task_type}")
+        unknown = [channel for channel in channels if channel not in CHANNEL_SCRAPING_CONFIG]
+        if unknown:
+            raise ValueError(f"Unknown channels: {', '.join(unknown)}")
+        if not products or not channels:
+            raise ValueError("A sync task needs at least one product and one channel")
+
+        products = list(dict.fromkeys(products))
+        fingerprint = sync_task_fingerprint(task_type, products, channels, target_value, brand)
+        async with self._submit_lock:
+            if idempotency_key:
+                existing = await self.store.find(idempotency_key)
+            else:
+                existing = await self.store.find_active(fingerprint)
+            if existing is not None:
+                return {**self.describe(existing), "duplicate": True}
+
+            requires_approval = task_type in APPROVAL_REQUIRED
+            batch_count = -(-len(products) // self.batch_size)
+            task = {
+                "id": f"sync_{uuid.uuid4().hex[:16]}",
+                "idempotency_key": idempotency_key or None,
+                "fingerprint": fingerprint,
+                "task_type": task_type,
+                "brand": brand,
+                "products": products,
+                "channels": list(channels),
+                "target_value": target_value,
+                "status": "pending_approval" if requires_approval else "queued",
+                "requires_approval": requires_approval,
+                "approved_by": None,
+                "approved_at": None,
+                "started_at": None,
+                "completed_at": None,
+                "steps": [
+                    {
+                        "channel": channel,
+                        "status": "pending",
+                        "batch_size": self.batch_size,
+                        "total": len(products),
+                        "synced": 0,
+                        "error": None,
+                        "batches": [
+                            {"index": index, "status": "pending", "attempts": 0, "error": None}
+                            for index in range(batch_count)
+                        ],
+                    }
+                    for channel in channels
+                ],
+            }
+            await self._save(task)
+
+        await self._publish(task)
+        if not requires_approval:
+            await self._claim_and_start(task["id"])
+        return self.describe(task)
+
+    async def approve(self, task_id: str, approved_by: str) -> dict[str, Any]:
+        """
+        Approve a task waiting for approval and start it.
+
+        Raises:
+            ValueError: If the task does not exist or is not waiting for approval
+        """
+        task = await self._claim_pending_approval(
+            task_id, {"status": "queued", "approved_by": approved_by, "approved_at": _now()}
+        )
+        await self._publish(task)
+        await self._claim_and_start(task_id)
+        return self.describe(task)
+
+    async def reject(self, task_id: str, rejected_by: str) -> dict[str, Any]:
+        """
+        Reject a task waiting for approval; nothing is sent.
+
+        Raises:
+            ValueError: If the task does not exist or is not waiting for approval
+        """
+        task = await self._claim_pending_approval(
+            task_id, {"status": "rejected", "approved_by": rejected_by, "completed_at": _now()}
+        )
+        await self._publish(task)
+        return self.describe(task)
+
+    async def _claim_pending_approval(self, task_id: str, values: dict[str, Any]) -> dict[str, Any]:
+        task = await self.store.claim(task_id, ("pending_approval",), values, _now())
+        if task is not None:
+            return task
+        current = await self.store.load(task_id)
+        if current is None:
+            raise ValueError(f"Unknown sync task: {task_id}")
+        raise ValueError(f"Sync task {task_id} is {current['status']}, not pending approval")
+
+    async def get(self, task_id: str) -> dict[str, Any] | None:
+        """Current state of a task, or None if unknown."""
+        task = await self.store.load(task_id)
+        return self.describe(task) if task is not None else None
+
+    async def wait(self, task_id: str) -> dict[str, Any] | None:
+        """Wait for a running task to finish and return its final state."""
+        running = self._running.get(task_id)
+        if running is not None:
+            # Not awaited directly: a run cancelled after losing its lease still counts as finished
+            await asyncio.wait([running])
+        return await self.get(task_id)
+
+    async def resume(self) -> int:
+        """
+        Restart queued tasks and running tasks whose lease expired or was released.
+
+        Each task is claimed first, so a task is restarted by one worker only.
+
+        Returns:
+            Number of tasks restarted
+        """
+        resumed = 0
+        for task in await self.store.unfinished():
+            if task["id"] not in self._running:
+                resumed += await self._claim_and_start(task["id"])
+        return resumed
+
+    def start(self) -> None:
+        """Start resuming unfinished tasks now and every ``lease_s``, so abandoned leases are picked up."""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._resume_periodically())
+
+    async def _resume_periodically(self) -> None:
+        failing = False
+        while True:
+            try:
+                resumed = await self.resume()
+            except Exception as e:
+                if not failing:
+                    print(f"Could not resume channel sync tasks: {e}")
+                    failing = True
+            else:
+                failing = False
+                if resumed:
+                    print(f"Resumed {resumed} channel sync tasks")
+            await asyncio.sleep(self.lease_s)
+
+    async def _claim_and_start(self, task_id: str) -> bool:
+        """Lease a queued or abandoned running task to this executor and run it."""
+        now = _now()
+        task = await self.store.claim(
+            task_id,
+            ("queued", "running"),
+            {
+                "status": "running",
+                "lease_owner": self.worker_id,
+                "lease_expires_at": now + timedelta(seconds=self.lease_s),
+            },
+            now,
+        )
+        if task is None:
+            return False
+
+        running = self._running[task_id] = asyncio.create_task(self._execute(task))
+        running.add_done_callback(lambda _: self._finished(task_id))
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.create_task(self._renew_leases())
+        return True
+
+    def _finished(self, task_id: str) -> None:
+        self._running.pop(task_id, None)
+        if not self._running and self._heartbeat is not None:
+            self._heartbeat.cancel()
+
+    async def _renew_leases(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_s / 3)
+            task_ids = list(self._running)
+            try:
+                held = await self.store.renew(task_ids, self.worker_id, _now() + timedelta(seconds=self.lease_s))
+            except Exception as e:
+                # The lease may lapse before the next attempt; stop rather than race a new owner
+                print(f"Renewing sync task leases failed: {e}")
+                held = set()
+            for task_id in task_ids:
+                if task_id not in held:
+                    self._abandon(task_id)
+
+    def _abandon(self, task_id: str) -> None:
+        running = self._running.get(task_id)
+        if running is not None and not running.done():
+            print(f"Sync task {task_id} lost its lease; stopping it here")
+            running.cancel()
+
+    async def _execute(self, task: dict[str, Any]) -> None:
+        try:
+            task["started_at"] = task["started_at"] or _now()
+            await self._save(task, leased=True)
+            await self._publish(task)
+
+            await asyncio.gather(*(
+                self._run_step(task, step) for step in task["steps"] if step["status"] != "completed"
+            ))
+
+            task["status"] = "failed" if any(step["status"] == "failed" for step in task["steps"]) else "completed"
+            task["completed_at"] = _now()
+            await self._save(task, leased=True)
+            await self._publish(task)
+        except LeaseLostError:
+            pass
+
+    async def _run_step(self, task: dict[str, Any], step: dict[str, Any]) -> None:
+        async with self._step_slots:
+            step["status"] = "running"
+            batches = step["batches"]
+            pending = deque(batch["index"] for batch in batches if batch["status"] != "done")
+
+            async def worker() -> None:
+                while pending:
+                    await self._run_batch(task, step, batches[pending.popleft()])
+                    step["synced"] = sum(
+                        len(self._batch_products(task, step, batch["index"]))
+                        for batch in batches
+                        if batch["status"] == "done"
+                    )
+                    await self._save(task, leased=True)
+                    await self._publish(task, step["channel"])
+
+            await asyncio.gather(*(worker() for _ in range(min(self.batch_concurrency, len(pending)))))
+
+            failed = [batch for batch in batches if batch["status"] != "done"]
+            step["status"] = "failed" if failed else "completed"
+            step["error"] = failed[0]["error"] if failed else None
+
+    @staticmethod
+    def _batch_products(task: dict[str, Any], step: dict[str, Any], index: int) -> list[str]:
+        size = step["batch_size"]
+        return task["products"][index * size:(index + 1) * size]
+
+    async def _run_batch(self, task: dict[str, Any], step: dict[str, Any], batch: dict[str, Any]) -> None:
+        channel = step["channel"]
+        path = SYNC_PATHS[task["task_type"]]
+        client = self.client_factory(channel)
+        while True:
+            batch["attempts"] += 1
+            try:
+                response = await client.request(
+                    "PUT",
+                    path,
+                    brand=task["brand"],
+                    json={
+                        "product_ids": self._batch_products(task, step, batch["index"]),
+                        "value": task["target_value"],
+                    },
+                    headers={"Idempotency-Key": f"{task['id']}:{channel}:{batch['index']}"},
+                )
+            except ChannelRequestError as e:
+                batch["error"] = str(e)
+                if batch["attempts"] >= self.max_attempts:
+                    batch["status"] = "failed"
+                    print(f"Sync task {task['id']} batch {batch['index']} on {channel} failed: {e}")
+                    return
+                await asyncio.sleep(random.uniform(0, self.backoff * 2 ** (batch["attempts"] - 1)))
+                continue
+
+            if response.is_error:
+                # Not retried: the request itself was refused
+                batch.update(status="failed", error=f"PUT {path} returned {response.status_code}")
+                print(f"Sync task {task['id']} batch {batch['index']} on {channel} failed: {batch['error']}")
+            else:
+                batch.update(status="done", error=None)
+            return
+
+    async def _save(self, task: dict[str, Any], leased: bool = False) -> None:
+        # Serialized so an older snapshot can never overwrite a newer one
+        async with self._save_lock:
+            saved = await self.store.save(copy.deepcopy(task), self.worker_id if leased else None)
+        if not saved:
+            self._abandon(task["id"])
+            raise LeaseLostError(f"Sync task {task['id']} is leased to another worker")
+
+    async def _publish(self, task: dict[str, Any], channel: str | None = None) -> None:
+        if self.publish is None:
+            return
+        topics = [f"sync:{task['id']}"]
+        if task["brand"]:
+            topics.append(f"brand:{task['brand']}")
+        topics.extend(f"channel:{c}" for c in ([channel] if channel else task["channels"]))
+        try:
+            await self.publish(
+                {
+                    "type": "sync_progress",
+                    "task": self.describe(task),
+                    "channel": channel,
+                    "timestamp": _now().isoformat(),
+                },
+                topics,
+            )
+        except Exception as e:
+            print(f"Sync progress event for {task['id']} failed: {e}")
+
+    def describe(self, task: dict[str, Any]) -> dict[str, Any]:
+        """Task summary with per-channel progress, without per-batch detail."""
+        total = sum(step["total"] for step in task["steps"])
+        synced = sum(step["synced"] for step in task["steps"])
+        return {
+            "task_id": task["id"],
+            "task_type": task["task_type"],
+            "brand": task["brand"],
+            "product_count": len(task["products"]),
+            "channels": task["channels"],
+            "target_value": task["target_value"],
+            "status": task["status"],
+            "requires_approval": task["requires_approval"],
+            "approved_by": task["approved_by"],
+            "approved_at": _isoformat(task["approved_at"]),
+            "started_at": _isoformat(task["started_at"]),
+            "completed_at": _isoformat(task["completed_at"]),
+            "idempotency_key": task["idempotency_key"],
+            "progress": {
+                "synced": synced,
+                "total": total,
+                "percent": round(synced / total * 100, 1) if total else 100.0,
+            },
+            "steps": [
+                {
+                    "channel": step["channel"],
+                    "status": step["status"],
+                    "synced": step["synced"],
+                    "total": step["total"],
+                    "failed_batches": sum(batch["status"] == "failed" for batch in step["batches"]),
+                    "error": step["error"],
+                }
+                for step in task["steps"]
+            ],
+        }
+
+    async def close(self) -> None:
+        """Cancel running tasks and release their leases; they resume on restart or on another worker."""
+        task_ids = list(self._running)
+        tasks = list(self._running.values())
+        tasks.extend(task for task in (self._heartbeat, self._sweeper) if task is not None)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await self.store.renew(task_ids, self.worker_id, None)
+        except Exception as e:
+            print(f"Releasing sync task leases failed: {e}")
+
+
+_executor: ChannelSyncExecutor | None = None
+
+
+def get_sync_executor() -> ChannelSyncExecutor:
+    """Get the shared executor, persisting tasks to the database."""
+    global _executor
+    if _executor is None:
+        _executor = ChannelSyncExecutor()
+    return _executor
+
+
+async def close_sync_executor() -> None:
+    """Cancel the shared executor's running tasks (on shutdown)."""
+    global _executor
+    if _executor is not None:
+        await _executor.close()
+        _executor = None
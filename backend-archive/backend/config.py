@@ -35,9 +35,32 @@ class Settings(BaseSettings):
 
     # Database (Supabase/PostgreSQL)
     database_url: str = ""
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    database_replica_url: str = ""  # Read-only GET endpoints use the primary if unset
+    database_replica_pool_size: int = 10
+    database_replica_max_overflow: int = 20
     supabase_url: str = ""
     supabase_key: str = ""
 
+    # Alerts
+    alert_writer_batch_size: int = 500
+    alert_writer_flush_interval_ms: int = 1000
+    alert_writer_max_buffer: int = 50000  # Oldest alerts are dropped beyond this while flushes fail
+
+    # WebSocket
+    websocket_send_queue_size: int = 256  # Slow consumers are evicted when full
+    websocket_backplane: str = "memory"  # "redis" to fan out across workers
+    websocket_backplane_channel: str = "promotor:ws-events"
+    websocket_event_batch_size: int = 100
+    websocket_event_flush_interval_ms: int = 20
+    websocket_event_dedup_size: int = 10000
+    websocket_metric_keyframe_interval: int = 50  # Full snapshot every N metric updates
+    websocket_max_concurrent_requests: int = 2  # In-flight chat requests per socket
+    websocket_heartbeat_interval_s: float = 20.0  # Server heartbeat after this much client silence
+    websocket_idle_timeout_s: float = 60.0  # Connections silent this long are closed
+
     # Redis
     redis_url: str = "redis://localhost:6379"
     cache_ttl_seconds: int = 3600  # 1 hour default
@@ -51,6 +74,11 @@ class Settings(BaseSettings):
     scraping_proxy_url: str | None = None
     scraping_base_delay: float = 3.0
     scraping_max_requests_per_hour: int = 100
+    oliveyoung_scraping_enabled: bool = False  # Serve sample data until enabled
+    browser_pool_size: int = 2  # Warm browser contexts (concurrent scrape jobs)
+    browser_pages_per_context: int = 50  # Recycle a context after this many pages
+    browser_headless: bool = True
+    browser_navigation_timeout_s: float = 20.0
 
     # Channel API Keys
     coupang_access_key: str = ""
@@ -59,6 +87,44 @@ class Settings(BaseSettings):
     naver_client_secret: str = ""
     kakao_admin_key: str = ""
 
+    # Channel HTTP clients
+    oliveyoung_api_base_url: str = "https://www.oliveyoung.co.kr"
+    coupang_api_base_url: str = "https://api-gateway.coupang.com"
+    naver_api_base_url: str = "https://api.commerce.naver.com"
+    kakao_api_base_url: str = "https://kapi.kakao.com"
+    channel_http_timeout_s: float = 10.0
+    channel_http_max_connections: int = 20
+    channel_http_max_retries: int = 3
+    channel_retry_backoff_s: float = 0.5  # Doubled per retry, with full jitter
+    channel_circuit_failure_threshold: int = 5
+    channel_circuit_reset_s: float = 30.0
+    channel_rate_limit_backend: str = "memory"  # "redis" to share budgets across workers and Celery
+    channel_fingerprint_cache_size: int = 5000  # URLs remembered for conditional fetches
+    channel_fingerprint_backend: str = "memory"  # "redis" to share fingerprints across workers and Celery
+    channel_fingerprint_ttl_s: int = 86400  # Fingerprints kept in Redis after their last write
+    channel_status_deadline_s: float = 2.0  # Per-channel budget for the dashboard overview
+    channel_status_ttl_s: float = 60.0  # Served from cache without revalidation
+    channel_status_max_stale_s: float = 900.0  # Served stale while revalidating in the background
+    ranking_keyframe_interval: int = 24  # Full ranking list stored every N snapshots
+    ranking_boards: list[str] = ["skincare:sales", "makeup:sales", "maskpack:sales", "cleansing:sales", "suncare:sales"]
+    ranking_fetch_interval_s: float = 3600.0  # Oliveyoung leaderboards are snapshotted this often
+    ranking_retention_days: int = 90
+    map_price_refresh_s: float = 300.0  # Reload MAP prices from products this often
+    price_read_batch_size: int = 5000  # Product IDs per batched pricing query
+    price_history_segment_size: int = 1024  # Raw points per series before a segment is sealed
+    price_history_raw_retention_days: int = 14  # Raw points kept; hourly/daily rollups are kept longer
+    price_history_raw_max_hours: int = 48  # Longest span served from raw points
+    price_history_hourly_max_days: int = 31  # Longest span served from hourly buckets
+    inventory_read_batch_size: int = 5000  # Product IDs per batched inventory query
+    sales_read_batch_size: int = 5000  # Product IDs or brands per batched sales rollup query
+    kakao_message_batch_size: int = 1000  # Recipients per Kakao Channel message API call
+    kakao_dispatch_concurrency: int = 4  # Message batches in flight at once
+    channel_sync_batch_size: int = 100  # Products per bulk update request
+    channel_sync_batch_concurrency: int = 2  # Update requests in flight per channel step
+    channel_sync_max_steps: int = 8  # Channel steps running at once across all sync tasks
+    channel_sync_max_attempts: int = 3  # Attempts per batch before its step fails
+    channel_sync_lease_s: float = 60.0  # A running task not renewed this long is taken over by another worker
+
     # Celery
     celery_broker_url: str = Field(default="redis://localhost:6379/0")
     celery_result_backend: str = Field(default="redis://localhost:6379/0")
@@ -67,6 +133,11 @@ class Settings(BaseSettings):
     enable_caching: bool = True
     enable_tiered_models: bool = True
     background_job_interval_hours: int = 4
+    background_job_executor: str = "local"  # "celery" when beat and workers run the jobs, "none" to disable
+    background_job_cache_backend: str = "memory"  # "redis" to share results between Celery workers and the API
+    background_job_jitter: float = 0.1  # Runs are shifted by up to this fraction of their interval
+    background_job_concurrency: int = 4  # Brands computed at once per job
+    background_job_lock_timeout_s: float = 900.0  # A crashed run's lock is released after this long
 
 
 @lru_cache
@@ -81,24 +152,28 @@ CHANNEL_SCRAPING_CONFIG = {
         "base_delay": 5,
         "random_delay": (2, 8),
         "max_requests_per_hour": 50,
+        "burst": 1,  # Token bucket capacity
         "use_proxy": True,
     },
     "coupang": {
         "base_delay": 3,
         "random_delay": (1, 5),
         "max_requests_per_hour": 100,
+        "burst": 5,
         "use_proxy": False,  # Prefer official API
     },
     "naver": {
         "base_delay": 3,
         "random_delay": (1, 4),
         "max_requests_per_hour": 100,
+        "burst": 5,
         "use_proxy": False,  # Prefer official API
     },
     "kakao": {
         "base_delay": 2,
         "random_delay": (1, 3),
         "max_requests_per_hour": 150,
+        "burst": 10,
         "use_proxy": False,  # Prefer official API
     },
 }
@@ -1,5 +1,24 @@
 """Database package for Promotor."""
 
-from backend.db.session import async_session, engine, get_db
+from backend.db.alert_writer import AlertWriter, alert_writer
+from backend.db.session import (
+    async_session,
+    engine,
+    get_db,
+    get_pool_metrics,
+    get_readonly_db,
+    readonly_session,
+    replica_engine,
+)
 
-__all__ = ["async_session", "engine", "get_db"]
+__all__ = [
+    "AlertWriter",
+    "alert_writer",
+    "async_session",
+    "engine",
+    "get_db",
+    "get_pool_metrics",
+    "get_readonly_db",
+    "readonly_session",
+    "replica_engine",
+]
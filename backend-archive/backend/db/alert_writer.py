@@ -0,0 +1,189 @@
+"""Batched alert writer that coalesces alerts into multi-row inserts."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.config import get_settings
+from backend.models import Alert
+from backend.models.alert import AlertSeverity, AlertType
+
+
+class AlertWriter:
+    """
+    Buffers alerts raised by agents and scheduled jobs and writes them in batches.
+
+    Alerts are queued in memory and flushed as a single multi-row INSERT
+    when the batch is full or the flush interval elapses, whichever comes first.
+    While flushes fail the buffer holds at most ``max_buffer`` alerts; the
+    oldest are dropped (and counted in ``dropped``) to make room.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_buffer: int | None = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session_factory: Session factory used for flushing (defaults to async_session)
+            batch_size: Maximum number of alerts per INSERT
+            flush_interval: Maximum seconds an alert waits in the buffer
+            max_buffer: Maximum number of alerts held while the database is unavailable
+        """
+        settings = get_settings()
+        self._session_factory = session_factory
+        self.batch_size = batch_size or settings.alert_writer_batch_size
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.alert_writer_flush_interval_ms / 1000
+        )
+        self.max_buffer = max_buffer or settings.alert_writer_max_buffer
+        self.dropped = 0
+        self._buffer: list[dict[str, Any]] = []
+        self._failing = False
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of alerts waiting to be written."""
+        return len(self._buffer)
+
+    def _get_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            # Imported lazily so the engine is only created when alerts are written
+            from backend.db.session import async_session
+
+            self._session_factory = async_session
+        return self._session_factory
+
+    async def write(
+        self,
+        title: str,
+        message: str,
+        alert_type: AlertType = AlertType.SYSTEM,
+        severity: AlertSeverity = AlertSeverity.INFO,
+        channel: str | None = None,
+    ) -> uuid.UUID:
+        """
+        Queue an alert for insertion.
+
+        Args:
+            title: Alert title
+            message: Alert message
+            alert_type: Type of alert
+            severity: Severity level
+            channel: Optional channel the alert relates to
+
+        Returns:
+            ID assigned to the alert
+        """
+        alert_id = uuid.uuid4()
+        self._buffer.append({
+            "id": alert_id,
+            "alert_type": AlertType(alert_type),
+            "severity": AlertSeverity(severity),
+            "title": title,
+            "message": message,
+            "channel": channel,
+            "acknowledged": False,
+        })
+        self._trim()
+
+        if len(self._buffer) >= self.batch_size:
+            if self._task is None:
+                await self.flush()
+            else:
+                self._wakeup.set()
+
+        return alert_id
+
+    async def flush(self) -> int:
+        """
+        Write all buffered alerts.
+
+        Returns:
+            Number of alerts written
+        """
+        async with self._lock:
+            if not self._buffer:
+                return 0
+
+            rows, self._buffer = self._buffer, []
+            session_factory = self._get_session_factory()
+
+            try:
+                async with session_factory() as session:
+                    for start in range(0, len(rows), self.batch_size):
+                        await session.execute(
+                            insert(Alert),
+                            rows[start : start + self.batch_size],
+                        )
+                    await session.commit()
+            except Exception:
+                # Put the rows back so the next flush retries them
+                self._buffer[:0] = rows
+                self._trim()
+                raise
+
+            return len(rows)
+
+    def _trim(self) -> None:
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self.dropped += overflow
+
+    async def _run(self) -> None:
+        """Background loop flushing the buffer periodically."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                # Reported once per outage, not on every retry
+                if not self._failing:
+                    print(f"Alert writer flush failed, retrying: {e}")
+                    self._failing = True
+            else:
+                if self._failing:
+                    print(f"Alert writer recovered; {self.dropped} alerts dropped so far")
+                    self._failing = False
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background loop and flush any remaining alerts."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+
+# Global alert writer
+alert_writer = AlertWriter()
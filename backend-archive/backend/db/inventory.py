@@ -0,0 +1,63 @@
+"""Bulk inventory reads."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.inventory import InventoryMatrix
+from backend.models import Inventory, Product
+from backend.pricing.consistency import CHANNELS
+
+
+async def load_inventory_matrix(
+    session: AsyncSession,
+    product_ids: Sequence[uuid.UUID] | None = None,
+    channels: Sequence[str] = CHANNELS,
+    brand: str | None = None,
+    batch_size: int | None = None,
+) -> InventoryMatrix:
+    """
+    Load the stock of many products on ``channels`` into one matrix.
+
+    The whole catalog (or brand) is read in one query; an explicit product
+    list is read in one query per ``batch_size`` IDs, so the IN list stays
+    under the driver's bind parameter limit.
+
+    Args:
+        session: Database session
+        product_ids: Only these products (None for all)
+        channels: Channels (matrix columns)
+        brand: Only this brand's products
+        batch_size: Product IDs per query
+
+    Returns:
+        Product x channel inventory matrix; products without inventory rows
+        get an empty row, unknown IDs are left out
+    """
+    query = select(
+        Product.id.label("product_id"),
+        Product.name.label("product_name"),
+        Inventory.channel,
+        Inventory.current_stock,
+        Inventory.daily_sales_avg,
+    ).outerjoin(Inventory, (Inventory.product_id == Product.id) & Inventory.channel.in_(list(channels)))
+    if brand is not None:
+        query = query.where(Product.brand == brand)
+
+    if product_ids is None:
+        result = await session.execute(query)
+        return InventoryMatrix.from_rows(result.mappings(), channels)
+
+    product_ids = list(dict.fromkeys(product_ids))
+    batch_size = batch_size or get_settings().inventory_read_batch_size
+    rows: list[Any] = []
+    for start in range(0, len(product_ids), batch_size):
+        result = await session.execute(query.where(Product.id.in_(product_ids[start:start + batch_size])))
+        rows.extend(result.mappings())
+    return InventoryMatrix.from_rows(rows, channels)
@@ -0,0 +1,55 @@
+"""Message dispatch checkpoints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.db.session import dialect_insert
+from backend.models.messaging import MessageDispatch
+
+DISPATCH_COLUMNS = (
+    "channel",
+    "channel_id",
+    "message_type",
+    "status",
+    "total_recipients",
+    "batch_size",
+    "recipients_digest",
+    "cursor",
+    "batches",
+)
+
+
+async def load_message_dispatch(session: AsyncSession, dispatch_id: str) -> dict[str, Any] | None:
+    """
+    Load a dispatch checkpoint.
+
+    Returns:
+        The checkpoint as saved (id plus DISPATCH_COLUMNS), or None
+    """
+    row = await session.get(MessageDispatch, dispatch_id)
+    if row is None:
+        return None
+    return {"id": row.id, **{column: getattr(row, column) for column in DISPATCH_COLUMNS}}
+
+
+async def save_message_dispatch(session: AsyncSession, checkpoint: dict[str, Any]) -> None:
+    """
+    Insert or overwrite a dispatch checkpoint.
+
+    Args:
+        session: Database session (committed by the caller)
+        checkpoint: id plus every DISPATCH_COLUMNS value
+    """
+    stmt = dialect_insert(session)(MessageDispatch).values(
+        id=checkpoint["id"],
+        **{column: checkpoint[column] for column in DISPATCH_COLUMNS},
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={column: stmt.excluded[column] for column in DISPATCH_COLUMNS},
+    )
+    await session.execute(stmt)
+
@@ -0,0 +1,90 @@
+"""Connection pool instrumentation for checkout wait-time metrics."""
+
+from __future__ import annotations
+
+import bisect
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds (seconds) of the checkout wait-time histogram buckets
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class PoolMetrics:
+    """Checkout wait-time statistics for a single connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.bucket_counts = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+
+    def observe(self, wait: float) -> None:
+        """Record the time spent waiting for a connection."""
+        self.checkouts += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+        self.bucket_counts[bisect.bisect_left(WAIT_TIME_BUCKETS, wait)] += 1
+
+    def observe_timeout(self) -> None:
+        """Record a checkout that timed out waiting for a connection."""
+        self.timeouts += 1
+
+    def snapshot(self, pool: AsyncAdaptedQueuePool | None = None) -> dict[str, Any]:
+        """Return metrics as a JSON-serializable dict."""
+        data: dict[str, Any] = {
+            "name": self.name,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.total_wait, 6),
+            "wait_seconds_avg": (
+                round(self.total_wait / self.checkouts, 6) if self.checkouts else 0.0
+            ),
+            "wait_seconds_max": round(self.max_wait, 6),
+            "wait_seconds_buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(WAIT_TIME_BUCKETS, self.bucket_counts)
+                },
+                "le_inf": self.bucket_counts[-1],
+            },
+        }
+        if pool is not None:
+            data["pool"] = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        return data
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited."""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        if self.metrics is None:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe_timeout()
+            raise
+        self.metrics.observe(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # Keep accumulating into the same metrics after engine.dispose()
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
@@ -0,0 +1,548 @@
+"""Channel price ingestion and bulk reads."""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from sqlalchemy import case, delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.db.session import dialect_insert
+from backend.models import Product
+from backend.models.pricing import (
+    ChannelPrice,
+    MapViolation,
+    PriceHistorySegment,
+    PriceRollup,
+    SellerPrice,
+)
+from backend.pricing.consistency import CHANNELS, PriceMatrix
+from backend.pricing.history import (
+    DAY,
+    ROLLUPS,
+    PriceRange,
+    Segment,
+    bucket_start,
+    resolution_for,
+)
+from backend.pricing.map_monitor import (
+    ListingKey,
+    MapViolationDetector,
+    PriceObservation,
+    describe_violation,
+    map_detector,
+    sort_violations,
+)
+from backend.pricing.margins import ProductCosts
+
+PRICE_COLUMNS = ("brand", "regular_price", "sale_price", "in_stock", "observed_at")
+
+SERIES_COLUMNS = ("product_id", "channel", "seller")
+
+MAP_VIOLATION_COLUMNS = (
+    "brand",
+    "map_price",
+    "price",
+    "lowest_price",
+    "severity",
+    "authorized",
+    "first_seen",
+    "last_seen",
+    "observations",
+)
+
+
+async def record_channel_prices(session: AsyncSession, rows: list[dict[str, Any]]) -> int:
+    """
+    Upsert the latest observed price per product and channel.
+
+    Args:
+        session: Database session (committed by the caller)
+        rows: Rows with product_id, channel, brand, regular_price, sale_price
+            and optionally in_stock and observed_at (defaults to now)
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    now = datetime.now().astimezone()
+    stmt = dialect_insert(session)(ChannelPrice)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["product_id", "channel"],
+        set_={column: stmt.excluded[column] for column in PRICE_COLUMNS},
+    )
+    await session.execute(stmt, [{"in_stock": True, "observed_at": now, **row} for row in rows])
+    return len(rows)
+
+
+async def load_price_matrix(
+    session: AsyncSession,
+    channels: Sequence[str] = CHANNELS,
+    brand: str | None = None,
+    in_stock_only: bool = True,
+) -> PriceMatrix:
+    """
+    Load the latest sale price of every product on ``channels``.
+
+    Args:
+        session: Database session
+        channels: Channels (matrix columns)
+        brand: Only this brand's products
+        in_stock_only: Ignore prices of listings that are out of stock
+
+    Returns:
+        Product x channel price matrix
+    """
+    query = select(ChannelPrice.product_id, ChannelPrice.channel, ChannelPrice.sale_price).where(
+        ChannelPrice.channel.in_(list(channels))
+    )
+    if brand is not None:
+        query = query.where(ChannelPrice.brand == brand)
+    if in_stock_only:
+        query = query.where(ChannelPrice.in_stock.is_(True))
+
+    result = await session.execute(query)
+    return PriceMatrix.from_rows(result, channels)
+
+
+async def load_product_costs(
+    session: AsyncSession,
+    product_ids: Sequence[uuid.UUID] | None = None,
+    brand: str | None = None,
+    batch_size: int | None = None,
+) -> ProductCosts:
+    """
+    Load the list price and unit cost of many products.
+
+    The whole catalog (or brand) is read in one query; an explicit product
+    list is read in one query per ``batch_size`` IDs, so the IN list stays
+    under the driver's bind parameter limit.
+
+    Args:
+        session: Database session
+        product_ids: Only these products (None for all); unknown IDs are left out
+        brand: Only this brand's products
+        batch_size: Product IDs per query
+
+    Returns:
+        Product costs, in ``product_ids`` order when given
+    """
+    query = select(
+        Product.id.label("product_id"),
+        Product.name.label("product_name"),
+        Product.price,
+        Product.cogs,
+    )
+    if brand is not None:
+        query = query.where(Product.brand == brand)
+
+    if product_ids is None:
+        result = await session.execute(query)
+        return ProductCosts.from_rows(result.mappings())
+
+    product_ids = list(dict.fromkeys(product_ids))
+    batch_size = batch_size or get_settings().price_read_batch_size
+    rows: list[Any] = []
+    for start in range(0, len(product_ids), batch_size):
+        result = await session.execute(query.where(Product.id.in_(product_ids[start:start + batch_size])))
+        rows.extend(result.mappings())
+    order = {product_id: i for i, product_id in enumerate(product_ids)}
+    rows.sort(key=lambda row: order[row["product_id"]])
+    return ProductCosts.from_rows(rows)
+
+
+async def load_map_violations(
+    session: AsyncSession,
+    brand: str | None = None,
+    platforms: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Load open MAP violations, most severe and deepest discount first.
+
+    Args:
+        session: Database session
+        brand: Only this brand's products
+        platforms: Only these platforms
+
+    Returns:
+        Violations as described by ``describe_violation``
+    """
+    query = select(MapViolation.__table__)
+    if brand is not None:
+        query = query.where(MapViolation.brand == brand)
+    if platforms is not None:
+        query = query.where(MapViolation.platform.in_(list(platforms)))
+
+    result = await session.execute(query)
+    return sort_violations([describe_violation(row) for row in result.mappings()])
+
+
+async def save_map_violations(
+    session: AsyncSession,
+    changed: list[dict[str, Any]],
+    resolved: list[ListingKey],
+) -> None:
+    """
+    Upsert opened or updated violations and delete resolved ones.
+
+    Args:
+        session: Database session (committed by the caller)
+        changed: Rows from ``MapViolationDetector.take_changes``
+        resolved: (platform, seller, product_id) of resolved violations
+    """
+    if changed:
+        stmt = dialect_insert(session)(MapViolation)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["platform", "seller", "product_id"],
+            set_={column: stmt.excluded[column] for column in MAP_VIOLATION_COLUMNS},
+        )
+        await session.execute(stmt, [{**row, "product_id": uuid.UUID(row["product_id"])} for row in changed])
+    if resolved:
+        key = tuple_(MapViolation.platform, MapViolation.seller, MapViolation.product_id)
+        await session.execute(
+            delete(MapViolation).where(
+                key.in_([(platform, seller, uuid.UUID(product_id)) for platform, seller, product_id in resolved])
+            )
+        )
+
+
+async def ingest_price_observations(
+    session: AsyncSession,
+    observations: Iterable[PriceObservation],
+    detector: MapViolationDetector | None = None,
+    batch_size: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Record scraped or reported listing prices and run them through MAP violation detection.
+
+    Every observation of a known product is added to ``seller_prices``
+    (re-sent observations are ignored). For products with a MAP, their open
+    violations are read from ``map_violations`` (locked until the caller
+    commits, where the database supports it) into the detector, the
+    observations are applied oldest first, and the changes are written
+    back; resolved violations are deleted.
+
+    Args:
+        session: Database session (committed by the caller)
+        observations: Observations, in any order; unknown products are skipped
+        detector: Detector holding MAP prices (defaults to the shared one)
+        batch_size: Product IDs per query
+
+    Returns:
+        Violation events, for ``record_map_alerts``
+    """
+    if detector is None:
+        detector = map_detector
+    if detector.is_stale():
+        await detector.refresh(session)
+    batch_size = batch_size or get_settings().price_read_batch_size
+
+    observations = sorted(observations, key=lambda observation: observation.observed_at)
+    candidates = list({_to_uuid(observation.product_id) for observation in observations} - {None})
+    known: set[str] = set()
+    for start in range(0, len(candidates), batch_size):
+        result = await session.execute(select(Product.id).where(Product.id.in_(candidates[start:start + batch_size])))
+        known.update(str(product_id) for product_id in result.scalars())
+    observations = [observation for observation in observations if observation.product_id in known]
+    await record_seller_prices(session, observations, batch_size)
+
+    observations = [observation for observation in observations if observation.product_id in detector.map_prices]
+    if not observations:
+        return []
+    product_ids = list(dict.fromkeys(observation.product_id for observation in observations))
+    rows: list[Any] = []
+    for start in range(0, len(product_ids), batch_size):
+        batch = [uuid.UUID(product_id) for product_id in product_ids[start:start + batch_size]]
+        result = await session.execute(
+            select(MapViolation.__table__).where(MapViolation.product_id.in_(batch)).with_for_update()
+        )
+        rows.extend(result.mappings())
+
+    detector.restore(product_ids, rows)
+    events = detector.observe_many(observations)
+    changed, resolved = detector.take_changes()
+    await save_map_violations(session, changed, resolved)
+    return events
+
+
+def _to_uuid(product_id: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(product_id)
+    except ValueError:
+        return None
+
+
+async def record_seller_prices(
+    session: AsyncSession,
+    observations: Sequence[PriceObservation],
+    batch_size: int | None = None,
+) -> int:
+    """
+    Add observed listing prices to each series' history.
+
+    New observations go to ``seller_prices`` and are merged into the
+    ``price_rollups`` hourly and daily buckets. Once a series has
+    ``price_history_segment_size`` of them, they are sealed into a
+    delta-encoded ``price_history_segments`` row and deleted; segments that
+    end ``price_history_raw_retention_days`` before the newest observation
+    are dropped, while their rollups are kept. Observations at or before the
+    end of a series' last sealed segment were already recorded and are
+    skipped.
+
+    Args:
+        session: Database session (committed by the caller)
+        observations: Observations of known products, in any order
+        batch_size: Product IDs per query
+
+    Returns:
+        Number of observations recorded
+    """
+    if not observations:
+        return 0
+    settings = get_settings()
+    batch_size = batch_size or settings.price_read_batch_size
+    product_ids = list(dict.fromkeys(uuid.UUID(observation.product_id) for observation in observations))
+
+    key_columns = [getattr(PriceHistorySegment, column) for column in SERIES_COLUMNS]
+    sealed_until: dict[tuple[uuid.UUID, str, str], int] = {}
+    for start in range(0, len(product_ids), batch_size):
+        result = await session.execute(
+            select(*key_columns, func.max(PriceHistorySegment.last_ts))
+            .where(PriceHistorySegment.product_id.in_(product_ids[start:start + batch_size]))
+            .group_by(*key_columns)
+        )
+        sealed_until.update(((product_id, channel, seller), last_ts) for product_id, channel, seller, last_ts in result)
+
+    rows = []
+    for observation in sorted(observations, key=lambda observation: observation.observed_at):
+        key = (uuid.UUID(observation.product_id), observation.platform, observation.seller)
+        if int(observation.observed_at.timestamp()) > sealed_until.get(key, -1):
+            rows.append(dict(zip(SERIES_COLUMNS, key), observed_at=observation.observed_at, price=observation.price))
+    if not rows:
+        return 0
+
+    stmt = dialect_insert(session)(SellerPrice).on_conflict_do_nothing(
+        index_elements=[*SERIES_COLUMNS, "observed_at"],
+    )
+    await session.execute(stmt, rows)
+    await _merge_rollups(session, rows)
+    await _seal_segments(session, product_ids, settings.price_history_segment_size, batch_size)
+
+    newest = max(int(row["observed_at"].timestamp()) for row in rows)
+    cutoff = newest - settings.price_history_raw_retention_days * DAY
+    for start in range(0, len(product_ids), batch_size):
+        await session.execute(
+            delete(PriceHistorySegment).where(
+                PriceHistorySegment.product_id.in_(product_ids[start:start + batch_size]),
+                PriceHistorySegment.last_ts < cutoff,
+            )
+        )
+    return len(rows)
+
+
+async def _merge_rollups(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Fold observations (oldest first) into their hourly and daily buckets."""
+    buckets: dict[tuple, dict[str, Any]] = {}
+    for row in rows:
+        timestamp = int(row["observed_at"].timestamp())
+        for resolution in ROLLUPS:
+            key = (row["product_id"], row["channel"], row["seller"], resolution, bucket_start(timestamp, resolution))
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = {
+                    **dict(zip((*SERIES_COLUMNS, "resolution", "bucket_start"), key)),
+                    "low_price": row["price"],
+                    "high_price": row["price"],
+                    "last_price": row["price"],
+                    "last_ts": timestamp,
+                }
+            else:
+                bucket["low_price"] = min(bucket["low_price"], row["price"])
+                bucket["high_price"] = max(bucket["high_price"], row["price"])
+                bucket["last_price"], bucket["last_ts"] = row["price"], timestamp
+
+    stmt = dialect_insert(session)(PriceRollup)
+    newer = stmt.excluded.last_ts >= PriceRollup.last_ts
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[*SERIES_COLUMNS, "resolution", "bucket_start"],
+        set_={
+            "low_price": case(
+                (stmt.excluded.low_price < PriceRollup.low_price, stmt.excluded.low_price),
+                else_=PriceRollup.low_price,
+            ),
+            "high_price": case(
+                (stmt.excluded.high_price > PriceRollup.high_price, stmt.excluded.high_price),
+                else_=PriceRollup.high_price,
+            ),
+            "last_price": case((newer, stmt.excluded.last_price), else_=PriceRollup.last_price),
+            "last_ts": case((newer, stmt.excluded.last_ts), else_=PriceRollup.last_ts),
+        },
+    )
+    await session.execute(stmt, list(buckets.values()))
+
+
+async def _seal_segments(
+    session: AsyncSession,
+    product_ids: list[uuid.UUID],
+    segment_size: int,
+    batch_size: int,
+) -> None:
+    """Move full segments' worth of unsealed observations into ``price_history_segments``."""
+    series: dict[tuple, list[tuple[datetime, int]]] = defaultdict(list)
+    for start in range(0, len(product_ids), batch_size):
+        key = (SellerPrice.product_id, SellerPrice.channel, SellerPrice.seller)
+        result = await session.execute(
+            select(*key, SellerPrice.observed_at, SellerPrice.price)
+            .where(SellerPrice.product_id.in_(product_ids[start:start + batch_size]))
+            .order_by(*key, SellerPrice.observed_at)
+        )
+        for product_id, channel, seller, observed_at, price in result:
+            series[(product_id, channel, seller)].append((observed_at, price))
+
+    segments = []
+    for key, points in series.items():
+        full = len(points) - len(points) % segment_size
+        if not full:
+            continue
+        for start in range(0, full, segment_size):
+            chunk = points[start:start + segment_size]
+            segment = Segment(int(chunk[0][0].timestamp()), chunk[0][1])
+            for observed_at, price in chunk[1:]:
+                segment.append(int(observed_at.timestamp()), price)
+            segment.seal()
+            segments.append({**dict(zip(SERIES_COLUMNS, key)), **segment.to_record()})
+        product_id, channel, seller = key
+        await session.execute(
+            delete(SellerPrice).where(
+                SellerPrice.product_id == product_id,
+                SellerPrice.channel == channel,
+                SellerPrice.seller == seller,
+                SellerPrice.observed_at <= points[full - 1][0],
+            )
+        )
+    if segments:
+        stmt = dialect_insert(session)(PriceHistorySegment).on_conflict_do_nothing(
+            index_elements=[*SERIES_COLUMNS, "first_ts"],
+        )
+        await session.execute(stmt, segments)
+
+
+async def load_price_history(
+    session: AsyncSession,
+    product_id: str,
+    channel: str,
+    start: datetime,
+    end: datetime,
+    seller: str | None = None,
+    resolution: str | None = None,
+) -> dict[str, PriceRange]:
+    """
+    Load a product's listing prices on a channel, per seller.
+
+    Raw points are decoded from the sealed segments plus the unsealed
+    observations; hourly and daily ranges are read straight from the stored
+    rollup buckets.
+
+    Args:
+        session: Database session
+        product_id: Product ID
+        channel: Channel name
+        start: Range start
+        end: Range end (inclusive)
+        seller: Only this seller
+        resolution: raw, hourly or daily; chosen from the span if omitted
+
+    Returns:
+        Seller -> prices in range, for sellers with any, by seller name
+
+    Raises:
+        ValueError: On an unknown resolution
+    """
+    resolution = resolution or resolution_for(end - start)
+    if resolution not in ("raw", *ROLLUPS):
+        raise ValueError(f"Unknown resolution: {resolution}")
+    product_uuid = _to_uuid(product_id)
+    if product_uuid is None:
+        return {}
+    lo, hi = int(start.timestamp()), int(end.timestamp())
+
+    if resolution != "raw":
+        query = (
+            select(
+                PriceRollup.seller,
+                PriceRollup.bucket_start,
+                PriceRollup.low_price,
+                PriceRollup.high_price,
+                PriceRollup.last_price,
+            )
+            .where(
+                PriceRollup.product_id == product_uuid,
+                PriceRollup.channel == channel,
+                PriceRollup.resolution == resolution,
+                PriceRollup.bucket_start >= bucket_start(lo, resolution),
+                PriceRollup.bucket_start <= hi,
+            )
+            .order_by(PriceRollup.seller, PriceRollup.bucket_start)
+        )
+        if seller is not None:
+            query = query.where(PriceRollup.seller == seller)
+        buckets: dict[str, list[tuple[int, int, int, int]]] = defaultdict(list)
+        for row_seller, *values in await session.execute(query):
+            buckets[row_seller].append(tuple(values))
+        return {
+            name: PriceRange(resolution, *(np.array(column, dtype=np.int64) for column in zip(*values)))
+            for name, values in buckets.items()
+        }
+
+    points: dict[str, list[tuple[np.ndarray, np.ndarray]]] = defaultdict(list)
+    query = (
+        select(PriceHistorySegment.__table__)
+        .where(
+            PriceHistorySegment.product_id == product_uuid,
+            PriceHistorySegment.channel == channel,
+            PriceHistorySegment.last_ts >= lo,
+            PriceHistorySegment.first_ts <= hi,
+        )
+        .order_by(PriceHistorySegment.seller, PriceHistorySegment.first_ts)
+    )
+    if seller is not None:
+        query = query.where(PriceHistorySegment.seller == seller)
+    for row in (await session.execute(query)).mappings():
+        points[row["seller"]].append(Segment.from_record(row).decode())
+
+    query = (
+        select(SellerPrice.seller, SellerPrice.observed_at, SellerPrice.price)
+        .where(
+            SellerPrice.product_id == product_uuid,
+            SellerPrice.channel == channel,
+            SellerPrice.observed_at >= start,
+            SellerPrice.observed_at <= end,
+        )
+        .order_by(SellerPrice.seller, SellerPrice.observed_at)
+    )
+    if seller is not None:
+        query = query.where(SellerPrice.seller == seller)
+    unsealed: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for row_seller, observed_at, price in await session.execute(query):
+        unsealed[row_seller].append((int(observed_at.timestamp()), price))
+    for name, values in unsealed.items():
+        timestamps, prices = zip(*values)
+        points[name].append((np.array(timestamps, dtype=np.int64), np.array(prices, dtype=np.int64)))
+
+    ranges = {}
+    for name in sorted(points):
+        timestamps = np.concatenate([ts for ts, _ in points[name]])
+        prices = np.concatenate([p for _, p in points[name]])
+        mask = (timestamps >= lo) & (timestamps <= hi)
+        if mask.any():
+            prices = prices[mask]
+            ranges[name] = PriceRange("raw", timestamps[mask], prices, prices, prices)
+    return ranges
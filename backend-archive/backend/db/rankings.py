@@ -0,0 +1,258 @@
+"""Channel ranking snapshot persistence and rank movement queries."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.channels.rankings import (
+    diff_ranks,
+    item_key,
+    rank_items,
+    ranking_movement,
+    ranking_movers,
+    summarize_rank_history,
+)
+from backend.config import get_settings
+from backend.db.session import dialect_insert
+from backend.models.ranking import ChannelRanking, ChannelRankMovement
+
+# Item fields kept per ranked product
+RANKING_ITEM_FIELDS = ("product_id", "product_name", "brand")
+
+
+class BoardState(NamedTuple):
+    """A leaderboard rebuilt as of one snapshot."""
+
+    observed_at: datetime
+    ranks: dict[str, int]
+    items: dict[str, dict[str, Any]]
+    since_keyframe: int  # Snapshots applied after the keyframe
+
+
+def _on_board(channel: str, scope: str):
+    return (ChannelRanking.channel == channel) & (ChannelRanking.scope == scope)
+
+
+async def load_board_state(
+    session: AsyncSession,
+    channel: str,
+    scope: str,
+    when: datetime | None = None,
+    oldest_if_earlier: bool = True,
+) -> BoardState | None:
+    """
+    Rebuild the list in effect at ``when`` from its keyframe and the diffs after it.
+
+    Reads at most ``ranking_keyframe_interval`` snapshots.
+
+    Args:
+        session: Database session
+        channel: Channel name
+        scope: Category or keyword
+        when: Point in time; the latest list if omitted
+        oldest_if_earlier: If nothing was recorded by ``when``, use the oldest retained list
+
+    Returns:
+        The board, or None if nothing (suitable) was recorded
+    """
+    board = _on_board(channel, scope)
+    keyframe = select(func.max(ChannelRanking.observed_at)).where(board, ChannelRanking.keyframe.is_(True))
+    if when is not None:
+        keyframe = keyframe.where(ChannelRanking.observed_at <= when)
+    start = await session.scalar(keyframe)
+    if start is None and when is not None and oldest_if_earlier:
+        # Retention always keeps a keyframe first
+        start = when = await session.scalar(select(func.min(ChannelRanking.observed_at)).where(board))
+    if start is None:
+        return None
+
+    query = (
+        select(ChannelRanking.observed_at, ChannelRanking.items, ChannelRanking.exited)
+        .where(board, ChannelRanking.observed_at >= start)
+        .order_by(ChannelRanking.observed_at)
+    )
+    if when is not None:
+        query = query.where(ChannelRanking.observed_at <= when)
+    ranks: dict[str, int] = {}
+    items: dict[str, dict[str, Any]] = {}
+    applied = 0
+    for observed_at, row_items, exited in await session.execute(query):
+        for key in exited:
+            ranks.pop(key, None)
+        for item in row_items:
+            key = item_key(item)
+            ranks[key] = item["rank"]
+            items[key] = {field: item.get(field) for field in RANKING_ITEM_FIELDS}
+        applied += 1
+    return BoardState(observed_at, ranks, items, applied - 1)
+
+
+async def record_ranking_snapshot(
+    session: AsyncSession,
+    channel: str,
+    scope: str,
+    items: Sequence[dict[str, Any]],
+    observed_at: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Store a fetched ranking list as a diff and drop the board's history past retention.
+
+    The list is diffed against the board's latest one: the products that
+    entered or changed rank are stored (every ``ranking_keyframe_interval``
+    snapshots, the full list), and each entry, exit and move is written as
+    a ``channel_rank_movements`` row for the history and movers queries.
+
+    Args:
+        session: Database session (committed by the caller)
+        channel: Channel name
+        scope: Category or keyword the list is for
+        items: Ranked items, best first, with a product_id or product_name
+        observed_at: When the list was fetched (now if omitted)
+
+    Returns:
+        Movement since the previous list: entered, exited and moved products
+
+    Raises:
+        ValueError: If a later list of the board was already recorded
+    """
+    observed_at = observed_at or datetime.now().astimezone()
+    board = _on_board(channel, scope)
+    if await session.scalar(select(func.count()).select_from(ChannelRanking).where(board, ChannelRanking.observed_at > observed_at)):
+        raise ValueError(f"Snapshot for {channel}/{scope} is older than the latest one")
+
+    state = await load_board_state(session, channel, scope)
+    previous = state.ranks if state is not None else {}
+    ranks, by_key = rank_items(items)
+    fields = {key: {field: item.get(field) for field in RANKING_ITEM_FIELDS} for key, item in by_key.items()}
+    changed, exited = diff_ranks(previous, ranks)
+    keyframe = state is None or state.since_keyframe + 1 >= get_settings().ranking_keyframe_interval
+
+    stmt = dialect_insert(session)(ChannelRanking).values(
+        channel=channel,
+        scope=scope,
+        observed_at=observed_at,
+        keyframe=keyframe,
+        items=[{**fields[key], "rank": rank} for key, rank in (ranks if keyframe else changed).items()],
+        exited=list(exited),
+    )
+    await session.execute(stmt.on_conflict_do_nothing(index_elements=["channel", "scope", "observed_at"]))
+
+    movements = [
+        {"product": key, "previous_rank": previous.get(key), "rank": rank} for key, rank in changed.items()
+    ] + [{"product": key, "previous_rank": previous[key], "rank": None} for key in exited]
+    if movements:
+        stmt = dialect_insert(session)(ChannelRankMovement).on_conflict_do_nothing(
+            index_elements=["channel", "scope", "product", "observed_at"],
+        )
+        await session.execute(
+            stmt, [{"channel": channel, "scope": scope, "observed_at": observed_at, **row} for row in movements]
+        )
+
+    # Keep the latest keyframe before the cutoff, so the list at the cutoff can still be rebuilt
+    cutoff = observed_at - timedelta(days=get_settings().ranking_retention_days)
+    keep_from = await session.scalar(
+        select(func.max(ChannelRanking.observed_at)).where(
+            board, ChannelRanking.keyframe.is_(True), ChannelRanking.observed_at <= cutoff
+        )
+    )
+    if keep_from is not None:
+        await session.execute(delete(ChannelRanking).where(board, ChannelRanking.observed_at < keep_from))
+        await session.execute(
+            delete(ChannelRankMovement).where(
+                ChannelRankMovement.channel == channel,
+                ChannelRankMovement.scope == scope,
+                ChannelRankMovement.observed_at < keep_from,
+            )
+        )
+
+    known = state.items if state is not None else {}
+    return ranking_movement(channel, scope, observed_at, previous, ranks, {**known, **fields})
+
+
+async def compare_ranking(
+    session: AsyncSession,
+    channel: str,
+    scope: str,
+    items: Sequence[dict[str, Any]],
+) -> dict[str, Any]:
+    """Movement of ``items`` since the board's latest recorded list, without recording them."""
+    state = await load_board_state(session, channel, scope)
+    ranks, by_key = rank_items(items)
+    previous, known = (state.ranks, state.items) if state is not None else ({}, {})
+    return ranking_movement(channel, scope, datetime.now().astimezone(), previous, ranks, {**known, **by_key})
+
+
+async def load_rank_history(
+    session: AsyncSession,
+    channel: str,
+    scope: str,
+    product: str,
+    since: datetime,
+    until: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Rank movement of one product over a time window.
+
+    The rank at ``since`` comes from the list in effect then; every change
+    after it is read from the product's ``channel_rank_movements`` rows.
+
+    Args:
+        session: Database session
+        channel: Channel name
+        scope: Category or keyword
+        product: Channel product ID, or product name where the channel has none
+        since: Window start
+        until: Window end (now if omitted)
+
+    Returns:
+        Rank at the window start and every change after it, plus best and
+        worst rank (None while the product was off the list)
+    """
+    points = []
+    start = await load_board_state(session, channel, scope, since, oldest_if_earlier=False)
+    if start is not None and product in start.ranks:
+        points.append({"timestamp": since.isoformat(), "rank": start.ranks[product]})
+
+    query = (
+        select(ChannelRankMovement.observed_at, ChannelRankMovement.rank)
+        .where(
+            ChannelRankMovement.channel == channel,
+            ChannelRankMovement.scope == scope,
+            ChannelRankMovement.product == product,
+            ChannelRankMovement.observed_at > since,
+        )
+        .order_by(ChannelRankMovement.observed_at)
+    )
+    if until is not None:
+        query = query.where(ChannelRankMovement.observed_at <= until)
+    for observed_at, rank in await session.execute(query):
+        points.append({"timestamp": observed_at.isoformat(), "rank": rank})
+    return summarize_rank_history(channel, scope, product, points)
+
+
+async def load_ranking_movers(
+    session: AsyncSession,
+    channel: str,
+    scope: str,
+    since: datetime,
+    limit: int = 10,
+) -> dict[str, Any]:
+    """
+    Products with the largest rank change between ``since`` and now.
+
+    Compares the latest list against the list in effect at ``since`` (the
+    oldest retained one if ``since`` is earlier), each rebuilt from its
+    nearest keyframe.
+    """
+    before = await load_board_state(session, channel, scope, since)
+    if before is None:
+        return ranking_movers(channel, scope, None, {}, {}, {}, limit)
+    after = await load_board_state(session, channel, scope)
+    return ranking_movers(
+        channel, scope, before.observed_at, before.ranks, after.ranks, {**before.items, **after.items}, limit
+    )
@@ -0,0 +1,421 @@
+"""Sales fact ingestion, partition management and rollup maintenance.
+
+Daily facts are upserted into the month-partitioned ``sales_daily_facts``
+table. Each ingest recomputes only the day, week and month rollup rows touched
+by the batch, so dashboard and analytics reads never scan raw facts.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import BigInteger, Date, cast, delete, func, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.db.session import dialect_insert
+from backend.models.sales import (
+    BrandSalesRollup,
+    ProductSalesRollup,
+    RollupGrain,
+    SalesDailyFact,
+)
+
+MEASURES = ("units", "orders", "gross_sales", "discount_amount")
+
+
+def period_start(day: date, grain: RollupGrain) -> date:
+    """Get the first day of the period containing ``day``."""
+    if grain == RollupGrain.WEEK:
+        return day - timedelta(days=day.weekday())
+    if grain == RollupGrain.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def period_end(start: date, grain: RollupGrain) -> date:
+    """Get the first day after the period starting at ``start``."""
+    if grain == RollupGrain.WEEK:
+        return start + timedelta(days=7)
+    if grain == RollupGrain.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+async def ensure_sales_partitions(session: AsyncSession, start: date, end: date) -> None:
+    """
+    Create monthly partitions of sales_daily_facts covering [start, end].
+
+    No-op on databases without declarative partitioning.
+    """
+    if session.bind.dialect.name != "postgresql":
+        return
+
+    month = start.replace(day=1)
+    while month <= end:
+        next_month = period_end(month, RollupGrain.MONTH)
+        await session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS sales_daily_facts_y{month.year}m{month.month:02d} "
+            f"PARTITION OF sales_daily_facts "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        ))
+        month = next_month
+
+
+async def record_daily_sales(session: AsyncSession, rows: list[dict[str, Any]]) -> int:
+    """
+    Upsert daily sales facts and refresh the rollups they affect.
+
+    Args:
+        session: Database session (committed by the caller)
+        rows: Fact rows with sale_date, product_id, channel, brand and measures.
+            Re-sending a (sale_date, product_id, channel) replaces its values.
+
+    Returns:
+        Number of fact rows written
+    """
+    if not rows:
+        return 0
+
+    dates = {row["sale_date"] for row in rows}
+    await ensure_sales_partitions(session, min(dates), max(dates))
+
+    product_ids = {row["product_id"] for row in rows}
+    # Brands the facts are filed under now, so a re-sent fact with a new brand leaves no stale rollup
+    brands = {row["brand"] for row in rows} | await _fact_brands(session, min(dates), max(dates), product_ids)
+
+    stmt = dialect_insert(session)(SalesDailyFact)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["sale_date", "product_id", "channel"],
+        set_={
+            column: stmt.excluded[column]
+            for column in (*MEASURES, "brand", "promotion_id")
+        },
+    )
+    await session.execute(stmt, [{"promotion_id": None, **row} for row in rows])
+
+    await refresh_rollups(
+        session,
+        dates,
+        product_ids=product_ids,
+        brands=brands,
+        channels={row["channel"] for row in rows},
+    )
+    return len(rows)
+
+
+async def _fact_brands(session: AsyncSession, start: date, end: date, product_ids: set[uuid.UUID]) -> set[str]:
+    """Brands of the stored facts of ``product_ids`` between ``start`` and ``end``."""
+    brands: set[str] = set()
+    for batch in _batches(product_ids, get_settings().sales_read_batch_size):
+        result = await session.execute(
+            select(SalesDailyFact.brand)
+            .where(
+                SalesDailyFact.sale_date >= start,
+                SalesDailyFact.sale_date <= end,
+                SalesDailyFact.product_id.in_(batch),
+            )
+            .distinct()
+        )
+        brands.update(result.scalars())
+    return brands
+
+
+def _batches(values: Iterable[Any] | None, size: int) -> list[list[Any] | None]:
+    """Split ``values`` into lists of at most ``size``; None stays a single unfiltered batch."""
+    if values is None:
+        return [None]
+    values = list(values)
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+async def refresh_rollups(
+    session: AsyncSession,
+    dates: Iterable[date],
+    product_ids: set[uuid.UUID] | None = None,
+    brands: set[str] | None = None,
+    channels: set[str] | None = None,
+) -> None:
+    """
+    Recompute rollup rows for every period containing one of ``dates``.
+
+    Filters restrict the recomputation to the given products, brands and
+    channels; pass None to recompute all of them. Product IDs and brands are
+    recomputed ``sales_read_batch_size`` at a time, so the IN lists stay
+    under the driver's bind parameter limit. Brand rows left without facts
+    are deleted.
+    """
+    dates = set(dates)
+    batch_size = get_settings().sales_read_batch_size
+    product_batches = _batches(product_ids, batch_size)
+    brand_batches = _batches(brands, batch_size)
+    for grain in RollupGrain:
+        for start in sorted({period_start(day, grain) for day in dates}):
+            end = period_end(start, grain)
+            for batch in product_batches:
+                await _refresh_product_rollup(session, grain, start, end, batch, channels)
+            for batch in brand_batches:
+                await _refresh_brand_rollup(session, grain, start, end, batch, channels)
+
+
+async def rebuild_rollups(session: AsyncSession, start: date, end: date) -> None:
+    """Recompute all rollups for periods overlapping [start, end], e.g. after a bulk load."""
+    days = (end - start).days + 1
+    await refresh_rollups(session, (start + timedelta(days=i) for i in range(days)))
+
+
+def _measure_sums() -> list[Any]:
+    return [
+        cast(func.sum(getattr(SalesDailyFact, measure)), BigInteger).label(measure)
+        for measure in MEASURES
+    ]
+
+
+async def _refresh_product_rollup(
+    session: AsyncSession,
+    grain: RollupGrain,
+    start: date,
+    end: date,
+    product_ids: list[uuid.UUID] | None,
+    channels: set[str] | None,
+) -> None:
+    query = (
+        select(
+            cast(literal(grain, ProductSalesRollup.grain.type), ProductSalesRollup.grain.type).label("grain"),
+            literal(start, Date).label("period_start"),
+            SalesDailyFact.product_id,
+            SalesDailyFact.channel,
+            func.max(SalesDailyFact.brand).label("brand"),
+            *_measure_sums(),
+        )
+        .where(SalesDailyFact.sale_date >= start, SalesDailyFact.sale_date < end)
+        .group_by(SalesDailyFact.product_id, SalesDailyFact.channel)
+    )
+    if product_ids is not None:
+        query = query.where(SalesDailyFact.product_id.in_(product_ids))
+    if channels is not None:
+        query = query.where(SalesDailyFact.channel.in_(channels))
+
+    columns = ["grain", "period_start", "product_id", "channel", "brand", *MEASURES]
+    stmt = dialect_insert(session)(ProductSalesRollup).from_select(columns, query)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["grain", "period_start", "product_id", "channel"],
+        set_={column: stmt.excluded[column] for column in ("brand", *MEASURES)},
+    )
+    await session.execute(stmt)
+
+
+async def _refresh_brand_rollup(
+    session: AsyncSession,
+    grain: RollupGrain,
+    start: date,
+    end: date,
+    brands: list[str] | None,
+    channels: set[str] | None,
+) -> None:
+    # Recomputed from scratch: a brand whose facts all moved to another brand must lose its row
+    stale = delete(BrandSalesRollup).where(BrandSalesRollup.grain == grain, BrandSalesRollup.period_start == start)
+    if brands is not None:
+        stale = stale.where(BrandSalesRollup.brand.in_(brands))
+    if channels is not None:
+        stale = stale.where(BrandSalesRollup.channel.in_(channels))
+    await session.execute(stale)
+
+    query = (
+        select(
+            cast(literal(grain, BrandSalesRollup.grain.type), BrandSalesRollup.grain.type).label("grain"),
+            literal(start, Date).label("period_start"),
+            SalesDailyFact.brand,
+            SalesDailyFact.channel,
+            *_measure_sums(),
+        )
+        .where(SalesDailyFact.sale_date >= start, SalesDailyFact.sale_date < end)
+        .group_by(SalesDailyFact.brand, SalesDailyFact.channel)
+    )
+    if brands is not None:
+        query = query.where(SalesDailyFact.brand.in_(brands))
+    if channels is not None:
+        query = query.where(SalesDailyFact.channel.in_(channels))
+
+    columns = ["grain", "period_start", "brand", "channel", *MEASURES]
+    stmt = dialect_insert(session)(BrandSalesRollup).from_select(columns, query)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["grain", "period_start", "brand", "channel"],
+        set_={column: stmt.excluded[column] for column in MEASURES},
+    )
+    await session.execute(stmt)
+
+
+async def get_sales_series(
+    session: AsyncSession,
+    grain: RollupGrain,
+    start: date,
+    end: date,
+    product_id: uuid.UUID | None = None,
+    brand: str | None = None,
+    channel: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Get sales per period from the rollups.
+
+    Product-level queries read product rollups; everything else reads the
+    smaller brand rollups.
+
+    Args:
+        session: Database session
+        grain: Period size
+        start: First day (inclusive)
+        end: Last day (inclusive)
+        product_id: Optional product filter
+        brand: Optional brand filter
+        channel: Optional channel filter
+
+    Returns:
+        One dict per period with period_start and summed measures
+    """
+    rollup = ProductSalesRollup if product_id is not None else BrandSalesRollup
+    query = (
+        select(
+            rollup.period_start,
+            *[
+                cast(func.sum(getattr(rollup, measure)), BigInteger).label(measure)
+                for measure in MEASURES
+            ],
+        )
+        .where(
+            rollup.grain == grain,
+            rollup.period_start >= period_start(start, grain),
+            rollup.period_start <= end,
+        )
+        .group_by(rollup.period_start)
+        .order_by(rollup.period_start)
+    )
+    if product_id is not None:
+        query = query.where(ProductSalesRollup.product_id == product_id)
+    if brand is not None:
+        query = query.where(rollup.brand == brand)
+    if channel is not None:
+        query = query.where(rollup.channel == channel)
+
+    result = await session.execute(query)
+    return [dict(row) for row in result.mappings()]
+
+
+async def get_sales_totals(
+    session: AsyncSession,
+    start: date,
+    end: date,
+    brand: str | None = None,
+    channel: str | None = None,
+    group_by_channel: bool = False,
+) -> dict[str, Any]:
+    """
+    Sum daily brand rollups over [start, end].
+
+    Returns:
+        Summed measures, or a dict of them per channel if ``group_by_channel``
+    """
+    sums = [
+        func.coalesce(cast(func.sum(getattr(BrandSalesRollup, measure)), BigInteger), 0).label(measure)
+        for measure in MEASURES
+    ]
+    columns = [BrandSalesRollup.channel, *sums] if group_by_channel else sums
+    query = select(*columns).where(
+        BrandSalesRollup.grain == RollupGrain.DAY,
+        BrandSalesRollup.period_start >= start,
+        BrandSalesRollup.period_start <= end,
+    )
+    if brand is not None:
+        query = query.where(BrandSalesRollup.brand == brand)
+    if channel is not None:
+        query = query.where(BrandSalesRollup.channel == channel)
+
+    if group_by_channel:
+        result = await session.execute(query.group_by(BrandSalesRollup.channel))
+        return {row["channel"]: {m: row[m] for m in MEASURES} for row in result.mappings()}
+
+    result = await session.execute(query)
+    return dict(result.mappings().one())
+
+
+async def get_period_change(
+    session: AsyncSession,
+    days: int = 7,
+    as_of: date | None = None,
+    brand: str | None = None,
+    channel: str | None = None,
+) -> dict[str, Any]:
+    """
+    Compare gross sales in the last ``days`` days with the preceding window.
+
+    Returns:
+        Current and previous totals and the fractional change
+    """
+    as_of = as_of or date.today()
+    current_start = as_of - timedelta(days=days - 1)
+    previous_end = current_start - timedelta(days=1)
+    previous_start = previous_end - timedelta(days=days - 1)
+
+    current = await get_sales_totals(session, current_start, as_of, brand, channel)
+    previous = await get_sales_totals(session, previous_start, previous_end, brand, channel)
+
+    change = (
+        (current["gross_sales"] - previous["gross_sales"]) / previous["gross_sales"]
+        if previous["gross_sales"]
+        else 0.0
+    )
+    return {
+        "current": current,
+        "previous": previous,
+        "change": round(change, 4),
+    }
+
+
+async def get_average_daily_units(
+    session: AsyncSession,
+    start: date,
+    end: date,
+    product_ids: Iterable[uuid.UUID] | None = None,
+    brand: str | None = None,
+    batch_size: int | None = None,
+) -> dict[tuple[uuid.UUID, str], float]:
+    """
+    Average daily units sold per (product_id, channel) over [start, end].
+
+    Reads daily product rollups; days without sales count as zero. An
+    explicit product list is read in one query per ``batch_size`` IDs, so
+    the IN list stays under the driver's bind parameter limit.
+    """
+    days = (end - start).days + 1
+    query = (
+        select(
+            ProductSalesRollup.product_id,
+            ProductSalesRollup.channel,
+            cast(func.sum(ProductSalesRollup.units), BigInteger).label("units"),
+        )
+        .where(
+            ProductSalesRollup.grain == RollupGrain.DAY,
+            ProductSalesRollup.period_start >= start,
+            ProductSalesRollup.period_start <= end,
+        )
+        .group_by(ProductSalesRollup.product_id, ProductSalesRollup.channel)
+    )
+    if brand is not None:
+        query = query.where(ProductSalesRollup.brand == brand)
+
+    if product_ids is None:
+        result = await session.execute(query)
+        return {(row.product_id, row.channel): row.units / days for row in result}
+
+    product_ids = list(dict.fromkeys(product_ids))
+    batch_size = batch_size or get_settings().sales_read_batch_size
+    averages = {}
+    for offset in range(0, len(product_ids), batch_size):
+        result = await session.execute(
+            query.where(ProductSalesRollup.product_id.in_(product_ids[offset:offset + batch_size]))
+        )
+        averages.update({(row.product_id, row.channel): row.units / days for row in result})
+    return averages
@@ -1,11 +1,14 @@
 """Seed script for sample K-beauty promotion data."""
 
+import argparse
 import asyncio
+import time
 from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.db.session import async_session, engine
+from backend.db.synthetic import SyntheticConfig, seed_synthetic
 from backend.models import (
     Alert,
     Base,
@@ -527,6 +530,42 @@ async def reset_and_seed() -> None:
     await seed_all()
 
 
+async def seed_synthetic_data(config: SyntheticConfig, reset: bool = False) -> None:
+    """Bulk load a synthetic dataset for load testing."""
+    if reset:
+        await drop_tables()
+        await create_tables()
+
+    print(f"Generating synthetic data (scale={config.scale}, seed={config.seed}, as_of={config.as_of})...")
+    start = time.perf_counter()
+
+    async with async_session() as session:
+        counts = await seed_synthetic(session, config)
+        await session.commit()
+
+    total = sum(counts.values())
+    print(f"\nLoaded {total:,} rows in {time.perf_counter() - start:.1f}s.")
+
+
+def _parse_synthetic_args(args: list[str]) -> tuple[SyntheticConfig, bool]:
+    parser = argparse.ArgumentParser(prog="python -m backend.db.seed --synthetic")
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--sales-days", type=int, default=0)
+    parser.add_argument("--reset", action="store_true")
+    parsed = parser.parse_args(args)
+    config = SyntheticConfig(
+        scale=parsed.scale,
+        seed=parsed.seed,
+        as_of=parsed.as_of,
+        years=parsed.years,
+        sales_history_days=parsed.sales_days,
+    )
+    return config, parsed.reset
+
+
 if __name__ == "__main__":
     import sys
 
@@ -534,7 +573,13 @@ if __name__ == "__main__":
         asyncio.run(reset_and_seed())
     elif len(sys.argv) > 1 and sys.argv[1] == "--create-tables":
         asyncio.run(create_tables())
+    elif len(sys.argv) > 1 and sys.argv[1] == "--synthetic":
+        synthetic_config, synthetic_reset = _parse_synthetic_args(sys.argv[2:])
+        asyncio.run(seed_synthetic_data(synthetic_config, reset=synthetic_reset))
     else:
         print("Usage:")
         print("  python -m backend.db.seed --create-tables  # Create tables only")
         print("  python -m backend.db.seed --reset          # Drop, create tables, and seed data")
+        print("  python -m backend.db.seed --synthetic [--scale N] [--seed S] [--as-of YYYY-MM-DD]")
+        print("                                [--sales-days D] [--reset]")
+        print("                                             # Bulk load synthetic data (scale 430 ~ 10M rows)")
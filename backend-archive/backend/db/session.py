@@ -1,27 +1,68 @@
 """Database session configuration for async SQLAlchemy with PostgreSQL."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from backend.config import get_settings
+from backend.db.pool import InstrumentedAsyncQueuePool, PoolMetrics
 
 settings = get_settings()
 
-# Create async engine
-# Convert postgresql:// to postgresql+asyncpg:// for async driver
-database_url = settings.database_url
-if database_url.startswith("postgresql://"):
-    database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-
-engine = create_async_engine(
-    database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+
+def to_async_url(url: str) -> str:
+    """Convert postgresql:// to postgresql+asyncpg:// for the async driver."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def create_instrumented_engine(
+    url: str,
+    name: str,
+    pool_size: int,
+    max_overflow: int,
+) -> AsyncEngine:
+    """Create an async engine whose pool records checkout wait-time metrics."""
+    async_engine = create_async_engine(
+        to_async_url(url),
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        poolclass=InstrumentedAsyncQueuePool,
+    )
+    async_engine.sync_engine.pool.metrics = PoolMetrics(name)
+    return async_engine
+
+
+# Primary (read-write) engine
+engine = create_instrumented_engine(
+    settings.database_url,
+    name="primary",
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
 )
 
+# Read replica engine, falling back to the primary when no replica is configured
+if settings.database_replica_url:
+    replica_engine = create_instrumented_engine(
+        settings.database_replica_url,
+        name="replica",
+        pool_size=settings.database_replica_pool_size,
+        max_overflow=settings.database_replica_max_overflow,
+    )
+else:
+    replica_engine = engine
+
 # Create async session factory
 async_session = async_sessionmaker(
     engine,
@@ -31,6 +72,22 @@ async_session = async_sessionmaker(
     autoflush=False,
 )
 
+# Session factory for read-only work, routed to the replica
+readonly_session = async_sessionmaker(
+    replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+def dialect_insert(session: AsyncSession):
+    """Dialect-specific INSERT construct supporting ON CONFLICT."""
+    if session.bind.dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database session."""
@@ -43,3 +100,25 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_readonly_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints.
+
+    Queries go to the replica when one is configured. The session never
+    commits or flushes; closing it simply returns the connection to the pool.
+    """
+    async with readonly_session() as session:
+        yield session
+
+
+def get_pool_metrics() -> list[dict[str, Any]]:
+    """Get checkout wait-time metrics for every configured pool."""
+    engines = [engine] if replica_engine is engine else [engine, replica_engine]
+    metrics = []
+    for async_engine in engines:
+        pool = async_engine.sync_engine.pool
+        if pool.metrics is not None:
+            metrics.append(pool.metrics.snapshot(pool))
+    return metrics
@@ -0,0 +1,171 @@
+"""Sync task persistence."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.db.session import dialect_insert
+from backend.models.sync import SyncTask
+
+SYNC_TASK_COLUMNS = (
+    "idempotency_key",
+    "fingerprint",
+    "task_type",
+    "brand",
+    "products",
+    "channels",
+    "target_value",
+    "status",
+    "requires_approval",
+    "approved_by",
+    "approved_at",
+    "started_at",
+    "completed_at",
+    "steps",
+)
+
+# Written only by claims and lease renewals, never by a save
+LEASE_COLUMNS = ("lease_owner", "lease_expires_at")
+
+# Tasks that were queued or running when the process stopped
+UNFINISHED_STATUSES = ("queued", "running")
+
+# Tasks an identical request without an idempotency key is deduplicated against
+ACTIVE_STATUSES = ("pending_approval", *UNFINISHED_STATUSES)
+
+
+def _to_dict(row: SyncTask) -> dict[str, Any]:
+    return {"id": row.id, **{column: getattr(row, column) for column in SYNC_TASK_COLUMNS + LEASE_COLUMNS}}
+
+
+async def load_sync_task(session: AsyncSession, task_id: str) -> dict[str, Any] | None:
+    """Load a sync task by ID."""
+    row = await session.get(SyncTask, task_id)
+    return _to_dict(row) if row is not None else None
+
+
+async def find_sync_task(session: AsyncSession, idempotency_key: str) -> dict[str, Any] | None:
+    """Load the sync task created with ``idempotency_key``."""
+    result = await session.execute(select(SyncTask).where(SyncTask.idempotency_key == idempotency_key))
+    row = result.scalar_one_or_none()
+    return _to_dict(row) if row is not None else None
+
+
+async def find_active_sync_task(session: AsyncSession, fingerprint: str) -> dict[str, Any] | None:
+    """Load the oldest unfinished sync task with ``fingerprint``."""
+    result = await session.execute(
+        select(SyncTask)
+        .where(SyncTask.fingerprint == fingerprint, SyncTask.status.in_(ACTIVE_STATUSES))
+        .order_by(SyncTask.created_at)
+        .limit(1)
+    )
+    row = result.scalar_one_or_none()
+    return _to_dict(row) if row is not None else None
+
+
+async def load_unfinished_sync_tasks(session: AsyncSession) -> list[dict[str, Any]]:
+    """Sync tasks that should be (re)started, oldest first."""
+    result = await session.execute(
+        select(SyncTask).where(SyncTask.status.in_(UNFINISHED_STATUSES)).order_by(SyncTask.created_at)
+    )
+    return [_to_dict(row) for row in result.scalars()]
+
+
+async def save_sync_task(session: AsyncSession, task: dict[str, Any], owner: str | None = None) -> bool:
+    """
+    Insert or overwrite a sync task, leaving its lease as it is.
+
+    Args:
+        session: Database session (committed by the caller)
+        task: id plus every SYNC_TASK_COLUMNS value
+        owner: If given, an existing task is only overwritten while ``owner`` holds its lease
+
+    Returns:
+        False if the task is leased to someone other than ``owner`` and was left untouched
+    """
+    stmt = dialect_insert(session)(SyncTask).values(
+        id=task["id"],
+        **{column: task[column] for column in SYNC_TASK_COLUMNS},
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            column: stmt.excluded[column]
+            for column in SYNC_TASK_COLUMNS
+            if column not in ("idempotency_key", "fingerprint")
+        },
+        where=SyncTask.lease_owner == owner if owner is not None else None,
+    )
+    result = await session.execute(stmt.returning(SyncTask.id))
+    return result.scalar_one_or_none() is not None
+
+
+async def claim_sync_task(
+    session: AsyncSession,
+    task_id: str,
+    statuses: Sequence[str],
+    values: dict[str, Any],
+    now: datetime,
+) -> dict[str, Any] | None:
+    """
+    Set ``values`` on a task in one of ``statuses`` whose lease, if any, expired before ``now``.
+
+    A single conditional UPDATE, so of several workers claiming the same
+    task exactly one gets it.
+
+    Args:
+        session: Database session (committed by the caller)
+        task_id: Task to claim
+        statuses: Statuses the task may be claimed from
+        values: Column values to set, typically a new status and lease
+        now: Current time
+
+    Returns:
+        The claimed task, or None if it is unknown, in another status or leased
+    """
+    result = await session.execute(
+        update(SyncTask)
+        .where(
+            SyncTask.id == task_id,
+            SyncTask.status.in_(statuses),
+            or_(SyncTask.lease_expires_at.is_(None), SyncTask.lease_expires_at < now),
+        )
+        .values(**values)
+        .returning(SyncTask)
+    )
+    row = result.scalar_one_or_none()
+    return _to_dict(row) if row is not None else None
+
+
+async def renew_sync_task_leases(
+    session: AsyncSession,
+    task_ids: Sequence[str],
+    owner: str,
+    expires_at: datetime | None,
+) -> set[str]:
+    """
+    Extend the leases ``owner`` holds on ``task_ids``, or release them with None.
+
+    Args:
+        session: Database session (committed by the caller)
+        task_ids: Tasks the owner is running
+        owner: Lease owner
+        expires_at: New lease expiry; None makes the tasks claimable at once
+
+    Returns:
+        IDs of the tasks whose lease ``owner`` still held
+    """
+    if not task_ids:
+        return set()
+    result = await session.execute(
+        update(SyncTask)
+        .where(SyncTask.id.in_(task_ids), SyncTask.lease_owner == owner)
+        .values(lease_expires_at=expires_at)
+        .returning(SyncTask.id)
+    )
+    return set(result.scalars())
@@ -0,0 +1,519 @@
+"""Deterministic synthetic data generator and bulk loader for load testing.
+
+Row counts scale linearly with ``scale``; scale 1 produces roughly 23k rows,
+so scale 430 stands up a ~10M-row benchmark database. Daily sales facts are
+opt-in via ``sales_history_days`` (about 3k rows per scale per day). Output depends only on
+the seed and the ``as_of`` reference date.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from datetime import time as dt_time
+from typing import Any
+
+from sqlalchemy import Enum, Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import JSON
+
+from backend.db.sales import ensure_sales_partitions, rebuild_rollups
+from backend.models import (
+    Alert,
+    Budget,
+    CalendarEvent,
+    Inventory,
+    Milestone,
+    Product,
+    Promotion,
+    SalesDailyFact,
+)
+from backend.models.alert import AlertSeverity, AlertType
+from backend.models.inventory import InventoryStatus
+from backend.models.promotion import (
+    EventType,
+    MilestoneStatus,
+    Priority,
+    PromotionStatus,
+    PromotionType,
+)
+
+CHANNELS = ["oliveyoung", "coupang", "naver", "kakao"]
+
+BRAND_PREFIXES = ["글로우", "퓨어", "그린", "데일리", "아쿠아", "블룸", "시카", "루미", "모이스", "코지"]
+BRAND_SUFFIXES = ["랩", "뷰티", "코스메틱", "스킨", "테라피", "가든", "하우스", "케어"]
+
+# (category, product line names, (min price, max price))
+PRODUCT_LINES = [
+    ("스킨케어", ["토너", "에센스", "세럼", "앰플", "수분크림", "아이크림", "나이트크림"], (18000, 65000)),
+    ("선케어", ["선크림 SPF50+", "선스틱", "톤업 선크림", "선쿠션"], (15000, 35000)),
+    ("클렌징", ["클렌징밤", "클렌징오일", "폼클렌저", "클렌징워터"], (12000, 32000)),
+    ("마스크팩", ["시트마스크 10매", "슬리핑마스크", "워시오프팩"], (10000, 30000)),
+    ("메이크업", ["쿠션", "립틴트", "파운데이션", "컨실러"], (14000, 42000)),
+]
+INGREDIENTS = ["히알루론산", "레티놀", "비타민C", "시카", "나이아신아마이드", "세라마이드", "펩타이드", "어성초"]
+
+SEASONAL_EVENTS = [
+    (1, "설 선물세트"),
+    (3, "봄맞이 수분케어"),
+    (4, "올리브영 페스타"),
+    (5, "가정의달 선물전"),
+    (6, "여름 선케어"),
+    (9, "추석 선물세트"),
+    (11, "블랙프라이데이"),
+    (12, "연말 홀리데이"),
+]
+
+MILESTONE_TEMPLATES = [
+    ("기획안 작성", 42, Priority.HIGH),
+    ("예산 승인", 35, Priority.HIGH),
+    ("크리에이티브 제작", 21, Priority.MEDIUM),
+    ("재고 입고 완료", 7, Priority.HIGH),
+    ("채널 상품 등록", 3, Priority.MEDIUM),
+]
+
+ALERT_TEMPLATES = [
+    (AlertType.INVENTORY, AlertSeverity.CRITICAL, "{product} 품절", "{channel} 채널에서 {product}이(가) 품절되었습니다."),
+    (AlertType.INVENTORY, AlertSeverity.WARNING, "{product} 재고 주의", "{channel} 채널의 {product} 재고가 낮습니다."),
+    (AlertType.PRICE, AlertSeverity.WARNING, "{product} 가격 편차", "{channel} 채널 판매가가 타 채널 대비 5% 이상 낮습니다."),
+    (AlertType.PRICE, AlertSeverity.CRITICAL, "{product} MAP 위반", "{channel} 채널에서 MAP 이하 판매가 감지되었습니다."),
+    (AlertType.CHANNEL, AlertSeverity.INFO, "{channel} 동기화 지연", "{channel} 채널 데이터 동기화가 지연되고 있습니다."),
+    (AlertType.PROMOTION, AlertSeverity.INFO, "프로모션 D-3", "{product} 프로모션 시작까지 3일 남았습니다."),
+]
+
+
+@dataclass
+class SyntheticConfig:
+    """Configuration for synthetic data generation."""
+
+    scale: int = 1
+    seed: int = 42
+    as_of: date = field(default_factory=date.today)
+    years: int = 3
+    brands_per_scale: int = 5
+    products_per_brand: int = 200
+    promotions_per_brand_per_year: int = 100
+    alerts_per_scale: int = 5000
+    sales_history_days: int = 0  # Days of daily sales facts per listing before as_of
+
+    @property
+    def brand_count(self) -> int:
+        return self.brands_per_scale * self.scale
+
+
+@dataclass
+class _PromotionRef:
+    """Minimal promotion info needed to derive child rows."""
+
+    id: uuid.UUID
+    name: str
+    start_date: date
+    end_date: date
+    channels: list[str]
+    status: PromotionStatus
+
+
+class SyntheticDataGenerator:
+    """Generates realistic, reproducible rows for every table."""
+
+    def __init__(self, config: SyntheticConfig):
+        self.config = config
+        self.brands = self._make_brands()
+        self.product_refs: list[tuple[uuid.UUID, str, str]] = []  # (id, brand, name)
+        self.product_prices: dict[uuid.UUID, int] = {}
+        self.listings: list[tuple[uuid.UUID, str, str, int]] = []  # (product_id, brand, channel, daily avg)
+        self.promotion_refs: list[_PromotionRef] = []
+
+    def _rng(self, table: str) -> random.Random:
+        # One independent stream per table keeps output stable if a table changes
+        return random.Random(f"{self.config.seed}:{table}")
+
+    @staticmethod
+    def _uuid(rng: random.Random) -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    def _make_brands(self) -> list[str]:
+        rng = self._rng("brands")
+        brands: list[str] = []
+        seen: set[str] = set()
+        while len(brands) < self.config.brand_count:
+            name = rng.choice(BRAND_PREFIXES) + rng.choice(BRAND_SUFFIXES)
+            if name in seen:
+                name = f"{name} {len(brands) + 1}"
+            seen.add(name)
+            brands.append(name)
+        return brands
+
+    def products(self) -> Iterator[dict[str, Any]]:
+        """Yield product rows and remember their IDs for child tables."""
+        rng = self._rng("products")
+        self.product_refs = []
+        for brand_index, brand in enumerate(self.brands):
+            for i in range(self.config.products_per_brand):
+                category, lines, (low, high) = rng.choice(PRODUCT_LINES)
+                name = f"{rng.choice(INGREDIENTS)} {rng.choice(lines)}"
+                price = rng.randrange(low, high, 500)
+                product_id = self._uuid(rng)
+                self.product_refs.append((product_id, brand, name))
+                self.product_prices[product_id] = price
+                yield {
+                    "id": product_id,
+                    "name": name,
+                    "category": category,
+                    "brand": brand,
+                    "sku": f"B{brand_index:05d}-{i:05d}",
+                    "price": price,
+                    "map_price": int(price * rng.uniform(0.8, 0.95)) // 100 * 100,
+                }
+
+    def inventories(self) -> Iterator[dict[str, Any]]:
+        """Yield per-channel inventory rows for generated products."""
+        rng = self._rng("inventories")
+        self.listings = []
+        for product_id, brand, _ in self.product_refs:
+            for channel in CHANNELS:
+                # Not every product is listed on every channel
+                if rng.random() > 0.85:
+                    continue
+                daily_avg = rng.randint(0, 60)
+                stock = 0 if rng.random() < 0.03 else rng.randint(0, 1500)
+                self.listings.append((product_id, brand, channel, daily_avg))
+                yield {
+                    "id": self._uuid(rng),
+                    "product_id": product_id,
+                    "channel": channel,
+                    "current_stock": stock,
+                    "daily_sales_avg": daily_avg,
+                    "status": inventory_status(stock, daily_avg),
+                }
+
+    def _promotion_status(self, rng: random.Random, start: date, end: date) -> PromotionStatus:
+        as_of = self.config.as_of
+        if end < as_of:
+            return PromotionStatus.CANCELLED if rng.random() < 0.05 else PromotionStatus.COMPLETED
+        if start <= as_of:
+            return PromotionStatus.ACTIVE
+        return PromotionStatus.SCHEDULED if rng.random() < 0.6 else PromotionStatus.DRAFT
+
+    def promotions(self) -> Iterator[dict[str, Any]]:
+        """Yield promotions spread over the configured number of years."""
+        rng = self._rng("promotions")
+        self.promotion_refs = []
+        # Full years of history before as_of, plus the rest of the current year
+        first_year = self.config.as_of.year - max(self.config.years - 1, 0)
+        span_start = date(first_year, 1, 1)
+        span_days = 365 * self.config.years
+        per_brand = self.config.promotions_per_brand_per_year * self.config.years
+
+        for brand in self.brands:
+            for _ in range(per_brand):
+                start = span_start + timedelta(days=rng.randrange(span_days))
+                end = start + timedelta(days=rng.choice([3, 7, 7, 10, 14, 14, 21, 30]))
+                promotion_type = rng.choice(list(PromotionType))
+                channels = rng.sample(CHANNELS, rng.randint(1, 3))
+                season = next(
+                    (label for month, label in reversed(SEASONAL_EVENTS) if month <= start.month),
+                    SEASONAL_EVENTS[-1][1],
+                )
+                name = f"{brand} {start.year} {season} 프로모션"
+                discount = rng.choice([10, 15, 20, 25, 30, 40, 50])
+                gmv_target = rng.randrange(20, 300) * 1_000_000
+                status = self._promotion_status(rng, start, end)
+                gmv_actual = (
+                    int(gmv_target * rng.uniform(0.6, 1.4))
+                    if status == PromotionStatus.COMPLETED
+                    else None
+                )
+
+                promotion_id = self._uuid(rng)
+                self.promotion_refs.append(
+                    _PromotionRef(promotion_id, name, start, end, channels, status)
+                )
+                yield {
+                    "id": promotion_id,
+                    "name": name,
+                    "description": f"{', '.join(channels)} 채널 {discount}% 할인 행사",
+                    "status": status,
+                    "promotion_type": promotion_type,
+                    "channels": channels,
+                    "start_date": start,
+                    "end_date": end,
+                    "discount_rate": f"{discount}%",
+                    "gmv_target": gmv_target,
+                    "gmv_actual": gmv_actual,
+                }
+
+    def calendar_events(self) -> Iterator[dict[str, Any]]:
+        """Yield start/end events per promotion plus standalone deadlines."""
+        rng = self._rng("calendar_events")
+        for promo in self.promotion_refs:
+            yield {
+                "id": self._uuid(rng),
+                "promotion_id": promo.id,
+                "date": promo.start_date,
+                "event_type": EventType.PROMOTION_START,
+                "title": f"{promo.name} 시작",
+                "description": f"{', '.join(promo.channels)} 동시 런칭",
+            }
+            yield {
+                "id": self._uuid(rng),
+                "promotion_id": promo.id,
+                "date": promo.end_date,
+                "event_type": EventType.PROMOTION_END,
+                "title": f"{promo.name} 종료",
+                "description": None,
+            }
+            if rng.random() < 0.3:
+                yield {
+                    "id": self._uuid(rng),
+                    "promotion_id": None,
+                    "date": promo.start_date - timedelta(days=rng.randint(14, 42)),
+                    "event_type": rng.choice([EventType.DEADLINE, EventType.EVENT]),
+                    "title": f"{promo.name} 신청 마감",
+                    "description": None,
+                }
+
+    def milestones(self) -> Iterator[dict[str, Any]]:
+        """Yield planning milestones leading up to each promotion."""
+        rng = self._rng("milestones")
+        as_of = self.config.as_of
+        for promo in self.promotion_refs:
+            for name, lead_days, priority in MILESTONE_TEMPLATES:
+                if rng.random() < 0.2:
+                    continue
+                due = promo.start_date - timedelta(days=lead_days)
+                if due < as_of - timedelta(days=7):
+                    status = MilestoneStatus.COMPLETE if rng.random() < 0.95 else MilestoneStatus.OVERDUE
+                elif due < as_of:
+                    status = rng.choice([MilestoneStatus.COMPLETE, MilestoneStatus.OVERDUE])
+                elif due < as_of + timedelta(days=14):
+                    status = rng.choice([MilestoneStatus.PENDING, MilestoneStatus.IN_PROGRESS])
+                else:
+                    status = MilestoneStatus.PENDING
+                yield {
+                    "id": self._uuid(rng),
+                    "promotion_id": promo.id,
+                    "name": name,
+                    "due_date": due,
+                    "status": status,
+                    "priority": priority,
+                }
+
+    def budgets(self) -> Iterator[dict[str, Any]]:
+        """Yield one budget allocation per promotion channel."""
+        rng = self._rng("budgets")
+        for promo in self.promotion_refs:
+            for channel in promo.channels:
+                total = rng.randrange(5, 60) * 1_000_000
+                advertising = int(total * rng.uniform(0.3, 0.5))
+                discounts = int(total * rng.uniform(0.2, 0.4))
+                influencer = int((total - advertising - discounts) * rng.uniform(0.3, 0.7))
+                yield {
+                    "id": self._uuid(rng),
+                    "promotion_id": promo.id,
+                    "channel": channel,
+                    "total_amount": total,
+                    "advertising": advertising,
+                    "discounts": discounts,
+                    "influencer": influencer,
+                    "creative": total - advertising - discounts - influencer,
+                }
+
+    def alerts(self) -> Iterator[dict[str, Any]]:
+        """Yield alerts spread over the history window; old ones are acknowledged."""
+        rng = self._rng("alerts")
+        as_of = datetime.combine(self.config.as_of, dt_time(9), tzinfo=timezone.utc)
+        window_seconds = 365 * 24 * 3600 * max(self.config.years - 1, 1)
+        for _ in range(self.config.alerts_per_scale * self.config.scale):
+            alert_type, severity, title, message = rng.choice(ALERT_TEMPLATES)
+            _, _, product = rng.choice(self.product_refs)
+            channel = rng.choice(CHANNELS)
+            created_at = as_of - timedelta(seconds=rng.randrange(window_seconds))
+            age_days = (as_of - created_at).days
+            yield {
+                "id": self._uuid(rng),
+                "alert_type": alert_type,
+                "severity": severity,
+                "title": title.format(product=product, channel=channel),
+                "message": message.format(product=product, channel=channel),
+                "channel": None if alert_type == AlertType.PROMOTION else channel,
+                "acknowledged": age_days > 7 or rng.random() < 0.3,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def sales_facts(self) -> Iterator[dict[str, Any]]:
+        """Yield daily sales per listed product and channel before as_of."""
+        rng = self._rng("sales_daily_facts")
+        days = self.config.sales_history_days
+        first_day = self.config.as_of - timedelta(days=days)
+        for product_id, brand, channel, daily_avg in self.listings:
+            price = self.product_prices[product_id]
+            for offset in range(days):
+                sale_date = first_day + timedelta(days=offset)
+                # Weekend bump plus noise around the listing's average
+                mean = daily_avg * (1.2 if sale_date.weekday() >= 5 else 1.0)
+                units = max(int(rng.gauss(mean, mean * 0.3 + 0.5)), 0)
+                if units == 0:
+                    continue
+                discount_rate = rng.choice([0.0, 0.0, 0.1, 0.2])
+                gross = units * price
+                yield {
+                    "sale_date": sale_date,
+                    "product_id": product_id,
+                    "channel": channel,
+                    "brand": brand,
+                    "promotion_id": None,
+                    "units": units,
+                    "orders": max(int(units * rng.uniform(0.7, 1.0)), 1),
+                    "gross_sales": gross,
+                    "discount_amount": int(gross * discount_rate),
+                }
+
+    def tables(self) -> Iterator[tuple[Table, Iterator[dict[str, Any]]]]:
+        """Yield (table, rows) in foreign-key order."""
+        yield Product.__table__, self.products()
+        yield Inventory.__table__, self.inventories()
+        yield Promotion.__table__, self.promotions()
+        yield CalendarEvent.__table__, self.calendar_events()
+        yield Milestone.__table__, self.milestones()
+        yield Budget.__table__, self.budgets()
+        yield Alert.__table__, self.alerts()
+        if self.config.sales_history_days > 0:
+            yield SalesDailyFact.__table__, self.sales_facts()
+
+
+def inventory_status(stock: int, daily_sales_avg: int) -> InventoryStatus:
+    """Derive inventory status from days of stock remaining."""
+    if stock == 0:
+        return InventoryStatus.OUT_OF_STOCK
+    if daily_sales_avg == 0:
+        return InventoryStatus.HEALTHY
+    days = stock / daily_sales_avg
+    if days < 7:
+        return InventoryStatus.CRITICAL
+    if days < 14:
+        return InventoryStatus.LOW_STOCK
+    return InventoryStatus.HEALTHY
+
+
+def _chunks(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    chunk: list[dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BulkLoader:
+    """
+    Loads row dicts into tables using COPY on asyncpg, multi-row INSERT otherwise.
+    """
+
+    def __init__(self, session: AsyncSession, chunk_size: int = 10_000):
+        self.session = session
+        self.chunk_size = chunk_size
+
+    async def _raw_asyncpg_connection(self) -> Any | None:
+        conn = await self.session.connection()
+        if conn.dialect.name != "postgresql" or conn.dialect.driver != "asyncpg":
+            return None
+        raw = await conn.get_raw_connection()
+        return raw.driver_connection
+
+    @staticmethod
+    def _copy_converters(table: Table, columns: list[str]) -> list[Any]:
+        """Per-column converters from Python values to COPY-compatible values."""
+        converters = []
+        for name in columns:
+            column_type = table.c[name].type
+            if isinstance(column_type, Enum) and column_type.enum_class is not None:
+                # SQLAlchemy stores Python enums by member name
+                converters.append(lambda v: v.name if v is not None else None)
+            elif isinstance(column_type, JSON):
+                converters.append(lambda v: json.dumps(v, ensure_ascii=False) if v is not None else None)
+            else:
+                converters.append(None)
+        return converters
+
+    async def load(self, table: Table, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Load rows into a table.
+
+        Args:
+            table: Target table
+            rows: Row dicts; every row must have the same keys
+
+        Returns:
+            Number of rows loaded
+        """
+        raw = await self._raw_asyncpg_connection()
+        count = 0
+
+        for chunk in _chunks(rows, self.chunk_size):
+            if raw is not None:
+                columns = list(chunk[0].keys())
+                converters = self._copy_converters(table, columns)
+                records = [
+                    tuple(
+                        convert(row[column]) if convert else row[column]
+                        for column, convert in zip(columns, converters)
+                    )
+                    for row in chunk
+                ]
+                await raw.copy_records_to_table(table.name, records=records, columns=columns)
+            else:
+                await self.session.execute(insert(table), chunk)
+            count += len(chunk)
+
+        return count
+
+
+async def seed_synthetic(session: AsyncSession, config: SyntheticConfig) -> dict[str, int]:
+    """
+    Generate and bulk load a synthetic dataset.
+
+    Args:
+        session: Session to load through (committed by the caller)
+        config: Generation settings
+
+    Returns:
+        Row counts per table
+    """
+    generator = SyntheticDataGenerator(config)
+    loader = BulkLoader(session)
+    counts: dict[str, int] = {}
+
+    sales_start = config.as_of - timedelta(days=config.sales_history_days)
+    sales_end = config.as_of - timedelta(days=1)
+    if config.sales_history_days > 0:
+        await ensure_sales_partitions(session, sales_start, sales_end)
+
+    for table, rows in generator.tables():
+        start = time.perf_counter()
+        counts[table.name] = await loader.load(table, rows)
+        elapsed = time.perf_counter() - start
+        print(
+            f"Loaded {counts[table.name]:,} rows into {table.name} "
+            f"in {elapsed:.1f}s ({counts[table.name] / max(elapsed, 1e-9):,.0f} rows/s)"
+        )
+
+    if config.sales_history_days > 0:
+        start = time.perf_counter()
+        await rebuild_rollups(session, sales_start, sales_end)
+        print(f"Rebuilt sales rollups in {time.perf_counter() - start:.1f}s")
+
+    connection = await session.connection()
+    if connection.dialect.name == "postgresql":
+        for table_name in counts:
+            await session.execute(text(f"ANALYZE {table_name}"))
+
+    return counts
@@ -0,0 +1,19 @@
+"""Catalog-wide inventory analysis for Promotor."""
+
+from backend.inventory.reorder import (
+    INVENTORY_CRITICAL_DAYS,
+    INVENTORY_WARNING_DAYS,
+    InventoryMatrix,
+    StockLevels,
+    check_stock_levels,
+    find_reorder_breaches,
+)
+
+__all__ = [
+    "INVENTORY_CRITICAL_DAYS",
+    "INVENTORY_WARNING_DAYS",
+    "InventoryMatrix",
+    "StockLevels",
+    "check_stock_levels",
+    "find_reorder_breaches",
+]
@@ -0,0 +1,203 @@
+"""Vectorized cross-channel inventory and reorder point checks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from backend.pricing.consistency import CHANNELS
+
+# Days of supply below which a product's channel stock is reported; the
+# warning level is also the reorder point (daily sales x 14 days)
+INVENTORY_CRITICAL_DAYS = 7
+INVENTORY_WARNING_DAYS = 14
+
+# Status codes of the matrix cells, indexing STOCK_STATUSES
+NOT_LISTED, HEALTHY, LOW_STOCK, CRITICAL, OUT_OF_STOCK = range(5)
+STOCK_STATUSES = ("not_listed", "healthy", "low_stock", "critical", "out_of_stock")
+
+# Alert severity per status; statuses not listed are not alerts
+STATUS_SEVERITY = {"low_stock": "warning", "critical": "critical", "out_of_stock": "critical"}
+
+
+class InventoryMatrix:
+    """
+    Stock and average daily sales per product (rows) and channel (columns).
+
+    Channels a product is not listed on have ``listed`` False and zero stock
+    and sales.
+    """
+
+    def __init__(
+        self,
+        product_ids: Sequence[Any],
+        product_names: Sequence[str],
+        channels: Sequence[str],
+        stock: np.ndarray,
+        daily_sales: np.ndarray,
+        listed: np.ndarray,
+    ):
+        self.product_ids = product_ids
+        self.product_names = product_names
+        self.channels = tuple(channels)
+        self.stock = stock
+        self.daily_sales = daily_sales
+        self.listed = listed
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        channels: Sequence[str] = CHANNELS,
+    ) -> InventoryMatrix:
+        """
+        Build the matrix from rows with product_id, product_name, channel,
+        current_stock and daily_sales_avg.
+
+        A row whose channel is None or not in ``channels`` still adds its
+        product (so products without inventory get an empty row); a repeated
+        (product_id, channel) keeps the last values.
+        """
+        channel_index = {channel: i for i, channel in enumerate(channels)}
+        product_index: dict[Any, int] = {}
+        names: list[str] = []
+        row_idx, col_idx, stock_values, sales_values = [], [], [], []
+        for row in rows:
+            product_id = row["product_id"]
+            index = product_index.get(product_id)
+            if index is None:
+                index = product_index[product_id] = len(names)
+                names.append(row["product_name"])
+            col = channel_index.get(row["channel"])
+            if col is None:
+                continue
+            row_idx.append(index)
+            col_idx.append(col)
+            stock_values.append(row["current_stock"])
+            sales_values.append(row["daily_sales_avg"])
+
+        shape = (len(names), len(channels))
+        stock = np.zeros(shape, dtype=np.int64)
+        daily_sales = np.zeros(shape, dtype=np.int64)
+        listed = np.zeros(shape, dtype=bool)
+        stock[row_idx, col_idx] = stock_values
+        daily_sales[row_idx, col_idx] = sales_values
+        listed[row_idx, col_idx] = True
+        return cls(list(product_index), names, channels, stock, daily_sales, listed)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+
+class StockLevels:
+    """Per-cell results of ``check_stock_levels``, aligned with the matrix."""
+
+    def __init__(self, days_of_supply: np.ndarray, reorder_point: np.ndarray, status: np.ndarray):
+        self.days_of_supply = days_of_supply
+        self.reorder_point = reorder_point
+        self.status = status
+
+
+def check_stock_levels(
+    matrix: InventoryMatrix,
+    critical_days: float = INVENTORY_CRITICAL_DAYS,
+    reorder_days: float = INVENTORY_WARNING_DAYS,
+) -> StockLevels:
+    """
+    Classify every product channel in one vectorized pass.
+
+    Days of supply is stock over average daily sales (infinite for stock
+    that is not selling, zero when out of stock). A listing is below its
+    reorder point when it has less than ``reorder_days`` of supply.
+
+    Args:
+        matrix: Inventory levels
+        critical_days: Days of supply below which stock is critical
+        reorder_days: Days of supply that make up the reorder point
+
+    Returns:
+        Days of supply, reorder point (units) and status code per cell
+    """
+    stock = matrix.stock
+    sales = matrix.daily_sales
+    selling = sales > 0
+
+    days = np.full(stock.shape, np.inf)
+    np.divide(stock, sales, out=days, where=selling)
+    days[stock <= 0] = 0.0
+
+    reorder_point = np.ceil(sales * reorder_days).astype(np.int64)
+    status = np.select(
+        [~matrix.listed, stock <= 0, days < critical_days, days < reorder_days],
+        [NOT_LISTED, OUT_OF_STOCK, CRITICAL, LOW_STOCK],
+        default=HEALTHY,
+    ).astype(np.int8)
+    return StockLevels(days, reorder_point, status)
+
+
+def find_reorder_breaches(
+    matrix: InventoryMatrix,
+    levels: StockLevels | None = None,
+    limit: int | None = None,
+) -> dict[str, Any]:
+    """
+    Report every product channel below its reorder point, fewest days of supply first.
+
+    Args:
+        matrix: Inventory levels
+        levels: Result of ``check_stock_levels`` (computed if omitted)
+        limit: Only build details for the ``limit`` most urgent breaches
+
+    Returns:
+        Counts per channel and status plus the breaching listings
+    """
+    levels = levels or check_stock_levels(matrix)
+    status = levels.status
+
+    breaching = np.flatnonzero((status >= LOW_STOCK).ravel())
+    days_flat = levels.days_of_supply.ravel()
+    breaching = breaching[np.argsort(days_flat[breaching], kind="stable")]
+    breach_count = len(breaching)
+    critical_count = int((status.ravel()[breaching] != LOW_STOCK).sum())
+    breaching = breaching[:limit]
+
+    channel_count = len(matrix.channels)
+    counts = np.stack([(status == code).sum(axis=0) for code in range(len(STOCK_STATUSES))])
+
+    # Convert once; per-element numpy indexing dominates otherwise
+    rows, cols = np.divmod(breaching, channel_count)
+    breaches = []
+    for row, col, stock, sales, days, reorder_point, code in zip(
+        rows.tolist(),
+        cols.tolist(),
+        matrix.stock.ravel()[breaching].tolist(),
+        matrix.daily_sales.ravel()[breaching].tolist(),
+        days_flat[breaching].tolist(),
+        levels.reorder_point.ravel()[breaching].tolist(),
+        status.ravel()[breaching].tolist(),
+    ):
+        breaches.append({
+            "product_id": str(matrix.product_ids[row]),
+            "product_name": matrix.product_names[row],
+            "channel": matrix.channels[col],
+            "current_stock": stock,
+            "daily_sales_avg": sales,
+            "days_of_supply": round(days, 1),
+            "reorder_point": reorder_point,
+            "status": STOCK_STATUSES[code],
+            "severity": STATUS_SEVERITY[STOCK_STATUSES[code]],
+        })
+
+    return {
+        "products_checked": len(matrix),
+        "listings_checked": int(matrix.listed.sum()),
+        "by_channel": {
+            channel: {name: int(counts[code, c]) for code, name in enumerate(STOCK_STATUSES)}
+            for c, channel in enumerate(matrix.channels)
+        },
+        "critical_count": critical_count,
+        "warning_count": breach_count - critical_count,
+        "breaches": breaches,
+    }
@@ -0,0 +1,25 @@
+"""Background precomputation jobs for Promotor."""
+
+from backend.jobs.cache import (
+    InMemoryResultCache,
+    RedisResultCache,
+    ResultCache,
+    create_result_cache,
+)
+from backend.jobs.scheduler import (
+    Job,
+    JobScheduler,
+    close_job_scheduler,
+    get_job_scheduler,
+)
+
+__all__ = [
+    "InMemoryResultCache",
+    "Job",
+    "JobScheduler",
+    "RedisResultCache",
+    "ResultCache",
+    "close_job_scheduler",
+    "create_result_cache",
+    "get_job_scheduler",
+]
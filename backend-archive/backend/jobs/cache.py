@@ -0,0 +1,145 @@
+"""Result cache and run locks for precomputed background jobs."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from backend.config import get_settings
+
+
+class ResultCache(ABC):
+    """
+    Stores the latest result of each (job, brand) and the locks that keep
+    two runs of the same job and brand from overlapping.
+
+    Entries and locks expire on their own, so a result that is no longer
+    refreshed disappears and a lock held by a crashed worker is released.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Entry stored under ``key``, or None if it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: dict[str, Any], ttl: float) -> None:
+        """Store ``entry`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    async def acquire(self, key: str, ttl: float) -> str | None:
+        """
+        Take the lock ``key`` unless someone else holds it.
+
+        Returns:
+            A token to release the lock with, or None if it is held
+        """
+
+    @abstractmethod
+    async def release(self, key: str, token: str) -> None:
+        """Release the lock ``key`` if ``token`` still holds it."""
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryResultCache(ResultCache):
+    """Results and locks in process memory; only visible to this process."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._locks: dict[str, tuple[float, str]] = {}
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if self.clock() >= expires_at:
+            del self._entries[key]
+            return None
+        return entry
+
+    async def set(self, key: str, entry: dict[str, Any], ttl: float) -> None:
+        self._entries[key] = (self.clock() + ttl, entry)
+
+    async def acquire(self, key: str, ttl: float) -> str | None:
+        now = self.clock()
+        held = self._locks.get(key)
+        if held is not None and now < held[0]:
+            return None
+        token = uuid.uuid4().hex
+        self._locks[key] = (now + ttl, token)
+        return token
+
+    async def release(self, key: str, token: str) -> None:
+        held = self._locks.get(key)
+        if held is not None and held[1] == token:
+            del self._locks[key]
+
+
+# Delete the lock only if it still holds our token; it may have expired
+# and been taken by another worker since.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisResultCache(ResultCache):
+    """Results and locks in Redis, shared by API workers and Celery tasks."""
+
+    def __init__(self, url: str, prefix: str = "promotor:jobs:"):
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+        self._release = None
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+            self._release = self._client.register_script(RELEASE_SCRIPT)
+        return self._client
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        raw = await self._get_client().get(self.prefix + key)
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, entry: dict[str, Any], ttl: float) -> None:
+        await self._get_client().set(
+            self.prefix + key,
+            orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS),
+            px=int(ttl * 1000),
+        )
+
+    async def acquire(self, key: str, ttl: float) -> str | None:
+        token = uuid.uuid4().hex
+        acquired = await self._get_client().set(self.prefix + key, token, nx=True, px=int(ttl * 1000))
+        return token if acquired else None
+
+    async def release(self, key: str, token: str) -> None:
+        self._get_client()
+        await self._release(keys=[self.prefix + key], args=[token])
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._release = None
+
+
+def create_result_cache() -> ResultCache:
+    """Create the cache selected by settings.background_job_cache_backend."""
+    settings = get_settings()
+    if settings.background_job_cache_backend == "redis":
+        return RedisResultCache(settings.redis_url)
+    return InMemoryResultCache()
@@ -0,0 +1,84 @@
+"""
+Celery app running the precomputation jobs on the configured broker.
+
+Beat enqueues one ``dispatch`` task per job and interval; it fans out a
+``run_job`` task per brand, each delayed by a random share of the jitter
+window. Results only reach the API when both use the Redis result cache
+(``background_job_cache_backend = "redis"``).
+
+Usage:
+    celery -A backend.jobs.celery_app worker --loglevel=info
+    celery -A backend.jobs.celery_app beat --loglevel=info
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Coroutine
+from typing import Any
+
+from celery import Celery
+
+from backend.config import get_settings
+from backend.jobs.precompute import default_jobs
+from backend.jobs.scheduler import get_job_scheduler
+
+settings = get_settings()
+
+celery_app = Celery(
+    "promotor",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+)
+celery_app.conf.update(
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    result_expires=24 * 3600,
+    beat_schedule={
+        f"precompute-{job.name}": {
+            "task": "promotor.jobs.dispatch",
+            "schedule": job.interval,
+            "args": (job.name,),
+        }
+        for job in default_jobs()
+    },
+)
+
+if settings.background_job_cache_backend != "redis":
+    print("Background job results are cached in worker memory; set BACKGROUND_JOB_CACHE_BACKEND=redis")
+
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` on this worker process's event loop, reused because DB and Redis clients are bound to it."""
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+@celery_app.task(name="promotor.jobs.dispatch")
+def dispatch(job_name: str) -> int:
+    """Enqueue ``job_name`` for every brand, spread over the jitter window."""
+    scheduler = get_job_scheduler()
+    job = scheduler.jobs[job_name]
+    brands = _run(scheduler.targets(job))
+    for brand_id in brands:
+        countdown = random.uniform(0, scheduler.jitter * job.interval)
+        # Drop runs still queued when the next dispatch is due
+        run_job.apply_async((job_name, brand_id), countdown=countdown, expires=countdown + job.interval)
+    return len(brands)
+
+
+@celery_app.task(name="promotor.jobs.run")
+def run_job(job_name: str, brand_id: str) -> dict[str, Any]:
+    """Run one job for one brand; skipped if a previous run still holds its lock."""
+    entry = _run(get_job_scheduler().run(job_name, brand_id))
+    return {
+        "job": job_name,
+        "brand_id": brand_id,
+        "refreshed": entry is not None,
+        "duration_s": entry["duration_s"] if entry is not None else None,
+    }
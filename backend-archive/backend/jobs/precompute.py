@@ -0,0 +1,181 @@
+"""Per-brand reports precomputed by background jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from typing import Any
+
+from backend.channels import ChannelRequestError, get_channel_status_aggregator
+from backend.channels.oliveyoung import get_oliveyoung_scraper
+from backend.channels.rankings import RANKING_DEPTH
+from backend.config import get_settings
+from backend.db.inventory import load_inventory_matrix
+from backend.db.pricing import load_map_violations, load_price_matrix
+from backend.db.rankings import record_ranking_snapshot
+from backend.db.sales import get_period_change
+from backend.inventory import find_reorder_breaches
+from backend.jobs.scheduler import Job, JobScheduler
+from backend.pricing import find_price_inconsistencies
+from backend.pricing.consistency import CHANNELS
+
+# Violations kept per brand; interactive reads asking for more compute live
+PRICE_CONSISTENCY_LIMIT = 50
+
+BRIEFING_TOP = 5
+
+
+async def channel_report(scheduler: JobScheduler, brand_id: str) -> dict[str, Any]:
+    """Full status of every channel, fetched concurrently; failed channels carry an error."""
+    providers = get_channel_status_aggregator().providers
+    results = await asyncio.gather(
+        *(provider(brand_id) for _, provider in providers.values()),
+        return_exceptions=True,
+    )
+    channels = {}
+    for (code, (name, _)), result in zip(providers.items(), results):
+        if isinstance(result, Exception):
+            channels[code] = {"name": name, "error": str(result) or type(result).__name__}
+        else:
+            channels[code] = {"name": name, **result}
+    return {
+        "brand_id": brand_id,
+        "channels": channels,
+        "failed": [code for code, channel in channels.items() if "error" in channel],
+    }
+
+
+async def inventory_alerts(scheduler: JobScheduler, brand_id: str) -> dict[str, Any]:
+    """Product channels below their reorder point, fewest days of supply first."""
+    async with scheduler.session_factory() as session:
+        matrix = await load_inventory_matrix(session, brand=brand_id)
+
+    report = find_reorder_breaches(matrix)
+    return {
+        "brand_id": brand_id,
+        "products_checked": report["listings_checked"],
+        "critical_count": report["critical_count"],
+        "warning_count": report["warning_count"],
+        "alerts": report["breaches"],
+    }
+
+
+async def price_consistency(scheduler: JobScheduler, brand_id: str) -> dict[str, Any]:
+    """Cross-channel price variance of the brand's whole catalog."""
+    async with scheduler.session_factory() as session:
+        matrix = await load_price_matrix(session, CHANNELS, brand=brand_id)
+
+    report = find_price_inconsistencies(matrix, limit=PRICE_CONSISTENCY_LIMIT)
+    return {
+        "brand": brand_id,
+        "channels": list(CHANNELS),
+        **report,
+        "truncated": report["warning_count"] + report["critical_count"] > PRICE_CONSISTENCY_LIMIT,
+    }
+
+
+async def daily_briefing(scheduler: JobScheduler, brand_id: str) -> dict[str, Any]:
+    """
+    Morning summary combining the other jobs' latest results with sales and
+    MAP violations. Missing sections are None rather than failing the briefing.
+    """
+    report, inventory, prices = await asyncio.gather(
+        scheduler.get("channel_report", brand_id),
+        scheduler.get("inventory_alerts", brand_id),
+        scheduler.get("price_consistency", brand_id),
+    )
+    async with scheduler.session_factory() as session:
+        sales = await get_period_change(session, days=7, brand=brand_id)
+        map_violations = await load_map_violations(session, brand=brand_id)
+
+    channels = None
+    if report is not None:
+        channels = {
+            code: channel.get("summary") or channel.get("error")
+            for code, channel in report["value"]["channels"].items()
+        }
+    stock = None
+    if inventory is not None:
+        value = inventory["value"]
+        stock = {
+            "critical_count": value["critical_count"],
+            "warning_count": value["warning_count"],
+            "top": value["alerts"][:BRIEFING_TOP],
+        }
+    pricing = None
+    if prices is not None:
+        value = prices["value"]
+        pricing = {
+            "critical_count": value["critical_count"],
+            "warning_count": value["warning_count"],
+            "top": value["violations"][:BRIEFING_TOP],
+        }
+
+    return {
+        "brand_id": brand_id,
+        "date": date.today().isoformat(),
+        "sales_7d": {
+            "gross_sales": sales["current"]["gross_sales"],
+            "units": sales["current"]["units"],
+            "change": sales["change"],
+        },
+        "channels": channels,
+        "inventory": stock,
+        "pricing": pricing,
+        "map_violations": {
+            "count": len(map_violations),
+            "top": map_violations[:BRIEFING_TOP],
+        },
+        "sources": {
+            entry_name: entry["computed_at"] if entry is not None else None
+            for entry_name, entry in (
+                ("channel_report", report),
+                ("inventory_alerts", inventory),
+                ("price_consistency", prices),
+            )
+        },
+    }
+
+
+async def ranking_snapshots(scheduler: JobScheduler, brand_id: str) -> dict[str, Any]:
+    """
+    Fetch the tracked Oliveyoung leaderboards and store the lists that changed.
+
+    Not per brand; a board that fails is reported and the others still recorded.
+    """
+    settings = get_settings()
+    if not settings.oliveyoung_scraping_enabled:
+        return {"recorded": [], "unchanged": [], "failed": {}, "skipped": "Oliveyoung scraping is disabled"}
+
+    from backend.db.session import async_session
+
+    scraper = get_oliveyoung_scraper()
+    recorded, unchanged, failed = [], [], {}
+    for scope in settings.ranking_boards:
+        category, _, ranking_type = scope.partition(":")
+        try:
+            items = await scraper.rankings(category, ranking_type or "sales", RANKING_DEPTH, only_changed=True)
+        except ChannelRequestError as e:
+            failed[scope] = str(e)
+            continue
+        if items is None:
+            unchanged.append(scope)
+            continue
+        async with async_session() as session:
+            await record_ranking_snapshot(session, "oliveyoung", scope, items)
+            await session.commit()
+        recorded.append(scope)
+    return {"recorded": recorded, "unchanged": unchanged, "failed": failed}
+
+
+def default_jobs() -> list[Job]:
+    """The precomputation jobs, at the configured interval (the briefing daily)."""
+    settings = get_settings()
+    interval = settings.background_job_interval_hours * 3600
+    return [
+        Job("channel_report", channel_report, interval),
+        Job("inventory_alerts", inventory_alerts, interval),
+        Job("price_consistency", price_consistency, interval),
+        Job("daily_briefing", daily_briefing, 24 * 3600),
+        Job("ranking_snapshots", ranking_snapshots, settings.ranking_fetch_interval_s, per_brand=False),
+    ]
@@ -0,0 +1,306 @@
+"""Jittered, non-overlapping execution of per-brand background jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.config import get_settings
+from backend.jobs.cache import ResultCache, create_result_cache
+from backend.models import Product
+
+JobFunction = Callable[["JobScheduler", str], Awaitable[dict[str, Any]]]
+
+
+# Brand ID under which jobs that are not per brand run and cache their result
+ALL_BRANDS = "all"
+
+
+class Job(NamedTuple):
+    """A computation refreshed for every brand (or once, under ALL_BRANDS) every ``interval`` seconds."""
+
+    name: str
+    func: JobFunction
+    interval: float
+    per_brand: bool = True
+
+
+def result_key(job_name: str, brand_id: str) -> str:
+    return f"result:{job_name}:{brand_id}"
+
+
+def lock_key(job_name: str, brand_id: str) -> str:
+    return f"lock:{job_name}:{brand_id}"
+
+
+class JobMetrics:
+    """Run counts, durations and cache reads of one job across all brands."""
+
+    def __init__(self):
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0  # Runs dropped because the previous one was still going
+        self.hits = 0
+        self.misses = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration: float | None = None
+        self.last_success: datetime | None = None
+        self.last_error: str | None = None
+
+    def record(self, duration: float, error: str | None = None) -> None:
+        self.runs += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.last_duration = duration
+        if error is None:
+            self.last_success = datetime.now().astimezone()
+        else:
+            self.failures += 1
+            self.last_error = error
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "last_duration_s": round(self.last_duration, 3) if self.last_duration is not None else None,
+            "avg_duration_s": round(self.total_duration / self.runs, 3) if self.runs else None,
+            "max_duration_s": round(self.max_duration, 3),
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_error": self.last_error,
+        }
+
+
+class JobScheduler:
+    """
+    Runs precomputation jobs per brand and serves their cached results.
+
+    A run of (job, brand) takes a lock in the result cache first and is
+    skipped if the previous run still holds it, whether that run is in this
+    process or, with the Redis cache, in a Celery worker. Its result is
+    cached for two intervals so one late or failed run still leaves the
+    previous result readable.
+
+    ``start`` runs every job in-process (the local executor, for development
+    and tests); in production Celery beat triggers the same ``run_all``.
+    Either way each run is shifted by up to ``jitter`` of its interval so
+    brands and workers do not all hit the database at the same moment.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[Job],
+        cache: ResultCache | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        brands: Sequence[str] | None = None,
+        jitter: float | None = None,
+        concurrency: int | None = None,
+        rng: random.Random | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            jobs: Jobs to run
+            cache: Result cache (defaults to the configured backend)
+            session_factory: Session factory for job queries (defaults to readonly_session)
+            brands: Brands to precompute for (defaults to every brand in the catalog)
+            jitter: Fraction of the interval each run is randomly shifted by
+            concurrency: Brands computed at once per job
+            rng: Random source for jitter
+        """
+        settings = get_settings()
+        self.jobs = {job.name: job for job in jobs}
+        self.cache = cache or create_result_cache()
+        self._session_factory = session_factory
+        self.brands = list(brands) if brands is not None else None
+        self.jitter = jitter if jitter is not None else settings.background_job_jitter
+        self.concurrency = concurrency or settings.background_job_concurrency
+        self.lock_timeout = settings.background_job_lock_timeout_s
+        self.rng = rng or random.Random()
+
+        self.metrics = {name: JobMetrics() for name in self.jobs}
+        self._running: dict[tuple[str, str], asyncio.Event] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from backend.db.session import readonly_session
+
+            self._session_factory = readonly_session
+        return self._session_factory
+
+    async def list_brands(self) -> list[str]:
+        """Brands to precompute for."""
+        if self.brands is not None:
+            return self.brands
+        async with self.session_factory() as session:
+            result = await session.execute(select(Product.brand).distinct().order_by(Product.brand))
+            return list(result.scalars())
+
+    async def targets(self, job: Job) -> list[str]:
+        """Brands to run ``job`` for."""
+        return await self.list_brands() if job.per_brand else [ALL_BRANDS]
+
+    def next_delay(self, job: Job) -> float:
+        """Seconds until the next run: the interval, shifted by up to +/- jitter."""
+        return job.interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    async def run(self, job_name: str, brand_id: str) -> dict[str, Any] | None:
+        """
+        Run one job for one brand and cache its result.
+
+        Returns:
+            The cached entry, or None if the run was skipped or failed
+        """
+        job = self.jobs[job_name]
+        metrics = self.metrics[job_name]
+        key = (job_name, brand_id)
+        if key in self._running:
+            metrics.skipped += 1
+            return None
+        token = await self.cache.acquire(lock_key(job_name, brand_id), self.lock_timeout)
+        if token is None:
+            metrics.skipped += 1
+            return None
+
+        done = self._running[key] = asyncio.Event()
+        start = time.perf_counter()
+        try:
+            value = await job.func(self, brand_id)
+        except Exception as e:
+            metrics.record(time.perf_counter() - start, str(e) or type(e).__name__)
+            print(f"Background job {job_name} for {brand_id} failed: {metrics.last_error}")
+            return None
+        else:
+            duration = time.perf_counter() - start
+            entry = {
+                "job": job_name,
+                "brand_id": brand_id,
+                "computed_at": datetime.now().astimezone().isoformat(),
+                "computed_ts": time.time(),
+                "duration_s": round(duration, 3),
+                "value": value,
+            }
+            await self.cache.set(result_key(job_name, brand_id), entry, job.interval * 2)
+            metrics.record(duration)
+            return entry
+        finally:
+            del self._running[key]
+            done.set()
+            await self.cache.release(lock_key(job_name, brand_id), token)
+
+    async def run_all(self, job_name: str) -> int:
+        """
+        Run one job for every brand (or once if it is not per brand), ``concurrency`` brands at a time.
+
+        Returns:
+            Number of brands whose result was refreshed
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_one(brand_id: str) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.run(job_name, brand_id)
+
+        results = await asyncio.gather(*(run_one(brand) for brand in await self.targets(self.jobs[job_name])))
+        return sum(result is not None for result in results)
+
+    async def get(self, job_name: str, brand_id: str, compute: bool = True) -> dict[str, Any] | None:
+        """
+        Latest precomputed result of a job for a brand.
+
+        Args:
+            job_name: Job name
+            brand_id: Brand
+            compute: Run the job now if there is no cached result (joining a
+                run already in progress in this process)
+
+        Returns:
+            The entry (job, brand_id, computed_at, duration_s, value, age_s),
+            or None if there is none
+        """
+        metrics = self.metrics[job_name]
+        entry = await self.cache.get(result_key(job_name, brand_id))
+        if entry is not None:
+            metrics.hits += 1
+        else:
+            metrics.misses += 1
+            if not compute:
+                return None
+            running = self._running.get((job_name, brand_id))
+            if running is not None:
+                await running.wait()
+                entry = await self.cache.get(result_key(job_name, brand_id))
+            else:
+                entry = await self.run(job_name, brand_id)
+            if entry is None:
+                return None
+        return {**entry, "age_s": round(time.time() - entry["computed_ts"], 1)}
+
+    async def _loop(self, job: Job) -> None:
+        # Stagger the first run too, so a restart does not run everything at once
+        delay = self.rng.uniform(0, self.jitter * job.interval)
+        while True:
+            await asyncio.sleep(delay)
+            start = time.monotonic()
+            try:
+                await self.run_all(job.name)
+            except Exception as e:
+                print(f"Background job {job.name} failed: {e}")
+            delay = max(0.0, self.next_delay(job) - (time.monotonic() - start))
+
+    def start(self) -> None:
+        """Start the local executor: one jittered loop per job."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._loop(job)) for job in self.jobs.values()]
+
+    async def stop(self) -> None:
+        """Stop the local executor and close the cache."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.cache.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "executor": "local" if self._tasks else "external",
+            "in_flight": len(self._running),
+            "jobs": {
+                name: {"interval_s": job.interval, **self.metrics[name].snapshot()}
+                for name, job in self.jobs.items()
+            },
+        }
+
+
+_scheduler: JobScheduler | None = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get the shared scheduler over the precomputation jobs."""
+    global _scheduler
+    if _scheduler is None:
+        from backend.jobs.precompute import default_jobs
+
+        _scheduler = JobScheduler(default_jobs())
+    return _scheduler
+
+
+async def close_job_scheduler() -> None:
+    """Stop the shared scheduler (on shutdown)."""
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
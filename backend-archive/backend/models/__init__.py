@@ -3,7 +3,18 @@
 from backend.models.alert import Alert
 from backend.models.base import Base
 from backend.models.inventory import Inventory, Product
+from backend.models.messaging import MessageDispatch
+from backend.models.pricing import (
+    ChannelPrice,
+    MapViolation,
+    PriceHistorySegment,
+    PriceRollup,
+    SellerPrice,
+)
 from backend.models.promotion import Budget, CalendarEvent, Milestone, Promotion
+from backend.models.ranking import ChannelRanking, ChannelRankMovement
+from backend.models.sales import BrandSalesRollup, ProductSalesRollup, SalesDailyFact
+from backend.models.sync import SyncTask
 
 __all__ = [
     "Base",
@@ -13,5 +24,17 @@ __all__ = [
     "Budget",
     "Product",
     "Inventory",
+    "ChannelPrice",
+    "MapViolation",
+    "SellerPrice",
+    "PriceHistorySegment",
+    "PriceRollup",
+    "ChannelRanking",
+    "ChannelRankMovement",
+    "MessageDispatch",
     "Alert",
+    "SalesDailyFact",
+    "ProductSalesRollup",
+    "BrandSalesRollup",
+    "SyncTask",
 ]
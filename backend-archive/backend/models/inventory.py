@@ -30,6 +30,7 @@ class Product(Base, UUIDMixin, TimestampMixin):
     sku: Mapped[str | None] = mapped_column(String(50), nullable=True, unique=True)
     price: Mapped[int] = mapped_column(Integer, nullable=False)
     map_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cogs: Mapped[int | None] = mapped_column(Integer, nullable=True)  # Unit cost; estimated from price if unset
 
     # Relationships
     inventories: Mapped[list["Inventory"]] = relationship(
@@ -0,0 +1,25 @@
+"""Channel message dispatch models."""
+
+from sqlalchemy import Integer, String
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base, TimestampMixin
+
+
+class MessageDispatch(Base, TimestampMixin):
+    """Progress checkpoint of a batched channel message send."""
+
+    __tablename__ = "message_dispatches"
+
+    id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    channel: Mapped[str] = mapped_column(String(50), nullable=False)
+    channel_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    message_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    total_recipients: Mapped[int] = mapped_column(Integer, nullable=False)
+    batch_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    recipients_digest: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Batches before the cursor are all done; later ones may be done out of order
+    cursor: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    batches: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
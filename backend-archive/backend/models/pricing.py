@@ -0,0 +1,125 @@
+"""Channel price models."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Integer, LargeBinary, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+
+
+class ChannelPrice(Base):
+    """Latest observed price of a product on a channel."""
+
+    __tablename__ = "channel_prices"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    brand: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    regular_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    sale_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    in_stock: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    observed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class MapViolation(Base):
+    """Open MAP violation of a seller's listing; deleted once resolved."""
+
+    __tablename__ = "map_violations"
+
+    platform: Mapped[str] = mapped_column(String(50), primary_key=True)
+    seller: Mapped[str] = mapped_column(String(200), primary_key=True)
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+    brand: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    map_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    price: Mapped[int] = mapped_column(Integer, nullable=False)
+    lowest_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    severity: Mapped[str] = mapped_column(String(20), nullable=False)
+    authorized: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    first_seen: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_seen: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    observations: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+
+
+class SellerPrice(Base):
+    """
+    A seller's listed price of a product on a channel, as observed at one time.
+
+    Only a series' newest observations are kept here; once there are enough
+    of them they are sealed into a PriceHistorySegment and deleted.
+    """
+
+    __tablename__ = "seller_prices"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    seller: Mapped[str] = mapped_column(String(200), primary_key=True)
+    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    price: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class PriceHistorySegment(Base):
+    """
+    A sealed run of one seller's observed prices, delta encoded.
+
+    Timestamps are epoch seconds; the delta arrays are the raw bytes of
+    numpy arrays of the named dtype (see ``backend.pricing.history.Segment``).
+    """
+
+    __tablename__ = "price_history_segments"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    seller: Mapped[str] = mapped_column(String(200), primary_key=True)
+    first_ts: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    last_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    ts_deltas: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    ts_dtype: Mapped[str] = mapped_column(String(8), nullable=False)
+    price_deltas: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    price_dtype: Mapped[str] = mapped_column(String(8), nullable=False)
+
+
+class PriceRollup(Base):
+    """Min, max and last price of one seller's listing per hour or KST day, kept after raw points expire."""
+
+    __tablename__ = "price_rollups"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    seller: Mapped[str] = mapped_column(String(200), primary_key=True)
+    resolution: Mapped[str] = mapped_column(String(10), primary_key=True)  # hourly or daily
+    bucket_start: Mapped[int] = mapped_column(BigInteger, primary_key=True)  # Epoch seconds
+    low_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    high_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)  # When last_price was observed
@@ -0,0 +1,42 @@
+"""Channel ranking models."""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+
+
+class ChannelRanking(Base):
+    """
+    A channel leaderboard as fetched at one time, stored as a diff.
+
+    A keyframe holds every ranked item; other snapshots hold only the items
+    that entered or changed rank since the previous snapshot, plus the keys
+    of the products that dropped out.
+    """
+
+    __tablename__ = "channel_rankings"
+
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(200), primary_key=True)  # Category or keyword and ranking type
+    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    keyframe: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Items with their rank: product_id, product_name, brand and rank
+    items: Mapped[list] = mapped_column(JSON, nullable=False)
+    exited: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+
+
+class ChannelRankMovement(Base):
+    """A product entering, leaving or changing rank on a leaderboard, written as the list is recorded."""
+
+    __tablename__ = "channel_rank_movements"
+
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(200), primary_key=True)
+    product: Mapped[str] = mapped_column(String(200), primary_key=True)  # Channel product ID, else name
+    observed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    previous_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)  # None: entered
+    rank: Mapped[int | None] = mapped_column(Integer, nullable=True)  # None: dropped out
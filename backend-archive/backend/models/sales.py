@@ -0,0 +1,76 @@
+"""Sales fact and rollup models."""
+
+import enum
+import uuid
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, Enum, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base
+
+
+class RollupGrain(str, enum.Enum):
+    """Time grain of a sales rollup."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class SalesDailyFact(Base):
+    """
+    Daily sales per product and channel.
+
+    Range-partitioned by ``sale_date`` on PostgreSQL with one partition per
+    month; partitions are created on demand by ``ensure_sales_partitions``.
+    """
+
+    __tablename__ = "sales_daily_facts"
+    __table_args__ = {"postgresql_partition_by": "RANGE (sale_date)"}
+
+    sale_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    brand: Mapped[str] = mapped_column(String(100), nullable=False)
+    promotion_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    units: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    orders: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    gross_sales: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    discount_amount: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+
+class ProductSalesRollup(Base):
+    """Sales per product and channel aggregated to a day, week or month."""
+
+    __tablename__ = "product_sales_rollups"
+
+    grain: Mapped[RollupGrain] = mapped_column(Enum(RollupGrain), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    product_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    brand: Mapped[str] = mapped_column(String(100), nullable=False)
+    units: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    orders: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    gross_sales: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    discount_amount: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+
+class BrandSalesRollup(Base):
+    """Sales per brand and channel aggregated to a day, week or month."""
+
+    __tablename__ = "brand_sales_rollups"
+
+    grain: Mapped[RollupGrain] = mapped_column(Enum(RollupGrain), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    brand: Mapped[str] = mapped_column(String(100), primary_key=True)
+    channel: Mapped[str] = mapped_column(String(50), primary_key=True)
+    units: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    orders: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    gross_sales: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    discount_amount: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
@@ -0,0 +1,38 @@
+"""Cross-channel sync task models."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base, TimestampMixin
+
+
+class SyncTask(Base, TimestampMixin):
+    """A price, inventory or content update pushed to several channels."""
+
+    __tablename__ = "sync_tasks"
+
+    id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    # Idempotency-Key the client sent, if any; the task is returned for it forever
+    idempotency_key: Mapped[str | None] = mapped_column(String(100), nullable=True, unique=True)
+    # Hash of what the task does; an identical request is deduplicated while this one is unfinished
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    task_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    brand: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    products: Mapped[list] = mapped_column(JSON, nullable=False)
+    channels: Mapped[list] = mapped_column(JSON, nullable=False)
+    target_value: Mapped[Any] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    requires_approval: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    approved_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Per-channel progress, including the status of every product batch
+    steps: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    # Executor running the task, and when another may take it over unless renewed
+    lease_owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,44 @@
+"""Catalog-wide pricing analysis for Promotor."""
+
+from backend.pricing.consistency import (
+    PRICE_VARIANCE_CRITICAL,
+    PRICE_VARIANCE_WARNING,
+    PriceMatrix,
+    find_price_inconsistencies,
+    price_variance_severity,
+)
+from backend.pricing.history import PriceHistoryStore, PriceRange
+from backend.pricing.map_monitor import (
+    MapViolationDetector,
+    PriceObservation,
+    map_detector,
+    map_violation_severity,
+    record_map_alerts,
+)
+from backend.pricing.margins import (
+    CHANNEL_FEES,
+    MarginGrid,
+    ProductCosts,
+    margin_grid,
+    max_discount_for_margin,
+)
+
+__all__ = [
+    "CHANNEL_FEES",
+    "PRICE_VARIANCE_CRITICAL",
+    "PRICE_VARIANCE_WARNING",
+    "MapViolationDetector",
+    "MarginGrid",
+    "PriceHistoryStore",
+    "PriceMatrix",
+    "PriceObservation",
+    "PriceRange",
+    "ProductCosts",
+    "find_price_inconsistencies",
+    "map_detector",
+    "map_violation_severity",
+    "margin_grid",
+    "max_discount_for_margin",
+    "price_variance_severity",
+    "record_map_alerts",
+]
@@ -0,0 +1,145 @@
+"""Vectorized cross-channel price consistency checks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+CHANNELS = ("oliveyoung", "coupang", "naver", "kakao")
+
+# (max - min) / min across channels
+PRICE_VARIANCE_WARNING = 0.05
+PRICE_VARIANCE_CRITICAL = 0.10
+
+
+def price_variance_severity(variance: float) -> str | None:
+    """Severity of a cross-channel price variance, or None if consistent."""
+    if variance >= PRICE_VARIANCE_CRITICAL:
+        return "critical"
+    if variance >= PRICE_VARIANCE_WARNING:
+        return "warning"
+    return None
+
+
+class PriceMatrix:
+    """
+    Latest sale price per product (rows) and channel (columns).
+
+    Missing prices are NaN.
+    """
+
+    def __init__(self, product_ids: Sequence[Any], channels: Sequence[str], prices: np.ndarray):
+        self.product_ids = product_ids
+        self.channels = tuple(channels)
+        self.prices = prices
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[Any, str, float]],
+        channels: Sequence[str] = CHANNELS,
+    ) -> PriceMatrix:
+        """
+        Build the matrix from (product_id, channel, price) rows.
+
+        Rows for channels not in ``channels`` are ignored; a repeated
+        (product_id, channel) keeps the last price.
+        """
+        channel_index = {channel: i for i, channel in enumerate(channels)}
+        product_index: dict[Any, int] = {}
+        row_idx, col_idx, values = [], [], []
+        for product_id, channel, price in rows:
+            col = channel_index.get(channel)
+            if col is None:
+                continue
+            row_idx.append(product_index.setdefault(product_id, len(product_index)))
+            col_idx.append(col)
+            values.append(price)
+
+        prices = np.full((len(product_index), len(channels)), np.nan)
+        prices[row_idx, col_idx] = values
+        return cls(list(product_index), channels, prices)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+
+def find_price_inconsistencies(
+    matrix: PriceMatrix,
+    warning: float = PRICE_VARIANCE_WARNING,
+    critical: float = PRICE_VARIANCE_CRITICAL,
+    limit: int | None = None,
+) -> dict[str, Any]:
+    """
+    Check every product in one vectorized pass.
+
+    Products priced on fewer than two channels are not compared.
+
+    Args:
+        matrix: Latest prices
+        warning: Variance at which a product is reported
+        critical: Variance at which it is reported as critical
+        limit: Only build details for the ``limit`` worst violations
+
+    Returns:
+        Counts plus the violating products, highest variance first
+    """
+    prices = matrix.prices
+    priced = ~np.isnan(prices)
+    comparable = (priced.sum(axis=1) >= 2) & (np.where(priced, prices, 1.0) > 0).all(axis=1)
+
+    lowest = np.where(priced, prices, np.inf).argmin(axis=1)
+    highest = np.where(priced, prices, -np.inf).argmax(axis=1)
+    rows = np.arange(len(prices))
+    min_price = prices[rows, lowest]
+    max_price = prices[rows, highest]
+
+    variance = np.zeros(len(prices))
+    np.divide(max_price - min_price, min_price, out=variance, where=comparable)
+
+    violating = np.flatnonzero(variance >= warning)
+    violating = violating[np.argsort(-variance[violating], kind="stable")]
+    critical_count = int((variance[violating] >= critical).sum())
+    violation_count = len(violating)
+    violating = violating[:limit]
+
+    # Convert once; per-element numpy indexing dominates otherwise
+    channels = matrix.channels
+    product_ids = matrix.product_ids
+    rows_priced = priced[violating].tolist()
+    rows_prices = prices[violating].tolist()
+    violations = []
+    for i, row_priced, row_prices, low, high, min_value, max_value, var in zip(
+        violating.tolist(),
+        rows_priced,
+        rows_prices,
+        lowest[violating].tolist(),
+        highest[violating].tolist(),
+        min_price[violating].tolist(),
+        max_price[violating].tolist(),
+        variance[violating].tolist(),
+    ):
+        violations.append({
+            "product_id": str(product_ids[i]),
+            "min_price": int(min_value),
+            "max_price": int(max_value),
+            "price_variance": round(var, 4),
+            "severity": "critical" if var >= critical else "warning",
+            "lowest_channel": channels[low],
+            "highest_channel": channels[high],
+            "prices": {
+                channel: int(price)
+                for channel, has_price, price in zip(channels, row_priced, row_prices)
+                if has_price
+            },
+        })
+
+    return {
+        "products_checked": len(prices),
+        "products_compared": int(comparable.sum()),
+        "warning_count": violation_count - critical_count,
+        "critical_count": critical_count,
+        "violations": violations,
+    }
@@ -0,0 +1,405 @@
+"""Compact columnar price history with hourly and daily rollups."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from backend.config import get_settings
+from backend.pricing.map_monitor import PriceObservation
+
+SeriesKey = tuple[str, str, str]  # (product_id, channel, seller)
+
+HOUR = 3600
+DAY = 86400
+# Daily buckets start at midnight KST
+DAY_OFFSET = 9 * HOUR
+KST = timezone(timedelta(hours=9))
+
+RESOLUTIONS = ("raw", "hourly", "daily")
+
+# Rollup resolution -> (bucket width, offset) in seconds
+ROLLUPS = {"hourly": (HOUR, 0), "daily": (DAY, DAY_OFFSET)}
+
+_INT_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def bucket_start(timestamp: int, resolution: str) -> int:
+    """Start of the hourly or daily bucket holding ``timestamp``."""
+    width, offset = ROLLUPS[resolution]
+    return (timestamp + offset) // width * width - offset
+
+
+def resolution_for(span: timedelta) -> str:
+    """Finest resolution that keeps a query over ``span`` small."""
+    settings = get_settings()
+    if span <= timedelta(hours=settings.price_history_raw_max_hours):
+        return "raw"
+    if span <= timedelta(days=settings.price_history_hourly_max_days):
+        return "hourly"
+    return "daily"
+
+
+def _narrow(values: array) -> np.ndarray:
+    """Copy ``values`` into the smallest signed integer dtype that holds them."""
+    data = np.frombuffer(values, dtype=np.int64)
+    if not len(data):
+        return data.astype(np.int8)
+    low, high = int(data.min()), int(data.max())
+    for dtype in _INT_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return data.astype(dtype)
+    return data.astype(np.int64)
+
+
+class Segment:
+    """
+    A run of consecutive observations of one series.
+
+    Timestamps and prices are delta encoded against the previous point.
+    While open, deltas are appended to ``array`` buffers; sealing copies
+    them into numpy arrays of the narrowest dtype that fits, typically one
+    or two bytes per value.
+    """
+
+    __slots__ = ("first_ts", "first_price", "last_ts", "last_price", "count", "ts_deltas", "price_deltas", "sealed")
+
+    def __init__(self, timestamp: int, price: int):
+        self.first_ts = self.last_ts = timestamp
+        self.first_price = self.last_price = price
+        self.count = 1
+        self.ts_deltas: array | np.ndarray = array("q")
+        self.price_deltas: array | np.ndarray = array("q")
+        self.sealed = False
+
+    def append(self, timestamp: int, price: int) -> None:
+        self.ts_deltas.append(timestamp - self.last_ts)
+        self.price_deltas.append(price - self.last_price)
+        self.last_ts = timestamp
+        self.last_price = price
+        self.count += 1
+
+    def seal(self) -> None:
+        self.ts_deltas = _narrow(self.ts_deltas)
+        self.price_deltas = _narrow(self.price_deltas)
+        self.sealed = True
+
+    def decode(self) -> tuple[np.ndarray, np.ndarray]:
+        """Absolute (timestamps, prices) as int64 arrays."""
+        timestamps = np.empty(self.count, dtype=np.int64)
+        prices = np.empty(self.count, dtype=np.int64)
+        timestamps[0], prices[0] = self.first_ts, self.first_price
+        if self.count > 1:
+            np.cumsum(np.asarray(self.ts_deltas, dtype=np.int64), out=timestamps[1:])
+            np.cumsum(np.asarray(self.price_deltas, dtype=np.int64), out=prices[1:])
+            timestamps[1:] += self.first_ts
+            prices[1:] += self.first_price
+        return timestamps, prices
+
+    def nbytes(self) -> int:
+        return _nbytes(self.ts_deltas) + _nbytes(self.price_deltas) + 4 * 8
+
+    def to_record(self) -> dict[str, Any]:
+        """Column values of a sealed segment, for ``price_history_segments``."""
+        return {
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "first_price": self.first_price,
+            "last_price": self.last_price,
+            "count": self.count,
+            "ts_deltas": self.ts_deltas.tobytes(),
+            "ts_dtype": self.ts_deltas.dtype.name,
+            "price_deltas": self.price_deltas.tobytes(),
+            "price_dtype": self.price_deltas.dtype.name,
+        }
+
+    @classmethod
+    def from_record(cls, record: Any) -> Segment:
+        """Sealed segment from a ``price_history_segments`` row or ``to_record`` output."""
+        segment = cls(record["first_ts"], record["first_price"])
+        segment.last_ts = record["last_ts"]
+        segment.last_price = record["last_price"]
+        segment.count = record["count"]
+        segment.ts_deltas = np.frombuffer(record["ts_deltas"], dtype=record["ts_dtype"])
+        segment.price_deltas = np.frombuffer(record["price_deltas"], dtype=record["price_dtype"])
+        segment.sealed = True
+        return segment
+
+
+class Rollup:
+    """
+    Min, max and last price per fixed-width time bucket, in parallel arrays.
+
+    Buckets are stored by index (``(timestamp + offset) // width``) and
+    prices as int32, 16 bytes per bucket.
+    """
+
+    __slots__ = ("width", "offset", "buckets", "low", "high", "last")
+
+    def __init__(self, width: int, offset: int = 0):
+        self.width = width
+        self.offset = offset
+        self.buckets = array("i")
+        self.low = array("i")
+        self.high = array("i")
+        self.last = array("i")
+
+    def add(self, timestamp: int, price: int) -> None:
+        bucket = (timestamp + self.offset) // self.width
+        if self.buckets and self.buckets[-1] == bucket:
+            if price < self.low[-1]:
+                self.low[-1] = price
+            if price > self.high[-1]:
+                self.high[-1] = price
+            self.last[-1] = price
+            return
+        self.buckets.append(bucket)
+        self.low.append(price)
+        self.high.append(price)
+        self.last.append(price)
+
+    def range(self, start: int, end: int) -> tuple[np.ndarray, ...]:
+        """(bucket starts, low, high, last) of buckets overlapping [start, end]."""
+        buckets = np.frombuffer(self.buckets, dtype=np.int32)
+        window = slice(
+            int(np.searchsorted(buckets, (start + self.offset) // self.width, side="left")),
+            int(np.searchsorted(buckets, (end + self.offset) // self.width, side="right")),
+        )
+        starts = buckets[window].astype(np.int64) * self.width - self.offset
+        return starts, *(
+            np.frombuffer(values, dtype=np.int32)[window].astype(np.int64)
+            for values in (self.low, self.high, self.last)
+        )
+
+    def nbytes(self) -> int:
+        return sum(_nbytes(buffer) for buffer in (self.buckets, self.low, self.high, self.last))
+
+
+def _nbytes(buffer: array | np.ndarray) -> int:
+    if isinstance(buffer, np.ndarray):
+        return buffer.nbytes
+    return buffer.itemsize * len(buffer)
+
+
+class PriceSeries:
+    """Raw segments plus hourly and daily rollups of one (product, channel, seller)."""
+
+    __slots__ = ("segments", "hourly", "daily")
+
+    def __init__(self):
+        self.segments: list[Segment] = []
+        self.hourly = Rollup(*ROLLUPS["hourly"])
+        self.daily = Rollup(*ROLLUPS["daily"])
+
+    @property
+    def last_ts(self) -> int | None:
+        return self.segments[-1].last_ts if self.segments else None
+
+
+class PriceRange(NamedTuple):
+    """
+    Prices of a series over a time range at one resolution.
+
+    For raw points ``low``, ``high`` and ``last`` are the same array.
+    """
+
+    resolution: str
+    timestamps: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+    last: np.ndarray
+
+    @classmethod
+    def empty(cls, resolution: str) -> PriceRange:
+        empty = np.empty(0, dtype=np.int64)
+        return cls(resolution, empty, empty, empty, empty)
+
+    def records(self) -> list[dict[str, Any]]:
+        """JSON-ready points, oldest first."""
+        timestamps = [datetime.fromtimestamp(ts, KST).isoformat() for ts in self.timestamps.tolist()]
+        if self.resolution == "raw":
+            return [{"timestamp": ts, "price": price} for ts, price in zip(timestamps, self.last.tolist())]
+        return [
+            {"timestamp": ts, "min": low, "max": high, "last": last}
+            for ts, low, high, last in zip(timestamps, self.low.tolist(), self.high.tolist(), self.last.tolist())
+        ]
+
+
+class PriceHistoryStore:
+    """
+    Compact in-memory price history per (product, channel, seller).
+
+    ``backend.db.pricing`` persists the same sealed segments and rollup
+    buckets as it ingests observations.
+
+    Observations are appended to the series' open segment, which is sealed
+    into compact arrays once it holds ``segment_size`` points. Every
+    observation also updates the hourly and daily min/max/last rollups, so
+    long ranges are served without decoding raw points. Sealed raw segments
+    older than ``raw_retention`` are dropped; rollups are kept.
+
+    Each series is append-only: observations older than the series' latest
+    one are counted in ``rejected`` and discarded.
+    """
+
+    def __init__(
+        self,
+        segment_size: int | None = None,
+        raw_retention: timedelta | None = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            segment_size: Points per raw segment before it is sealed
+            raw_retention: How long raw points are kept behind a series' latest point
+        """
+        settings = get_settings()
+        self.segment_size = segment_size or settings.price_history_segment_size
+        retention = raw_retention or timedelta(days=settings.price_history_raw_retention_days)
+        self.raw_retention = int(retention.total_seconds())
+
+        self._series: dict[SeriesKey, PriceSeries] = {}
+        self.appended = 0
+        self.rejected = 0
+        self.segments_dropped = 0
+
+    def append(
+        self,
+        product_id: str,
+        channel: str,
+        seller: str,
+        price: int,
+        observed_at: datetime,
+    ) -> bool:
+        """
+        Append one observation.
+
+        Returns:
+            False if it was older than the series' latest observation
+        """
+        key = (product_id, channel, seller)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = PriceSeries()
+        timestamp = int(observed_at.timestamp())
+
+        segments = series.segments
+        head = segments[-1] if segments else None
+        if head is not None and timestamp < head.last_ts:
+            self.rejected += 1
+            return False
+
+        if head is None or head.sealed:
+            segments.append(Segment(timestamp, price))
+        else:
+            head.append(timestamp, price)
+            if head.count >= self.segment_size:
+                head.seal()
+                self._expire(series)
+        series.hourly.add(timestamp, price)
+        series.daily.add(timestamp, price)
+        self.appended += 1
+        return True
+
+    def append_many(self, observations: Iterable[PriceObservation]) -> int:
+        """Append MAP-monitor observations; returns how many were accepted."""
+        append = self.append
+        accepted = 0
+        for platform, seller, product_id, price, observed_at in observations:
+            accepted += append(product_id, platform, seller, price, observed_at)
+        return accepted
+
+    def _expire(self, series: PriceSeries) -> None:
+        cutoff = series.last_ts - self.raw_retention
+        expired = 0
+        for segment in series.segments:
+            if not segment.sealed or segment.last_ts >= cutoff:
+                break
+            expired += 1
+        if expired:
+            del series.segments[:expired]
+            self.segments_dropped += expired
+
+    def sellers(self, product_id: str, channel: str) -> list[str]:
+        """Sellers with history for a product on a channel."""
+        return sorted(seller for pid, ch, seller in self._series if pid == product_id and ch == channel)
+
+    def resolution_for(self, span: timedelta) -> str:
+        """Finest resolution that keeps a query over ``span`` small."""
+        return resolution_for(span)
+
+    def query(
+        self,
+        product_id: str,
+        channel: str,
+        seller: str,
+        start: datetime,
+        end: datetime,
+        resolution: str | None = None,
+    ) -> PriceRange:
+        """
+        Prices of one series in [start, end].
+
+        Args:
+            product_id: Product ID
+            channel: Channel name
+            seller: Seller name
+            start: Range start
+            end: Range end (inclusive)
+            resolution: raw, hourly or daily; chosen from the span if omitted
+
+        Returns:
+            The points or buckets in range (empty if the series is unknown)
+        """
+        resolution = resolution or self.resolution_for(end - start)
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        lo, hi = int(start.timestamp()), int(end.timestamp())
+        series = self._series.get((product_id, channel, seller))
+
+        if series is None:
+            return PriceRange.empty(resolution)
+
+        if resolution == "raw":
+            decoded = [
+                segment.decode()
+                for segment in series.segments
+                if segment.last_ts >= lo and segment.first_ts <= hi
+            ]
+            if decoded:
+                timestamps = np.concatenate([ts for ts, _ in decoded])
+                prices = np.concatenate([p for _, p in decoded])
+            else:
+                timestamps = prices = np.empty(0, dtype=np.int64)
+            mask = (timestamps >= lo) & (timestamps <= hi)
+            prices = prices[mask]
+            return PriceRange(resolution, timestamps[mask], prices, prices, prices)
+
+        rollup = series.hourly if resolution == "hourly" else series.daily
+        return PriceRange(resolution, *rollup.range(lo, hi))
+
+    def stats(self) -> dict[str, Any]:
+        """Series, point and memory counters."""
+        raw_points = raw_bytes = rollup_bytes = 0
+        for series in self._series.values():
+            for segment in series.segments:
+                raw_points += segment.count
+                raw_bytes += segment.nbytes()
+            rollup_bytes += series.hourly.nbytes() + series.daily.nbytes()
+        return {
+            "series": len(self._series),
+            "observations": self.appended,
+            "rejected": self.rejected,
+            "raw_points": raw_points,
+            "segments_dropped": self.segments_dropped,
+            "raw_bytes": raw_bytes,
+            "rollup_bytes": rollup_bytes,
+            "bytes_per_observation": round(raw_bytes / raw_points, 2) if raw_points else None,
+        }
+
@@ -0,0 +1,420 @@
+"""Streaming MAP (minimum advertised price) violation detection."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.config import get_settings
+from backend.models import Product
+from backend.models.alert import AlertSeverity, AlertType
+
+if TYPE_CHECKING:
+    from backend.db.alert_writer import AlertWriter
+
+# Ordered lowest to highest
+SEVERITIES = ("low", "medium", "high", "critical")
+SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITIES)}
+
+
+def map_violation_severity(discount_from_map: float, authorized: bool) -> str:
+    """
+    Severity tier of a listing priced ``discount_from_map`` below MAP.
+
+    Critical above 30% below MAP, high for unauthorized sellers above 20%,
+    medium from 10%, low otherwise.
+    """
+    if discount_from_map > 0.30:
+        return "critical"
+    if discount_from_map > 0.20 and not authorized:
+        return "high"
+    if discount_from_map >= 0.10:
+        return "medium"
+    return "low"
+
+
+class PriceObservation(NamedTuple):
+    """A seller's listed price for a product, as seen on a platform."""
+
+    platform: str
+    seller: str
+    product_id: str
+    price: int
+    observed_at: datetime
+
+
+ListingKey = tuple[str, str, str]  # (platform, seller, product_id)
+
+
+class ViolationState:
+    """Incrementally maintained history of one open (platform, seller, product) violation."""
+
+    __slots__ = (
+        "first_seen",
+        "last_seen",
+        "price",
+        "lowest_price",
+        "severity",
+        "observations",
+    )
+
+    def __init__(self, observed_at: datetime, price: int, severity: str):
+        self.first_seen = observed_at
+        self.last_seen = observed_at
+        self.price = price
+        self.lowest_price = price
+        self.severity = severity
+        self.observations = 1
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> ViolationState:
+        """Restore a state saved from ``MapViolationDetector.take_changes``."""
+        state = cls(row["first_seen"], row["price"], row["severity"])
+        state.last_seen = row["last_seen"]
+        state.lowest_price = row["lowest_price"]
+        state.observations = row["observations"]
+        return state
+
+
+def describe_violation(row: Mapping[str, Any], status: str = "active") -> dict[str, Any]:
+    """
+    JSON-ready view of a violation.
+
+    Args:
+        row: platform, seller, product_id, brand, map_price, price,
+            lowest_price, severity, authorized, first_seen, last_seen and
+            observations
+        status: active or resolved
+    """
+    map_price = row["map_price"]
+    return {
+        "platform": row["platform"],
+        "seller": row["seller"],
+        "product_id": str(row["product_id"]),
+        "brand": row["brand"],
+        "map_price": map_price,
+        "price": row["price"],
+        "lowest_price": row["lowest_price"],
+        "discount_from_map": round((map_price - row["price"]) / map_price, 4),
+        "severity": row["severity"],
+        "authorized": row["authorized"],
+        "first_seen": row["first_seen"].isoformat(),
+        "last_seen": row["last_seen"].isoformat(),
+        "observations": row["observations"],
+        "status": status,
+    }
+
+
+def sort_violations(violations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sort described violations most severe and deepest discount first, in place."""
+    violations.sort(key=lambda v: (-SEVERITY_RANK[v["severity"]], -v["discount_from_map"]))
+    return violations
+
+
+class MapViolationDetector:
+    """
+    Joins a stream of price observations against products' MAP prices.
+
+    MAP prices are held in memory and refreshed from ``products``. State is
+    kept per open (platform, seller, product) violation, so each observation
+    is O(1) and history is never rescanned. Events are deduplicated: one is
+    emitted when a violation opens, when its severity changes, and when a
+    later observation is back at or above MAP (resolved). Repeat sightings
+    only move ``last_seen``. Resolved violations are dropped, so a listing
+    that drops below MAP again opens a new one.
+
+    The detector is the working set of an ingestion batch, not the record:
+    ``restore`` loads the persisted state of the batch's listings and
+    ``take_changes`` returns what to persist afterwards (see
+    ``backend.db.pricing.ingest_price_observations``).
+    """
+
+    def __init__(
+        self,
+        authorized_sellers: Iterable[tuple[str, str]] = (),
+        refresh_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            authorized_sellers: (platform, seller) pairs in the authorized distribution
+            refresh_interval: Seconds before MAP prices are reloaded by ``ensure_fresh``
+            clock: Monotonic clock
+        """
+        self.authorized_sellers = set(authorized_sellers)
+        self.refresh_interval = (
+            refresh_interval if refresh_interval is not None else get_settings().map_price_refresh_s
+        )
+        self.clock = clock
+
+        self.map_prices: dict[str, int] = {}
+        self.brands: dict[str, str] = {}
+        self._loaded_at: float | None = None
+
+        self._states: dict[ListingKey, ViolationState] = {}
+        # Active violations per product, so compliant observations of
+        # products without one skip the state lookup
+        self._active_by_product: dict[str, int] = {}
+        # Listings changed or resolved since the last take_changes
+        self._changed: set[ListingKey] = set()
+        self._resolved: set[ListingKey] = set()
+
+        self.observed = 0
+        self.unknown_products = 0
+        self.events_emitted = 0
+
+    def set_map_prices(self, map_prices: dict[str, int], brands: dict[str, str] | None = None) -> None:
+        """Replace the MAP price table (product_id -> MAP)."""
+        self.map_prices = map_prices
+        if brands is not None:
+            self.brands = brands
+        self._loaded_at = self.clock()
+
+    async def refresh(self, session: AsyncSession) -> int:
+        """
+        Reload MAP prices from products with a map_price.
+
+        Returns:
+            Number of products with a MAP
+        """
+        result = await session.execute(
+            select(Product.id, Product.brand, Product.map_price).where(Product.map_price.is_not(None))
+        )
+        map_prices, brands = {}, {}
+        for product_id, brand, map_price in result:
+            map_prices[str(product_id)] = map_price
+            brands[str(product_id)] = brand
+        self.set_map_prices(map_prices, brands)
+        return len(map_prices)
+
+    def is_stale(self) -> bool:
+        """Whether MAP prices were never loaded or are older than refresh_interval."""
+        return self._loaded_at is None or self.clock() - self._loaded_at >= self.refresh_interval
+
+    async def ensure_fresh(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Refresh MAP prices if they are stale."""
+        if self.is_stale():
+            async with session_factory() as session:
+                await self.refresh(session)
+
+    def restore(self, product_ids: Iterable[str], rows: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Replace the state of ``product_ids``' listings with persisted violations.
+
+        Args:
+            product_ids: Products whose in-memory state is discarded
+            rows: Their open violations, with platform, seller, product_id
+                and the ViolationState fields
+        """
+        product_ids = set(product_ids)
+        for key in [key for key in self._states if key[2] in product_ids]:
+            del self._states[key]
+        for product_id in product_ids:
+            self._active_by_product.pop(product_id, None)
+        for row in rows:
+            product_id = str(row["product_id"])
+            self._states[(row["platform"], row["seller"], product_id)] = ViolationState.from_row(row)
+            self._active_by_product[product_id] = self._active_by_product.get(product_id, 0) + 1
+
+    def observe(self, observation: PriceObservation) -> dict[str, Any] | None:
+        """
+        Process one observation.
+
+        Returns:
+            A violation event (opened, escalated, deescalated or resolved), or None
+        """
+        self.observed += 1
+        platform, seller, product_id, price, observed_at = observation
+        map_price = self.map_prices.get(product_id)
+        if map_price is None:
+            self.unknown_products += 1
+            return None
+
+        key = (platform, seller, product_id)
+        if price >= map_price:
+            if product_id not in self._active_by_product:
+                return None
+            state = self._states.get(key)
+            if state is None or observed_at < state.last_seen:
+                return None
+            state.last_seen = observed_at
+            state.price = price
+            del self._states[key]
+            self._deactivate(product_id)
+            self._changed.discard(key)
+            self._resolved.add(key)
+            return self._event("resolved", platform, seller, product_id, map_price, state)
+
+        discount = (map_price - price) / map_price
+        severity = map_violation_severity(discount, (platform, seller) in self.authorized_sellers)
+        state = self._states.get(key)
+        self._changed.add(key)
+        self._resolved.discard(key)
+
+        if state is None:
+            state = self._states[key] = ViolationState(observed_at, price, severity)
+            self._active_by_product[product_id] = self._active_by_product.get(product_id, 0) + 1
+            return self._event("opened", platform, seller, product_id, map_price, state)
+
+        state.observations += 1
+        state.lowest_price = min(state.lowest_price, price)
+        if observed_at < state.first_seen:
+            state.first_seen = observed_at
+        if observed_at < state.last_seen:
+            # Late arrival: history updated, current state unchanged
+            return None
+        state.last_seen = observed_at
+        state.price = price
+
+        if severity != state.severity:
+            kind = "escalated" if SEVERITY_RANK[severity] > SEVERITY_RANK[state.severity] else "deescalated"
+            state.severity = severity
+            return self._event(kind, platform, seller, product_id, map_price, state)
+        return None
+
+    def observe_many(self, observations: Iterable[PriceObservation]) -> list[dict[str, Any]]:
+        """Process observations in order and return the events they produced."""
+        observe = self.observe
+        events = []
+        for observation in observations:
+            event = observe(observation)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def take_changes(self) -> tuple[list[dict[str, Any]], list[ListingKey]]:
+        """
+        Listings changed since the last call, to persist.
+
+        Returns:
+            Rows of violations opened or updated (platform, seller,
+            product_id, brand, map_price, authorized and the ViolationState
+            fields), and the (platform, seller, product_id) keys of resolved ones
+        """
+        changed = [self._row(*key, self._states[key]) for key in self._changed]
+        resolved = list(self._resolved)
+        self._changed.clear()
+        self._resolved.clear()
+        return changed, resolved
+
+    def _deactivate(self, product_id: str) -> None:
+        remaining = self._active_by_product[product_id] - 1
+        if remaining:
+            self._active_by_product[product_id] = remaining
+        else:
+            del self._active_by_product[product_id]
+
+    def _event(
+        self,
+        kind: str,
+        platform: str,
+        seller: str,
+        product_id: str,
+        map_price: int,
+        state: ViolationState,
+    ) -> dict[str, Any]:
+        self.events_emitted += 1
+        row = self._row(platform, seller, product_id, state, map_price)
+        return {
+            "event": kind,
+            **describe_violation(row, "resolved" if kind == "resolved" else "active"),
+        }
+
+    def _row(
+        self,
+        platform: str,
+        seller: str,
+        product_id: str,
+        state: ViolationState,
+        map_price: int | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "platform": platform,
+            "seller": seller,
+            "product_id": product_id,
+            "brand": self.brands.get(product_id),
+            "map_price": map_price if map_price is not None else self.map_prices[product_id],
+            "authorized": (platform, seller) in self.authorized_sellers,
+            **{field: getattr(state, field) for field in ViolationState.__slots__},
+        }
+
+    def active_violations(
+        self,
+        brand: str | None = None,
+        platforms: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Currently active violations, most severe and deepest discount first."""
+        platforms = set(platforms) if platforms is not None else None
+        violations = []
+        for (platform, seller, product_id), state in self._states.items():
+            if platforms is not None and platform not in platforms:
+                continue
+            if brand is not None and self.brands.get(product_id) != brand:
+                continue
+            map_price = self.map_prices.get(product_id)
+            if map_price is None:
+                continue
+            violations.append(describe_violation(self._row(platform, seller, product_id, state, map_price)))
+        return sort_violations(violations)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "observed": self.observed,
+            "unknown_products": self.unknown_products,
+            "events_emitted": self.events_emitted,
+            "tracked_listings": len(self._states),
+            "active_violations": sum(self._active_by_product.values()),
+            "map_products": len(self.map_prices),
+        }
+
+
+# Alert severity for violation events worth an alert
+ALERT_SEVERITIES = {
+    "critical": AlertSeverity.CRITICAL,
+    "high": AlertSeverity.CRITICAL,
+    "medium": AlertSeverity.WARNING,
+    "low": AlertSeverity.INFO,
+}
+
+
+async def record_map_alerts(events: Iterable[dict[str, Any]], writer: AlertWriter | None = None) -> int:
+    """
+    Queue a price alert for every opened or escalated violation.
+
+    Args:
+        events: Events returned by ``observe`` / ``observe_many``
+        writer: Alert writer (defaults to the shared one)
+
+    Returns:
+        Number of alerts queued
+    """
+    if writer is None:
+        from backend.db.alert_writer import alert_writer as writer
+
+    count = 0
+    for event in events:
+        if event["event"] not in ("opened", "escalated"):
+            continue
+        await writer.write(
+            title=f"MAP violation: {event['seller']} on {event['platform']}",
+            message=(
+                f"Product {event['product_id']} listed at {event['price']:,}원, "
+                f"{event['discount_from_map']:.0%} below MAP {event['map_price']:,}원"
+            ),
+            alert_type=AlertType.PRICE,
+            severity=ALERT_SEVERITIES[event["severity"]],
+            channel=event["platform"],
+        )
+        count += 1
+    return count
+
+
+# Working set of the price ingestion (backend.db.pricing.ingest_price_observations)
+map_detector = MapViolationDetector()
@@ -0,0 +1,176 @@
+"""Vectorized channel margin grid and closed-form discount limits."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+# Fees charged on the selling price, per channel
+CHANNEL_FEES = {
+    "oliveyoung": {"commission": 0.30, "marketing_fee": 0.05},
+    "coupang": {"commission": 0.25, "marketing_fee": 0.03},
+    "naver": {"commission": 0.15, "marketing_fee": 0.05},
+    "kakao": {"commission": 0.18, "marketing_fee": 0.02},
+}
+DEFAULT_CHANNEL_FEES = {"commission": 0.20, "marketing_fee": 0.03}
+
+# Discount levels shown when analysing a single product
+DISCOUNT_LEVELS = (0.0, 0.10, 0.15, 0.20, 0.25, 0.30)
+
+# Margin at which a sale counts as profitable
+MIN_PROFITABLE_MARGIN = 0.15
+
+# Unit cost as a share of the list price for products without a recorded COGS
+DEFAULT_COGS_RATIO = 0.23
+
+
+def channel_fee_rates(channels: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Commission and marketing fee rates of ``channels``, unknown channels at the default."""
+    fees = [CHANNEL_FEES.get(channel, DEFAULT_CHANNEL_FEES) for channel in channels]
+    return (
+        np.array([fee["commission"] for fee in fees], dtype=float),
+        np.array([fee["marketing_fee"] for fee in fees], dtype=float),
+    )
+
+
+class ProductCosts:
+    """List price and unit cost per product."""
+
+    def __init__(
+        self,
+        product_ids: Sequence[Any],
+        product_names: Sequence[str],
+        base_prices: np.ndarray,
+        cogs: np.ndarray,
+    ):
+        self.product_ids = product_ids
+        self.product_names = product_names
+        self.base_prices = base_prices
+        self.cogs = cogs
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> ProductCosts:
+        """
+        Build from rows with product_id, product_name, price and cogs.
+
+        A missing cogs is estimated as DEFAULT_COGS_RATIO of the price.
+        """
+        ids, names, prices, cogs = [], [], [], []
+        for row in rows:
+            ids.append(row["product_id"])
+            names.append(row["product_name"])
+            prices.append(row["price"])
+            cogs.append(row["cogs"] if row["cogs"] is not None else np.nan)
+
+        base_prices = np.array(prices, dtype=float)
+        unit_costs = np.array(cogs, dtype=float)
+        missing = np.isnan(unit_costs)
+        unit_costs[missing] = base_prices[missing] * DEFAULT_COGS_RATIO
+        return cls(ids, names, base_prices, unit_costs)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+
+class MarginGrid:
+    """
+    Margin breakdown per product, channel and discount level.
+
+    Every array has shape (products, channels, discounts).
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[str],
+        discounts: np.ndarray,
+        selling_price: np.ndarray,
+        commission: np.ndarray,
+        marketing_fee: np.ndarray,
+        net_revenue: np.ndarray,
+        gross_margin: np.ndarray,
+        margin: np.ndarray,
+    ):
+        self.channels = tuple(channels)
+        self.discounts = discounts
+        self.selling_price = selling_price
+        self.commission = commission
+        self.marketing_fee = marketing_fee
+        self.net_revenue = net_revenue
+        self.gross_margin = gross_margin
+        self.margin = margin
+
+
+def margin_grid(costs: ProductCosts, channels: Sequence[str], discounts: Sequence[float]) -> MarginGrid:
+    """
+    Evaluate every product on every channel at every discount at once.
+
+    Channel fees are charged on the discounted price; COGS does not change
+    with the price. The margin of a free item is 0.
+
+    Args:
+        costs: List prices and unit costs
+        channels: Channels (second axis)
+        discounts: Discounts as fractions of the list price (third axis)
+
+    Returns:
+        The margin breakdown grid
+    """
+    commission_rate, marketing_rate = channel_fee_rates(channels)
+    discounts = np.asarray(discounts, dtype=float)
+
+    selling_price = np.broadcast_to(
+        costs.base_prices[:, None, None] * (1 - discounts)[None, None, :],
+        (len(costs), len(channels), len(discounts)),
+    )
+    commission = selling_price * commission_rate[None, :, None]
+    marketing_fee = selling_price * marketing_rate[None, :, None]
+    net_revenue = selling_price - commission - marketing_fee
+    gross_margin = net_revenue - costs.cogs[:, None, None]
+
+    margin = np.zeros(selling_price.shape)
+    np.divide(gross_margin, selling_price, out=margin, where=selling_price > 0)
+    return MarginGrid(
+        channels, discounts, selling_price, commission, marketing_fee, net_revenue, gross_margin, margin
+    )
+
+
+def max_discount_for_margin(
+    costs: ProductCosts,
+    channels: Sequence[str],
+    target_margin: float,
+) -> np.ndarray:
+    """
+    Largest discount that keeps each product's margin at ``target_margin`` on each channel.
+
+    With fee rate f the margin at selling price s is 1 - f - cogs / s, so
+    the target holds while s >= cogs / (1 - f - target), i.e. for discounts
+    up to 1 - cogs / (price * (1 - f - target)).
+
+    Args:
+        costs: List prices and unit costs
+        channels: Channels (columns)
+        target_margin: Margin to keep, as a fraction of the selling price
+
+    Returns:
+        (products, channels) array of discounts in [0, 1); NaN where the
+        target is missed even at list price
+    """
+    commission_rate, marketing_rate = channel_fee_rates(channels)
+    keep = 1 - commission_rate - marketing_rate - target_margin
+
+    floor_price = np.full((len(costs), len(channels)), np.inf)
+    np.divide(costs.cogs[:, None], keep[None, :], out=floor_price, where=keep[None, :] > 0)
+
+    max_discount = np.full(floor_price.shape, np.nan)
+    np.divide(floor_price, costs.base_prices[:, None], out=max_discount, where=costs.base_prices[:, None] > 0)
+    max_discount = 1 - max_discount
+    max_discount[~(max_discount >= 0)] = np.nan
+    return max_discount
+
+
+def floor_discount(max_discount: np.ndarray, step: float = 0.01) -> np.ndarray:
+    """Round discounts down to ``step`` so the rounded discount still meets the target."""
+    # The epsilon keeps exact multiples (0.2 stored as 0.19999...) on their step
+    return np.floor(max_discount / step + 1e-9) * step
@@ -0,0 +1,7 @@
+"""Performance benchmarks for Promotor backend."""
+
+import os
+
+# The engine in backend.db.session is created at import time; benchmarks never
+# connect, so a placeholder URL is enough to import the backend modules.
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/promotor_bench")
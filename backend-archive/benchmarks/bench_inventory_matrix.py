@@ -0,0 +1,77 @@
+"""
+Benchmark: catalog-wide reorder point check.
+
+Builds a product x channel inventory matrix from rows as loaded from
+``inventories``, then runs the vectorized stock level check. About a
+third of the synthetic listings are below their reorder point;
+``report ms`` builds every breach, ``top-50 ms`` only the 50 most urgent.
+
+Usage:
+    python -m benchmarks.bench_inventory_matrix [--products 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+import numpy as np
+
+from backend.inventory import InventoryMatrix, check_stock_levels, find_reorder_breaches
+from backend.pricing.consistency import CHANNELS
+
+
+def make_rows(products: int, seed: int = 7) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    daily_sales = rng.integers(0, 40, size=(products, len(CHANNELS))).tolist()
+    days = rng.uniform(0, 40, size=(products, len(CHANNELS)))
+    stock = (days * np.array(daily_sales)).astype(int).tolist()
+    ids = [uuid.uuid4() for _ in range(products)]
+    return [
+        {
+            "product_id": ids[i],
+            "product_name": f"product {i}",
+            "channel": channel,
+            "current_stock": stock[i][c],
+            "daily_sales_avg": daily_sales[i][c],
+        }
+        for i in range(products)
+        for c, channel in enumerate(CHANNELS)
+    ]
+
+
+def run(products: int) -> None:
+    rows = make_rows(products)
+
+    start = time.perf_counter()
+    matrix = InventoryMatrix.from_rows(rows)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    levels = check_stock_levels(matrix)
+    check_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    report = find_reorder_breaches(matrix, levels)
+    report_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    find_reorder_breaches(matrix, levels, limit=50)
+    top_ms = (time.perf_counter() - start) * 1000
+
+    breaches = report["critical_count"] + report["warning_count"]
+    print(f"{'products':>10}{'breaches':>10}{'build ms':>10}{'check ms':>10}{'report ms':>11}{'top-50 ms':>11}")
+    print(f"{products:>10,}{breaches:>10,}{build_ms:>10.1f}{check_ms:>10.1f}{report_ms:>11.1f}{top_ms:>11.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run(args.products)
+
+
+if __name__ == "__main__":
+    main()
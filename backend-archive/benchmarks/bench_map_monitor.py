@@ -0,0 +1,81 @@
+"""
+Benchmark: streaming MAP violation detection.
+
+Replays observations of sellers' prices against products with a MAP price
+through ``MapViolationDetector.observe_many``. About 5% of listings are
+priced below MAP; each listing is seen many times, so most observations
+are repeat sightings that must not emit events.
+
+Usage:
+    python -m benchmarks.bench_map_monitor [--observations 2000000] [--products 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from backend.pricing import MapViolationDetector, PriceObservation
+
+PLATFORMS = ("coupang", "naver", "11st", "gmarket")
+
+
+def make_observations(
+    observations: int,
+    products: int,
+    sellers: int,
+    seed: int = 7,
+) -> tuple[list[PriceObservation], dict[str, int]]:
+    rng = np.random.default_rng(seed)
+    map_prices = rng.integers(5_000, 80_000, size=products)
+    product = rng.integers(0, products, size=observations)
+    seller = rng.integers(0, sellers, size=observations)
+    platform = rng.integers(0, len(PLATFORMS), size=observations)
+
+    # A fixed ~5% of (seller, product) listings undercut MAP by a fixed 5-50%
+    listing = product * 31 + seller * 17
+    violating = listing % 100 < 5
+    ratio = np.where(violating, 0.5 + (listing // 100 % 46) / 100, rng.uniform(1.0, 1.1, size=observations))
+    prices = (map_prices[product] * ratio).astype(int)
+
+    start = datetime(2026, 3, 1)
+    return [
+        PriceObservation(PLATFORMS[p], f"seller-{s}", f"product-{i}", price, start + timedelta(seconds=n))
+        for n, (p, s, i, price) in enumerate(
+            zip(platform.tolist(), seller.tolist(), product.tolist(), prices.tolist())
+        )
+    ], {f"product-{i}": price for i, price in enumerate(map_prices.tolist())}
+
+
+def run(observations: int, products: int, sellers: int) -> None:
+    stream, map_prices = make_observations(observations, products, sellers)
+    detector = MapViolationDetector(refresh_interval=300)
+    detector.set_map_prices(map_prices)
+
+    start = time.perf_counter()
+    events = detector.observe_many(stream)
+    elapsed = time.perf_counter() - start
+
+    stats = detector.stats()
+    print(f"{'observations':>14}{'events':>10}{'active':>10}{'seconds':>10}{'obs/sec':>14}")
+    print(
+        f"{observations:>14,}{len(events):>10,}{stats['active_violations']:>10,}"
+        f"{elapsed:>10.2f}{observations / elapsed:>14,.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--observations", type=int, default=2_000_000)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--sellers", type=int, default=50)
+    args = parser.parse_args()
+
+    run(args.observations, args.products, args.sellers)
+
+
+if __name__ == "__main__":
+    main()
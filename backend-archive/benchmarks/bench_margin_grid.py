@@ -0,0 +1,59 @@
+"""
+Benchmark: catalog-wide discount optimisation.
+
+Solves the maximum discount keeping a 20% margin for every product on
+every channel in closed form (``solve ms``), and evaluates the full
+product x channel x discount-level margin grid (``grid ms``) at the six
+levels the margin calculator reports.
+
+Usage:
+    python -m benchmarks.bench_margin_grid [--products 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+import numpy as np
+
+from backend.pricing import ProductCosts, margin_grid, max_discount_for_margin
+from backend.pricing.consistency import CHANNELS
+from backend.pricing.margins import DISCOUNT_LEVELS
+
+
+def make_costs(products: int, seed: int = 7) -> ProductCosts:
+    rng = np.random.default_rng(seed)
+    prices = rng.integers(5_000, 80_000, size=products).astype(float)
+    cogs = prices * rng.uniform(0.15, 0.4, size=products)
+    ids = [uuid.uuid4() for _ in range(products)]
+    return ProductCosts(ids, [f"product {i}" for i in range(products)], prices, cogs)
+
+
+def run(products: int) -> None:
+    costs = make_costs(products)
+
+    start = time.perf_counter()
+    max_discount = max_discount_for_margin(costs, CHANNELS, 0.20)
+    solve_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    margin_grid(costs, CHANNELS, DISCOUNT_LEVELS)
+    grid_ms = (time.perf_counter() - start) * 1000
+
+    unreachable = int(np.isnan(max_discount).sum())
+    print(f"{'products':>10}{'unreachable':>13}{'solve ms':>10}{'grid ms':>9}")
+    print(f"{products:>10,}{unreachable:>13,}{solve_ms:>10.1f}{grid_ms:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run(args.products)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: bytes on the wire per metric update.
+
+Streams an inventory/price snapshot covering many SKUs where only a small
+share of SKUs change per update, and compares full JSON payloads with
+delta messages encoded as JSON and msgpack (keyframes included).
+
+Usage:
+    python -m benchmarks.bench_metric_deltas [--skus 500] [--updates 500] [--change 0.02]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+from datetime import datetime
+
+from backend.api.metric_stream import MetricDeltaEncoder
+from backend.api.websocket import encode_message
+
+CHANNELS = ["oliveyoung", "coupang", "naver", "kakao"]
+
+
+def initial_snapshot(skus: int, rng: random.Random) -> dict:
+    return {
+        f"SKU-{i:06d}": {
+            channel: {
+                "price": rng.randrange(10_000, 60_000, 100),
+                "stock": rng.randrange(0, 2_000),
+                "status": "healthy",
+            }
+            for channel in CHANNELS
+        }
+        for i in range(skus)
+    }
+
+
+def mutate(snapshot: dict, change: float, rng: random.Random) -> None:
+    for sku in rng.sample(list(snapshot), max(int(len(snapshot) * change), 1)):
+        entry = snapshot[sku][rng.choice(CHANNELS)]
+        entry["stock"] = max(entry["stock"] - rng.randrange(1, 50), 0)
+        if rng.random() < 0.2:
+            entry["price"] += rng.choice((-500, 500))
+        entry["status"] = "low" if entry["stock"] < 100 else "healthy"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--skus", type=int, default=500)
+    parser.add_argument("--updates", type=int, default=500)
+    parser.add_argument("--change", type=float, default=0.02, help="Share of SKUs changed per update")
+    parser.add_argument("--keyframe-interval", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    data = initial_snapshot(args.skus, rng)
+    encoder = MetricDeltaEncoder(keyframe_interval=args.keyframe_interval)
+    topics = ["metric:inventory"]
+
+    totals = {"full json": 0, "delta json": 0, "delta msgpack": 0}
+    for _ in range(args.updates):
+        mutate(data, args.change, rng)
+        full = {
+            "type": "metric_update",
+            "metric_type": "inventory",
+            "data": data,
+            "timestamp": datetime.now().isoformat(),
+        }
+        totals["full json"] += len(encode_message(full).encode())
+
+        message = encoder.encode("inventory", topics, copy.deepcopy(data))
+        if message is not None:
+            totals["delta json"] += len(encode_message(message).encode())
+            totals["delta msgpack"] += len(encode_message(message, "msgpack"))
+
+    print(f"SKUs: {args.skus}  updates: {args.updates}  changed/update: {args.change:.0%}  "
+          f"keyframe every {args.keyframe_interval}")
+    baseline = totals["full json"] / args.updates
+    print(f"{'encoding':<16}{'bytes/update':>14}{'vs full':>10}")
+    for name, total in totals.items():
+        per_update = total / args.updates
+        print(f"{name:<16}{per_update:>14,.0f}{per_update / baseline:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
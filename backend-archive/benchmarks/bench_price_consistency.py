@@ -0,0 +1,62 @@
+"""
+Benchmark: catalog-wide price consistency check.
+
+Builds a product x channel price matrix from (product_id, channel, price)
+rows, as loaded from ``channel_prices``, then runs the vectorized check.
+About a third of the synthetic products exceed the 5% warning threshold;
+``check ms`` builds every violation, ``top-50 ms`` only the worst 50.
+
+Usage:
+    python -m benchmarks.bench_price_consistency [--products 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+import numpy as np
+
+from backend.pricing import PriceMatrix, find_price_inconsistencies
+from backend.pricing.consistency import CHANNELS
+
+
+def make_rows(products: int, seed: int = 7) -> list[tuple[uuid.UUID, str, int]]:
+    rng = np.random.default_rng(seed)
+    base = rng.integers(5_000, 80_000, size=products)
+    spread = rng.uniform(0.97, 1.04, size=(products, len(CHANNELS)))
+    prices = (base[:, None] * spread).astype(int).tolist()
+    ids = [uuid.uuid4() for _ in range(products)]
+    return [(ids[i], channel, prices[i][c]) for i in range(products) for c, channel in enumerate(CHANNELS)]
+
+
+def run(products: int) -> None:
+    rows = make_rows(products)
+
+    start = time.perf_counter()
+    matrix = PriceMatrix.from_rows(rows)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    report = find_price_inconsistencies(matrix)
+    check_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    find_price_inconsistencies(matrix, limit=50)
+    top_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{'products':>10}{'violations':>12}{'build ms':>10}{'check ms':>10}{'top-50 ms':>11}")
+    print(f"{products:>10,}{len(report['violations']):>12,}{build_ms:>10.1f}{check_ms:>10.1f}{top_ms:>11.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run(args.products)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: columnar price history store.
+
+Appends observations for many (product, channel, seller) series, one every
+ten minutes per series with occasional price changes, then queries a day
+(raw points), a week (hourly buckets) and a quarter (daily buckets). The
+``obs bytes`` baseline is a (datetime, int) tuple per observation in a list.
+
+Usage:
+    python -m benchmarks.bench_price_history [--series 1000] [--days 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from backend.pricing import PriceHistoryStore
+from backend.pricing.history import KST
+
+
+def run(series: int, days: int) -> None:
+    points = days * 24 * 6
+    rng = np.random.default_rng(7)
+    base = rng.integers(5_000, 80_000, size=series)
+    # ~2% of observations change the price by up to +/-10%
+    changes = np.where(rng.random((points, series)) < 0.02, rng.uniform(0.9, 1.1, (points, series)), 1.0)
+    prices = (base * np.cumprod(changes, axis=0)).astype(int).tolist()
+    start = datetime(2026, 1, 1, tzinfo=KST)
+    times = [start + timedelta(minutes=10 * i) for i in range(points)]
+    keys = [(f"product-{i // 4}", ("coupang", "naver", "kakao", "oliveyoung")[i % 4], "seller") for i in range(series)]
+
+    store = PriceHistoryStore()
+    begin = time.perf_counter()
+    for observed_at, row in zip(times, prices):
+        for (product_id, channel, seller), price in zip(keys, row):
+            store.append(product_id, channel, seller, price, observed_at)
+    append_s = time.perf_counter() - begin
+
+    stats = store.stats()
+    observations = series * points
+    naive = sys.getsizeof((times[0], prices[0][0])) + sys.getsizeof(prices[0][0]) + 8
+    print(f"{'observations':>14}{'obs/sec':>12}{'bytes/obs':>11}{'obs bytes':>11}{'rollup MB':>11}")
+    print(
+        f"{observations:>14,}{observations / append_s:>12,.0f}{stats['bytes_per_observation']:>11.2f}"
+        f"{naive:>11}{stats['rollup_bytes'] / 1e6:>11.1f}"
+    )
+
+    end = times[-1]
+    product_id, channel, seller = keys[0]
+    print(f"\n{'span':>8}{'resolution':>12}{'points':>8}{'query us':>10}")
+    for label, span in (("1 day", timedelta(days=1)), ("7 days", timedelta(days=7)), ("90 days", timedelta(days=90))):
+        repeats = 200
+        begin = time.perf_counter()
+        for _ in range(repeats):
+            result = store.query(product_id, channel, seller, end - span, end)
+        query_us = (time.perf_counter() - begin) / repeats * 1e6
+        print(f"{label:>8}{result.resolution:>12}{len(result.timestamps):>8}{query_us:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--series", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=30)
+    args = parser.parse_args()
+
+    run(args.series, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: ranking snapshot store.
+
+Records an hourly top-100 leaderboard for 90 days, with a few products
+swapping places or entering each hour, then measures a 30-day rank history
+of one product and the biggest movers since yesterday. ``stored`` is the
+number of rank entries kept as diffs and keyframes against ``full``, the
+entries needed to keep every list whole.
+
+Usage:
+    python -m benchmarks.bench_ranking_snapshots [--days 90] [--depth 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.channels import RankingSnapshotStore
+
+
+def run(days: int, depth: int) -> None:
+    rng = random.Random(7)
+    store = RankingSnapshotStore()
+    products = [f"P{i}" for i in range(depth)]
+    next_id = depth
+    start = datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=9)))
+    snapshots = days * 24
+
+    begin = time.perf_counter()
+    for hour in range(snapshots):
+        for _ in range(3):
+            i = rng.randrange(depth - 1)
+            products[i], products[i + 1] = products[i + 1], products[i]
+        if rng.random() < 0.3:
+            products[rng.randrange(depth // 2, depth)] = f"P{next_id}"
+            next_id += 1
+        store.record("oliveyoung", "skincare:sales", [{"product_id": p} for p in products], start + timedelta(hours=hour))
+    record_us = (time.perf_counter() - begin) / snapshots * 1e6
+
+    now = start + timedelta(hours=snapshots)
+    repeats = 1000
+    begin = time.perf_counter()
+    for _ in range(repeats):
+        store.rank_history("oliveyoung", "skincare:sales", products[0], now - timedelta(days=30), now)
+    history_us = (time.perf_counter() - begin) / repeats * 1e6
+
+    begin = time.perf_counter()
+    for _ in range(repeats):
+        store.biggest_movers("oliveyoung", "skincare:sales", now - timedelta(days=1))
+    movers_us = (time.perf_counter() - begin) / repeats * 1e6
+
+    stats = store.stats()
+    print(f"{'snapshots':>10}{'stored':>10}{'full':>10}{'record us':>11}{'history us':>12}{'movers us':>11}")
+    print(
+        f"{stats['snapshots']:>10,}{stats['stored_ranks']:>10,}{stats['snapshots'] * depth:>10,}"
+        f"{record_us:>11.1f}{history_us:>12.1f}{movers_us:>11.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--depth", type=int, default=100)
+    args = parser.parse_args()
+
+    run(args.days, args.depth)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: per-acquire overhead of the channel rate limiter.
+
+Measures ``ChannelRateLimiter.acquire`` when a slot is free (the common
+case), so the number is pure limiter overhead rather than waiting time.
+Runs against the in-memory backend and, if reachable, Redis.
+
+Usage:
+    python -m benchmarks.bench_rate_limiter [--acquires 20000] [--redis-url redis://localhost:6379/0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from backend.channels.rate_limit import (
+    ChannelRateLimiter,
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+)
+
+# High enough that no acquire ever waits
+UNLIMITED_CONFIG = {"max_requests_per_hour": 3_600_000_000, "burst": 1_000_000}
+
+
+async def measure(backend: RateLimitBackend, acquires: int) -> float:
+    """Return microseconds per acquire."""
+    limiter = ChannelRateLimiter("bench", UNLIMITED_CONFIG, backend)
+    await limiter.acquire()  # warm up (script load, connection)
+
+    start = time.perf_counter()
+    for i in range(acquires):
+        await limiter.acquire(f"brand-{i % 8}")
+    return (time.perf_counter() - start) / acquires * 1e6
+
+
+async def run(acquires: int, redis_url: str) -> None:
+    print(f"{'backend':>10}{'acquires':>10}{'µs/acquire':>13}")
+    memory_us = await measure(InMemoryRateLimitBackend(), acquires)
+    print(f"{'memory':>10}{acquires:>10,}{memory_us:>13.1f}")
+
+    backend = RedisRateLimitBackend(redis_url, prefix="promotor:bench:")
+    try:
+        redis_us = await measure(backend, acquires // 10)
+    except Exception as e:
+        print(f"{'redis':>10}  skipped ({type(e).__name__}: {e})")
+    else:
+        print(f"{'redis':>10}{acquires // 10:>10,}{redis_us:>13.1f}")
+    finally:
+        await backend.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--acquires", type=int, default=20_000)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.acquires, args.redis_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark: rows/second serialized for 10k-row dashboard list responses.
+
+Compares the previous path (hand-built dicts of stringified values, run
+through FastAPI's jsonable_encoder and the stdlib-based JSONResponse) with
+projected row dicts rendered by ORJSONResponse.
+
+Usage:
+    python -m benchmarks.bench_serialization [--rows 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from backend.api.responses import ORJSONResponse
+from backend.models.inventory import InventoryStatus
+from backend.models.promotion import PromotionStatus, PromotionType
+
+CHANNELS = ["oliveyoung", "coupang", "naver", "kakao"]
+
+
+def make_inventory_rows(n: int) -> list[dict[str, Any]]:
+    """Rows shaped like the projected /inventory query result."""
+    statuses = list(InventoryStatus)
+    rows = []
+    for i in range(n):
+        daily = i % 40
+        rows.append({
+            "id": uuid.uuid4(),
+            "product_id": uuid.uuid4(),
+            "product_name": f"Product {i}",
+            "product_sku": f"SKU-{i:06d}",
+            "channel": CHANNELS[i % 4],
+            "current_stock": i * 3 % 1000,
+            "daily_sales_avg": daily,
+            "days_of_stock": (i * 3 % 1000) // daily if daily else None,
+            "status": statuses[i % len(statuses)],
+        })
+    return rows
+
+
+def make_promotion_rows(n: int) -> list[dict[str, Any]]:
+    """Rows shaped like the projected /promotions query result."""
+    start = date(2026, 1, 1)
+    rows = []
+    for i in range(n):
+        rows.append({
+            "id": uuid.uuid4(),
+            "name": f"Promotion {i}",
+            "description": "Seasonal hydration campaign",
+            "status": PromotionStatus.SCHEDULED,
+            "type": PromotionType.SEASONAL,
+            "channels": CHANNELS[: 1 + i % 4],
+            "start_date": start + timedelta(days=i % 365),
+            "end_date": start + timedelta(days=i % 365 + 14),
+            "discount_rate": "20%",
+            "gmv_target": 100_000_000,
+            "gmv_actual": None,
+            "total_budget": 35_000_000,
+        })
+    return rows
+
+
+def legacy_format(row: dict[str, Any]) -> dict[str, Any]:
+    """Previous per-row formatting: stringify ids, enums and dates by hand."""
+    return {
+        key: (
+            str(value) if isinstance(value, uuid.UUID)
+            else value.value if hasattr(value, "value")
+            else value.isoformat() if isinstance(value, (date, datetime))
+            else value
+        )
+        for key, value in row.items()
+    }
+
+
+def legacy_render(rows: list[dict[str, Any]]) -> bytes:
+    content = {"timestamp": datetime.now().isoformat(), "items": [legacy_format(r) for r in rows]}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def orjson_render(rows: list[dict[str, Any]]) -> bytes:
+    content = {"timestamp": datetime.now().isoformat(), "items": rows}
+    return ORJSONResponse(content).body
+
+
+def measure(render: Callable[[list[dict[str, Any]]], bytes], rows: list[dict[str, Any]], repeat: int) -> float:
+    """Return the best rows/second over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(rows)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    datasets = {
+        "inventory": make_inventory_rows(args.rows),
+        "promotions": make_promotion_rows(args.rows),
+    }
+
+    print(f"{'dataset':<12}{'legacy rows/s':>16}{'orjson rows/s':>16}{'speedup':>10}")
+    for name, rows in datasets.items():
+        legacy = measure(legacy_render, rows, args.repeat)
+        fast = measure(orjson_render, rows, args.repeat)
+        print(f"{name:<12}{legacy:>16,.0f}{fast:>16,.0f}{fast / legacy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
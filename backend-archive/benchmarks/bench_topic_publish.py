@@ -0,0 +1,85 @@
+"""
+Benchmark: per-publish cost of topic-indexed WebSocket fan-out.
+
+Holds the number of matching subscribers fixed while growing the total
+number of open connections, and compares ``publish`` (topic index) with
+``broadcast`` (every connection). Publish cost should stay flat.
+
+Usage:
+    python -m benchmarks.bench_topic_publish [--subscribers 100] [--publishes 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from backend.api.subscriptions import make_topic
+from backend.api.websocket import ConnectionManager
+
+CHANNELS = ["oliveyoung", "coupang", "naver", "kakao"]
+
+
+class NullWebSocket:
+    """Socket that accepts and discards every frame."""
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+async def measure(total: int, subscribers: int, publishes: int) -> tuple[float, float]:
+    """Return microseconds per publish and per broadcast."""
+    manager = ConnectionManager(queue_size=publishes + 1)
+    brands = max(total // subscribers, 1)
+
+    for i in range(total):
+        connection = await manager.connect(NullWebSocket(), f"client-{i}")
+        # Each brand topic gets ``subscribers`` connections
+        manager.subscriptions.subscribe(connection, [make_topic("brand", f"brand-{i % brands}")])
+
+    topics = [make_topic("brand", "brand-0"), make_topic("channel", CHANNELS[0])]
+    message = {"type": "metric_update", "metric_type": "sales", "data": {"value": 1}}
+
+    start = time.perf_counter()
+    for _ in range(publishes):
+        await manager.publish(topics, message)
+    publish_us = (time.perf_counter() - start) / publishes * 1e6
+
+    rounds = max(publishes // 100, 1)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await manager.broadcast(message)
+    broadcast_us = (time.perf_counter() - start) / rounds * 1e6
+
+    for client_id in list(manager.active_connections):
+        for connection in list(manager.active_connections.get(client_id, [])):
+            manager.disconnect(connection.websocket, client_id)
+    await asyncio.sleep(0)
+    return publish_us, broadcast_us
+
+
+async def run(subscribers: int, publishes: int) -> None:
+    print(f"{'connections':>12}{'subscribers':>13}{'publish µs':>13}{'broadcast µs':>15}")
+    for total in (1_000, 10_000, 50_000):
+        publish_us, broadcast_us = await measure(total, subscribers, publishes)
+        print(f"{total:>12,}{subscribers:>13,}{publish_us:>13.1f}{broadcast_us:>15.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--subscribers", type=int, default=100, help="Matching subscribers per publish")
+    parser.add_argument("--publishes", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.subscribers, args.publishes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: WebSocket broadcast fan-out to many simulated connections.
+
+Measures how long ``ConnectionManager.broadcast`` holds the caller and how
+long until every healthy connection has received every message, with a
+fraction of connections stalled to show that slow consumers are evicted
+rather than delaying everyone else.
+
+Usage:
+    python -m benchmarks.bench_websocket_fanout [--connections 10000] [--messages 20] [--slow 0.01]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from backend.api.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    """Stand-in socket; stalled sockets never complete a send."""
+
+    def __init__(self, stalled: bool, expected: int, done: asyncio.Event, counter: list[int]):
+        self.stalled = stalled
+        self.received = 0
+        self.expected = expected
+        self.done = done
+        self.counter = counter
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        # Yield like a real socket write would
+        await asyncio.sleep(0)
+        self.received += 1
+        if self.received == self.expected:
+            self.counter[0] -= 1
+            if self.counter[0] == 0:
+                self.done.set()
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+async def run(connections: int, messages: int, slow_fraction: float, queue_size: int) -> None:
+    manager = ConnectionManager(queue_size=queue_size)
+    done = asyncio.Event()
+    slow_every = int(1 / slow_fraction) if slow_fraction else 0
+    stalled_ids = set(range(0, connections, slow_every)) if slow_every else set()
+    healthy = connections - len(stalled_ids)
+    remaining = [healthy]
+
+    for i in range(connections):
+        await manager.connect(FakeWebSocket(i in stalled_ids, messages, done, remaining), f"client-{i}")
+
+    payload = {"type": "metric_update", "metric_type": "sales", "data": {"value": 1234567}}
+    call_times = []
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        call_start = time.perf_counter()
+        await manager.broadcast(payload)
+        call_times.append(time.perf_counter() - call_start)
+        # Give writer tasks a turn between publishes
+        await asyncio.sleep(0)
+    await done.wait()
+    delivered = time.perf_counter() - start
+
+    print(f"connections:              {connections:,}")
+    print(f"stalled connections:      {len(stalled_ids):,}")
+    print(f"messages:                 {messages}")
+    print(f"broadcast call p50:       {statistics.median(call_times) * 1000:.2f} ms")
+    print(f"broadcast call max:       {max(call_times) * 1000:.2f} ms")
+    print(f"all delivered after:      {delivered * 1000:.1f} ms")
+    print(f"deliveries/second:        {healthy * messages / delivered:,.0f}")
+    print(f"evicted slow consumers:   {manager.evicted_count:,}")
+    print(f"open connections:         {manager.connection_count:,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--slow", type=float, default=0.01, help="Fraction of stalled connections")
+    parser.add_argument("--queue-size", type=int, default=8)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.connections, args.messages, args.slow, args.queue_size))
+
+
+if __name__ == "__main__":
+    main()
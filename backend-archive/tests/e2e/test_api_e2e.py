@@ -89,3 +89,19 @@ class TestDashboardEndpoint:
         data = response.json()
         assert "active" in data
         assert "upcoming" in data
+
+    def test_bulk_acknowledge_requires_criteria(self, api_client):
+        """Test that bulk acknowledgement without criteria is rejected."""
+        response = api_client.post("/api/dashboard/alerts/acknowledge", json={})
+        assert response.status_code == 400
+
+    def test_bulk_acknowledge_by_filter(self, api_client):
+        """Test bulk acknowledgement by filter."""
+        response = api_client.post(
+            "/api/dashboard/alerts/acknowledge",
+            json={"created_before": "2000-01-01T00:00:00"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["acknowledged"] == 0
+        assert data["alert_ids"] == []
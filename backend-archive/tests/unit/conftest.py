@@ -0,0 +1,94 @@
+"""Pytest configuration and fixtures for unit tests."""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The engine in backend.db.session is created at import time; point it at a
+# placeholder URL so modules can be imported without a live database.
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/promotor_test")
+
+import pytest  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from backend.models import Base  # noqa: E402
+
+
+@pytest.fixture
+async def session_factory():
+    """Session factory bound to a fresh in-memory SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+class StubServer:
+    """
+    Local HTTP server returning scripted responses.
+
+    ``responses[path]`` is a list of (status, headers, body) tuples served in
+    order; the last one repeats. Every request is recorded in ``requests``.
+    """
+
+    def __init__(self):
+        self.responses: dict[str, list[tuple[int, dict[str, str], bytes]]] = {}
+        self.requests: list[dict] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                path = self.path.split("?")[0]
+                stub.requests.append({
+                    "method": self.command,
+                    "path": self.path,
+                    "headers": dict(self.headers),
+                    "body": self.rfile.read(length) if length else b"",
+                })
+                script = stub.responses.get(path) or [(404, {}, b"")]
+                status, headers, body = script.pop(0) if len(script) > 1 else script[0]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self._respond()
+
+            def do_PUT(self):
+                self._respond()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    def script(self, path: str, *responses: tuple[int, dict[str, str], bytes]) -> None:
+        self.responses[path] = list(responses)
+
+    def json(self, path: str, payload, status: int = 200, headers: dict[str, str] | None = None) -> None:
+        self.script(path, (status, {"Content-Type": "application/json", **(headers or {})}, json.dumps(payload).encode()))
+
+
+@pytest.fixture
+def stub_server():
+    """A local HTTP stub server for channel client tests."""
+    server = StubServer()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
@@ -0,0 +1,81 @@
+"""Unit tests for the batched alert writer."""
+
+import asyncio
+
+from sqlalchemy import func, select
+
+from backend.db.alert_writer import AlertWriter
+from backend.models import Alert
+from backend.models.alert import AlertSeverity, AlertType
+
+
+async def count_alerts(session_factory) -> int:
+    async with session_factory() as session:
+        result = await session.execute(select(func.count(Alert.id)))
+        return result.scalar()
+
+
+class TestAlertWriter:
+    """Test alert batching and flushing."""
+
+    async def test_flush_writes_buffered_alerts(self, session_factory):
+        """Test that an explicit flush inserts every buffered alert."""
+        writer = AlertWriter(session_factory, batch_size=100, flush_interval=60)
+
+        for i in range(5):
+            await writer.write(f"Alert {i}", "message", alert_type=AlertType.INVENTORY)
+
+        assert writer.pending == 5
+        assert await count_alerts(session_factory) == 0
+
+        written = await writer.flush()
+        assert written == 5
+        assert writer.pending == 0
+        assert await count_alerts(session_factory) == 5
+
+    async def test_full_batch_flushes_without_background_loop(self, session_factory):
+        """Test that reaching the batch size flushes immediately."""
+        writer = AlertWriter(session_factory, batch_size=3, flush_interval=60)
+
+        for i in range(4):
+            await writer.write(f"Alert {i}", "message", severity=AlertSeverity.CRITICAL)
+
+        assert await count_alerts(session_factory) == 3
+        assert writer.pending == 1
+
+    async def test_background_loop_flushes_on_interval(self, session_factory):
+        """Test that the background loop flushes after the interval and on stop."""
+        writer = AlertWriter(session_factory, batch_size=100, flush_interval=0.05)
+        writer.start()
+
+        await writer.write("Interval alert", "message")
+        await asyncio.sleep(0.2)
+        assert await count_alerts(session_factory) == 1
+
+        await writer.write("Shutdown alert", "message")
+        await writer.stop()
+        assert await count_alerts(session_factory) == 2
+
+    async def test_buffer_is_capped_while_flushes_fail(self, session_factory, capsys):
+        """Test that the oldest alerts are dropped and the outage is logged once."""
+
+        class Unavailable:
+            async def __aenter__(self):
+                raise ConnectionError("database unavailable")
+
+            async def __aexit__(self, *exc):
+                return False
+
+        writer = AlertWriter(lambda: Unavailable(), batch_size=100, flush_interval=0.01, max_buffer=3)
+        writer.start()
+        for i in range(5):
+            await writer.write(f"Alert {i}", "message")
+        await asyncio.sleep(0.1)
+
+        assert (writer.pending, writer.dropped) == (3, 2)
+        assert [row["title"] for row in writer._buffer] == ["Alert 2", "Alert 3", "Alert 4"]
+        assert capsys.readouterr().out.count("flush failed") == 1
+
+        writer._session_factory = session_factory
+        await writer.stop()
+        assert await count_alerts(session_factory) == 3
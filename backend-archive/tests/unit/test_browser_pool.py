@@ -0,0 +1,281 @@
+"""Unit tests for the browser pool and Oliveyoung scraper."""
+
+import asyncio
+
+import pytest
+
+from backend.channels import (
+    BrowserPool,
+    ChannelRateLimiter,
+    FingerprintStore,
+    InMemoryRateLimitBackend,
+)
+from backend.channels.browser_pool import should_block
+from backend.channels.oliveyoung import RANKING_PATH, OliveyoungScraper
+
+RANKINGS_HTML = """<!DOCTYPE html>
+<html>
+<head>
+  <link rel="stylesheet" href="/css/fonts.css">
+  <script src="https://www.google-analytics.com/analytics.js"></script>
+</head>
+<body>
+  <ul class="cate_prd_list">
+    <li>
+      <div class="prd_info">
+        <a href="#" data-ref-goodsno="A000000184228"><img src="/img/1.png"></a>
+        <span class="tx_brand">라운드랩</span>
+        <p class="tx_name">라운드랩 1025 독도 토너 500ml</p>
+        <p class="prd_price">
+          <span class="tx_org"><span class="tx_num">23,000</span>원</span>
+          <span class="tx_cur"><span class="tx_num">18,400</span>원</span>
+        </p>
+        <p class="prd_flag"><span class="icon_flag sale">세일</span><span class="icon_flag coupon">쿠폰</span></p>
+      </div>
+    </li>
+    <li>
+      <div class="prd_info">
+        <a href="#" data-ref-goodsno="A000000150811"><img src="/img/2.png"></a>
+        <span class="tx_brand">코스알엑스</span>
+        <p class="tx_name">코스알엑스 어드밴스드 스네일 96 뮤신 파워 에센스</p>
+        <p class="prd_price"><span class="tx_cur"><span class="tx_num">14,000</span>원</span></p>
+      </div>
+    </li>
+  </ul>
+</body>
+</html>
+"""
+
+
+class FakeRequest:
+    def __init__(self, resource_type: str, url: str):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type: str, url: str):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+        self.handler = None
+
+    def set_default_navigation_timeout(self, timeout: float):
+        pass
+
+    async def route(self, pattern: str, handler):
+        self.handler = handler
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """Stands in for a launched Chromium; records the contexts it creates."""
+
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+        self.fail_next = False
+        self.stall_next = False
+
+    async def new_context(self, **kwargs):
+        if self.stall_next:
+            self.stall_next = False
+            await asyncio.Event().wait()
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("browser crashed")
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+@pytest.fixture
+async def chromium():
+    """A real headless Chromium, or skip if Playwright's browser is not installed."""
+    playwright_api = pytest.importorskip("playwright.async_api")
+    playwright = await playwright_api.async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch()
+    except playwright_api.Error as e:
+        await playwright.stop()
+        pytest.skip(f"Chromium not available: {e.message.splitlines()[0]}")
+    yield browser
+    await browser.close()
+    await playwright.stop()
+
+
+def make_scraper(pool: BrowserPool, url: str) -> OliveyoungScraper:
+    return OliveyoungScraper(
+        pool,
+        url,
+        ChannelRateLimiter("oliveyoung", {"max_requests_per_hour": 3_600_000, "burst": 100}, InMemoryRateLimitBackend()),
+        FingerprintStore("oliveyoung"),
+    )
+
+
+class TestRequestBlocking:
+    """Test which subresources are aborted."""
+
+    def test_blocks_heavy_resources_and_analytics(self):
+        """Test resource-type and host based blocking."""
+        assert should_block("image", "https://image.oliveyoung.co.kr/a.jpg")
+        assert should_block("font", "https://static.oliveyoung.co.kr/a.woff2")
+        assert should_block("script", "https://www.googletagmanager.com/gtm.js")
+        assert should_block("xhr", "https://wcs.naver.net/wcslog.js")
+        assert not should_block("document", "https://www.oliveyoung.co.kr/store/main/getBestList.do")
+        assert not should_block("script", "https://static.oliveyoung.co.kr/pc-static-root/js/common.js")
+
+
+class TestBrowserPool:
+    """Test leasing and recycling with a fake browser."""
+
+    async def test_warms_contexts_and_bounds_concurrent_leases(self):
+        """Test that the pool pre-creates contexts and makes extra leases wait."""
+        browser = FakeBrowser()
+        pool = BrowserPool(size=2, pages_per_context=10, browser=browser)
+        await pool.start()
+        assert len(browser.contexts) == 2
+
+        release = asyncio.Event()
+
+        async def job():
+            async with pool.lease():
+                await release.wait()
+
+        jobs = [asyncio.create_task(job()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert pool.stats()["idle"] == 0
+
+        release.set()
+        await asyncio.gather(*jobs)
+        assert len(browser.contexts) == 2
+        assert pool.stats()["idle"] == 2
+
+    async def test_recycles_context_after_page_budget(self):
+        """Test that a context is closed and replaced after N pages."""
+        browser = FakeBrowser()
+        pool = BrowserPool(size=1, pages_per_context=3, browser=browser)
+
+        for _ in range(4):
+            async with pool.page():
+                pass
+
+        first, second = browser.contexts
+        assert first.closed and not second.closed
+        stats = pool.stats()
+        assert stats["pages_served"] == 4
+        assert stats["contexts_recycled"] == 1
+
+    async def test_failed_recycle_is_retried_on_next_lease(self):
+        """Test that a slot survives a context that cannot be recreated."""
+        browser = FakeBrowser()
+        pool = BrowserPool(size=1, pages_per_context=1, browser=browser)
+
+        async with pool.page():
+            browser.fail_next = True
+        async with pool.lease() as pooled:
+            assert pooled.context is browser.contexts[-1]
+        assert len(browser.contexts) == 2
+
+    async def test_cancelled_recycle_keeps_the_slot(self):
+        """Test that a slot survives a recycle cancelled while recreating the context."""
+        browser = FakeBrowser()
+        pool = BrowserPool(size=1, pages_per_context=1, browser=browser)
+
+        async def use():
+            async with pool.page():
+                browser.stall_next = True
+
+        task = asyncio.create_task(use())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        async def lease_again():
+            async with pool.lease() as pooled:
+                assert pooled.context is browser.contexts[-1]
+
+        await asyncio.wait_for(lease_again(), timeout=1)
+        assert len(browser.contexts) == 2
+
+    async def test_route_handler_counts_blocked_requests(self):
+        """Test that the installed route handler aborts blocked requests."""
+        browser = FakeBrowser()
+        pool = BrowserPool(size=1, browser=browser)
+        await pool.start()
+        handler = browser.contexts[0].handler
+
+        image = FakeRoute("image", "https://image.oliveyoung.co.kr/a.jpg")
+        document = FakeRoute("document", "https://www.oliveyoung.co.kr/")
+        await handler(image)
+        await handler(document)
+
+        assert (image.outcome, document.outcome) == ("aborted", "continued")
+        assert pool.stats()["blocked_ratio"] == 0.5
+
+
+class TestOliveyoungScraper:
+    """Test scraping a local fixture page with a real browser."""
+
+    async def test_scrapes_rankings_without_loading_images(self, chromium, stub_server):
+        """Test parsing of the ranking page and that images are never fetched."""
+        stub_server.script(RANKING_PATH, (200, {"Content-Type": "text/html; charset=utf-8"}, RANKINGS_HTML.encode()))
+        stub_server.script("/css/fonts.css", (200, {"Content-Type": "text/css"}, b"body { margin: 0; }"))
+        pool = BrowserPool(size=1, browser=chromium)
+        scraper = make_scraper(pool, stub_server.url)
+
+        rankings = await scraper.rankings("skincare", limit=10)
+        await pool.stop()
+
+        assert [item["product_id"] for item in rankings] == ["A000000184228", "A000000150811"]
+        assert rankings[0]["price"] == 18400
+        assert rankings[0]["discount"] == "20%"
+        assert rankings[0]["flags"] == ["세일", "쿠폰"]
+        assert rankings[1]["original_price"] == 14000
+
+        paths = [request["path"] for request in stub_server.requests]
+        assert paths[0].startswith(f"{RANKING_PATH}?dispCatNo=10000010001")
+        assert "/css/fonts.css" in paths
+        assert not any(path.startswith("/img/") for path in paths)
+        assert pool.stats()["requests_blocked"] >= 3
+
+    async def test_unchanged_page_is_revalidated_not_reparsed(self, chromium, stub_server):
+        """Test the conditional navigation and the only_changed flag."""
+        html_headers = {"Content-Type": "text/html; charset=utf-8", "ETag": '"r1"'}
+        stub_server.script(
+            RANKING_PATH,
+            (200, html_headers, RANKINGS_HTML.encode()),
+            (304, {"ETag": '"r1"'}, b""),
+        )
+        pool = BrowserPool(size=1, browser=chromium)
+        scraper = make_scraper(pool, stub_server.url)
+
+        first = await scraper.rankings("skincare")
+        assert await scraper.rankings("skincare", only_changed=True) is None
+        cached = await scraper.rankings("skincare")
+        await pool.stop()
+
+        assert cached == first
+        documents = [request for request in stub_server.requests if request["path"].startswith(RANKING_PATH)]
+        assert documents[1]["headers"]["If-None-Match"] == '"r1"'
+        assert scraper.fingerprints.snapshot()["not_modified"] == 2
@@ -0,0 +1,396 @@
+"""Unit tests for the channel HTTP client layer against a local stub server."""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.agents.divisions.channel_management.coupang_agent import get_coupang_wing_metrics
+from backend.channels import (
+    ChannelClient,
+    ChannelRateLimiter,
+    ChannelRequestError,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    FingerprintBackend,
+    FingerprintStore,
+    InMemoryRateLimitBackend,
+)
+from backend.channels import client as client_module
+from backend.config import get_settings
+
+# No pacing, effectively unlimited tokens
+FAST_CONFIG = {"max_requests_per_hour": 3_600_000, "burst": 100, "base_delay": 0, "random_delay": (0, 0)}
+
+
+def make_client(url: str, **kwargs) -> ChannelClient:
+    kwargs.setdefault("backoff", 0.001)
+    return ChannelClient("coupang", base_url=url, config=FAST_CONFIG, **kwargs)
+
+
+class DictFingerprintBackend(FingerprintBackend):
+    """Stands in for Redis: one dict shared by every store given this backend."""
+
+    def __init__(self):
+        self.entries = {}
+        self.down = False
+
+    async def load(self, channel, key):
+        if self.down:
+            raise ConnectionError("redis unavailable")
+        return self.entries.get((channel, key))
+
+    async def save(self, channel, key, entry):
+        if self.down:
+            raise ConnectionError("redis unavailable")
+        self.entries[(channel, key)] = entry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiting:
+    """Test the GCRA backend, fair queuing and request spacing."""
+
+    async def test_gcra_allows_burst_then_spaces_requests(self):
+        """Test burst capacity and emission interval."""
+        clock = FakeClock()
+        backend = InMemoryRateLimitBackend(clock=clock)
+        limits = [("coupang", 0.5, 0.5)]  # 2/s, burst of 2
+
+        assert await backend.try_acquire(limits) == 0
+        assert await backend.try_acquire(limits) == 0
+        assert await backend.try_acquire(limits) == pytest.approx(0.5)
+
+        clock.now += 0.5
+        assert await backend.try_acquire(limits) == 0
+
+    async def test_gcra_takes_all_limits_or_none(self):
+        """Test that a denied limit does not consume the others."""
+        clock = FakeClock()
+        backend = InMemoryRateLimitBackend(clock=clock)
+
+        assert await backend.try_acquire([("scraping", 10.0, 0.0)]) == 0
+        assert await backend.try_acquire([("oliveyoung", 1.0, 0.0), ("scraping", 10.0, 0.0)]) == pytest.approx(10.0)
+        assert await backend.try_acquire([("oliveyoung", 1.0, 0.0)]) == 0
+
+    async def test_limiters_sharing_a_backend_share_the_budget(self):
+        """Test that two workers' limiters draw from one budget."""
+        config = {"max_requests_per_hour": 36_000, "burst": 1}
+        backend = InMemoryRateLimitBackend()
+        worker_a = ChannelRateLimiter("coupang", config, backend)
+        worker_b = ChannelRateLimiter("coupang", config, backend)
+
+        start = time.perf_counter()
+        await worker_a.acquire()
+        await worker_b.acquire()
+        await worker_a.acquire()
+        # 10 requests/second with no burst: two waits of ~0.1s
+        assert time.perf_counter() - start >= 0.18
+
+    async def test_waiting_requests_alternate_between_brands(self):
+        """Test that a bulk brand cannot starve another brand."""
+        limiter = ChannelRateLimiter(
+            "coupang", {"max_requests_per_hour": 360_000, "burst": 1}, InMemoryRateLimitBackend()
+        )
+        await limiter.acquire("bulk")  # use up the burst so everyone queues
+        order = []
+
+        async def request(brand: str):
+            await limiter.acquire(brand)
+            order.append(brand)
+
+        tasks = [asyncio.create_task(request("bulk")) for _ in range(6)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(request("small")) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert limiter.queued == {"bulk": 6, "small": 2}
+
+        await asyncio.gather(*tasks)
+        assert order[:4] == ["bulk", "small", "bulk", "small"]
+        assert limiter.queued == {}
+
+    async def test_backend_failure_fails_queued_requests(self):
+        """Test that queued requests get the backend's error instead of waiting forever."""
+
+        class FlakyBackend(InMemoryRateLimitBackend):
+            down = False
+
+            async def try_acquire(self, limits):
+                if self.down:
+                    raise ConnectionError("redis unavailable")
+                return await super().try_acquire(limits)
+
+        backend = FlakyBackend()
+        limiter = ChannelRateLimiter("coupang", {"max_requests_per_hour": 360_000, "burst": 1}, backend)
+        await limiter.acquire()
+        tasks = [asyncio.create_task(limiter.acquire(brand)) for brand in ("a", "b", "a")]
+        await asyncio.sleep(0)
+        backend.down = True
+
+        results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert limiter.queued == {}
+
+    async def test_scraped_channels_share_the_global_scraping_budget(self):
+        """Test that use_proxy channels also draw from scraping_max_requests_per_hour."""
+        limiter = ChannelRateLimiter("oliveyoung", {"max_requests_per_hour": 100, "use_proxy": True})
+
+        assert limiter.limits[1] == ("scraping", 3600 / get_settings().scraping_max_requests_per_hour, 0.0)
+
+
+class TestChannelClient:
+    """Test retries, circuit breaking and metrics."""
+
+    async def test_retries_server_errors_then_succeeds(self, stub_server):
+        """Test that 503s are retried and the eventual 200 is returned."""
+        stub_server.script(
+            "/metrics",
+            (503, {}, b""),
+            (503, {}, b""),
+            (200, {"Content-Type": "application/json"}, b'{"ok": true}'),
+        )
+        client = make_client(stub_server.url)
+
+        assert await client.get_json("/metrics") == {"ok": True}
+        assert len(stub_server.requests) == 3
+        snapshot = client.snapshot()
+        assert snapshot["retries"] == 2
+        assert snapshot["successes"] == 1
+        await client.aclose()
+
+    async def test_throttling_honours_retry_after(self, stub_server):
+        """Test that a 429 waits for Retry-After before retrying."""
+        stub_server.script(
+            "/rankings",
+            (429, {"Retry-After": "0.2"}, b""),
+            (200, {"Content-Type": "application/json"}, b"[]"),
+        )
+        client = make_client(stub_server.url)
+
+        start = time.perf_counter()
+        assert await client.get_json("/rankings") == []
+        assert time.perf_counter() - start >= 0.2
+        assert client.metrics.throttled == 1
+        await client.aclose()
+
+    async def test_non_idempotent_requests_are_not_retried_on_5xx(self, stub_server):
+        """Test that a failed POST is not resent."""
+        stub_server.script("/deals", (500, {}, b""))
+        client = make_client(stub_server.url)
+
+        with pytest.raises(ChannelRequestError) as exc_info:
+            await client.request("POST", "/deals", json={"deal": 1})
+        assert exc_info.value.status_code == 500
+        assert len(stub_server.requests) == 1
+        await client.aclose()
+
+    async def test_requests_marked_idempotent_are_retried_on_5xx(self, stub_server):
+        """Test that a POST carrying an idempotency key is resent when the caller opts in."""
+        stub_server.script("/deals", (500, {}, b""), (201, {}, b""))
+        client = make_client(stub_server.url)
+
+        response = await client.request(
+            "POST", "/deals", idempotent=True, json={"deal": 1}, headers={"Idempotency-Key": "deal-1"}
+        )
+        assert response.status_code == 201
+        assert [request["headers"]["Idempotency-Key"] for request in stub_server.requests] == ["deal-1", "deal-1"]
+        await client.aclose()
+
+    async def test_circuit_opens_and_recovers(self, stub_server):
+        """Test that repeated failures open the circuit until the reset timeout."""
+        stub_server.script("/status", (500, {}, b""))
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        client = make_client(stub_server.url, max_retries=0, breaker=breaker)
+
+        for _ in range(3):
+            with pytest.raises(ChannelRequestError):
+                await client.request("GET", "/status")
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await client.request("GET", "/status")
+        assert len(stub_server.requests) == 3
+        assert client.metrics.rejected == 1
+
+        clock.now += 31
+        stub_server.script("/status", (200, {}, b"ok"))
+        response = await client.request("GET", "/status")
+        assert response.status_code == 200
+        assert breaker.state == CircuitState.CLOSED
+        await client.aclose()
+
+    async def test_interrupted_trial_does_not_block_the_circuit(self, stub_server, monkeypatch):
+        """Test that a half-open trial that is cancelled or raises frees its slot."""
+        stub_server.script("/status", (200, {}, b"ok"))
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        client = make_client(stub_server.url, max_retries=0, breaker=breaker)
+        breaker.record_failure()
+        clock.now += 31
+        send = client.http.request
+
+        async def broken(*args, **kwargs):
+            raise ValueError("bad request body")
+
+        monkeypatch.setattr(client.http, "request", broken)
+        with pytest.raises(ValueError):
+            await client.request("GET", "/status")
+
+        async def hang(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(client.http, "request", hang)
+        trial = asyncio.create_task(client.request("GET", "/status"))
+        await asyncio.sleep(0.01)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        monkeypatch.setattr(client.http, "request", send)
+        response = await client.request("GET", "/status")
+        assert response.status_code == 200
+        assert breaker.state == CircuitState.CLOSED
+        await client.aclose()
+
+
+class TestConditionalFetch:
+    """Test ETag / Last-Modified revalidation and content fingerprints."""
+
+    async def test_not_modified_reuses_parsed_value(self, stub_server):
+        """Test that validators are sent back and a 304 returns the cached data."""
+        stub_server.script(
+            "/rankings",
+            (200, {"Content-Type": "application/json", "ETag": '"v1"', "Last-Modified": "Mon, 19 Oct 2026 00:00:00 GMT"}, b'[{"rank": 1}]'),
+            (304, {"ETag": '"v1"'}, b""),
+        )
+        fingerprints = FingerprintStore("coupang")
+        client = make_client(stub_server.url, fingerprints=fingerprints)
+
+        first = await client.fetch_json("/rankings", params={"category": "skincare"})
+        second = await client.fetch_json("/rankings", params={"category": "skincare"})
+
+        assert first.changed and not second.changed and second.not_modified
+        assert second.data == [{"rank": 1}]
+        headers = stub_server.requests[1]["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 19 Oct 2026 00:00:00 GMT"
+        assert fingerprints.snapshot()["saved_ratio"] == 0.5
+        await client.aclose()
+
+    async def test_identical_body_is_not_parsed_again(self, stub_server):
+        """Test the content-hash fallback for servers without validators."""
+        stub_server.script(
+            "/deals",
+            (200, {"Content-Type": "application/json"}, b'{"deals": [1]}'),
+            (200, {"Content-Type": "application/json"}, b'{"deals": [1]}'),
+            (200, {"Content-Type": "application/json"}, b'{"deals": [1, 2]}'),
+        )
+        fingerprints = FingerprintStore("coupang")
+        client = make_client(stub_server.url, fingerprints=fingerprints)
+
+        results = [await client.fetch_json("/deals") for _ in range(3)]
+
+        assert [result.changed for result in results] == [True, False, True]
+        assert results[2].data == {"deals": [1, 2]}
+        assert "If-None-Match" not in stub_server.requests[1]["headers"]
+        snapshot = fingerprints.snapshot()
+        assert (snapshot["fetches"], snapshot["unchanged"], snapshot["not_modified"]) == (3, 1, 0)
+        await client.aclose()
+
+    async def test_store_evicts_least_recently_used_urls(self):
+        """Test that the fingerprint store stays bounded."""
+        fingerprints = FingerprintStore("naver", max_entries=2)
+        for url in ("/a", "/b", "/c"):
+            await fingerprints.record_body(url, b"body")
+            await fingerprints.store(url, {"url": url})
+
+        assert await fingerprints.get("/a") is None
+        assert (await fingerprints.get("/c")).value == {"url": "/c"}
+
+    async def test_workers_share_fingerprints_through_the_backend(self, stub_server):
+        """Test that a page parsed by one worker is revalidated, not fetched again in full, by another."""
+        stub_server.script(
+            "/rankings",
+            (200, {"Content-Type": "application/json", "ETag": '"v1"'}, b'[{"rank": 1}]'),
+            (304, {"ETag": '"v1"'}, b""),
+        )
+        backend = DictFingerprintBackend()
+        first = make_client(stub_server.url, fingerprints=FingerprintStore("coupang", backend=backend))
+        second = make_client(stub_server.url, fingerprints=FingerprintStore("coupang", backend=backend))
+
+        await first.fetch_json("/rankings")
+        result = await second.fetch_json("/rankings")
+
+        assert result.not_modified and result.data == [{"rank": 1}]
+        assert stub_server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        await first.aclose()
+        await second.aclose()
+
+    async def test_failing_backend_falls_back_to_the_local_cache(self, stub_server):
+        """Test that fetches keep working, and the local LRU keeps saving them, while the backend is down."""
+        stub_server.script(
+            "/deals",
+            (200, {"Content-Type": "application/json"}, b'{"deals": [1]}'),
+            (200, {"Content-Type": "application/json"}, b'{"deals": [1]}'),
+        )
+        backend = DictFingerprintBackend()
+        backend.down = True
+        fingerprints = FingerprintStore("coupang", backend=backend)
+        client = make_client(stub_server.url, fingerprints=fingerprints)
+
+        results = [await client.fetch_json("/deals") for _ in range(2)]
+
+        assert [result.changed for result in results] == [True, False]
+        assert fingerprints.snapshot()["unchanged"] == 1
+        await client.aclose()
+
+
+class TestCoupangWingMetrics:
+    """Test the WING metrics tool through the shared Coupang client."""
+
+    async def test_tool_fetches_signed_request(self, stub_server, monkeypatch):
+        """Test that the tool signs the request and maps the response."""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "coupang_access_key", "access")
+        monkeypatch.setattr(settings, "coupang_secret_key", "secret")
+        client = make_client(stub_server.url)
+        monkeypatch.setitem(client_module._clients, "coupang", client)
+
+        path = "/v2/providers/seller_api/apis/api/v1/vendors/A0001/performance"
+        stub_server.json(path, {"metrics": {"total_sales": 1000, "order_count": 3}})
+
+        result = await get_coupang_wing_metrics.ainvoke({"seller_id": "A0001", "date_range": "30d"})
+
+        assert result["source"] == "wing_api"
+        assert result["metrics"]["order_count"] == 3
+        request = stub_server.requests[0]
+        assert request["path"] == f"{path}?period=30d"
+        assert request["headers"]["Authorization"].startswith("CEA algorithm=HmacSHA256, access-key=access")
+        await client.aclose()
+
+    async def test_tool_reports_errors(self, stub_server, monkeypatch):
+        """Test that a failing API yields an error dict instead of raising."""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "coupang_access_key", "access")
+        monkeypatch.setattr(settings, "coupang_secret_key", "secret")
+        client = make_client(stub_server.url, max_retries=1)
+        monkeypatch.setitem(client_module._clients, "coupang", client)
+
+        result = await get_coupang_wing_metrics.ainvoke({"seller_id": "A0001"})
+
+        assert "error" in result
+        assert "404" in result["error"]
+        await client.aclose()
+
+    async def test_tool_falls_back_to_sample_without_credentials(self):
+        """Test that the tool keeps working without API credentials."""
+        result = await get_coupang_wing_metrics.ainvoke({"seller_id": "A0001"})
+        assert result["source"] == "sample"
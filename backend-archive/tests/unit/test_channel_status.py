@@ -0,0 +1,124 @@
+"""Unit tests for the channel status aggregator."""
+
+import asyncio
+import time
+
+from backend.channels import ChannelStatusAggregator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProvider:
+    """Status coroutine that counts calls and can be slowed down or broken."""
+
+    def __init__(self, channel: str, delay: float = 0.0):
+        self.channel = channel
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self, brand_id: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.channel} unavailable")
+        return {"metrics": {"calls": self.calls}, "summary": f"{self.channel} for {brand_id}"}
+
+
+def make_aggregator(providers: dict[str, FakeProvider], **kwargs) -> ChannelStatusAggregator:
+    return ChannelStatusAggregator(
+        {code: (code.title(), provider) for code, provider in providers.items()},
+        **{"deadline": 0.5, "ttl": 10, "max_stale": 100, **kwargs},
+    )
+
+
+class TestChannelStatusAggregator:
+    """Test fan-out, deadlines and stale-while-revalidate caching."""
+
+    async def test_fans_out_concurrently(self):
+        """Test that the overview takes about as long as one channel."""
+        providers = {code: FakeProvider(code, delay=0.05) for code in ("oliveyoung", "coupang", "naver", "kakao")}
+        aggregator = make_aggregator(providers)
+
+        start = time.perf_counter()
+        overview = await aggregator.overview("brand-1")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.15
+        assert [c["code"] for c in overview["channels"]] == ["oliveyoung", "coupang", "naver", "kakao"]
+        assert all(c["status"] == "online" and not c["stale"] for c in overview["channels"])
+        assert overview["channels"][0]["summary"] == "oliveyoung for brand-1"
+
+    async def test_slow_channel_is_bounded_by_deadline(self):
+        """Test partial results when one channel misses its deadline."""
+        fast, slow = FakeProvider("naver"), FakeProvider("coupang", delay=0.2)
+        aggregator = make_aggregator({"naver": fast, "coupang": slow}, deadline=0.05)
+
+        start = time.perf_counter()
+        overview = await aggregator.overview()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.15
+        naver, coupang = overview["channels"]
+        assert naver["status"] == "online"
+        assert (coupang["status"], coupang["stale"]) == ("pending", True)
+        assert overview["stale"] is True
+
+        # The timed-out fetch keeps running and fills the cache
+        await asyncio.sleep(0.25)
+        coupang = await aggregator.channel_status("coupang")
+        assert coupang["status"] == "online"
+        assert slow.calls == 1
+        assert aggregator.stats()["timeouts"] == 1
+
+    async def test_serves_stale_while_revalidating(self):
+        """Test that an expired entry is served at once and refreshed in the background."""
+        clock = FakeClock()
+        provider = FakeProvider("kakao")
+        aggregator = make_aggregator({"kakao": provider}, clock=clock)
+
+        await aggregator.channel_status("kakao")
+        clock.now = 5
+        assert (await aggregator.channel_status("kakao"))["metrics"] == {"calls": 1}
+
+        clock.now = 20
+        stale = await aggregator.channel_status("kakao")
+        assert (stale["stale"], stale["status"], stale["metrics"]) == (True, "degraded", {"calls": 1})
+
+        await asyncio.sleep(0.01)
+        fresh = await aggregator.channel_status("kakao")
+        assert (fresh["stale"], fresh["metrics"]) == (False, {"calls": 2})
+        assert aggregator.stats()["stale_hits"] == 1
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test single-flight fetching per channel and brand."""
+        provider = FakeProvider("oliveyoung", delay=0.02)
+        aggregator = make_aggregator({"oliveyoung": provider})
+
+        await asyncio.gather(*(aggregator.channel_status("oliveyoung") for _ in range(5)))
+
+        assert provider.calls == 1
+
+    async def test_failures_fall_back_to_last_status(self):
+        """Test offline without a cache and degraded with an expired one."""
+        clock = FakeClock()
+        provider = FakeProvider("naver")
+        aggregator = make_aggregator({"naver": provider}, clock=clock)
+
+        provider.fail = True
+        offline = await aggregator.channel_status("naver")
+        assert (offline["status"], offline["error"]) == ("offline", "naver unavailable")
+
+        provider.fail = False
+        await aggregator.channel_status("naver")
+        provider.fail = True
+        clock.now = 500
+        degraded = await aggregator.channel_status("naver")
+        assert (degraded["status"], degraded["stale"], degraded["error"]) == ("degraded", True, "naver unavailable")
+        assert degraded["age_s"] == 500
@@ -0,0 +1,280 @@
+"""Unit tests for the cross-channel sync executor against a local stub server."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.channels import (
+    ChannelClient,
+    ChannelSyncExecutor,
+    DatabaseSyncTaskStore,
+    InMemoryRateLimitBackend,
+    InMemorySyncTaskStore,
+)
+from backend.channels.sync import SYNC_PATHS, estimate_sync_seconds
+
+# No pacing, effectively unlimited tokens
+FAST_CONFIG = {"max_requests_per_hour": 3_600_000, "burst": 100, "base_delay": 0, "random_delay": (0, 0)}
+
+CHANNELS = ["oliveyoung", "coupang", "naver", "kakao"]
+PRODUCTS = [f"prod-{i:03d}" for i in range(500)]
+OK = (200, {"Content-Type": "application/json"}, b"{}")
+
+
+def make_executor(url: str, store=None, events=None, **kwargs) -> ChannelSyncExecutor:
+    clients = {}
+
+    def client_factory(channel: str) -> ChannelClient:
+        if channel not in clients:
+            clients[channel] = ChannelClient(
+                channel,
+                base_url=url,
+                config=FAST_CONFIG,
+                backoff=0.001,
+                max_retries=0,
+                rate_limit_backend=InMemoryRateLimitBackend(),
+            )
+        return clients[channel]
+
+    async def publish(message, topics):
+        events.append((message, topics))
+
+    return ChannelSyncExecutor(
+        store or InMemorySyncTaskStore(),
+        client_factory=client_factory,
+        publish=publish if events is not None else None,
+        **{"batch_size": 100, "backoff": 0.001, **kwargs},
+    )
+
+
+def sent_keys(stub) -> list[str]:
+    return [request["headers"]["Idempotency-Key"] for request in stub.requests]
+
+
+class TestChannelSyncExecutor:
+    """Test parallel steps, idempotency, approval, retries, progress and resume."""
+
+    async def test_syncs_every_channel_in_batches(self, stub_server):
+        """Test a 500-product, 4-channel sync as five bulk requests per channel."""
+        stub_server.json(SYNC_PATHS["inventory"], {"result": "ok"})
+        executor = make_executor(stub_server.url)
+
+        task = await executor.submit("inventory", PRODUCTS, CHANNELS, 0, brand="글로우랩")
+        assert task["status"] == "queued"
+        done = await executor.wait(task["task_id"])
+
+        assert done["status"] == "completed"
+        assert done["progress"] == {"synced": 2000, "total": 2000, "percent": 100.0}
+        assert len(stub_server.requests) == 20
+        assert {request["method"] for request in stub_server.requests} == {"PUT"}
+        assert sorted(
+            product for request in stub_server.requests for product in json.loads(request["body"])["product_ids"]
+        ) == sorted(PRODUCTS * 4)
+        assert len(set(sent_keys(stub_server))) == 20
+
+    async def test_same_request_runs_once(self, stub_server):
+        """Test that a repeated request returns the existing task."""
+        stub_server.json(SYNC_PATHS["content"], {})
+        executor = make_executor(stub_server.url)
+
+        first = await executor.submit("content", PRODUCTS[:10], ["naver"], {"title": "봄 세일"})
+        second = await executor.submit("content", PRODUCTS[:10], ["naver"], {"title": "봄 세일"})
+        await executor.wait(first["task_id"])
+
+        assert second["task_id"] == first["task_id"] and second["duplicate"]
+        assert len(stub_server.requests) == 1
+
+    async def test_finished_requests_can_run_again(self, stub_server):
+        """Test that only unfinished tasks absorb repeats, unless the client sent an idempotency key."""
+        stub_server.json(SYNC_PATHS["content"], {})
+        stub_server.json(SYNC_PATHS["price"], {})
+        executor = make_executor(stub_server.url)
+
+        first = await executor.submit("content", PRODUCTS[:10], ["naver"], {"title": "봄 세일"})
+        await executor.wait(first["task_id"])
+        again = await executor.submit("content", PRODUCTS[:10], ["naver"], {"title": "봄 세일"})
+        assert again["task_id"] != first["task_id"] and "duplicate" not in again
+
+        rejected = await executor.submit("price", PRODUCTS[:10], ["coupang"], 32000)
+        await executor.reject(rejected["task_id"], "김민지")
+        resubmitted = await executor.submit("price", PRODUCTS[:10], ["coupang"], 32000)
+        assert resubmitted["task_id"] != rejected["task_id"]
+        assert resubmitted["status"] == "pending_approval"
+
+        keyed = await executor.submit("inventory", PRODUCTS[:10], ["naver"], 0, idempotency_key="req-1")
+        await executor.wait(keyed["task_id"])
+        repeat = await executor.submit("inventory", PRODUCTS[:10], ["naver"], 0, idempotency_key="req-1")
+        assert repeat["task_id"] == keyed["task_id"] and repeat["duplicate"]
+
+    async def test_price_tasks_wait_for_approval(self, stub_server):
+        """Test that nothing is sent for a price task until it is approved."""
+        stub_server.json(SYNC_PATHS["price"], {})
+        executor = make_executor(stub_server.url)
+
+        task = await executor.submit("price", PRODUCTS[:10], ["coupang"], 32000)
+        assert (task["status"], task["requires_approval"]) == ("pending_approval", True)
+        await asyncio.sleep(0.05)
+        assert stub_server.requests == []
+
+        approved = await executor.approve(task["task_id"], "김민지")
+        assert approved["approved_by"] == "김민지"
+        assert (await executor.wait(task["task_id"]))["status"] == "completed"
+        with pytest.raises(ValueError):
+            await executor.approve(task["task_id"], "김민지")
+
+        rejected = await executor.submit("price", PRODUCTS[:10], ["naver"], 32000)
+        assert (await executor.reject(rejected["task_id"], "김민지"))["status"] == "rejected"
+        assert len(stub_server.requests) == 1
+
+    async def test_failed_batches_are_retried_then_fail_the_step(self, stub_server):
+        """Test retries of batches the client gave up on, and a step failing after max_attempts."""
+        stub_server.script(SYNC_PATHS["inventory"], (503, {}, b""), OK)
+        executor = make_executor(stub_server.url, batch_concurrency=1)
+
+        task = await executor.submit("inventory", PRODUCTS[:200], ["kakao"], 5)
+        done = await executor.wait(task["task_id"])
+        assert done["status"] == "completed"
+        assert sent_keys(stub_server) == [f"{task['task_id']}:kakao:{i}" for i in (0, 0, 1)]
+
+        stub_server.script(SYNC_PATHS["inventory"], (503, {}, b""))
+        task = await executor.submit("inventory", PRODUCTS[:200], ["naver"], 5)
+        done = await executor.wait(task["task_id"])
+        assert done["status"] == "failed"
+        assert done["steps"][0]["failed_batches"] == 2
+        assert done["steps"][0]["error"] == f"naver: PUT {SYNC_PATHS['inventory']} returned 503"
+
+    async def test_progress_events(self, stub_server):
+        """Test events per status change and per batch, tagged with task, brand and channel topics."""
+        stub_server.json(SYNC_PATHS["inventory"], {})
+        events = []
+        executor = make_executor(stub_server.url, events=events)
+
+        task = await executor.submit("inventory", PRODUCTS[:300], ["coupang"], 0, brand="글로우랩")
+        await executor.wait(task["task_id"])
+
+        assert [message["task"]["status"] for message, _ in events] == [
+            "queued", "running", "running", "running", "running", "completed",
+        ]
+        assert [message["task"]["progress"]["synced"] for message, _ in events[2:5]] == [100, 200, 300]
+        assert events[2][1] == [f"sync:{task['task_id']}", "brand:글로우랩", "channel:coupang"]
+
+    async def test_resumes_unfinished_tasks_from_database(self, stub_server, session_factory):
+        """Test that a new executor finishes an interrupted task without resending synced batches."""
+        stub_server.json(SYNC_PATHS["inventory"], {})
+        store = DatabaseSyncTaskStore(session_factory)
+        first = make_executor(stub_server.url, store, batch_size=10, batch_concurrency=1)
+        task = await first.submit("inventory", PRODUCTS[:100], ["coupang"], 0)
+        while (await first.get(task["task_id"]))["progress"]["synced"] < 30:
+            await asyncio.sleep(0.005)
+        await first.close()
+        interrupted = await first.get(task["task_id"])
+        assert interrupted["status"] == "running"
+
+        second = make_executor(stub_server.url, store, batch_size=10)
+        assert await second.resume() == 1
+        done = await second.wait(task["task_id"])
+
+        assert done["status"] == "completed"
+        keys = sent_keys(stub_server)
+        assert {f"{task['task_id']}:coupang:{i}" for i in range(10)} == set(keys)
+        assert len(keys) <= 11  # At most the batch in flight at cancellation is sent again
+
+    async def test_concurrent_approvals_start_once(self, stub_server, session_factory):
+        """Test that of two workers approving the same task, one starts it and the other is refused."""
+        stub_server.json(SYNC_PATHS["price"], {})
+        store = DatabaseSyncTaskStore(session_factory)
+        first, second = make_executor(stub_server.url, store), make_executor(stub_server.url, store)
+        task = await first.submit("price", PRODUCTS[:10], ["coupang"], 32000)
+
+        results = await asyncio.gather(
+            first.approve(task["task_id"], "김민지"),
+            second.approve(task["task_id"], "박서준"),
+            return_exceptions=True,
+        )
+        await first.wait(task["task_id"])
+        await second.wait(task["task_id"])
+
+        assert sum(isinstance(result, ValueError) for result in results) == 1
+        assert len(stub_server.requests) == 1
+        assert (await first.get(task["task_id"]))["status"] == "completed"
+
+    async def test_each_task_is_resumed_by_one_worker(self, stub_server, session_factory):
+        """Test that a leased task is left alone and a released one is claimed by exactly one worker."""
+        stub_server.json(SYNC_PATHS["inventory"], {})
+        store = DatabaseSyncTaskStore(session_factory)
+        first = make_executor(stub_server.url, store, batch_size=10, batch_concurrency=1)
+        task = await first.submit("inventory", PRODUCTS[:100], ["coupang"], 0)
+        while (await first.get(task["task_id"]))["progress"]["synced"] < 30:
+            await asyncio.sleep(0.005)
+
+        workers = [make_executor(stub_server.url, store, batch_size=10) for _ in range(3)]
+        assert await workers[0].resume() == 0  # Still leased to the first executor
+        await first.close()
+
+        assert [await worker.resume() for worker in workers] == [1, 0, 0]
+        for worker in workers:
+            await worker.wait(task["task_id"])
+
+        assert (await first.get(task["task_id"]))["status"] == "completed"
+        keys = sent_keys(stub_server)
+        assert {f"{task['task_id']}:coupang:{i}" for i in range(10)} == set(keys)
+        assert len(keys) <= 11
+
+    async def test_run_stops_when_another_worker_takes_the_lease(self, stub_server):
+        """Test that a worker whose lease was taken over stops without overwriting the new owner's task."""
+        stub_server.json(SYNC_PATHS["inventory"], {})
+        store = InMemorySyncTaskStore()
+        executor = make_executor(stub_server.url, store, batch_size=10, batch_concurrency=1)
+        task = await executor.submit("inventory", PRODUCTS[:100], ["coupang"], 0)
+        while (await executor.get(task["task_id"]))["progress"]["synced"] < 20:
+            await asyncio.sleep(0.005)
+
+        later = datetime.now().astimezone() + timedelta(hours=1)
+        taken = await store.claim(task["task_id"], ("running",), {"lease_owner": "other"}, later)
+        done = await executor.wait(task["task_id"])
+        sent = len(stub_server.requests)
+        await asyncio.sleep(0.05)
+
+        assert done["status"] == "running"
+        assert done["progress"]["synced"] == taken["steps"][0]["synced"]
+        assert (await store.load(task["task_id"]))["lease_owner"] == "other"
+        assert len(stub_server.requests) == sent < 10
+
+    async def test_run_stops_when_renewal_fails(self, stub_server):
+        """Test that a run is cancelled once its lease can no longer be renewed."""
+
+        class FailingRenewalStore(InMemorySyncTaskStore):
+            async def renew(self, task_ids, owner, expires_at):
+                raise ConnectionError("database unavailable")
+
+        stub_server.json(SYNC_PATHS["inventory"], {})
+        executor = make_executor(
+            stub_server.url, FailingRenewalStore(), batch_size=1, batch_concurrency=1, lease_s=0.06
+        )
+        task = await executor.submit("inventory", PRODUCTS[:100], ["coupang"], 0)
+        done = await executor.wait(task["task_id"])
+
+        assert done["status"] == "running"
+        assert done["progress"]["synced"] < 100
+
+    async def test_guarded_save_needs_the_lease(self, session_factory):
+        """Test that a save on behalf of a lease owner leaves a task leased to someone else untouched."""
+        store = DatabaseSyncTaskStore(session_factory)
+        executor = ChannelSyncExecutor(store, publish=None)
+        task = await executor.submit("price", PRODUCTS[:10], ["coupang"], 32000)
+        later = datetime.now().astimezone() + timedelta(hours=1)
+        claimed = await store.claim(task["task_id"], ("pending_approval",), {"lease_owner": "other"}, later)
+
+        assert not await store.save({**claimed, "status": "failed"}, owner=executor.worker_id)
+        assert (await store.load(task["task_id"]))["status"] == "pending_approval"
+        assert await store.save({**claimed, "status": "queued"}, owner="other")
+        assert (await store.load(task["task_id"]))["status"] == "queued"
+
+    def test_estimate_for_rate_limited_channels(self):
+        """Test that a 500-product price sync fits the channel rate limits in minutes."""
+        seconds = estimate_sync_seconds(CHANNELS, 500, batch_size=100)
+
+        # Oliveyoung is the slowest: one burst token, then one request per 72s
+        assert seconds == 4 * 72
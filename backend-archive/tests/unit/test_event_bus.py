@@ -0,0 +1,74 @@
+"""Unit tests for the cross-worker WebSocket event bus."""
+
+import asyncio
+
+from backend.api.event_bus import EventBus, InMemoryBackplane
+from backend.api.websocket import ConnectionManager
+from tests.unit.test_websocket_manager import FakeWebSocket, drain
+
+
+async def make_worker(backplane: InMemoryBackplane) -> tuple[EventBus, FakeWebSocket]:
+    """A bus plus one socket subscribed to every topic."""
+    manager = ConnectionManager(queue_size=64)
+    ws = FakeWebSocket()
+    connection = await manager.connect(ws, "client")
+    manager.subscriptions.subscribe(connection, ["*"])
+    bus = EventBus(manager, backplane, batch_size=100, flush_interval=60, dedup_size=100)
+    bus.start()
+    return bus, ws
+
+
+class TestEventBus:
+    """Test cross-worker delivery, batching and duplicate suppression."""
+
+    async def test_event_reaches_sockets_on_every_worker(self):
+        """Test that one publish is delivered once on each worker, batched."""
+        backplane = InMemoryBackplane()
+        bus_a, ws_a = await make_worker(backplane)
+        bus_b, ws_b = await make_worker(backplane)
+        await asyncio.sleep(0)
+
+        for n in range(5):
+            await bus_a.publish({"n": n}, topics=["channel:coupang"])
+        assert await bus_a.flush() == 5
+        await drain()
+
+        assert [m["n"] for m in ws_a.sent] == [0, 1, 2, 3, 4]
+        assert [m["n"] for m in ws_b.sent] == [0, 1, 2, 3, 4]
+        assert bus_a.stats["batches_sent"] == 1
+
+        await bus_a.stop()
+        await bus_b.stop()
+
+    async def test_duplicate_event_ids_are_suppressed(self):
+        """Test that an event id published twice is delivered once."""
+        backplane = InMemoryBackplane()
+        bus_a, ws_a = await make_worker(backplane)
+        bus_b, ws_b = await make_worker(backplane)
+        await asyncio.sleep(0)
+
+        await bus_a.publish({"type": "alert"}, event_id="alert:1")
+        await bus_b.publish({"type": "alert"}, event_id="alert:1")
+        await bus_a.flush()
+        await bus_b.flush()
+        await drain()
+
+        assert ws_a.sent == [{"type": "alert"}]
+        assert ws_b.sent == [{"type": "alert"}]
+        assert bus_a.stats["duplicates"] == 1
+
+        await bus_a.stop()
+        await bus_b.stop()
+
+    async def test_publish_without_listener_delivers_locally(self):
+        """Test that a stopped bus still reaches local sockets."""
+        manager = ConnectionManager(queue_size=8)
+        ws = FakeWebSocket()
+        connection = await manager.connect(ws, "client")
+        manager.subscriptions.subscribe(connection, ["severity:critical"])
+        bus = EventBus(manager, InMemoryBackplane())
+
+        await bus.publish({"type": "alert"}, topics=["severity:critical"])
+        await drain()
+
+        assert ws.sent == [{"type": "alert"}]
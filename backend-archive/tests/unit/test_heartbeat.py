@@ -0,0 +1,101 @@
+"""Unit tests for server heartbeats and idle reaping."""
+
+import time
+
+from backend.api.heartbeat import IDLE_CLOSE_CODE, HeartbeatMonitor
+from backend.api.websocket import ConnectionManager
+from tests.unit.test_websocket_manager import FakeWebSocket, drain
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_manager(clock: FakeClock) -> ConnectionManager:
+    manager = ConnectionManager(queue_size=8)
+    manager.heartbeat = HeartbeatMonitor(manager, interval=20, timeout=60, clock=clock)
+    return manager
+
+
+class TestHeartbeatMonitor:
+    """Test heartbeat scheduling, RTT and reaping."""
+
+    async def test_heartbeat_then_reap(self):
+        """Test that silent clients get a heartbeat, then are closed at the timeout."""
+        clock = FakeClock()
+        manager = make_manager(clock)
+        silent, chatty = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(silent, "silent")
+        chatty_conn = await manager.connect(chatty, "chatty")
+
+        clock.now += 21
+        manager.heartbeat.check()
+        await drain()
+        assert silent.sent[-1]["type"] == "heartbeat"
+        assert manager.heartbeat.heartbeats_sent == 2
+
+        clock.now += 0.25
+        manager.heartbeat.record_ack(chatty_conn)
+        assert manager.heartbeat.rtt_last == 0.25
+
+        clock.now += 40
+        manager.heartbeat.touch(chatty_conn)
+        assert manager.heartbeat.check() == 1
+        await drain()
+
+        assert list(manager.active_connections) == ["chatty"]
+        assert silent.closed_with == IDLE_CLOSE_CODE
+        assert manager.heartbeat.snapshot()["reaped"] == 1
+
+    async def test_active_clients_are_not_pinged(self):
+        """Test that a client sending traffic never receives heartbeats."""
+        clock = FakeClock()
+        manager = make_manager(clock)
+        ws = FakeWebSocket()
+        connection = await manager.connect(ws, "active")
+
+        for _ in range(10):
+            clock.now += 15
+            manager.heartbeat.touch(connection)
+            manager.heartbeat.check()
+        await drain()
+
+        assert manager.heartbeat.heartbeats_sent == 0
+        assert manager.connection_count == 1
+
+    async def test_fifty_thousand_connections(self):
+        """Test heartbeat and reaping passes over 50k connections with one heap."""
+        clock = FakeClock()
+        manager = make_manager(clock)
+        connections = [manager.register(FakeWebSocket(), f"client-{i}") for i in range(50_000)]
+
+        # Nothing is due yet: the check only peeks at the heap
+        start = time.perf_counter()
+        assert manager.heartbeat.check() == 0
+        assert time.perf_counter() - start < 0.01
+
+        clock.now += 21
+        start = time.perf_counter()
+        manager.heartbeat.check()
+        heartbeat_pass = time.perf_counter() - start
+        assert manager.heartbeat.heartbeats_sent == 50_000
+
+        # Half the clients answer
+        clock.now += 0.1
+        for connection in connections[::2]:
+            manager.heartbeat.record_ack(connection)
+
+        clock.now += 40
+        start = time.perf_counter()
+        reaped = manager.heartbeat.check()
+        reap_pass = time.perf_counter() - start
+        await drain()
+
+        assert reaped == 25_000
+        assert manager.connection_count == 25_000
+        assert manager.heartbeat.rtt_count == 25_000
+        assert heartbeat_pass < 2.0 and reap_pass < 2.0
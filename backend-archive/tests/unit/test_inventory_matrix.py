@@ -0,0 +1,106 @@
+"""Unit tests for batched inventory reads and vectorized reorder point checks."""
+
+import numpy as np
+
+from backend.db.inventory import load_inventory_matrix
+from backend.inventory import InventoryMatrix, check_stock_levels, find_reorder_breaches
+from backend.models import Inventory, Product
+
+
+def level(product_id, channel, stock, daily_sales, name=None):
+    return {
+        "product_id": product_id,
+        "product_name": name or product_id,
+        "channel": channel,
+        "current_stock": stock,
+        "daily_sales_avg": daily_sales,
+    }
+
+
+class TestInventoryMatrix:
+    """Test the dense matrix and the vectorized checks."""
+
+    def test_from_rows(self):
+        """Test that missing listings stay unlisted and products without inventory get a row."""
+        matrix = InventoryMatrix.from_rows([
+            level("serum", "coupang", 50, 10),
+            level("serum", "naver", 80, 4),
+            level("toner", None, None, None),
+            level("serum", "gmarket", 999, 1),
+        ])
+
+        assert matrix.product_ids == ["serum", "toner"]
+        assert matrix.stock.tolist() == [[0, 50, 80, 0], [0, 0, 0, 0]]
+        assert matrix.listed.tolist() == [[False, True, True, False], [False, False, False, False]]
+
+    def test_stock_levels(self):
+        """Test days of supply, reorder points and statuses per cell."""
+        matrix = InventoryMatrix.from_rows([
+            level("serum", "oliveyoung", 0, 0),
+            level("serum", "coupang", 50, 10),
+            level("serum", "naver", 100, 10),
+            level("serum", "kakao", 500, 10),
+            level("toner", "coupang", 30, 0),
+        ])
+
+        levels = check_stock_levels(matrix)
+
+        assert levels.days_of_supply[0].tolist() == [0.0, 5.0, 10.0, 50.0]
+        assert np.isinf(levels.days_of_supply[1, 1])
+        assert levels.reorder_point[0].tolist() == [0, 140, 140, 140]
+        assert levels.status.tolist() == [[4, 3, 2, 1], [0, 1, 0, 0]]
+
+    def test_reorder_breaches(self):
+        """Test breaches ordered by days of supply, counts per channel and the detail limit."""
+        matrix = InventoryMatrix.from_rows([
+            level("serum", "coupang", 50, 10),
+            level("serum", "naver", 100, 10),
+            level("toner", "coupang", 0, 5),
+            level("toner", "naver", 1000, 5),
+        ])
+
+        report = find_reorder_breaches(matrix, limit=2)
+
+        assert (report["products_checked"], report["listings_checked"]) == (2, 4)
+        assert (report["critical_count"], report["warning_count"]) == (2, 1)
+        assert [(b["product_id"], b["channel"], b["status"], b["severity"]) for b in report["breaches"]] == [
+            ("toner", "coupang", "out_of_stock", "critical"),
+            ("serum", "coupang", "critical", "critical"),
+        ]
+        assert report["by_channel"]["coupang"] == {
+            "not_listed": 0, "healthy": 0, "low_stock": 0, "critical": 1, "out_of_stock": 1,
+        }
+        assert report["by_channel"]["naver"]["low_stock"] == 1
+
+
+class TestLoadInventoryMatrix:
+    """Test the batched database read."""
+
+    async def test_reads_requested_products_in_batches(self, session_factory):
+        """Test that batched reads cover every requested product across channels."""
+        async with session_factory() as session:
+            products = [
+                Product(name=f"세럼 {i}", category="스킨케어", brand="글로우랩" if i % 2 else "라운드랩", price=30000)
+                for i in range(7)
+            ]
+            session.add_all(products)
+            await session.flush()
+            session.add_all([
+                Inventory(product_id=product.id, channel=channel, current_stock=i * 10, daily_sales_avg=i)
+                for i, product in enumerate(products[:6])
+                for channel in ("coupang", "naver")
+            ])
+            await session.commit()
+
+        async with session_factory() as session:
+            ids = [product.id for product in products]
+            matrix = await load_inventory_matrix(session, ids + ids[:2], batch_size=3)
+            brand = await load_inventory_matrix(session, brand="글로우랩")
+
+        assert sorted(matrix.product_ids) == sorted(ids)
+        assert int(matrix.listed.sum()) == 12
+        row = matrix.product_ids.index(products[6].id)
+        assert not matrix.listed[row].any()
+
+        assert len(brand) == 3
+        assert brand.stock.sum() == (10 + 30 + 50) * 2
@@ -0,0 +1,192 @@
+"""Unit tests for the background job scheduler and precomputed reports."""
+
+import asyncio
+import random
+
+from backend.db.pricing import record_channel_prices
+from backend.jobs import InMemoryResultCache, Job, JobScheduler
+from backend.jobs.precompute import inventory_alerts, price_consistency
+from backend.jobs.scheduler import ALL_BRANDS, lock_key
+from backend.models import Inventory, Product
+
+
+class FakeJob:
+    """Job function that counts calls and can be slowed down or broken."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self, scheduler: JobScheduler, brand_id: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("warehouse API down")
+        return {"brand_id": brand_id, "calls": self.calls}
+
+
+def make_scheduler(func: FakeJob, interval: float = 3600, **kwargs) -> JobScheduler:
+    return JobScheduler(
+        [Job("report", func, interval)],
+        **{"cache": InMemoryResultCache(), "brands": ["글로우랩", "라운드랩"], "rng": random.Random(1), **kwargs},
+    )
+
+
+class TestJobScheduler:
+    """Test runs, overlap prevention, jitter and cached reads."""
+
+    async def test_run_caches_result_and_metrics(self):
+        """Test that a run's result is readable and its duration recorded."""
+        func = FakeJob()
+        scheduler = make_scheduler(func)
+
+        assert await scheduler.run_all("report") == 2
+        entry = await scheduler.get("report", "라운드랩")
+
+        assert entry["value"] == {"brand_id": "라운드랩", "calls": 2}
+        assert entry["age_s"] >= 0
+        metrics = scheduler.stats()["jobs"]["report"]
+        assert (metrics["runs"], metrics["failures"], metrics["cache_hits"]) == (2, 0, 1)
+        assert metrics["last_success"] is not None
+
+    async def test_overlapping_runs_are_skipped(self):
+        """Test that a run is skipped while the same job and brand is running here or elsewhere."""
+        func = FakeJob(delay=0.05)
+        scheduler = make_scheduler(func)
+
+        first, second = await asyncio.gather(scheduler.run("report", "글로우랩"), scheduler.run("report", "글로우랩"))
+        assert first is not None and second is None
+
+        # A lock held by another worker sharing the cache
+        await scheduler.cache.acquire(lock_key("report", "라운드랩"), 60)
+        assert await scheduler.run("report", "라운드랩") is None
+
+        assert func.calls == 1
+        assert scheduler.stats()["jobs"]["report"]["skipped"] == 2
+
+    async def test_read_joins_run_in_progress(self):
+        """Test that a cache miss waits for the running job instead of starting another."""
+        func = FakeJob(delay=0.05)
+        scheduler = make_scheduler(func)
+
+        run = asyncio.create_task(scheduler.run("report", "글로우랩"))
+        await asyncio.sleep(0.01)
+        entry = await scheduler.get("report", "글로우랩")
+        await run
+
+        assert entry["value"]["calls"] == 1
+        assert func.calls == 1
+
+    async def test_failure_keeps_previous_result(self):
+        """Test that a failed run is counted and the last good result is still served."""
+        func = FakeJob()
+        scheduler = make_scheduler(func)
+        await scheduler.run("report", "글로우랩")
+
+        func.fail = True
+        assert await scheduler.run("report", "글로우랩") is None
+
+        assert (await scheduler.get("report", "글로우랩"))["value"]["calls"] == 1
+        metrics = scheduler.stats()["jobs"]["report"]
+        assert (metrics["runs"], metrics["failures"], metrics["last_error"]) == (2, 1, "warehouse API down")
+
+    async def test_job_not_per_brand_runs_once(self):
+        """Test that a catalog-wide job runs once under ALL_BRANDS rather than per brand."""
+        func = FakeJob()
+        scheduler = JobScheduler(
+            [Job("rankings", func, 3600, per_brand=False)],
+            cache=InMemoryResultCache(),
+            brands=["글로우랩", "라운드랩"],
+        )
+
+        assert await scheduler.run_all("rankings") == 1
+        assert (await scheduler.get("rankings", ALL_BRANDS))["value"]["brand_id"] == ALL_BRANDS
+
+    def test_next_delay_is_jittered_within_bounds(self):
+        """Test that delays spread over interval +/- jitter."""
+        scheduler = make_scheduler(FakeJob(), jitter=0.2)
+        job = scheduler.jobs["report"]
+
+        delays = [scheduler.next_delay(job) for _ in range(1000)]
+
+        assert all(2880 <= delay <= 4320 for delay in delays)
+        assert max(delays) - min(delays) > 1000
+
+    async def test_local_executor_runs_periodically(self):
+        """Test that start runs every brand repeatedly until stopped."""
+        func = FakeJob()
+        scheduler = make_scheduler(func, interval=0.02)
+
+        scheduler.start()
+        await asyncio.sleep(0.15)
+        await scheduler.stop()
+
+        calls = func.calls
+        assert calls >= 6
+        await asyncio.sleep(0.05)
+        assert func.calls == calls
+
+
+class TestPrecompute:
+    """Test the precomputation jobs against a database."""
+
+    async def test_inventory_alerts(self, session_factory):
+        """Test severities by days of supply, fewest days first."""
+        async with session_factory() as session:
+            serum = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", price=38000)
+            toner = Product(name="독도 토너", category="스킨케어", brand="라운드랩", price=23000)
+            session.add_all([serum, toner])
+            await session.flush()
+            session.add_all([
+                Inventory(product_id=serum.id, channel="coupang", current_stock=50, daily_sales_avg=10),
+                Inventory(product_id=serum.id, channel="naver", current_stock=100, daily_sales_avg=10),
+                Inventory(product_id=serum.id, channel="kakao", current_stock=500, daily_sales_avg=10),
+                Inventory(product_id=serum.id, channel="oliveyoung", current_stock=0, daily_sales_avg=0),
+                Inventory(product_id=toner.id, channel="coupang", current_stock=0, daily_sales_avg=5),
+            ])
+            await session.commit()
+
+        scheduler = JobScheduler([], cache=InMemoryResultCache(), session_factory=session_factory)
+        report = await inventory_alerts(scheduler, "글로우랩")
+
+        assert report["products_checked"] == 4
+        assert [(a["channel"], a["days_of_supply"], a["severity"]) for a in report["alerts"]] == [
+            ("oliveyoung", 0.0, "critical"),
+            ("coupang", 5.0, "critical"),
+            ("naver", 10.0, "warning"),
+        ]
+
+    async def test_price_consistency_is_cached_per_brand(self, session_factory):
+        """Test that the scan is run through the scheduler and served from cache."""
+        async with session_factory() as session:
+            serum = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", price=38000)
+            toner = Product(name="독도 토너", category="스킨케어", brand="라운드랩", price=23000)
+            session.add_all([serum, toner])
+            await session.flush()
+            await record_channel_prices(session, [
+                {"product_id": product.id, "channel": channel, "brand": product.brand,
+                 "regular_price": product.price, "sale_price": sale_price}
+                for product, channel, sale_price in [
+                    (serum, "coupang", 30000),
+                    (serum, "naver", 36000),
+                    (toner, "naver", 15000),
+                    (toner, "kakao", 23000),
+                ]
+            ])
+            await session.commit()
+
+        scheduler = JobScheduler(
+            [Job("price_consistency", price_consistency, 3600)],
+            cache=InMemoryResultCache(),
+            session_factory=session_factory,
+        )
+
+        assert await scheduler.list_brands() == ["글로우랩", "라운드랩"]
+        entry = await scheduler.get("price_consistency", "글로우랩")
+        assert [v["product_id"] for v in entry["value"]["violations"]] == [str(serum.id)]
+        assert entry["value"]["critical_count"] == 1
+
+        await scheduler.get("price_consistency", "글로우랩")
+        metrics = scheduler.stats()["jobs"]["price_consistency"]
+        assert (metrics["runs"], metrics["cache_hits"], metrics["cache_misses"]) == (1, 1, 1)
@@ -0,0 +1,180 @@
+"""Unit tests for batched Kakao Channel message dispatch against a local stub server."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from backend.agents.divisions.channel_management.kakao_agent import (
+    get_kakao_dispatch_status,
+    send_kakao_channel_message,
+)
+from backend.channels import (
+    ChannelClient,
+    DatabaseCheckpointStore,
+    InMemoryCheckpointStore,
+    InMemoryRateLimitBackend,
+    KakaoMessageDispatcher,
+    kakao_dispatch,
+)
+from backend.channels.kakao_dispatch import KAKAO_CHANNEL_MESSAGE_PATH
+
+# No pacing, effectively unlimited tokens
+FAST_CONFIG = {"max_requests_per_hour": 3_600_000, "burst": 100, "base_delay": 0, "random_delay": (0, 0)}
+
+RECIPIENTS = [f"user{i:05d}" for i in range(2500)]
+CONTENT = {"text": "봄 세일 시작!"}
+
+
+def make_dispatcher(url: str, store=None, config=FAST_CONFIG, max_retries=None, **kwargs) -> KakaoMessageDispatcher:
+    client = ChannelClient(
+        "kakao",
+        base_url=url,
+        config=config,
+        backoff=0.001,
+        max_retries=max_retries,
+        rate_limit_backend=InMemoryRateLimitBackend(),
+    )
+    return KakaoMessageDispatcher(client, store or InMemoryCheckpointStore(), **{"batch_size": 1000, **kwargs})
+
+
+def sent_batches(stub) -> list[tuple[str, list[str]]]:
+    return [
+        (request["headers"]["Idempotency-Key"], json.loads(request["body"])["receiver_ids"])
+        for request in stub.requests
+    ]
+
+
+class TestKakaoMessageDispatcher:
+    """Test batching, per-batch status, resume and throughput."""
+
+    async def test_sends_every_recipient_in_batches(self, stub_server):
+        """Test API-sized batches, each with its own idempotency key."""
+        stub_server.json(KAKAO_CHANNEL_MESSAGE_PATH, {"result": "ok"})
+        dispatcher = make_dispatcher(stub_server.url)
+
+        report = await dispatcher.dispatch("spring-sale", "_xkAbc", "text", CONTENT, RECIPIENTS)
+
+        batches = sorted(sent_batches(stub_server))
+        assert [(key, len(ids)) for key, ids in batches] == [
+            ("spring-sale:0", 1000), ("spring-sale:1", 1000), ("spring-sale:2", 500),
+        ]
+        assert sorted(i for _, ids in batches for i in ids) == RECIPIENTS
+        assert (report["status"], report["sent"], report["cursor"], report["failed_batches"]) == (
+            "completed", 2500, 3, [],
+        )
+        assert report["throughput"]["recipients_sent"] == 2500
+        assert report["throughput"]["recipients_per_s"] > 0
+
+    async def test_rejected_receivers_mark_batch_partial(self, stub_server):
+        """Test that receivers the API rejects are counted, not resent."""
+        stub_server.json(KAKAO_CHANNEL_MESSAGE_PATH, {"failed_receivers": ["user00007"]})
+        dispatcher = make_dispatcher(stub_server.url)
+
+        report = await dispatcher.dispatch("blocked", "_xkAbc", "text", CONTENT, RECIPIENTS[:10])
+        again = await dispatcher.dispatch("blocked", "_xkAbc", "text", CONTENT, RECIPIENTS[:10])
+
+        assert (report["status"], report["sent"], report["rejected_receivers"]) == ("completed", 9, 1)
+        assert again["throughput"]["batches_attempted"] == 0
+        assert len(stub_server.requests) == 1
+
+    async def test_resumes_failed_batches_from_checkpoint(self, stub_server, session_factory):
+        """Test that a new dispatcher resends only the batches that failed."""
+        store = DatabaseCheckpointStore(session_factory)
+        ok = (200, {"Content-Type": "application/json"}, b"{}")
+        stub_server.script(KAKAO_CHANNEL_MESSAGE_PATH, ok, ok, (503, {}, b""))
+        first = await make_dispatcher(stub_server.url, store, concurrency=1, max_retries=0).dispatch(
+            "restock", "_xkAbc", "text", CONTENT, RECIPIENTS
+        )
+
+        assert (first["status"], first["cursor"], first["sent"]) == ("incomplete", 2, 2000)
+        assert first["failed_batches"] == [
+            {"index": 2, "attempts": 1, "error": f"kakao: POST {KAKAO_CHANNEL_MESSAGE_PATH} returned 503"}
+        ]
+
+        stub_server.script(KAKAO_CHANNEL_MESSAGE_PATH, ok)
+        second = await make_dispatcher(stub_server.url, store).dispatch(
+            "restock", "_xkAbc", "text", CONTENT, RECIPIENTS
+        )
+
+        assert [key for key, _ in sent_batches(stub_server)] == ["restock:0", "restock:1", "restock:2", "restock:2"]
+        assert (second["status"], second["cursor"], second["sent"]) == ("completed", 3, 2500)
+        assert second["throughput"]["recipients_sent"] == 500
+
+    async def test_retries_a_batch_with_its_idempotency_key(self, stub_server):
+        """Test that a batch hit by a 5xx is resent under the same key within the dispatch."""
+        ok = (200, {"Content-Type": "application/json"}, b"{}")
+        stub_server.script(KAKAO_CHANNEL_MESSAGE_PATH, (503, {}, b""), ok)
+
+        report = await make_dispatcher(stub_server.url).dispatch("retry", "_xkAbc", "text", CONTENT, RECIPIENTS[:10])
+
+        assert [key for key, _ in sent_batches(stub_server)] == ["retry:0", "retry:0"]
+        assert (report["status"], report["sent"], report["failed_batches"]) == ("completed", 10, [])
+
+    async def test_resumes_after_interruption(self, stub_server):
+        """Test that a cancelled dispatch resumes from its cursor without redoing finished batches."""
+        stub_server.json(KAKAO_CHANNEL_MESSAGE_PATH, {})
+        store = InMemoryCheckpointStore()
+        slow = {**FAST_CONFIG, "max_requests_per_hour": 72_000, "burst": 1}  # 20 requests/s
+        task = asyncio.create_task(
+            make_dispatcher(stub_server.url, store, config=slow, batch_size=100).dispatch(
+                "flash", "_xkAbc", "text", CONTENT, RECIPIENTS[:1000]
+            )
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        cursor = (await store.load("flash"))["cursor"]
+        assert 0 < cursor < 10
+
+        report = await make_dispatcher(stub_server.url, store, batch_size=100).dispatch(
+            "flash", "_xkAbc", "text", CONTENT, RECIPIENTS[:1000]
+        )
+        keys = [key for key, _ in sent_batches(stub_server)]
+        assert {f"flash:{i}" for i in range(10)} == set(keys)
+        assert len(keys) <= 11  # At most the batch in flight at cancellation is sent again
+        assert (report["status"], report["sent"]) == ("completed", 1000)
+
+    async def test_rate_limit_bounds_throughput(self, stub_server):
+        """Test that concurrent batches still wait for the channel rate limit."""
+        stub_server.json(KAKAO_CHANNEL_MESSAGE_PATH, {})
+        slow = {**FAST_CONFIG, "max_requests_per_hour": 72_000, "burst": 1}
+        dispatcher = make_dispatcher(stub_server.url, config=slow, batch_size=100, concurrency=4)
+
+        start = time.perf_counter()
+        report = await dispatcher.dispatch("paced", "_xkAbc", "text", CONTENT, RECIPIENTS[:500])
+
+        assert time.perf_counter() - start >= 0.19
+        assert report["throughput"]["batches_per_s"] <= 25
+
+    async def test_rejects_a_different_recipient_list(self, stub_server):
+        """Test that resuming with other recipients is refused."""
+        stub_server.json(KAKAO_CHANNEL_MESSAGE_PATH, {})
+        dispatcher = make_dispatcher(stub_server.url)
+        await dispatcher.dispatch("weekly", "_xkAbc", "text", CONTENT, RECIPIENTS[:10])
+
+        with pytest.raises(ValueError):
+            await dispatcher.dispatch("weekly", "_xkAbc", "text", CONTENT, RECIPIENTS[10:20])
+
+
+class TestKakaoMessageTools:
+    """Test the agent tools on top of the shared dispatcher."""
+
+    async def test_send_then_status(self, stub_server, monkeypatch):
+        """Test that the send tool dispatches and its dispatch ID reports status."""
+        stub_server.json(KAKAO_CHANNEL_MESSAGE_PATH, {})
+        monkeypatch.setattr(kakao_dispatch, "_dispatcher", make_dispatcher(stub_server.url))
+        message = {"channel_id": "_xkAbc", "message_type": "text", "content": CONTENT}
+
+        report = await send_kakao_channel_message.ainvoke({**message, "recipients": RECIPIENTS[:1500]})
+        status = await get_kakao_dispatch_status.ainvoke({"dispatch_id": report["dispatch_id"]})
+        mismatch = await send_kakao_channel_message.ainvoke(
+            {**message, "recipients": RECIPIENTS[:10], "dispatch_id": report["dispatch_id"]}
+        )
+
+        assert (report["status"], report["sent"], report["batches"]) == ("completed", 1500, 2)
+        assert (status["status"], status["sent"], status["cursor"]) == ("completed", 1500, 2)
+        assert "different recipient list" in mismatch["error"]
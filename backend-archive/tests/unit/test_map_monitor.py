@@ -0,0 +1,188 @@
+"""Unit tests for the streaming MAP violation detector."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from backend.db.alert_writer import AlertWriter
+from backend.db.pricing import ingest_price_observations, load_map_violations
+from backend.models import Alert, Product
+from backend.models.alert import AlertSeverity, AlertType
+from backend.pricing import (
+    MapViolationDetector,
+    PriceObservation,
+    map_violation_severity,
+    record_map_alerts,
+)
+
+T0 = datetime(2026, 3, 1, 9, 0)
+
+
+def at(minutes: int) -> datetime:
+    return T0 + timedelta(minutes=minutes)
+
+
+def make_detector(**kwargs) -> MapViolationDetector:
+    detector = MapViolationDetector(**kwargs)
+    detector.set_map_prices({"serum": 35000, "cream": 65000}, {"serum": "글로우랩", "cream": "글로우랩"})
+    return detector
+
+
+class TestMapViolationSeverity:
+    """Test the severity tiers."""
+
+    def test_tiers(self):
+        """Test critical, high, medium and low boundaries."""
+        assert map_violation_severity(0.51, authorized=True) == "critical"
+        assert map_violation_severity(0.25, authorized=False) == "high"
+        assert map_violation_severity(0.25, authorized=True) == "medium"
+        assert map_violation_severity(0.10, authorized=False) == "medium"
+        assert map_violation_severity(0.05, authorized=False) == "low"
+
+
+class TestMapViolationDetector:
+    """Test event emission and incremental state."""
+
+    def test_opens_once_and_dedups_repeat_sightings(self):
+        """Test that a violation opens once and repeats only move last_seen."""
+        detector = make_detector()
+
+        events = detector.observe_many([
+            PriceObservation("coupang", "BeautyDeals", "serum", 28000, at(0)),
+            PriceObservation("coupang", "BeautyDeals", "serum", 28000, at(10)),
+            PriceObservation("coupang", "BeautyDeals", "serum", 28000, at(20)),
+            PriceObservation("naver", "Official", "serum", 35000, at(20)),
+        ])
+
+        (opened,) = events
+        assert opened["event"] == "opened"
+        assert opened["severity"] == "medium"
+        assert opened["discount_from_map"] == 0.2
+        (violation,) = detector.active_violations()
+        assert violation["first_seen"] == at(0).isoformat()
+        assert violation["last_seen"] == at(20).isoformat()
+        assert violation["observations"] == 3
+
+    def test_escalates_and_resolves(self):
+        """Test severity changes and resolution at or above MAP."""
+        detector = make_detector()
+
+        events = detector.observe_many([
+            PriceObservation("11st", "GlobalBeauty", "cream", 55000, at(0)),
+            PriceObservation("11st", "GlobalBeauty", "cream", 32000, at(5)),
+            PriceObservation("11st", "GlobalBeauty", "cream", 65000, at(10)),
+            PriceObservation("11st", "GlobalBeauty", "cream", 66000, at(15)),
+        ])
+
+        assert [(e["event"], e["severity"]) for e in events] == [
+            ("opened", "medium"),
+            ("escalated", "critical"),
+            ("resolved", "critical"),
+        ]
+        assert events[-1]["lowest_price"] == 32000
+        assert detector.active_violations() == []
+        assert detector.stats()["tracked_listings"] == 0
+
+    def test_late_arrival_updates_history_only(self):
+        """Test that an out-of-order observation does not change current state."""
+        detector = make_detector()
+        detector.observe(PriceObservation("coupang", "BeautyDeals", "serum", 30000, at(10)))
+
+        assert detector.observe(PriceObservation("coupang", "BeautyDeals", "serum", 20000, at(5))) is None
+        assert detector.observe(PriceObservation("coupang", "BeautyDeals", "serum", 36000, at(6))) is None
+
+        (violation,) = detector.active_violations()
+        assert violation["first_seen"] == at(5).isoformat()
+        assert violation["last_seen"] == at(10).isoformat()
+        assert (violation["price"], violation["lowest_price"]) == (30000, 20000)
+
+    def test_authorized_sellers_and_filters(self):
+        """Test the unauthorized tier and platform / brand filtering."""
+        detector = make_detector(authorized_sellers=[("naver", "Official")])
+        detector.observe_many([
+            PriceObservation("naver", "Official", "serum", 27000, at(0)),
+            PriceObservation("coupang", "BeautyDeals", "serum", 27000, at(0)),
+            PriceObservation("coupang", "BeautyDeals", "unknown", 1000, at(0)),
+        ])
+
+        severities = {v["seller"]: v["severity"] for v in detector.active_violations()}
+        assert severities == {"BeautyDeals": "high", "Official": "medium"}
+        assert [v["seller"] for v in detector.active_violations(platforms=["naver"])] == ["Official"]
+        assert detector.active_violations(brand="라운드랩") == []
+        assert detector.stats()["unknown_products"] == 1
+
+    async def test_refresh_loads_map_prices(self, session_factory):
+        """Test that MAP prices are read from products with a map_price."""
+        async with session_factory() as session:
+            serum = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", price=38000, map_price=35000)
+            toner = Product(name="독도 토너", category="스킨케어", brand="라운드랩", price=23000)
+            session.add_all([serum, toner])
+            await session.commit()
+
+        detector = MapViolationDetector(refresh_interval=300)
+        await detector.ensure_fresh(session_factory)
+
+        assert detector.map_prices == {str(serum.id): 35000}
+        assert detector.brands == {str(serum.id): "글로우랩"}
+
+
+class TestIngestPriceObservations:
+    """Test violation state persisted across detectors."""
+
+    async def test_violations_survive_a_new_detector(self, session_factory):
+        """Test that a second detector (another worker, or a restart) continues open violations."""
+        async with session_factory() as session:
+            serum = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", price=38000, map_price=35000)
+            session.add(serum)
+            await session.commit()
+        serum_id = str(serum.id)
+
+        async with session_factory() as session:
+            events = await ingest_price_observations(session, [
+                PriceObservation("coupang", "BeautyDeals", serum_id, 28000, at(0)),
+                PriceObservation("naver", "Official", serum_id, 30000, at(0)),
+                PriceObservation("coupang", "BeautyDeals", "unknown", 1000, at(0)),
+            ], detector=MapViolationDetector())
+            await session.commit()
+        assert [e["event"] for e in events] == ["opened", "opened"]
+
+        async with session_factory() as session:
+            events = await ingest_price_observations(session, [
+                PriceObservation("coupang", "BeautyDeals", serum_id, 26000, at(10)),
+                PriceObservation("naver", "Official", serum_id, 36000, at(10)),
+            ], detector=MapViolationDetector())
+            await session.commit()
+
+        assert [(e["event"], e["seller"]) for e in events] == [
+            ("escalated", "BeautyDeals"),
+            ("resolved", "Official"),
+        ]
+        async with session_factory() as session:
+            (violation,) = await load_map_violations(session, brand="글로우랩")
+            assert await load_map_violations(session, platforms=["naver"]) == []
+        assert violation["severity"] == "high"
+        assert (violation["observations"], violation["lowest_price"]) == (2, 26000)
+        assert violation["product_id"] == serum_id
+
+
+class TestRecordMapAlerts:
+    """Test turning violation events into alerts."""
+
+    async def test_alerts_for_opened_and_escalated_only(self, session_factory):
+        """Test that resolved and de-escalated events are not alerted."""
+        detector = make_detector()
+        events = detector.observe_many([
+            PriceObservation("coupang", "BeautyDeals", "cream", 55000, at(0)),
+            PriceObservation("coupang", "BeautyDeals", "cream", 30000, at(5)),
+            PriceObservation("coupang", "BeautyDeals", "cream", 55000, at(10)),
+            PriceObservation("coupang", "BeautyDeals", "cream", 70000, at(15)),
+        ])
+        writer = AlertWriter(session_factory, batch_size=100, flush_interval=60)
+
+        assert await record_map_alerts(events, writer) == 2
+        await writer.flush()
+
+        async with session_factory() as session:
+            alerts = (await session.execute(select(Alert).order_by(Alert.severity))).scalars().all()
+        assert {alert.severity for alert in alerts} == {AlertSeverity.WARNING, AlertSeverity.CRITICAL}
+        assert all(alert.alert_type == AlertType.PRICE and alert.channel == "coupang" for alert in alerts)
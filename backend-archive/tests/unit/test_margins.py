@@ -0,0 +1,109 @@
+"""Unit tests for the vectorized margin grid and closed-form discount limits."""
+
+import math
+import uuid
+
+import numpy as np
+
+from backend.db.pricing import load_product_costs
+from backend.models import Product
+from backend.pricing import ProductCosts, margin_grid, max_discount_for_margin
+from backend.pricing.margins import DEFAULT_COGS_RATIO, floor_discount
+
+CHANNELS = ["oliveyoung", "coupang", "naver", "kakao", "gmarket"]
+
+
+def make_costs(*products: tuple[int, int | None]) -> ProductCosts:
+    return ProductCosts.from_rows(
+        {"product_id": f"p{i}", "product_name": f"product {i}", "price": price, "cogs": cogs}
+        for i, (price, cogs) in enumerate(products)
+    )
+
+
+def scalar_margin(price: float, cogs: float, fee_rate: float, discount: float) -> float:
+    selling_price = price * (1 - discount)
+    return (selling_price * (1 - fee_rate) - cogs) / selling_price if selling_price > 0 else 0
+
+
+class TestMarginGrid:
+    """Test the grid against the per-cell formula."""
+
+    def test_matches_scalar_formula(self):
+        """Test every product x channel x discount cell, fees on the discounted price."""
+        costs = make_costs((35000, 8000), (20000, 12000))
+        discounts = [0, 0.1, 0.25, 1.0]
+
+        grid = margin_grid(costs, CHANNELS, discounts)
+
+        assert grid.margin.shape == (2, 5, 4)
+        fee_rates = [0.35, 0.28, 0.20, 0.20, 0.23]
+        for p, (price, cogs) in enumerate([(35000, 8000), (20000, 12000)]):
+            for c, fee_rate in enumerate(fee_rates):
+                for d, discount in enumerate(discounts):
+                    assert math.isclose(
+                        grid.margin[p, c, d], scalar_margin(price, cogs, fee_rate, discount), abs_tol=1e-12
+                    )
+        assert grid.selling_price[0, 1, 1] == 31500
+        assert math.isclose(grid.commission[0, 1, 1], 31500 * 0.25)
+        assert grid.gross_margin[1, 0, 0] == 20000 * 0.65 - 12000
+
+    def test_missing_cogs_is_estimated(self):
+        """Test the default unit cost for products without COGS."""
+        costs = make_costs((10000, None))
+
+        assert costs.cogs.tolist() == [10000 * DEFAULT_COGS_RATIO]
+
+
+class TestMaxDiscount:
+    """Test the closed-form maximum discount."""
+
+    def test_matches_a_fine_scan(self):
+        """Test that the solved discount is where the scanned margin crosses the target."""
+        costs = make_costs((35000, 8000), (28000, 9000), (45000, 6000))
+        scan = np.linspace(0, 0.99, 9901)
+
+        max_discount = max_discount_for_margin(costs, CHANNELS, 0.20)
+
+        grid = margin_grid(costs, CHANNELS, scan)
+        scanned = np.where(grid.margin >= 0.20 - 1e-12, scan, -1).max(axis=2)
+        assert np.all(max_discount >= scanned - 1e-9)
+        assert np.all(max_discount < scanned + 1e-4)
+
+        optimal = floor_discount(max_discount)
+        margins = margin_grid(costs, CHANNELS, np.unique(optimal)).margin
+        at_optimal = np.take_along_axis(margins, np.searchsorted(np.unique(optimal), optimal)[:, :, None], axis=2)
+        assert np.all(at_optimal >= 0.20 - 1e-9)
+
+    def test_unreachable_targets_are_nan(self):
+        """Test targets missed at list price, or above what the fees leave."""
+        costs = make_costs((10000, 5000), (10000, 1000))
+
+        max_discount = max_discount_for_margin(costs, ["oliveyoung", "naver"], 0.20)
+
+        assert np.isnan(max_discount[0, 0])  # 0.35 fees + 0.50 cost > 1 - 0.20
+        assert math.isclose(max_discount[0, 1], 1 - 5000 / (10000 * 0.60))
+        assert not np.isnan(max_discount[1]).any()
+        assert np.isnan(max_discount_for_margin(costs, ["oliveyoung"], 0.70)).all()
+
+
+class TestLoadProductCosts:
+    """Test the product cost read."""
+
+    async def test_loads_requested_products_in_order(self, session_factory):
+        """Test request order across batches, brand filtering and unknown IDs left out."""
+        async with session_factory() as session:
+            serum = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", price=38000, cogs=9000)
+            toner = Product(name="독도 토너", category="스킨케어", brand="라운드랩", price=23000)
+            session.add_all([serum, toner])
+            await session.commit()
+
+        async with session_factory() as session:
+            costs = await load_product_costs(session, [toner.id, uuid.uuid4(), serum.id, serum.id])
+            batched = await load_product_costs(session, [serum.id, uuid.uuid4(), toner.id], batch_size=1)
+            brand = await load_product_costs(session, brand="글로우랩")
+
+        assert costs.product_ids == [toner.id, serum.id]
+        assert batched.product_ids == [serum.id, toner.id]
+        assert costs.base_prices.tolist() == [23000, 38000]
+        assert costs.cogs.tolist() == [23000 * DEFAULT_COGS_RATIO, 9000]
+        assert brand.product_names == ["비타민C 세럼"]
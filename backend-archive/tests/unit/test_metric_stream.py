@@ -0,0 +1,107 @@
+"""Unit tests for delta-encoded metric updates."""
+
+import copy
+
+from backend.api.metric_stream import MetricDeltaEncoder, apply_delta, diff
+from backend.api.websocket import ConnectionManager
+from tests.unit.test_websocket_manager import FakeWebSocket, drain
+
+
+def snapshot(prices: dict[str, int]) -> dict:
+    return {sku: {"price": price, "stock": 100} for sku, price in prices.items()}
+
+
+class TestDiff:
+    """Test nested diffing and its client-side application."""
+
+    def test_round_trip(self):
+        """Test that applying the diff to the old snapshot gives the new one."""
+        old = {"a": {"price": 1, "stock": 2}, "b": {"price": 3}, "c": 5, "d": {"x": 1}}
+        new = {"a": {"price": 1, "stock": 7}, "c": [1, 2], "d": 4, "e": {"y": {"z": 1}}}
+
+        changes, removed = diff(old, new)
+        assert changes == {"a": {"stock": 7}, "c": [1, 2], "d": 4, "e": {"y": {"z": 1}}}
+        assert removed == [["b"]]
+        assert apply_delta(copy.deepcopy(old), changes, removed) == new
+
+    def test_nested_removal(self):
+        """Test that keys removed inside nested dicts are reported by path."""
+        changes, removed = diff({"a": {"x": 1, "y": 2}}, {"a": {"x": 1}})
+        assert changes == {}
+        assert removed == [["a", "y"]]
+
+
+class TestMetricDeltaEncoder:
+    """Test sequencing, keyframes and change suppression."""
+
+    def test_sequence_and_keyframes(self):
+        """Test first update and every Nth update are keyframes, others deltas."""
+        encoder = MetricDeltaEncoder(keyframe_interval=3)
+        topics = ["metric:price"]
+
+        messages = [
+            encoder.encode("price", topics, snapshot({"SKU-1": 1000 + i, "SKU-2": 2000}))
+            for i in range(5)
+        ]
+
+        assert [m["seq"] for m in messages] == [1, 2, 3, 4, 5]
+        assert [m["type"] for m in messages] == [
+            "metric_update", "metric_delta", "metric_delta", "metric_update", "metric_delta",
+        ]
+        assert messages[1]["changes"] == {"SKU-1": {"price": 1001}}
+
+    def test_unchanged_snapshot_sends_nothing(self):
+        """Test that resending the same data produces no message."""
+        encoder = MetricDeltaEncoder(keyframe_interval=10)
+        data = snapshot({"SKU-1": 1000})
+
+        assert encoder.encode("price", ["metric:price"], data) is not None
+        assert encoder.encode("price", ["metric:price"], copy.deepcopy(data)) is None
+        assert encoder.streams["metric:price"].seq == 1
+
+    def test_snapshot_is_copied(self):
+        """Test that mutating the caller's dict after publishing is detected as a change."""
+        encoder = MetricDeltaEncoder(keyframe_interval=10)
+        data = snapshot({"SKU-1": 1000})
+        encoder.encode("price", ["metric:price"], data)
+
+        data["SKU-1"]["price"] = 900
+        message = encoder.encode("price", ["metric:price"], data)
+        assert message["changes"] == {"SKU-1": {"price": 900}}
+
+
+class TestMetricPublish:
+    """Test delta delivery over the connection manager."""
+
+    async def test_client_reconstructs_state_from_deltas(self):
+        """Test that a msgpack client applying deltas ends with the latest snapshot."""
+        manager = ConnectionManager(queue_size=64)
+        manager.metrics = MetricDeltaEncoder(keyframe_interval=100)
+        ws = FakeWebSocket()
+        connection = await manager.connect(ws, "client", encoding="msgpack")
+        manager.subscriptions.subscribe(connection, ["metric:inventory"])
+
+        for i in range(4):
+            await manager.publish_metric("inventory", ["metric:inventory"], snapshot({"A": i, "B": 1}))
+        await manager.publish_metric("inventory", ["metric:inventory"], snapshot({"A": 9}))
+        await drain()
+
+        state: dict = {}
+        for message in ws.sent:
+            if message["type"] == "metric_update":
+                state = message["data"]
+            else:
+                apply_delta(state, message["changes"], message["removed"])
+        assert state == snapshot({"A": 9})
+
+    async def test_late_subscriber_gets_keyframe(self):
+        """Test that subscribing to an active stream sends its current keyframe."""
+        manager = ConnectionManager(queue_size=16)
+        await manager.publish_metric("price", ["metric:price", "channel:naver"], snapshot({"A": 1}))
+        ws = FakeWebSocket()
+        connection = await manager.connect(ws, "late")
+
+        assert manager.send_keyframes(connection, ["channel:*"]) == 1
+        await drain()
+        assert ws.sent[0]["keyframe"] is True
+        assert ws.sent[0]["data"] == snapshot({"A": 1})
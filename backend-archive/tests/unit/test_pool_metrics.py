@@ -0,0 +1,34 @@
+"""Unit tests for connection pool checkout metrics."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.db.pool import InstrumentedAsyncQueuePool, PoolMetrics
+
+
+class TestInstrumentedPool:
+    """Test checkout wait-time recording."""
+
+    async def test_checkouts_are_recorded(self, tmp_path):
+        """Test that every checkout is timed and bucketed."""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=2,
+            max_overflow=0,
+        )
+        metrics = PoolMetrics("test")
+        engine.sync_engine.pool.metrics = metrics
+
+        for _ in range(3):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        snapshot = metrics.snapshot(engine.sync_engine.pool)
+        assert snapshot["checkouts"] == 3
+        assert snapshot["timeouts"] == 0
+        assert sum(snapshot["wait_seconds_buckets"].values()) == 3
+        assert snapshot["pool"]["checked_out"] == 0
+
+        await engine.dispose()
+        assert engine.sync_engine.pool.metrics is metrics
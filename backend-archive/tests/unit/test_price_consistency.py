@@ -0,0 +1,114 @@
+"""Unit tests for the vectorized price consistency checks."""
+
+import time
+
+import numpy as np
+import pytest
+
+from backend.db.pricing import load_price_matrix, record_channel_prices
+from backend.models import Product
+from backend.pricing import PriceMatrix, find_price_inconsistencies
+
+CHANNELS = ("oliveyoung", "coupang", "naver", "kakao")
+
+
+def matrix(*rows: list[float]) -> PriceMatrix:
+    return PriceMatrix([f"p{i}" for i in range(len(rows))], CHANNELS, np.array(rows, dtype=float))
+
+
+class TestFindPriceInconsistencies:
+    """Test thresholds and edge cases of the batch check."""
+
+    def test_emits_only_violations_with_severity(self):
+        """Test the 5% warning and 10% critical thresholds."""
+        report = find_price_inconsistencies(matrix(
+            [28000, 26500, 28000, 29000],  # 9.4% -> warning
+            [10000, 10000, 10400, 10000],  # 4% -> consistent
+            [20000, 22000, 20000, 20000],  # 10% -> critical
+        ))
+
+        assert [v["product_id"] for v in report["violations"]] == ["p2", "p0"]
+        critical, warning = report["violations"]
+        assert critical["severity"] == "critical"
+        assert critical["highest_channel"] == "coupang"
+        assert warning["severity"] == "warning"
+        assert (warning["lowest_channel"], warning["highest_channel"]) == ("coupang", "kakao")
+        assert warning["price_variance"] == pytest.approx(2500 / 26500, abs=1e-4)
+        assert (report["warning_count"], report["critical_count"]) == (1, 1)
+
+    def test_limit_keeps_counts_for_all_violations(self):
+        """Test that only the worst violations are detailed when limited."""
+        report = find_price_inconsistencies(
+            matrix([28000, 26500, 28000, 29000], [20000, 22000, 20000, 20000]),
+            limit=1,
+        )
+
+        assert [v["product_id"] for v in report["violations"]] == ["p1"]
+        assert (report["warning_count"], report["critical_count"]) == (1, 1)
+
+    def test_missing_prices_are_ignored(self):
+        """Test that unpriced channels and single-channel products are skipped."""
+        nan = np.nan
+        report = find_price_inconsistencies(matrix(
+            [nan, 10000, nan, 12000],
+            [nan, nan, 15000, nan],
+            [nan, nan, nan, nan],
+        ))
+
+        assert report["products_compared"] == 1
+        (violation,) = report["violations"]
+        assert violation["prices"] == {"coupang": 10000, "kakao": 12000}
+
+    def test_checks_100k_products_quickly(self):
+        """Test that a full-catalog sweep stays well under a second."""
+        rng = np.random.default_rng(7)
+        base = rng.integers(5_000, 80_000, size=(100_000, 1))
+        prices = base * rng.uniform(0.9, 1.1, size=(100_000, 4))
+        catalog = PriceMatrix(list(range(100_000)), CHANNELS, prices)
+
+        start = time.perf_counter()
+        report = find_price_inconsistencies(catalog, limit=50)
+        elapsed = time.perf_counter() - start
+
+        assert report["products_compared"] == 100_000
+        assert len(report["violations"]) == 50
+        assert elapsed < 0.5
+
+
+class TestPriceMatrixLoading:
+    """Test loading the latest channel prices from the database."""
+
+    async def test_loads_latest_in_stock_prices(self, session_factory):
+        """Test upserts, the stock filter and the brand filter."""
+        async with session_factory() as session:
+            serum = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", price=35000)
+            toner = Product(name="독도 토너", category="스킨케어", brand="라운드랩", price=23000)
+            session.add_all([serum, toner])
+            await session.flush()
+
+            def price(product, channel, sale_price, in_stock=True):
+                return {
+                    "product_id": product.id,
+                    "channel": channel,
+                    "brand": product.brand,
+                    "regular_price": product.price,
+                    "sale_price": sale_price,
+                    "in_stock": in_stock,
+                }
+
+            await record_channel_prices(session, [
+                price(serum, "coupang", 26500),
+                price(serum, "naver", 28000),
+                price(serum, "kakao", 20000, in_stock=False),
+                price(toner, "coupang", 18400),
+            ])
+            await record_channel_prices(session, [price(serum, "coupang", 27000)])
+            await session.commit()
+
+            catalog = await load_price_matrix(session)
+            brand_only = await load_price_matrix(session, brand="라운드랩")
+
+        row = catalog.product_ids.index(serum.id)
+        assert catalog.prices[row].tolist()[1:3] == [27000, 28000]
+        assert np.isnan(catalog.prices[row, 3])
+        assert brand_only.product_ids == [toner.id]
@@ -0,0 +1,194 @@
+"""Unit tests for the columnar price history store."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+
+from backend.config import get_settings
+from backend.db.pricing import ingest_price_observations, load_price_history, record_seller_prices
+from backend.models import PriceHistorySegment, Product, SellerPrice
+from backend.pricing import MapViolationDetector, PriceHistoryStore, PriceObservation
+from backend.pricing.history import KST
+
+T0 = datetime(2026, 3, 1, 0, 0, tzinfo=KST)
+
+
+def at(minutes: int) -> datetime:
+    return T0 + timedelta(minutes=minutes)
+
+
+def utc_at(minutes: int) -> datetime:
+    # SQLite drops the offset, so stored times are given in UTC
+    return at(minutes).astimezone(timezone.utc)
+
+
+class TestPriceHistoryStore:
+    """Test encoding, rollups and range queries."""
+
+    def test_raw_points_round_trip_across_sealed_segments(self):
+        """Test that delta-encoded, sealed segments decode to the original points."""
+        store = PriceHistoryStore(segment_size=4)
+        prices = [35000, 34000, 34000, 28000, 28000, 31500, 30000, 35000, 36000, 29000]
+        for i, price in enumerate(prices):
+            store.append("serum", "coupang", "BeautyDeals", price, at(i * 7))
+
+        result = store.query("serum", "coupang", "BeautyDeals", at(7), at(56), resolution="raw")
+
+        assert result.last.tolist() == prices[1:9]
+        assert result.timestamps.tolist() == [int(at(i * 7).timestamp()) for i in range(1, 9)]
+        stats = store.stats()
+        assert stats["raw_points"] == 10
+        assert stats["bytes_per_observation"] < 16
+
+    def test_hourly_and_daily_rollups(self):
+        """Test min, max and last per bucket, with days starting at midnight KST."""
+        store = PriceHistoryStore()
+        for minutes, price in [(0, 30000), (20, 28000), (50, 29000), (70, 31000), (24 * 60 + 5, 27000)]:
+            store.append("serum", "naver", "Official", price, at(minutes))
+
+        hourly = store.query("serum", "naver", "Official", at(0), at(120), resolution="hourly")
+        daily = store.query("serum", "naver", "Official", at(0), at(3 * 24 * 60), resolution="daily")
+
+        assert hourly.low.tolist() == [28000, 31000]
+        assert hourly.high.tolist() == [30000, 31000]
+        assert hourly.last.tolist() == [29000, 31000]
+        assert [record["timestamp"] for record in daily.records()] == [
+            "2026-03-01T00:00:00+09:00",
+            "2026-03-02T00:00:00+09:00",
+        ]
+        assert daily.low.tolist() == [28000, 27000]
+
+    def test_resolution_follows_span(self):
+        """Test that longer spans are served from coarser rollups."""
+        store = PriceHistoryStore()
+        store.append("serum", "naver", "Official", 30000, at(0))
+
+        assert store.query("serum", "naver", "Official", at(0), at(60)).resolution == "raw"
+        assert store.query("serum", "naver", "Official", at(0), at(7 * 24 * 60)).resolution == "hourly"
+        assert store.query("serum", "naver", "Official", at(0), at(90 * 24 * 60)).resolution == "daily"
+        with pytest.raises(ValueError):
+            store.query("serum", "naver", "Official", at(0), at(60), resolution="minutely")
+
+    def test_rejects_out_of_order_and_expires_raw_segments(self):
+        """Test append-only series and raw retention with rollups kept."""
+        store = PriceHistoryStore(segment_size=2, raw_retention=timedelta(days=1))
+        store.append_many([
+            PriceObservation("coupang", "BeautyDeals", "serum", 30000, at(0)),
+            PriceObservation("coupang", "BeautyDeals", "serum", 29000, at(10)),
+            PriceObservation("coupang", "BeautyDeals", "serum", 31000, at(5)),
+        ])
+        for day in range(1, 4):
+            store.append("serum", "coupang", "BeautyDeals", 28000, at(day * 24 * 60))
+            store.append("serum", "coupang", "BeautyDeals", 28500, at(day * 24 * 60 + 1))
+
+        stats = store.stats()
+        assert stats["rejected"] == 1
+        assert stats["segments_dropped"] == 2
+        raw = store.query("serum", "coupang", "BeautyDeals", at(0), at(4 * 24 * 60), resolution="raw")
+        daily = store.query("serum", "coupang", "BeautyDeals", at(0), at(4 * 24 * 60), resolution="daily")
+        assert raw.last.tolist() == [28000, 28500, 28000, 28500]
+        assert daily.low.tolist() == [29000, 28000, 28000, 28000]
+
+    def test_unknown_series_is_empty(self):
+        """Test that querying a series without history returns no points."""
+        store = PriceHistoryStore()
+
+        result = store.query("serum", "kakao", "Official", at(0), at(60))
+
+        assert len(result.timestamps) == 0
+        assert np.array_equal(result.last, np.empty(0, dtype=np.int64))
+        assert store.sellers("serum", "kakao") == []
+
+
+async def add_product(session_factory) -> str:
+    async with session_factory() as session:
+        toner = Product(name="독도 토너", category="스킨케어", brand="라운드랩", price=23000)
+        session.add(toner)
+        await session.commit()
+    return str(toner.id)
+
+
+class TestLoadPriceHistory:
+    """Test history recorded by price ingestion."""
+
+    async def test_ingested_observations_are_loaded(self, session_factory):
+        """Test that every known product's observations are kept, once, and read back per seller."""
+        toner_id = await add_product(session_factory)
+        day = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        observations = [
+            PriceObservation("coupang", "BeautyDeals", toner_id, 21000, day),
+            PriceObservation("coupang", "BeautyDeals", toner_id, 19000, day + timedelta(hours=2)),
+            PriceObservation("coupang", "Official", toner_id, 23000, day),
+            PriceObservation("naver", "Official", toner_id, 22000, day),
+            PriceObservation("coupang", "BeautyDeals", "not-a-product", 100, day),
+        ]
+
+        for _ in range(2):
+            async with session_factory() as session:
+                await ingest_price_observations(session, observations, detector=MapViolationDetector())
+                await session.commit()
+
+        async with session_factory() as session:
+            history = await load_price_history(session, toner_id, "coupang", day, day + timedelta(days=1))
+            official = await load_price_history(
+                session, toner_id, "coupang", day, day + timedelta(days=1), seller="Official"
+            )
+
+        assert list(history) == ["BeautyDeals", "Official"]
+        assert history["BeautyDeals"].resolution == "raw"
+        assert history["BeautyDeals"].last.tolist() == [21000, 19000]
+        assert list(official) == ["Official"]
+
+    async def test_full_segments_are_sealed_and_raw_rows_deleted(self, session_factory, monkeypatch):
+        """Test that sealed segments and the unsealed tail read back as one series, each point once."""
+        monkeypatch.setattr(get_settings(), "price_history_segment_size", 4)
+        toner_id = await add_product(session_factory)
+        prices = [35000, 34000, 34000, 28000, 28000, 31500, 30000, 35000, 36000, 29000]
+        observations = [
+            PriceObservation("coupang", "BeautyDeals", toner_id, price, utc_at(i * 7)) for i, price in enumerate(prices)
+        ]
+
+        async with session_factory() as session:
+            await record_seller_prices(session, observations[:6])
+            await record_seller_prices(session, observations)  # Re-sent, plus four new
+            await session.commit()
+
+        async with session_factory() as session:
+            segments = (await session.execute(select(func.count()).select_from(PriceHistorySegment))).scalar()
+            unsealed = (await session.execute(select(func.count()).select_from(SellerPrice))).scalar()
+            history = await load_price_history(session, toner_id, "coupang", utc_at(7), utc_at(56), resolution="raw")
+
+        assert (segments, unsealed) == (2, 2)
+        assert history["BeautyDeals"].last.tolist() == prices[1:9]
+        assert history["BeautyDeals"].timestamps.tolist() == [int(at(i * 7).timestamp()) for i in range(1, 9)]
+
+    async def test_long_spans_are_served_from_stored_rollups(self, session_factory, monkeypatch):
+        """Test hourly and daily buckets merged across ingests, kept after raw segments expire."""
+        monkeypatch.setattr(get_settings(), "price_history_segment_size", 2)
+        monkeypatch.setattr(get_settings(), "price_history_raw_retention_days", 1)
+        toner_id = await add_product(session_factory)
+        points = [(0, 30000), (20, 28000), (50, 29000), (70, 31000), (24 * 60 + 5, 27000), (3 * 24 * 60, 26000)]
+
+        for minutes, price in points:
+            async with session_factory() as session:
+                await record_seller_prices(session, [PriceObservation("naver", "Official", toner_id, price, utc_at(minutes))])
+                await session.commit()
+
+        async with session_factory() as session:
+            hourly = await load_price_history(session, toner_id, "naver", utc_at(0), utc_at(120), resolution="hourly")
+            daily = await load_price_history(session, toner_id, "naver", utc_at(0), utc_at(90 * 24 * 60))
+            raw = await load_price_history(session, toner_id, "naver", utc_at(0), utc_at(4 * 24 * 60), resolution="raw")
+
+        assert hourly["Official"].low.tolist() == [28000, 31000]
+        assert hourly["Official"].high.tolist() == [30000, 31000]
+        assert hourly["Official"].last.tolist() == [29000, 31000]
+        assert daily["Official"].resolution == "daily"
+        assert [record["timestamp"] for record in daily["Official"].records()] == [
+            "2026-03-01T00:00:00+09:00",
+            "2026-03-02T00:00:00+09:00",
+            "2026-03-04T00:00:00+09:00",
+        ]
+        assert daily["Official"].low.tolist() == [28000, 27000, 26000]
+        assert raw["Official"].last.tolist() == [27000, 26000]
@@ -0,0 +1,179 @@
+"""Unit tests for the ranking snapshot store."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.channels import RankingSnapshotStore
+from backend.config import get_settings
+from backend.db.rankings import (
+    compare_ranking,
+    load_rank_history,
+    load_ranking_movers,
+    record_ranking_snapshot,
+)
+from backend.models import ChannelRanking, ChannelRankMovement
+
+KST = timezone(timedelta(hours=9))
+T0 = datetime(2026, 3, 1, 9, 0, tzinfo=KST)
+
+
+def at(days: float) -> datetime:
+    return T0 + timedelta(days=days)
+
+
+def ranking(*names: str) -> list[dict]:
+    return [{"product_name": name, "brand": name.split()[0]} for name in names]
+
+
+class TestRecord:
+    """Test the movement returned when a list is recorded."""
+
+    def test_reports_entered_exited_and_moved(self):
+        """Test the diff against the previous snapshot."""
+        store = RankingSnapshotStore()
+        first = store.record("coupang", "토너", ranking("A", "B", "C", "D"), at(0))
+        movement = store.record("coupang", "토너", ranking("C", "A", "B", "E"), at(1))
+
+        assert [entry["product"] for entry in first["entered"]] == ["A", "B", "C", "D"]
+        assert [entry["product"] for entry in movement["entered"]] == ["E"]
+        assert movement["exited"] == [{"product": "D", "previous_rank": 4}]
+        assert [(m["product"], m["change"]) for m in movement["moved"]] == [("C", 2), ("A", -1), ("B", -1)]
+        assert movement["unchanged"] == 0
+
+    def test_track_annotates_items(self):
+        """Test previous_rank and rank_change on the returned items."""
+        store = RankingSnapshotStore()
+        store.track("naver", "skincare:popularity", ranking("A", "B", "C"))
+        items = store.track("naver", "skincare:popularity", ranking("B", "A", "D"))
+
+        assert [(i["product_name"], i["previous_rank"], i["rank_change"]) for i in items] == [
+            ("B", 2, 1),
+            ("A", 1, -1),
+            ("D", None, None),
+        ]
+
+    def test_rejects_snapshot_older_than_latest(self):
+        """Test that boards are append-only in time."""
+        store = RankingSnapshotStore()
+        store.record("kakao", "skincare:all", ranking("A"), at(1))
+
+        with pytest.raises(ValueError):
+            store.record("kakao", "skincare:all", ranking("A"), at(0))
+
+
+class TestQueries:
+    """Test rank history and biggest movers."""
+
+    def test_rank_history_over_window(self):
+        """Test the rank at the window start, later changes and off-list periods."""
+        store = RankingSnapshotStore()
+        lists = [
+            ranking("A", "B", "C"),
+            ranking("B", "A", "C"),
+            ranking("B", "C", "D"),
+            ranking("B", "C", "D"),
+            ranking("A", "B", "C"),
+        ]
+        for day, items in enumerate(lists):
+            store.record("oliveyoung", "skincare:sales", items, at(day))
+
+        history = store.rank_history("oliveyoung", "skincare:sales", "A", since=at(1.5), until=at(10))
+
+        assert [point["rank"] for point in history["points"]] == [2, None, 1]
+        assert (history["start_rank"], history["current_rank"], history["net_change"]) == (2, 1, 1)
+        assert (history["best_rank"], history["worst_rank"]) == (1, 2)
+
+    def test_biggest_movers_rebuilds_past_list_from_keyframe(self):
+        """Test movers against a list rebuilt from a keyframe plus diffs."""
+        store = RankingSnapshotStore(keyframe_interval=3)
+        names = [f"P{i}" for i in range(10)]
+        for day in range(7):
+            # Rotate the list by one each day
+            store.record("coupang", "선크림", ranking(*names[day:], *names[:day]), at(day))
+
+        movers = store.biggest_movers("coupang", "선크림", since=at(4.5), limit=3)
+
+        # The day-4 list was P4..P9, P0..P3; the latest is P6..P9, P0..P5
+        assert [(m["product"], m["change"]) for m in movers["risers"]] == [
+            ("P6", 2), ("P7", 2), ("P8", 2),
+        ]
+        assert [(m["product"], m["change"]) for m in movers["fallers"]] == [("P4", -8), ("P5", -8)]
+        assert movers["since"] == at(4).isoformat()
+
+    def test_prunes_snapshots_beyond_retention(self):
+        """Test that old snapshots are dropped but current history stays answerable."""
+        store = RankingSnapshotStore(keyframe_interval=2, retention=timedelta(days=3))
+        for day in range(10):
+            store.record("naver", "선크림:popularity", ranking("A", "B") if day % 2 else ranking("B", "A"), at(day))
+
+        board = store.board("naver", "선크림:popularity")
+        assert board.snapshots[0].keyframe is not None
+        assert len(board.snapshots) <= 5
+        assert store.biggest_movers("naver", "선크림:popularity", since=at(-5))["risers"][0]["product"] == "A"
+        assert len(board.history["A"][0]) <= 5
+
+
+class TestPersistedSnapshots:
+    """Test snapshots stored as diffs and movement rows in the database."""
+
+    async def test_movement_queries_from_stored_diffs(self, session_factory):
+        """Test the recorded movement, compare without recording, movers and one product's history."""
+        async with session_factory() as session:
+            for days, names in [(-120, ("Z",)), (0, ("A", "B", "C")), (1, ("B", "A", "C"))]:
+                await record_ranking_snapshot(session, "oliveyoung", "skincare:sales", ranking(*names), at(days))
+            movement = await record_ranking_snapshot(
+                session, "oliveyoung", "skincare:sales", ranking("C", "B", "D"), at(2)
+            )
+            await session.commit()
+
+        async with session_factory() as session:
+            compared = await compare_ranking(session, "oliveyoung", "skincare:sales", ranking("D", "C", "B"))
+            movers = await load_ranking_movers(session, "oliveyoung", "skincare:sales", at(0.5))
+            history = await load_rank_history(session, "oliveyoung", "skincare:sales", "C", at(-1))
+            rows = (await session.execute(select(func.count()).select_from(ChannelRanking))).scalar()
+
+        assert [(m["product"], m["change"]) for m in movement["moved"]] == [("C", 2), ("B", -1)]
+        assert [m["product"] for m in movement["entered"]] == ["D"]
+        assert movement["exited"] == [{"product": "A", "previous_rank": 2}]
+        assert [(m["product"], m["change"]) for m in compared["moved"]] == [("D", 2), ("C", -1), ("B", -1)]
+        assert rows == 4
+
+        assert [m["product"] for m in movers["risers"]] == ["C"]
+        assert movers["exited"] == [{"product": "A", "previous_rank": 1}]
+        assert [m["product"] for m in movers["entered"]] == ["D"]
+        assert [point["rank"] for point in history["points"]] == [3, 1]
+        assert (history["best_rank"], history["worst_rank"], history["net_change"]) == (1, 3, 2)
+
+    async def test_keyframes_and_retention(self, session_factory, monkeypatch):
+        """Test that only changes are stored between keyframes and history past retention is dropped."""
+        monkeypatch.setattr(get_settings(), "ranking_keyframe_interval", 2)
+        monkeypatch.setattr(get_settings(), "ranking_retention_days", 1)
+        async with session_factory() as session:
+            for days, names in [(-120, ("Z",)), (0, ("A", "B", "C")), (1, ("B", "A", "C")), (2, ("B", "D", "A"))]:
+                await record_ranking_snapshot(session, "oliveyoung", "skincare:sales", ranking(*names), at(days))
+            await session.commit()
+
+        async with session_factory() as session:
+            stored = (
+                await session.execute(select(ChannelRanking).order_by(ChannelRanking.observed_at))
+            ).scalars().all()
+            movers = await load_ranking_movers(session, "oliveyoung", "skincare:sales", at(-365))
+            old_moves = (
+                await session.execute(
+                    select(func.count()).select_from(ChannelRankMovement).where(ChannelRankMovement.product == "Z")
+                )
+            ).scalar()
+
+        # Day 1 is the latest keyframe past the cutoff; day 2 stores D entering and A dropping a place
+        assert [(row.keyframe, len(row.items), row.exited) for row in stored] == [(True, 3, []), (False, 2, ["C"])]
+        assert old_moves == 0
+        assert movers["since"] == stored[0].observed_at.isoformat()
+        assert [m["product"] for m in movers["fallers"]] == ["A"]
+        assert [m["product"] for m in movers["entered"]] == ["D"]
+        assert movers["exited"] == [{"product": "C", "previous_rank": 3}]
+
+        with pytest.raises(ValueError):
+            async with session_factory() as session:
+                await record_ranking_snapshot(session, "oliveyoung", "skincare:sales", ranking("A"), at(1.5))
@@ -0,0 +1,163 @@
+"""Unit tests for sales fact ingestion and rollup maintenance."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from backend.config import get_settings
+from backend.db.sales import (
+    get_average_daily_units,
+    get_period_change,
+    get_sales_series,
+    get_sales_totals,
+    period_end,
+    period_start,
+    record_daily_sales,
+)
+from backend.models import Product
+from backend.models.sales import RollupGrain
+
+AS_OF = date(2026, 3, 4)  # Wednesday
+
+
+@pytest.fixture
+async def product(session_factory):
+    async with session_factory() as session:
+        product = Product(name="비타민C 세럼", category="스킨케어", brand="글로우랩", sku="GL-VC-030", price=38000)
+        session.add(product)
+        await session.commit()
+    return product
+
+
+def fact(product, day: date, channel: str = "coupang", units: int = 10) -> dict:
+    return {
+        "sale_date": day,
+        "product_id": product.id,
+        "channel": channel,
+        "brand": product.brand,
+        "units": units,
+        "orders": units,
+        "gross_sales": units * 1000,
+        "discount_amount": 0,
+    }
+
+
+class TestPeriods:
+    """Test period boundaries."""
+
+    def test_week_and_month_boundaries(self):
+        """Test that weeks start on Monday and months on the 1st."""
+        assert period_start(AS_OF, RollupGrain.WEEK) == date(2026, 3, 2)
+        assert period_start(AS_OF, RollupGrain.MONTH) == date(2026, 3, 1)
+        assert period_end(date(2026, 2, 1), RollupGrain.MONTH) == date(2026, 3, 1)
+        assert period_end(date(2026, 12, 1), RollupGrain.MONTH) == date(2027, 1, 1)
+
+
+class TestRollups:
+    """Test incremental rollup maintenance."""
+
+    async def test_rollups_follow_ingested_facts(self, session_factory, product):
+        """Test that day, week and month rollups sum the ingested facts."""
+        async with session_factory() as session:
+            rows = [fact(product, AS_OF - timedelta(days=i), units=i + 1) for i in range(10)]
+            await record_daily_sales(session, rows)
+            await session.commit()
+
+            weekly = await get_sales_series(
+                session, RollupGrain.WEEK, AS_OF - timedelta(days=9), AS_OF, product_id=product.id
+            )
+            monthly = await get_sales_series(
+                session, RollupGrain.MONTH, AS_OF - timedelta(days=9), AS_OF, brand=product.brand
+            )
+
+        assert sum(row["units"] for row in weekly) == sum(range(1, 11))
+        assert [row["period_start"] for row in monthly] == [date(2026, 2, 1), date(2026, 3, 1)]
+        assert monthly[1]["units"] == 1 + 2 + 3 + 4
+
+    async def test_resending_a_fact_replaces_it(self, session_factory, product):
+        """Test that corrections replace rather than double count."""
+        async with session_factory() as session:
+            await record_daily_sales(session, [fact(product, AS_OF, units=10)])
+            await record_daily_sales(session, [fact(product, AS_OF, units=4)])
+            await session.commit()
+
+            totals = await get_sales_totals(session, AS_OF, AS_OF)
+
+        assert totals["units"] == 4
+        assert totals["gross_sales"] == 4000
+
+    async def test_rebranded_facts_leave_no_stale_brand_rollup(self, session_factory, product):
+        """Test that re-sending a fact under a new brand moves it between brand rollups."""
+        async with session_factory() as session:
+            await record_daily_sales(session, [fact(product, AS_OF, units=10)])
+            await record_daily_sales(session, [{**fact(product, AS_OF, units=10), "brand": "글로우랩 키즈"}])
+            await session.commit()
+
+            old = await get_sales_totals(session, AS_OF, AS_OF, brand="글로우랩")
+            new = await get_sales_totals(session, AS_OF, AS_OF, brand="글로우랩 키즈")
+            monthly = await get_sales_series(session, RollupGrain.MONTH, AS_OF, AS_OF, brand="글로우랩")
+
+        assert (old["units"], new["units"], monthly) == (0, 10, [])
+
+    async def test_rollups_refresh_in_batches(self, session_factory, product, monkeypatch):
+        """Test that products and brands beyond the batch size are all rolled up."""
+        monkeypatch.setattr(get_settings(), "sales_read_batch_size", 2)
+        async with session_factory() as session:
+            products = [
+                Product(name=f"토너 {i}", category="스킨케어", brand=f"브랜드 {i}", price=23000) for i in range(5)
+            ]
+            session.add_all(products)
+            await session.flush()
+            await record_daily_sales(session, [fact(item, AS_OF, units=i + 1) for i, item in enumerate(products)])
+            await session.commit()
+
+            totals = await get_sales_totals(session, AS_OF, AS_OF)
+            series = await get_sales_series(
+                session, RollupGrain.WEEK, AS_OF, AS_OF, product_id=products[4].id
+            )
+
+        assert totals["units"] == 1 + 2 + 3 + 4 + 5
+        assert series[0]["units"] == 5
+
+    async def test_period_change_compares_windows(self, session_factory, product):
+        """Test the 7-day change against the preceding 7 days."""
+        async with session_factory() as session:
+            rows = [fact(product, AS_OF - timedelta(days=i), units=20) for i in range(7)]
+            rows += [fact(product, AS_OF - timedelta(days=i), units=10) for i in range(7, 14)]
+            await record_daily_sales(session, rows)
+            await session.commit()
+
+            change = await get_period_change(session, days=7, as_of=AS_OF)
+
+        assert change["current"]["gross_sales"] == 140_000
+        assert change["previous"]["gross_sales"] == 70_000
+        assert change["change"] == 1.0
+
+    async def test_average_daily_units_per_channel(self, session_factory, product):
+        """Test per-channel daily averages, counting missing days as zero."""
+        async with session_factory() as session:
+            rows = [fact(product, AS_OF - timedelta(days=i), channel="naver", units=6) for i in range(3)]
+            await record_daily_sales(session, rows)
+            await session.commit()
+
+            averages = await get_average_daily_units(session, AS_OF - timedelta(days=5), AS_OF)
+
+        assert averages == {(product.id, "naver"): 3.0}
+
+    async def test_average_daily_units_by_brand_or_batched_ids(self, session_factory, product):
+        """Test the brand filter and explicit IDs read in batches."""
+        async with session_factory() as session:
+            others = [Product(name=f"토너 {i}", category="스킨케어", brand="라운드랩", price=23000) for i in range(3)]
+            session.add_all(others)
+            await session.flush()
+            await record_daily_sales(session, [fact(item, AS_OF, units=4) for item in [product, *others]])
+            await session.commit()
+
+            start = AS_OF - timedelta(days=1)
+            brand = await get_average_daily_units(session, start, AS_OF, brand="라운드랩")
+            batched = await get_average_daily_units(
+                session, start, AS_OF, product_ids=[others[2].id, product.id, others[0].id], batch_size=2
+            )
+
+        assert brand == {(item.id, "coupang"): 2.0 for item in others}
+        assert batched == {(item.id, "coupang"): 2.0 for item in (others[2], product, others[0])}
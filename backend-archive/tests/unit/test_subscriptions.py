@@ -0,0 +1,69 @@
+"""Unit tests for topic-indexed WebSocket subscriptions."""
+
+from backend.api.subscriptions import SubscriptionRegistry, alert_topics
+from backend.api.websocket import ConnectionManager
+from tests.unit.test_websocket_manager import FakeWebSocket, drain
+
+
+class TestSubscriptionRegistry:
+    """Test topic matching, wildcards and unsubscribe."""
+
+    def test_exact_and_wildcard_matching(self):
+        """Test that exact, dimension wildcard and global wildcard subscribers match."""
+        registry = SubscriptionRegistry()
+        registry.subscribe("coupang", ["channel:coupang"])
+        registry.subscribe("any-channel", ["channel:*"])
+        registry.subscribe("everything", ["*"])
+        registry.subscribe("critical", ["severity:critical"])
+
+        assert registry.match(["channel:coupang"]) == {"coupang", "any-channel", "everything"}
+        assert registry.match(["channel:naver"]) == {"any-channel", "everything"}
+        assert registry.match(["metric:sales"]) == {"everything"}
+
+    def test_invalid_topics_are_rejected(self):
+        """Test that unknown dimensions and empty values are rejected."""
+        registry = SubscriptionRegistry()
+        rejected = registry.subscribe("client", ["channel:kakao", "alerts", "colour:red", "brand:"])
+
+        assert rejected == ["alerts", "colour:red", "brand:"]
+        assert registry.topics_for("client") == {"channel:kakao"}
+
+    def test_unsubscribe_cleans_up_index(self):
+        """Test that unsubscribing removes empty topics and subscribers."""
+        registry = SubscriptionRegistry()
+        registry.subscribe("client", ["brand:Laneige", "channel:naver"])
+
+        registry.unsubscribe("client", ["brand:Laneige"])
+        assert registry.match(["brand:Laneige"]) == set()
+        assert registry.topic_count == 1
+
+        registry.remove("client")
+        assert registry.topic_count == 0
+        assert len(registry) == 0
+
+    def test_alert_topics(self):
+        """Test that alerts are tagged by type, severity and channel."""
+        topics = alert_topics({"type": "price", "severity": "critical", "channel": "coupang"})
+        assert topics == ["alert:price", "severity:critical", "channel:coupang"]
+
+
+class TestTopicPublish:
+    """Test that publishing only reaches interested connections."""
+
+    async def test_publish_reaches_only_subscribers(self):
+        """Test that unsubscribed and disconnected clients get nothing."""
+        manager = ConnectionManager(queue_size=16)
+        coupang, naver, idle = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        coupang_conn = await manager.connect(coupang, "coupang")
+        naver_conn = await manager.connect(naver, "naver")
+        await manager.connect(idle, "idle")
+        manager.subscriptions.subscribe(coupang_conn, ["channel:coupang"])
+        manager.subscriptions.subscribe(naver_conn, ["channel:naver"])
+
+        assert await manager.publish(["channel:coupang", "severity:warning"], {"n": 1}) == 1
+        await drain()
+        assert coupang.sent == [{"n": 1}]
+        assert naver.sent == [] and idle.sent == []
+
+        manager.disconnect(coupang, "coupang")
+        assert await manager.publish(["channel:coupang"], {"n": 2}) == 0
@@ -0,0 +1,73 @@
+"""Unit tests for the synthetic data generator and bulk loader."""
+
+from datetime import date
+
+from sqlalchemy import func, select
+
+from backend.db.synthetic import SyntheticConfig, SyntheticDataGenerator, seed_synthetic
+from backend.models import Budget, Promotion
+
+
+def small_config(seed: int = 42) -> SyntheticConfig:
+    return SyntheticConfig(
+        seed=seed,
+        as_of=date(2026, 2, 1),
+        products_per_brand=10,
+        promotions_per_brand_per_year=5,
+        alerts_per_scale=50,
+    )
+
+
+def generate_all(config: SyntheticConfig) -> dict[str, list[dict]]:
+    generator = SyntheticDataGenerator(config)
+    return {table.name: list(rows) for table, rows in generator.tables()}
+
+
+class TestSyntheticDataGenerator:
+    """Test generated data."""
+
+    def test_same_seed_is_deterministic(self):
+        """Test that the same seed and as_of produce identical rows."""
+        assert generate_all(small_config()) == generate_all(small_config())
+
+    def test_different_seed_changes_data(self):
+        """Test that changing the seed changes the data."""
+        assert generate_all(small_config(1)) != generate_all(small_config(2))
+
+    def test_scale_multiplies_row_counts(self):
+        """Test that parent table sizes scale linearly."""
+        base = generate_all(small_config())
+        config = small_config()
+        config.scale = 3
+        scaled = generate_all(config)
+
+        for table in ("products", "promotions", "alerts"):
+            assert len(scaled[table]) == 3 * len(base[table])
+
+    def test_child_rows_reference_parents(self):
+        """Test that child rows only reference generated parents."""
+        data = generate_all(small_config())
+        product_ids = {row["id"] for row in data["products"]}
+        promotion_ids = {row["id"] for row in data["promotions"]}
+
+        assert {row["product_id"] for row in data["inventories"]} <= product_ids
+        assert {row["promotion_id"] for row in data["budgets"]} <= promotion_ids
+        assert {row["promotion_id"] for row in data["milestones"]} <= promotion_ids
+
+
+class TestBulkLoad:
+    """Test loading through the multi-row INSERT path."""
+
+    async def test_seed_synthetic_loads_all_tables(self, session_factory):
+        """Test that every generated row is loaded."""
+        async with session_factory() as session:
+            counts = await seed_synthetic(session, small_config())
+            await session.commit()
+
+        async with session_factory() as session:
+            promotions = await session.execute(select(func.count(Promotion.id)))
+            budgets = await session.execute(select(func.count(Budget.id)))
+
+        assert promotions.scalar() == counts["promotions"]
+        assert budgets.scalar() == counts["budgets"]
+        assert counts["products"] == 50
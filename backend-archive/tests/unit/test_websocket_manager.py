@@ -0,0 +1,96 @@
+"""Unit tests for WebSocket fan-out."""
+
+import asyncio
+import json
+
+import msgpack
+
+from backend.api.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    """Records sent frames; a stalled socket blocks forever on send."""
+
+    def __init__(self, stalled: bool = False, fail: bool = False):
+        self.stalled = stalled
+        self.fail = fail
+        self.sent: list[dict] = []
+        self.closed_with: int | None = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.sent.append(json.loads(data))
+
+    async def send_bytes(self, data: bytes):
+        await self.send_text(json.dumps(msgpack.unpackb(data)))
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestConnectionManager:
+    """Test queued broadcast and slow-consumer eviction."""
+
+    async def test_broadcast_reaches_every_connection_in_order(self):
+        """Test that each connection receives every message in publish order."""
+        manager = ConnectionManager(queue_size=16)
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for i, ws in enumerate(sockets):
+            await manager.connect(ws, f"client-{i}")
+
+        for n in range(5):
+            assert await manager.broadcast({"n": n}) == 3
+        await drain()
+
+        for ws in sockets:
+            assert [m["n"] for m in ws.sent] == [0, 1, 2, 3, 4]
+
+    async def test_slow_consumer_is_evicted(self):
+        """Test that a stalled socket is dropped once its queue overflows."""
+        manager = ConnectionManager(queue_size=2)
+        fast, slow = FakeWebSocket(), FakeWebSocket(stalled=True)
+        await manager.connect(fast, "fast")
+        await manager.connect(slow, "slow")
+
+        for n in range(5):
+            await manager.broadcast({"n": n})
+            await drain()
+
+        assert manager.evicted_count == 1
+        assert "slow" not in manager.active_connections
+        assert slow.closed_with == 1013
+        assert len(fast.sent) == 5
+
+    async def test_failed_send_disconnects(self):
+        """Test that a socket error removes only that connection."""
+        manager = ConnectionManager(queue_size=4)
+        await manager.connect(FakeWebSocket(fail=True), "broken")
+        ok = FakeWebSocket()
+        await manager.connect(ok, "ok")
+
+        await manager.broadcast({"type": "alert"})
+        await drain()
+
+        assert list(manager.active_connections) == ["ok"]
+        assert ok.sent == [{"type": "alert"}]
+
+    async def test_disconnect_is_idempotent(self):
+        """Test that disconnecting twice does not raise."""
+        manager = ConnectionManager(queue_size=4)
+        ws = FakeWebSocket()
+        await manager.connect(ws, "client")
+
+        manager.disconnect(ws, "client")
+        manager.disconnect(ws, "client")
+        assert manager.connection_count == 0
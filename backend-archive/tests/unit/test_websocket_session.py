@@ -0,0 +1,95 @@
+"""Unit tests for concurrent request handling within one WebSocket session."""
+
+import asyncio
+
+from fastapi import WebSocketDisconnect
+
+from backend.api import websocket as ws_module
+from tests.unit.test_websocket_manager import FakeWebSocket, drain
+
+
+class ScriptedWebSocket(FakeWebSocket):
+    """Fake socket whose incoming messages are fed by the test."""
+
+    def __init__(self):
+        super().__init__()
+        self.query_params: dict[str, str] = {}
+        self.inbox: asyncio.Queue = asyncio.Queue()
+
+    async def receive_json(self):
+        message = await self.inbox.get()
+        if message is None:
+            raise WebSocketDisconnect()
+        return message
+
+    def of_type(self, message_type: str) -> list[dict]:
+        return [m for m in self.sent if m["type"] == message_type]
+
+
+async def wait_for(predicate, timeout: float = 2.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestWebSocketSession:
+    """Test that chat runs in the background and can be cancelled."""
+
+    async def test_ping_answered_while_chat_runs_and_cancel(self, monkeypatch):
+        """Test pings during chat, the concurrency limit and cancellation."""
+        monkeypatch.setattr(ws_module, "DIVISION_STEP_DELAY", 0.05)
+        monkeypatch.setattr(ws_module.manager, "max_concurrent_requests", 2)
+        ws = ScriptedWebSocket()
+        session = asyncio.create_task(ws_module.websocket_endpoint(ws, "session-test"))
+
+        for request_id in ("a", "b", "c"):
+            ws.inbox.put_nowait({"type": "chat", "message": "plan", "request_id": request_id})
+        ws.inbox.put_nowait({"type": "ping"})
+        await wait_for(lambda: ws.of_type("pong"))
+
+        # Pong arrives before any chat finished; the third request is rejected
+        assert not ws.of_type("processing_complete")
+        assert [m["request_id"] for m in ws.of_type("error")] == ["c"]
+
+        ws.inbox.put_nowait({"type": "cancel", "request_id": "a"})
+        await wait_for(lambda: ws.of_type("processing_complete"))
+
+        assert [m["request_id"] for m in ws.of_type("processing_cancelled")] == ["a"]
+        assert [m["request_id"] for m in ws.of_type("processing_complete")] == ["b"]
+
+        ws.inbox.put_nowait(None)
+        await session
+        await drain()
+        assert "session-test" not in ws_module.manager.active_connections
+
+    async def test_disconnect_cancels_in_flight_requests(self, monkeypatch):
+        """Test that closing the socket cancels its running chats."""
+        monkeypatch.setattr(ws_module, "DIVISION_STEP_DELAY", 10)
+        ws = ScriptedWebSocket()
+        session = asyncio.create_task(ws_module.websocket_endpoint(ws, "session-close"))
+
+        ws.inbox.put_nowait({"type": "chat", "message": "plan", "request_id": "x"})
+        await wait_for(lambda: ws.of_type("division_processing"))
+        connection = ws_module.manager.active_connections["session-close"][0]
+        task = connection.tasks["x"]
+
+        ws.inbox.put_nowait(None)
+        await session
+        await drain()
+        assert task.cancelled()
+
+    async def test_legacy_channel_subscription(self):
+        """Test that bare channel names from older clients become channel topics."""
+        ws = ScriptedWebSocket()
+        session = asyncio.create_task(ws_module.websocket_endpoint(ws, "session-legacy"))
+
+        ws.inbox.put_nowait({"type": "subscribe", "channels": ["coupang", "naver"]})
+        await wait_for(lambda: ws.of_type("subscribed"))
+
+        assert ws.of_type("subscribed")[0]["topics"] == ["channel:coupang", "channel:naver"]
+        assert ws.of_type("subscribed")[0]["rejected"] == []
+
+        ws.inbox.put_nowait(None)
+        await session
+        await drain()